@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Offline NIM Stand-in Server
+
+Serves the OpenAI-compatible endpoints that ``NIMClient``, the document
+judge and the guardrails service call, so the API can be load-tested
+without network access or NIM quota:
+
+- ``POST /v1/chat/completions`` (regular and ``stream: true`` SSE)
+- ``POST /v1/embeddings``
+- ``GET /v1/models``
+
+Responses are deterministic for a given request. Completions follow the
+JSON shape the prompt asks for (intent parsing, agent responses with
+``natural_language``, guardrails checks, reasoning steps); embeddings are
+hashed bag-of-words vectors, so similar texts get similar vectors.
+
+Latency is drawn from a named profile, and errors, 429s and a concurrency
+cap can be injected to exercise retries, the adaptive limiter and hedging.
+
+Usage:
+    python scripts/testing/nim_standin.py --port 8010 --profile heavy_tail --rate-limit-rate 0.02
+
+    export LLM_NIM_URL=http://localhost:8010/v1
+    export EMBEDDING_NIM_URL=http://localhost:8010/v1
+    export RAIL_API_URL=http://localhost:8010/v1
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+EMBEDDING_DIMENSION = 1024
+DEFAULT_LLM_MODEL = "nvidia/llama-3.3-nemotron-super-49b-v1"
+DEFAULT_EMBEDDING_MODEL = "nvidia/nv-embedqa-e5-v5"
+
+
+@dataclass
+class LatencyProfile:
+    """Log-normal latency with an optional slow tail."""
+
+    median_ms: float
+    sigma: float = 0.0
+    tail_probability: float = 0.0
+    tail_multiplier: Tuple[float, float] = (4.0, 10.0)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a latency in seconds."""
+        latency_ms = self.median_ms * math.exp(rng.gauss(0.0, self.sigma)) if self.sigma else self.median_ms
+        if self.tail_probability and rng.random() < self.tail_probability:
+            latency_ms *= rng.uniform(*self.tail_multiplier)
+        return latency_ms / 1000
+
+
+# Per-endpoint profiles: (chat completions, embeddings)
+LATENCY_PROFILES: Dict[str, Tuple[LatencyProfile, LatencyProfile]] = {
+    "instant": (LatencyProfile(0.0), LatencyProfile(0.0)),
+    "fast": (LatencyProfile(50.0, 0.2), LatencyProfile(10.0, 0.2)),
+    "nim": (LatencyProfile(1200.0, 0.4), LatencyProfile(80.0, 0.3)),
+    "heavy_tail": (
+        LatencyProfile(1200.0, 0.4, tail_probability=0.05),
+        LatencyProfile(80.0, 0.3, tail_probability=0.05),
+    ),
+}
+
+
+@dataclass
+class StandinConfig:
+    """Behaviour of the stand-in server."""
+
+    profile: str = "fast"
+    error_rate: float = 0.0  # Fraction of calls answered with HTTP 500
+    rate_limit_rate: float = 0.0  # Fraction of calls answered with HTTP 429
+    max_concurrency: Optional[int] = None  # Calls beyond this get HTTP 429
+    stream_chunk_words: int = 4
+    seed: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Deterministic content
+# ---------------------------------------------------------------------------
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+_INTENT_OPTIONS_RE = re.compile(r"Intent options:\s*([a-z_]+)", re.IGNORECASE)
+_RESPONSE_TYPE_RE = re.compile(r'"response_type":\s*"([a-z_]+)"')
+
+
+def _json_objects(text: str) -> List[Dict[str, Any]]:
+    """Find top-level JSON objects embedded in prompt text (e.g. format examples)."""
+    objects = []
+    start = text.find("{")
+    while start != -1:
+        depth = 0
+        end = -1
+        for i in range(start, len(text)):
+            if text[i] == "{":
+                depth += 1
+            elif text[i] == "}":
+                depth -= 1
+                if depth == 0:
+                    end = i
+                    break
+        if end == -1:
+            break
+        try:
+            value = json.loads(text[start:end + 1].replace("{{", "{").replace("}}", "}"))
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
+            continue
+        if isinstance(value, dict) and value:
+            objects.append(value)
+        start = text.find("{", end + 1)
+    return objects
+
+
+def _last_user_message(messages: List[Dict[str, Any]]) -> str:
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            return str(message.get("content", ""))
+    return ""
+
+
+def _summary(text: str, words: int = 12) -> str:
+    tokens = text.split()
+    return " ".join(tokens[:words]) + ("..." if len(tokens) > words else "")
+
+
+def build_completion(messages: List[Dict[str, Any]]) -> str:
+    """Deterministic completion shaped after what the prompt asks for."""
+    prompt = "\n".join(str(m.get("content", "")) for m in messages)
+    user_text = _last_user_message(messages)
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+
+    if "natural_language" in prompt:
+        match = _RESPONSE_TYPE_RE.search(prompt)
+        return json.dumps({
+            "response_type": match.group(1) if match else "general",
+            "data": {},
+            "natural_language": f"Stand-in answer {digest} for: {_summary(user_text)}",
+            "recommendations": ["Review the latest warehouse status"],
+            "confidence": 0.85,
+            "actions_taken": [],
+        })
+    if "is_safe" in prompt or "safety violations" in prompt:
+        return json.dumps({"is_safe": True, "violations": [], "confidence": 0.95})
+    if "reasoning steps" in prompt.lower():
+        return json.dumps({
+            "steps": [
+                {"description": "Identify the request", "reasoning": _summary(user_text), "confidence": 0.8},
+                {"description": "Select data sources", "reasoning": "Use warehouse records", "confidence": 0.8},
+            ]
+        })
+    if '"intent"' in prompt:
+        example = next((o for o in _json_objects(prompt) if "intent" in o), {"entities": {}})
+        match = _INTENT_OPTIONS_RE.search(prompt)
+        return json.dumps({
+            "intent": match.group(1) if match else example.get("intent", "general"),
+            "entities": example.get("entities", {}),
+            "context": example.get("context", {}),
+        })
+    if "json" in prompt.lower():
+        examples = _json_objects(prompt)
+        if examples:
+            return json.dumps(examples[0])
+    return f"Stand-in response {digest}: {_summary(user_text, 24)}"
+
+
+def build_embedding(text: str, dimension: int = EMBEDDING_DIMENSION) -> List[float]:
+    """Unit-length hashed bag-of-words embedding (shared words -> higher cosine similarity)."""
+    vector = np.zeros(dimension, dtype=np.float64)
+    for word in _WORD_RE.findall(text.lower()) or [text]:
+        seed = int.from_bytes(hashlib.sha256(word.encode("utf-8")).digest()[:8], "little")
+        vector += np.random.default_rng(seed).standard_normal(dimension)
+    norm = np.linalg.norm(vector)
+    return (vector / norm if norm else vector).tolist()
+
+
+def _usage(prompt_text: str, completion_text: str = "") -> Dict[str, int]:
+    prompt_tokens = len(prompt_text.split())
+    completion_tokens = len(completion_text.split())
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Application
+# ---------------------------------------------------------------------------
+
+
+def create_app(config: Optional[StandinConfig] = None) -> FastAPI:
+    """Create the stand-in application."""
+    config = config or StandinConfig()
+    if config.profile not in LATENCY_PROFILES:
+        raise ValueError(f"Unknown latency profile '{config.profile}', expected one of {sorted(LATENCY_PROFILES)}")
+    llm_latency, embedding_latency = LATENCY_PROFILES[config.profile]
+    rng = random.Random(config.seed)
+    state = {"in_flight": 0, "requests": 0, "errors": 0, "rate_limited": 0}
+
+    def injected_fault() -> Optional[JSONResponse]:
+        if config.max_concurrency is not None and state["in_flight"] > config.max_concurrency:
+            state["rate_limited"] += 1
+            return JSONResponse({"error": "Too many concurrent requests"}, status_code=429,
+                                headers={"Retry-After": "1"})
+        roll = rng.random()
+        if roll < config.rate_limit_rate:
+            state["rate_limited"] += 1
+            return JSONResponse({"error": "Rate limit exceeded"}, status_code=429, headers={"Retry-After": "1"})
+        if roll < config.rate_limit_rate + config.error_rate:
+            state["errors"] += 1
+            return JSONResponse({"error": "Injected server error"}, status_code=500)
+        return None
+
+    router = APIRouter()
+
+    @router.get("/models")
+    async def list_models():
+        return {"object": "list", "data": [
+            {"id": DEFAULT_LLM_MODEL, "object": "model"},
+            {"id": DEFAULT_EMBEDDING_MODEL, "object": "model"},
+        ]}
+
+    @router.post("/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        state["requests"] += 1
+        state["in_flight"] += 1
+        try:
+            fault = injected_fault()
+            if fault is not None:
+                return fault
+
+            messages = body.get("messages", [])
+            model = body.get("model", DEFAULT_LLM_MODEL)
+            content = build_completion(messages)
+            usage = _usage(" ".join(str(m.get("content", "")) for m in messages), content)
+            latency = llm_latency.sample(rng)
+            created = int(time.time())
+            completion_id = "chatcmpl-" + hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+
+            if not body.get("stream"):
+                await asyncio.sleep(latency)
+                return {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                                 "finish_reason": "stop"}],
+                    "usage": usage,
+                }
+        finally:
+            state["in_flight"] -= 1
+
+        words = content.split(" ")
+        size = max(1, config.stream_chunk_words)
+        pieces = [" ".join(words[i:i + size]) + (" " if i + size < len(words) else "")
+                  for i in range(0, len(words), size)]
+
+        async def events():
+            state["in_flight"] += 1
+            try:
+                for index, piece in enumerate(pieces):
+                    await asyncio.sleep(latency / len(pieces))
+                    last = index == len(pieces) - 1
+                    chunk = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"content": piece},
+                                     "finish_reason": "stop" if last else None}],
+                    }
+                    if last:
+                        chunk["usage"] = usage
+                    yield f"data: {json.dumps(chunk)}\n\n"
+                yield "data: [DONE]\n\n"
+            finally:
+                state["in_flight"] -= 1
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @router.post("/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        state["requests"] += 1
+        state["in_flight"] += 1
+        try:
+            fault = injected_fault()
+            if fault is not None:
+                return fault
+            texts = body.get("input", [])
+            if isinstance(texts, str):
+                texts = [texts]
+            await asyncio.sleep(embedding_latency.sample(rng))
+            return {
+                "object": "list",
+                "model": body.get("model", DEFAULT_EMBEDDING_MODEL),
+                "data": [{"object": "embedding", "index": i, "embedding": build_embedding(text)}
+                         for i, text in enumerate(texts)],
+                "usage": _usage(" ".join(texts)),
+            }
+        finally:
+            state["in_flight"] -= 1
+
+    @router.get("/standin/stats")
+    async def stats():
+        return {"profile": config.profile, **state}
+
+    app = FastAPI(title="NIM Stand-in")
+    app.include_router(router, prefix="/v1")
+    app.include_router(router)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline NIM stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8010)
+    parser.add_argument("--profile", default="fast", choices=sorted(LATENCY_PROFILES))
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of calls returning HTTP 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of calls returning HTTP 429")
+    parser.add_argument("--max-concurrency", type=int, default=None, help="Return 429 beyond this many in-flight calls")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    app = create_app(StandinConfig(
+        profile=args.profile,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        max_concurrency=args.max_concurrency,
+        seed=args.seed,
+    ))
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
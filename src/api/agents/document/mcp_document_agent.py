@@ -33,6 +33,7 @@ from src.api.services.mcp.tool_discovery import (
     ToolCategory,
 )
 from src.api.services.mcp.base import MCPManager
+from src.api.utils.async_singleton import AsyncSingleton
 from src.api.services.reasoning import (
     get_reasoning_engine,
     ReasoningType,
@@ -812,17 +813,18 @@ class MCPDocumentExtractionAgent:
         return params
 
 
-# Factory function for getting the document agent
-async def get_mcp_document_agent() -> MCPDocumentExtractionAgent:
-    """Get or create MCP Document Extraction Agent instance."""
-    global _document_agent_instance
+async def _create_mcp_document_agent() -> MCPDocumentExtractionAgent:
+    agent = MCPDocumentExtractionAgent()
+    await agent.initialize()
+    return agent
 
-    if _document_agent_instance is None:
-        _document_agent_instance = MCPDocumentExtractionAgent()
-        await _document_agent_instance.initialize()
 
-    return _document_agent_instance
+# Global instance
+_document_agent_instance: AsyncSingleton[MCPDocumentExtractionAgent] = AsyncSingleton(
+    _create_mcp_document_agent
+)
 
 
-# Global instance
-_document_agent_instance: Optional[MCPDocumentExtractionAgent] = None
+async def get_mcp_document_agent() -> MCPDocumentExtractionAgent:
+    """Get or create MCP Document Extraction Agent instance."""
+    return await _document_agent_instance.get()
@@ -36,6 +36,8 @@ from pymilvus import (
 )
 
 from src.api.services.llm.nim_client import get_nim_client
+from src.api.services.llm.concurrency import LLMPriority, llm_priority
+from src.retrieval.vector.embedding_cache import get_embedding_cache
 
 logger = logging.getLogger(__name__)
 
@@ -111,8 +113,9 @@ class EmbeddingIndexingService:
             # Prepare text content for embedding
             text_content = await self._prepare_text_content(structured_data, entities)
 
-            # Generate embeddings
-            embeddings = await self._generate_embeddings(text_content)
+            # Generate embeddings (indexing yields to interactive queries)
+            with llm_priority(LLMPriority.BACKGROUND):
+                embeddings = await self._generate_embeddings(text_content, input_type="passage")
 
             # Prepare metadata
             metadata = await self._prepare_metadata(
@@ -180,15 +183,32 @@ class EmbeddingIndexingService:
             logger.error(f"Failed to prepare text content: {e}")
             return []
 
-    async def _generate_embeddings(self, text_content: List[str]) -> List[List[float]]:
-        """Generate embeddings using nv-embedqa-e5-v5."""
+    async def _generate_embeddings(
+        self, text_content: List[str], input_type: str = "query"
+    ) -> List[List[float]]:
+        """
+        Generate embeddings using nv-embedqa-e5-v5.
+
+        Any number of texts can be passed: the NIM client splits them into
+        provider-sized sub-batches and embeds those in parallel.
+        """
         try:
             if not self.nim_client:
                 logger.warning("NIM client not available, using mock embeddings")
                 return await self._generate_mock_embeddings(text_content)
 
-            # Generate embeddings for all text content
-            embeddings = await self.nim_client.generate_embeddings(text_content)
+            async def embed(texts: List[str]) -> List[List[float]]:
+                response = await self.nim_client.generate_embeddings(texts, input_type=input_type)
+                return response.embeddings
+
+            # Generate embeddings for all text content, reusing cached vectors
+            cache = get_embedding_cache()
+            if cache is not None:
+                embeddings = await cache.get_or_embed(
+                    text_content, self.nim_client.config.embedding_model, input_type, embed
+                )
+            else:
+                embeddings = await embed(text_content)
 
             logger.info(
                 f"Generated {len(embeddings)} embeddings with dimension {len(embeddings[0]) if embeddings else 0}"
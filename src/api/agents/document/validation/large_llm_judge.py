@@ -27,6 +27,9 @@ import json
 from datetime import datetime
 from dataclasses import dataclass
 
+from src.api.services.llm.concurrency import LLMPriority
+from src.api.services.llm.nim_client import get_nim_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -219,7 +222,12 @@ class LargeLLMJudge:
             
             logger.info(f"Calling Large LLM Judge API with timeout: {self.timeout}s")
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            # The judge shares the LLM endpoint with chat, so it takes a slot
+            # from the same adaptive limiter at judge priority
+            llm_limiter = (await get_nim_client()).llm_limiter
+            async with llm_limiter.acquire(LLMPriority.JUDGE), httpx.AsyncClient(
+                timeout=self.timeout
+            ) as client:
                 response = await client.post(
                     f"{self.base_url}/chat/completions",
                     headers={
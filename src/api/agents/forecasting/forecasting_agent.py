@@ -41,7 +41,9 @@ from src.api.services.reasoning import (
     ReasoningChain,
 )
 from src.api.utils.log_utils import sanitize_prompt_input
+from src.api.utils.async_singleton import AsyncSingleton
 from src.api.services.agent_config import load_agent_config, AgentConfig
+from src.api.services.monitoring.tracing import traced
 from .forecasting_action_tools import get_forecasting_action_tools
 
 logger = logging.getLogger(__name__)
@@ -237,6 +239,7 @@ class ForecastingAgent:
                 actions_taken=[],
             )
 
+    @traced("agent.parse")
     async def _parse_query(
         self, query: str, context: Optional[Dict[str, Any]]
     ) -> MCPForecastingQuery:
@@ -316,6 +319,7 @@ class ForecastingAgent:
                 user_query=query,
             )
 
+    @traced("agent.tool_discovery")
     async def _discover_tools(
         self, query: MCPForecastingQuery
     ) -> List[DiscoveredTool]:
@@ -328,7 +332,9 @@ class ForecastingAgent:
             
             # Also search by query keywords
             if query.user_query:
-                keyword_tools = await self.tool_discovery.search_tools(query.user_query)
+                keyword_tools = await self.tool_discovery.search_tools(
+                    query.user_query, match_all=True
+                )
                 discovered_tools.extend(keyword_tools)
 
             # Add direct tools if MCP doesn't have them
@@ -372,6 +378,7 @@ class ForecastingAgent:
             logger.error(f"Failed to discover tools: {e}")
             return []
 
+    @traced("agent.tool_execution")
     async def _execute_forecasting_tools(
         self, query: MCPForecastingQuery, tools: List[DiscoveredTool]
     ) -> Dict[str, Any]:
@@ -454,6 +461,7 @@ class ForecastingAgent:
 
         return tool_results
 
+    @traced("agent.response")
     async def _generate_response(
         self,
         original_query: str,
@@ -496,7 +504,9 @@ class ForecastingAgent:
                 },
             ]
 
-            llm_response = await self.nim_client.generate_response(response_prompt)
+            llm_response = await self.nim_client.generate_response(
+                response_prompt, stream_to_client=True
+            )
             natural_language = llm_response.content
 
             # Extract recommendations
@@ -669,15 +679,17 @@ class ForecastingAgent:
         return reasoning_types
 
 
+async def _create_forecasting_agent() -> ForecastingAgent:
+    agent = ForecastingAgent()
+    await agent.initialize()
+    return agent
+
+
 # Global instance
-_forecasting_agent: Optional[ForecastingAgent] = None
+_forecasting_agent: AsyncSingleton[ForecastingAgent] = AsyncSingleton(_create_forecasting_agent)
 
 
 async def get_forecasting_agent() -> ForecastingAgent:
     """Get or create the global forecasting agent instance."""
-    global _forecasting_agent
-    if _forecasting_agent is None:
-        _forecasting_agent = ForecastingAgent()
-        await _forecasting_agent.initialize()
-    return _forecasting_agent
+    return await _forecasting_agent.get()
 
@@ -52,8 +52,10 @@ from src.api.services.reasoning import (
     ReasoningChain,
 )
 from src.api.utils.log_utils import sanitize_prompt_input
+from src.api.utils.async_singleton import AsyncSingleton
 from src.api.services.agent_config import load_agent_config, AgentConfig
 from src.api.services.validation import get_response_validator
+from src.api.services.monitoring.tracing import traced
 from .equipment_asset_tools import get_equipment_asset_tools
 
 logger = logging.getLogger(__name__)
@@ -310,6 +312,7 @@ class MCPEquipmentAssetOperationsAgent:
                 reasoning_steps=None,
             )
 
+    @traced("agent.parse")
     async def _parse_equipment_query(
         self, query: str, context: Optional[Dict[str, Any]]
     ) -> MCPEquipmentQuery:
@@ -422,6 +425,7 @@ Return only valid JSON.""",
                 intent="equipment_lookup", entities={}, context={}, user_query=query
             )
 
+    @traced("agent.tool_discovery")
     async def _discover_relevant_tools(
         self, query: MCPEquipmentQuery
     ) -> List[DiscoveredTool]:
@@ -488,6 +492,7 @@ Return only valid JSON.""",
             logger.error(f"Error discovering relevant tools: {e}")
             return []
 
+    @traced("agent.tool_planning")
     async def _create_tool_execution_plan(
         self, query: MCPEquipmentQuery, tools: List[DiscoveredTool]
     ) -> List[Dict[str, Any]]:
@@ -664,6 +669,7 @@ Return only valid JSON.""",
 
         return arguments
 
+    @traced("agent.tool_execution")
     async def _execute_tool_plan(
         self, execution_plan: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
@@ -921,6 +927,7 @@ IMPORTANT: Use the tool execution results to provide a comprehensive answer. The
         
         return content
 
+    @traced("agent.response")
     async def _generate_response_with_tools(
         self, query: MCPEquipmentQuery, tool_results: Dict[str, Any], reasoning_chain: Optional[ReasoningChain] = None
     ) -> MCPEquipmentResponse:
@@ -996,7 +1003,8 @@ ABSOLUTELY CRITICAL:
             response = await self.nim_client.generate_response(
                 response_prompt,
                 temperature=0.0,  # Lower temperature for more consistent JSON format
-                max_tokens=2000  # Allow more tokens for detailed responses
+                max_tokens=2000,  # Allow more tokens for detailed responses
+                stream_to_client=True,  # Final answer - stream tokens on /chat/stream
             )
 
             # Parse JSON response - try to extract JSON from response if it contains extra text
@@ -1187,7 +1195,8 @@ Write in a way that sounds natural and human, not robotic or template-like. Retu
                     generation_response = await self.nim_client.generate_response(
                         generation_prompt,
                         temperature=0.4,  # Higher temperature for more natural, fluent language
-                        max_tokens=1000
+                        max_tokens=1000,
+                        stream_to_client=True,
                     )
                     natural_language = generation_response.content.strip()
                     logger.info(f"LLM generated natural_language: {natural_language[:200]}...")
@@ -1644,14 +1653,18 @@ Do not include any other text, just the JSON array."""
         return reasoning_types
 
 
+async def _create_mcp_equipment_agent() -> MCPEquipmentAssetOperationsAgent:
+    agent = MCPEquipmentAssetOperationsAgent()
+    await agent.initialize()
+    return agent
+
+
 # Global MCP equipment agent instance
-_mcp_equipment_agent = None
+_mcp_equipment_agent: AsyncSingleton[MCPEquipmentAssetOperationsAgent] = AsyncSingleton(
+    _create_mcp_equipment_agent
+)
 
 
 async def get_mcp_equipment_agent() -> MCPEquipmentAssetOperationsAgent:
     """Get the global MCP equipment agent instance."""
-    global _mcp_equipment_agent
-    if _mcp_equipment_agent is None:
-        _mcp_equipment_agent = MCPEquipmentAssetOperationsAgent()
-        await _mcp_equipment_agent.initialize()
-    return _mcp_equipment_agent
+    return await _mcp_equipment_agent.get()
@@ -42,8 +42,10 @@ from src.api.services.reasoning import (
     ReasoningChain,
 )
 from src.api.utils.log_utils import sanitize_prompt_input
+from src.api.utils.async_singleton import AsyncSingleton
 from src.api.services.agent_config import load_agent_config, AgentConfig
 from src.api.services.validation import get_response_validator
+from src.api.services.monitoring.tracing import traced
 from .action_tools import get_operations_action_tools
 
 logger = logging.getLogger(__name__)
@@ -291,6 +293,7 @@ class MCPOperationsCoordinationAgent:
             logger.error(f"Error processing operations query: {e}")
             return self._create_error_response(str(e), "processing your request")
 
+    @traced("agent.parse")
     async def _parse_operations_query(
         self, query: str, context: Optional[Dict[str, Any]]
     ) -> MCPOperationsQuery:
@@ -352,6 +355,7 @@ Return only valid JSON.""",
                 intent="workforce_management", entities={}, context={}, user_query=query
             )
 
+    @traced("agent.tool_discovery")
     async def _discover_relevant_tools(
         self, query: MCPOperationsQuery
     ) -> List[DiscoveredTool]:
@@ -450,6 +454,7 @@ Return only valid JSON.""",
                 }
             )
     
+    @traced("agent.tool_planning")
     async def _create_tool_execution_plan(
         self, query: MCPOperationsQuery, tools: List[DiscoveredTool]
     ) -> List[Dict[str, Any]]:
@@ -730,6 +735,7 @@ Return only valid JSON.""",
 
         return arguments
 
+    @traced("agent.tool_execution")
     async def _execute_tool_plan(
         self, execution_plan: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
@@ -984,6 +990,7 @@ Return only valid JSON.""",
             logger.info(f"Equipment tool execution results: {[(k, v.get('tool_name'), 'SUCCESS' if v.get('success') else 'FAILED', str(v.get('error', 'N/A'))[:100]) for k, v in equipment_results.items()]}")
         return results
 
+    @traced("agent.response")
     async def _generate_response_with_tools(
         self, query: MCPOperationsQuery, tool_results: Dict[str, Any], reasoning_chain: Optional[ReasoningChain] = None
     ) -> MCPOperationsResponse:
@@ -1037,7 +1044,8 @@ Return only valid JSON.""",
             # This balances consistency with natural, fluent language
             response = await self.nim_client.generate_response(
                 response_prompt, 
-                temperature=0.3
+                temperature=0.3,
+                stream_to_client=True,  # Final answer - stream tokens on /chat/stream
             )
 
             # Parse JSON response
@@ -1105,7 +1113,8 @@ Return ONLY the natural language response text (no JSON, no formatting, just the
                         try:
                             natural_lang_response = await self.nim_client.generate_response(
                                 natural_lang_prompt,
-                                temperature=0.4  # Slightly higher for more natural language
+                                temperature=0.4,  # Slightly higher for more natural language
+                                stream_to_client=True,
                             )
                             natural_language = natural_lang_response.content.strip()
                             logger.info(f"Generated natural language from LLM: {natural_language[:200]}...")
@@ -1248,7 +1257,8 @@ Expand this into a natural, conversational response (2-4 sentences) that explain
                     ]
                     enhanced_response = await self.nim_client.generate_response(
                         enhance_prompt,
-                        temperature=0.4
+                        temperature=0.4,
+                        stream_to_client=True,
                     )
                     natural_language = enhanced_response.content.strip()
                     logger.info(f"Enhanced natural language: {natural_language[:200]}...")
@@ -1479,14 +1489,18 @@ Expand this into a natural, conversational response (2-4 sentences) that explain
         return reasoning_types
 
 
+async def _create_mcp_operations_agent() -> MCPOperationsCoordinationAgent:
+    agent = MCPOperationsCoordinationAgent()
+    await agent.initialize()
+    return agent
+
+
 # Global MCP operations agent instance
-_mcp_operations_agent = None
+_mcp_operations_agent: AsyncSingleton[MCPOperationsCoordinationAgent] = AsyncSingleton(
+    _create_mcp_operations_agent
+)
 
 
 async def get_mcp_operations_agent() -> MCPOperationsCoordinationAgent:
     """Get the global MCP operations agent instance."""
-    global _mcp_operations_agent
-    if _mcp_operations_agent is None:
-        _mcp_operations_agent = MCPOperationsCoordinationAgent()
-        await _mcp_operations_agent.initialize()
-    return _mcp_operations_agent
+    return await _mcp_operations_agent.get()
@@ -43,8 +43,10 @@ from src.api.services.reasoning import (
     ReasoningChain,
 )
 from src.api.utils.log_utils import sanitize_prompt_input
+from src.api.utils.async_singleton import AsyncSingleton
 from src.api.services.agent_config import load_agent_config, AgentConfig
 from src.api.services.validation import get_response_validator
+from src.api.services.monitoring.tracing import traced
 from .action_tools import get_safety_action_tools
 
 logger = logging.getLogger(__name__)
@@ -280,6 +282,7 @@ class MCPSafetyComplianceAgent:
                 reasoning_steps=None,
             )
 
+    @traced("agent.parse")
     async def _parse_safety_query(
         self, query: str, context: Optional[Dict[str, Any]]
     ) -> MCPSafetyQuery:
@@ -408,6 +411,7 @@ Return only valid JSON.""",
                 intent="incident_reporting", entities={}, context={}, user_query=query
             )
 
+    @traced("agent.tool_discovery")
     async def _discover_relevant_tools(
         self, query: MCPSafetyQuery
     ) -> List[DiscoveredTool]:
@@ -493,6 +497,7 @@ Return only valid JSON.""",
                 }
             )
 
+    @traced("agent.tool_planning")
     async def _create_tool_execution_plan(
         self, query: MCPSafetyQuery, tools: List[DiscoveredTool]
     ) -> List[Dict[str, Any]]:
@@ -739,6 +744,7 @@ Return only valid JSON.""",
             "context": {"priority": "high" if entities.get("severity") == "critical" else "normal"}
         }
 
+    @traced("agent.tool_execution")
     async def _execute_tool_plan(
         self, execution_plan: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
@@ -809,6 +815,7 @@ Return only valid JSON.""",
         logger.info(f"Executed {len(execution_plan)} tools in parallel, {len([r for r in results.values() if r.get('success')])} successful")
         return results
 
+    @traced("agent.response")
     async def _generate_response_with_tools(
         self, query: MCPSafetyQuery, tool_results: Dict[str, Any], reasoning_chain: Optional[ReasoningChain] = None
     ) -> MCPSafetyResponse:
@@ -886,7 +893,8 @@ ABSOLUTELY CRITICAL:
             response = await self.nim_client.generate_response(
                 response_prompt,
                 temperature=0.0,  # Lower temperature for more consistent JSON format
-                max_tokens=2000  # Allow more tokens for detailed responses
+                max_tokens=2000,  # Allow more tokens for detailed responses
+                stream_to_client=True,  # Final answer - stream tokens on /chat/stream
             )
 
             # Parse JSON response - try to extract JSON from response if it contains extra text
@@ -1014,7 +1022,8 @@ Write in a way that sounds natural and human, not robotic or template-like. Retu
                     generation_response = await self.nim_client.generate_response(
                         generation_prompt,
                         temperature=0.4,  # Higher temperature for more natural, fluent language
-                        max_tokens=1000
+                        max_tokens=1000,
+                        stream_to_client=True,
                     )
                     natural_language = generation_response.content.strip()
                     logger.info(f"LLM generated natural_language: {natural_language[:200]}...")
@@ -1555,14 +1564,18 @@ Do not include any other text, just the JSON array."""
         return None
 
 
+async def _create_mcp_safety_agent() -> MCPSafetyComplianceAgent:
+    agent = MCPSafetyComplianceAgent()
+    await agent.initialize()
+    return agent
+
+
 # Global MCP safety agent instance
-_mcp_safety_agent = None
+_mcp_safety_agent: AsyncSingleton[MCPSafetyComplianceAgent] = AsyncSingleton(
+    _create_mcp_safety_agent
+)
 
 
 async def get_mcp_safety_agent() -> MCPSafetyComplianceAgent:
     """Get the global MCP safety agent instance."""
-    global _mcp_safety_agent
-    if _mcp_safety_agent is None:
-        _mcp_safety_agent = MCPSafetyComplianceAgent()
-        await _mcp_safety_agent.initialize()
-    return _mcp_safety_agent
+    return await _mcp_safety_agent.get()
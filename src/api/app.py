@@ -17,37 +17,22 @@ from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response, JSONResponse
 from fastapi.exceptions import RequestValidationError
-import time
 import logging
 import os
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
-from src.api.routers.health import router as health_router
-from src.api.routers.chat import router as chat_router
-from src.api.routers.equipment import router as equipment_router
-from src.api.routers.operations import router as operations_router
-from src.api.routers.safety import router as safety_router
-from src.api.routers.auth import router as auth_router
-from src.api.routers.wms import router as wms_router
-from src.api.routers.iot import router as iot_router
-from src.api.routers.erp import router as erp_router
-from src.api.routers.scanning import router as scanning_router
-from src.api.routers.attendance import router as attendance_router
-from src.api.routers.reasoning import router as reasoning_router
-from src.api.routers.migration import router as migration_router
-from src.api.routers.mcp import router as mcp_router
-from src.api.routers.document import router as document_router
-from src.api.routers.inventory import router as inventory_router
-from src.api.routers.advanced_forecasting import router as forecasting_router
-from src.api.routers.training import router as training_router
-from src.api.services.monitoring.metrics import (
-    record_request_metrics,
-    get_metrics_response,
-)
+from src.api.services.monitoring.metrics import get_metrics_response
 from src.api.middleware.security_headers import SecurityHeadersMiddleware
+from src.api.middleware.lazy_routers import LazyRouterMiddleware
+from src.api.middleware.request_pipeline import (
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    RequestSizeLimitMiddleware,
+)
 from src.api.services.security.rate_limiter import get_rate_limiter
+from src.api.services.startup.routers import get_router_registry
 from src.api.utils.error_handler import (
     handle_validation_error,
     handle_http_exception,
@@ -83,12 +68,43 @@ async def lifespan(app: FastAPI):
         logger.info("✅ Alert checker started")
     except Exception as e:
         logger.warning(f"Failed to start alert checker: {e}")
+
+    # Build the planner, agents, tool catalog and semantic router in the
+    # background; /api/v1/health/ready reports not ready until done
+    try:
+        from src.api.services.startup.warmup import get_startup_warmup
+
+        startup_warmup = get_startup_warmup()
+        if startup_warmup is not None:
+            startup_warmup.start()
+            logger.info("✅ Startup warm-up started")
+    except Exception as e:
+        logger.warning(f"Failed to start startup warm-up: {e}")
     
     yield
     
     # Shutdown
     logger.info("Shutting down Warehouse Operational Assistant...")
     
+    # Cancel a warm-up that is still running
+    try:
+        from src.api.services.startup.warmup import get_startup_warmup
+
+        startup_warmup = get_startup_warmup()
+        if startup_warmup is not None:
+            await startup_warmup.stop()
+    except Exception as e:
+        logger.warning(f"Failed to stop startup warm-up: {e}")
+
+    # Stop deferred enrichment workers
+    try:
+        from src.api.services.enrichment.enrichment_pipeline import get_enrichment_pipeline
+
+        await get_enrichment_pipeline().close()
+        logger.info("✅ Enrichment pipeline stopped")
+    except Exception as e:
+        logger.warning(f"Failed to stop enrichment pipeline: {e}")
+
     # Stop rate limiter
     try:
         rate_limiter = await get_rate_limiter()
@@ -188,6 +204,11 @@ cors_origins_list = [origin.strip() for origin in cors_origins.split(",") if ori
 # Add security headers middleware (must be first)
 app.add_middleware(SecurityHeadersMiddleware)
 
+# Route groups: imported at startup, on first request (ROUTER_LAZY_GROUPS)
+# or not at all (ROUTER_GROUPS_DISABLED); import costs at /api/v1/health/startup
+router_registry = get_router_registry()
+app.add_middleware(LazyRouterMiddleware, registry=router_registry, openapi_path=app.openapi_url)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -199,83 +220,17 @@ app.add_middleware(
     max_age=3600,
 )
 
-# Add rate limiting middleware
-@app.middleware("http")
-async def rate_limit_middleware(request: Request, call_next):
-    """Rate limiting middleware."""
-    # Skip rate limiting for health checks and metrics
-    if request.url.path in ["/health", "/api/v1/health", "/api/v1/health/simple", "/api/v1/metrics", "/docs", "/openapi.json", "/"]:
-        return await call_next(request)
-    
-    try:
-        rate_limiter = await get_rate_limiter()
-        # check_rate_limit raises HTTPException if limit exceeded, returns True if allowed
-        await rate_limiter.check_rate_limit(request)
-    except HTTPException as http_exc:
-        # Re-raise HTTP exceptions (429 Too Many Requests)
-        raise http_exc
-    except Exception as e:
-        logger.error(f"Rate limiting error: {e}", exc_info=True)
-        # Fail open - allow request if rate limiter fails
-        pass
-    
-    return await call_next(request)
-
-# Add request size limit middleware
-@app.middleware("http")
-async def request_size_middleware(request: Request, call_next):
-    """Check request size limits."""
-    # Check content-length header
-    content_length = request.headers.get("content-length")
-    if content_length:
-        try:
-            size = int(content_length)
-            # Different limits for different endpoints
-            if "/document/upload" in request.url.path or "/upload" in request.url.path:
-                max_size = MAX_UPLOAD_SIZE
-            else:
-                max_size = MAX_REQUEST_SIZE
-            
-            if size > max_size:
-                from fastapi import HTTPException, status
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail=f"Request too large. Maximum size: {max_size / 1024 / 1024:.1f}MB"
-                )
-        except ValueError:
-            # Invalid content-length, let it through (will be caught by FastAPI)
-            pass
-    
-    return await call_next(request)
-
-# Add metrics middleware
-@app.middleware("http")
-async def metrics_middleware(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    duration = time.time() - start_time
-    record_request_metrics(request, response, duration)
-    return response
-
-
-app.include_router(health_router)
-app.include_router(chat_router)
-app.include_router(equipment_router)
-app.include_router(operations_router)
-app.include_router(safety_router)
-app.include_router(auth_router)
-app.include_router(wms_router)
-app.include_router(iot_router)
-app.include_router(erp_router)
-app.include_router(scanning_router)
-app.include_router(attendance_router)
-app.include_router(reasoning_router)
-app.include_router(migration_router)
-app.include_router(mcp_router)
-app.include_router(document_router)
-app.include_router(inventory_router)
-app.include_router(forecasting_router)
-app.include_router(training_router)
+# Request pipeline middleware (pure ASGI; the last one added runs first):
+# metrics -> request size limit -> rate limit -> CORS -> lazy routers -> security headers
+app.add_middleware(RateLimitMiddleware)
+app.add_middleware(
+    RequestSizeLimitMiddleware,
+    max_request_size=MAX_REQUEST_SIZE,
+    max_upload_size=MAX_UPLOAD_SIZE,
+)
+app.add_middleware(MetricsMiddleware)
+
+router_registry.install(app)
 
 
 @app.get("/")
@@ -26,7 +26,7 @@ This module implements the MCP-enhanced planner/router agent that:
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, TypedDict, Annotated, Any
+from typing import Dict, List, Optional, Sequence, Tuple, TypedDict, Annotated, Any
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
@@ -34,14 +34,29 @@ from langchain_core.tools import tool
 from dataclasses import asdict
 import logging
 import asyncio
+import os
+import re
 import threading
+import time
+from contextvars import ContextVar
 
 from src.api.services.mcp.tool_discovery import ToolDiscoveryService
 from src.api.services.mcp.tool_binding import ToolBindingService
 from src.api.services.mcp.tool_routing import ToolRoutingService, RoutingStrategy
 from src.api.services.mcp.tool_validation import ToolValidationService
 from src.api.services.mcp.base import MCPManager
+from src.api.services.streaming.chat_stream import (
+    EVENT_ROUTING,
+    emit_chat_event,
+    get_chat_stream_sink,
+    set_chat_stream_sink,
+)
+from src.api.services.guardrails.safety_gate import wait_for_input_safety
+from src.api.services.monitoring.tracing import span, traced
+from src.api.services.routing.keyword_matcher import KeywordMatcher
 from src.api.utils.log_utils import sanitize_log_data
+from src.api.utils.async_singleton import AsyncSingleton
+from src.api.utils.serialization import serialize_reasoning_chain
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +78,31 @@ COMPLEX_QUERY_KEYWORDS = [
 COMPLEX_QUERY_ACTIONS = ["create", "dispatch", "assign", "show", "list", "get", "check"]
 COMPLEX_QUERY_WORD_COUNT_THRESHOLD = 15
 
+# Multi-intent fan-out (opt-in): a message whose clauses ask different agents is
+# answered by those agents concurrently, within one shared agent deadline
+MULTI_INTENT_ENABLED = os.getenv("PLANNER_MULTI_INTENT_ENABLED", "false").lower() == "true"
+MAX_FANOUT_INTENTS = 3
+FANOUT_INTENTS = ("equipment", "operations", "safety", "forecasting", "document")
+_CLAUSE_SPLIT_RE = re.compile(r"[?;.!]+|,?\s+\b(?:and|also|then|plus)\b\s+", re.IGNORECASE)
+
+# Route computed ahead of time for the current request, as (message, intent, confidence)
+_route_hint: ContextVar[Optional[Tuple[str, str, float]]] = ContextVar("route_hint", default=None)
+
+
+def set_route_hint(message: str, intent: str, confidence: float):
+    """
+    Skip intent classification for ``message`` in the current context.
+
+    Used by batch requests that already routed their messages with
+    ``MCPPlannerGraph.route_messages``. Returns a reset token.
+    """
+    return _route_hint.set((message, intent, confidence))
+
+
+def reset_route_hint(token) -> None:
+    """Restore the route hint that was active before ``set_route_hint``."""
+    _route_hint.reset(token)
+
 
 def _extract_message_text(state: "MCPWarehouseState") -> Optional[str]:
     """Helper to extract text content from the latest message in state."""
@@ -137,67 +177,59 @@ def _create_error_response(agent_name: str, message_text: str, error: Exception,
     }
 
 
+def _merge_agent_responses(
+    intents: List[str], agent_responses: Dict[str, Any], branches: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Helper to merge the responses of a multi-intent fan-out, primary intent first."""
+    responses = {
+        intent: _convert_response_to_dict(agent_responses[intent], f"{intent}_info")
+        if not isinstance(agent_responses[intent], str)
+        else {"natural_language": agent_responses[intent]}
+        for intent in intents
+        if intent in agent_responses
+    }
+    primary = responses.get(intents[0], {})
+
+    def merged_list(field_name: str) -> List[Any]:
+        items: List[Any] = []
+        for response in responses.values():
+            for item in response.get(field_name) or []:
+                if item not in items:
+                    items.append(item)
+        return items
+
+    tool_execution_results: Dict[str, Any] = {}
+    for response in responses.values():
+        tool_execution_results.update(response.get("tool_execution_results") or {})
+
+    return {
+        "natural_language": "\n\n".join(
+            response["natural_language"]
+            for response in responses.values()
+            if isinstance(response.get("natural_language"), str) and response["natural_language"].strip()
+        ),
+        "data": {intent: response.get("data", {}) for intent, response in responses.items()},
+        "recommendations": merged_list("recommendations"),
+        # The merged answer is only as certain as its weakest part
+        "confidence": min((r.get("confidence", 0.0) for r in responses.values()), default=0.0),
+        "response_type": "multi_intent",
+        "mcp_tools_used": merged_list("mcp_tools_used"),
+        "tool_execution_results": tool_execution_results,
+        "actions_taken": merged_list("actions_taken"),
+        "reasoning_chain": primary.get("reasoning_chain"),
+        "reasoning_steps": primary.get("reasoning_steps"),
+        "intents": list(responses),
+        "branches": branches,
+    }
+
+
 def _convert_reasoning_chain_to_dict(reasoning_chain: Any) -> Optional[Dict[str, Any]]:
     """Helper to convert ReasoningChain dataclass to dict, avoiding recursion."""
     from dataclasses import is_dataclass
-    
+
     if not is_dataclass(reasoning_chain):
         return reasoning_chain if isinstance(reasoning_chain, dict) else None
-    
-    try:
-        reasoning_chain_dict = {
-            "chain_id": getattr(reasoning_chain, "chain_id", ""),
-            "query": getattr(reasoning_chain, "query", ""),
-            "reasoning_type": getattr(reasoning_chain, "reasoning_type", ""),
-            "final_conclusion": getattr(reasoning_chain, "final_conclusion", ""),
-            "overall_confidence": float(getattr(reasoning_chain, "overall_confidence", 0.0)),
-            "execution_time": float(getattr(reasoning_chain, "execution_time", 0.0)),
-        }
-        
-        # Convert enum to string
-        if hasattr(reasoning_chain_dict["reasoning_type"], "value"):
-            reasoning_chain_dict["reasoning_type"] = reasoning_chain_dict["reasoning_type"].value
-        
-        # Convert datetime
-        if hasattr(reasoning_chain, "created_at"):
-            created_at = getattr(reasoning_chain, "created_at")
-            if hasattr(created_at, "isoformat"):
-                reasoning_chain_dict["created_at"] = created_at.isoformat()
-            else:
-                reasoning_chain_dict["created_at"] = str(created_at)
-        
-        # Convert steps
-        if hasattr(reasoning_chain, "steps") and reasoning_chain.steps:
-            converted_steps = []
-            for step in reasoning_chain.steps:
-                if is_dataclass(step):
-                    step_dict = {
-                        "step_id": getattr(step, "step_id", ""),
-                        "step_type": getattr(step, "step_type", ""),
-                        "description": getattr(step, "description", ""),
-                        "reasoning": getattr(step, "reasoning", ""),
-                        "confidence": float(getattr(step, "confidence", 0.0)),
-                    }
-                    if hasattr(step, "timestamp"):
-                        timestamp = getattr(step, "timestamp")
-                        if hasattr(timestamp, "isoformat"):
-                            step_dict["timestamp"] = timestamp.isoformat()
-                        else:
-                            step_dict["timestamp"] = str(timestamp)
-                    step_dict["input_data"] = {}
-                    step_dict["output_data"] = {}
-                    step_dict["dependencies"] = []
-                    converted_steps.append(step_dict)
-                else:
-                    converted_steps.append(step)
-            reasoning_chain_dict["steps"] = converted_steps
-        else:
-            reasoning_chain_dict["steps"] = []
-        
-        return reasoning_chain_dict
-    except Exception as e:
-        logger.error(f"Error converting reasoning_chain to dict: {e}", exc_info=True)
-        return None
+    return serialize_reasoning_chain(reasoning_chain)
 
 
 class MCPWarehouseState(TypedDict):
@@ -212,10 +244,11 @@ class MCPWarehouseState(TypedDict):
     session_id: str
     mcp_results: Optional[Any]  # MCP execution results
     tool_execution_plan: Optional[List[Dict[str, Any]]]  # Planned tool executions
-    available_tools: Optional[List[Dict[str, Any]]]  # Available MCP tools
+    available_tools: Optional[Sequence[Dict[str, Any]]]  # Available MCP tools (catalog summaries)
     enable_reasoning: bool  # Enable advanced reasoning
     reasoning_types: Optional[List[str]]  # Specific reasoning types to use
     reasoning_chain: Optional[Dict[str, Any]]  # Reasoning chain from agents
+    intents: Optional[List[str]]  # Agent intents to fan out to, primary first
 
 
 class MCPIntentClassifier:
@@ -398,7 +431,7 @@ class MCPIntentClassifier:
             # Only override if base_intent is "general" (uncertain) - don't override specific classifications
             if self.tool_discovery and len(self.tool_discovery.discovered_tools) > 0 and base_intent == "general":
                 # Search for tools that might help with intent classification
-                relevant_tools = await self.tool_discovery.search_tools(message)
+                relevant_tools = await self.tool_discovery.search_tools(message, limit=3)
                 
                 # If we found relevant tools, use them to refine the intent
                 if relevant_tools:
@@ -449,162 +482,174 @@ class MCPIntentClassifier:
         "projection",
     ]
 
+    # Emergency/urgent safety keywords that should always route to safety
+    EMERGENCY_KEYWORDS = [
+        "flooding", "flood", "fire", "spill", "leak", "urgent", "critical",
+        "emergency", "evacuate", "evacuation", "issue", "problem", "malfunction",
+        "failure", "accident", "injury", "hazard", "danger", "unsafe"
+    ]
+
+    # Safety context indicators (broader list)
+    SAFETY_CONTEXT_INDICATORS = [
+        "procedure", "procedures", "policy", "policies", "incident", "incidents",
+        "compliance", "safety", "ppe", "hazard", "hazards", "report", "reporting",
+        "training", "audit", "checklist", "protocol", "guidelines", "standards",
+        "regulations", "lockout", "tagout", "loto", "corrective", "action",
+        "investigation", "violation", "breach", "concern", "flooding", "flood",
+        "issue", "issues", "problem", "problems", "emergency", "urgent", "critical"
+    ]
+
+    # Document keywords that are specific enough to route on their own
+    # ("process" alone is too generic)
+    DOCUMENT_INDICATORS = [k for k in DOCUMENT_KEYWORDS if k != "process"]
+
+    EQUIPMENT_INDICATORS = [
+        "available", "availability", "status", "utilization", "maintenance",
+        "telemetry", "assignment", "assign", "dispatch", "deploy"
+    ]
+    EQUIPMENT_OBJECTS = [
+        "forklift", "forklifts", "scanner", "scanners", "conveyor", "conveyors",
+        "truck", "trucks", "amr", "agv", "equipment", "machine", "machines",
+        "asset", "assets"
+    ]
+
+    # Terms that make an equipment query a safety query
+    SAFETY_EQUIPMENT_TERMS = [
+        "safety", "incident", "accident", "hazard", "danger", "unsafe",
+        "issue", "problem", "malfunction", "failure", "emergency", "urgent"
+    ]
+
+    # Terms that make an equipment query a workflow query
+    WORKFLOW_TERMS = ["wave", "order", "create", "pick", "pack", "task", "workflow"]
+
+    # Workflow terms that confirm an operations match
+    OPERATIONS_WORKFLOW_TERMS = [
+        "task", "wave", "order", "create", "pick", "pack", "management",
+        "workflow", "dispatch"
+    ]
+
+    AMBIGUOUS_PATTERNS = ["inventory", "management", "help", "assistance", "support"]
+
+    # Requests to change something; such messages are not fanned out, so the
+    # one agent that owns the action coordinates it
+    ACTION_TERMS = [
+        "create", "dispatch", "assign", "reassign", "deploy", "schedule",
+        "allocate", "update", "cancel", "submit", "upload", "report", "log",
+    ]
+
+    # Keyword lists that show a clause is really about an agent's domain
+    INTENT_SIGNALS = {
+        "forecasting": ("forecasting",),
+        "safety": ("safety", "emergency"),
+        "document": ("document",),
+        "equipment": ("equipment", "equipment_objects"),
+        "operations": ("operations",),
+    }
+
+    _keyword_matcher: Optional[KeywordMatcher] = None
+
+    @classmethod
+    def _get_keyword_matcher(cls) -> KeywordMatcher:
+        """Matcher for all keyword lists, compiled on first use."""
+        if cls._keyword_matcher is None:
+            cls._keyword_matcher = KeywordMatcher({
+                "forecasting": cls.FORECASTING_KEYWORDS,
+                "safety": cls.SAFETY_KEYWORDS,
+                "emergency": cls.EMERGENCY_KEYWORDS,
+                "safety_context": cls.SAFETY_CONTEXT_INDICATORS,
+                "document": cls.DOCUMENT_INDICATORS,
+                "equipment_indicators": cls.EQUIPMENT_INDICATORS,
+                "equipment_objects": cls.EQUIPMENT_OBJECTS,
+                "safety_equipment": cls.SAFETY_EQUIPMENT_TERMS,
+                "workflow": cls.WORKFLOW_TERMS,
+                "operations": cls.OPERATIONS_KEYWORDS,
+                "operations_workflow": cls.OPERATIONS_WORKFLOW_TERMS,
+                "equipment": cls.EQUIPMENT_KEYWORDS,
+                "ambiguous": cls.AMBIGUOUS_PATTERNS,
+                "actions": cls.ACTION_TERMS,
+            })
+        return cls._keyword_matcher
+
     @classmethod
     def classify_intent(cls, message: str) -> str:
         """Enhanced intent classification with better logic and ambiguity handling."""
-        message_lower = message.lower()
-        
+        # One scan of the message finds the hits for every keyword list
+        hits = cls._get_keyword_matcher().match(message)
+
         # Check for forecasting-related keywords (high priority)
-        forecasting_score = sum(
-            1 for keyword in cls.FORECASTING_KEYWORDS if keyword in message_lower
-        )
-        if forecasting_score > 0:
+        if hits["forecasting"]:
             return "forecasting"
 
         # Check for specific safety-related queries first (highest priority)
         # Safety queries should take precedence over equipment/operations
-        safety_score = sum(
-            1 for keyword in cls.SAFETY_KEYWORDS if keyword in message_lower
-        )
-        
-        # Emergency/urgent safety keywords that should always route to safety
-        emergency_keywords = [
-            "flooding", "flood", "fire", "spill", "leak", "urgent", "critical", 
-            "emergency", "evacuate", "evacuation", "issue", "problem", "malfunction",
-            "failure", "accident", "injury", "hazard", "danger", "unsafe"
-        ]
-        has_emergency = any(keyword in message_lower for keyword in emergency_keywords)
-        
-        # Safety context indicators (broader list)
-        safety_context_indicators = [
-            "procedure", "procedures", "policy", "policies", "incident", "incidents",
-            "compliance", "safety", "ppe", "hazard", "hazards", "report", "reporting",
-            "training", "audit", "checklist", "protocol", "guidelines", "standards",
-            "regulations", "lockout", "tagout", "loto", "corrective", "action",
-            "investigation", "violation", "breach", "concern", "flooding", "flood",
-            "issue", "issues", "problem", "problems", "emergency", "urgent", "critical"
-        ]
-        
+        safety_score = len(hits["safety"])
+
         # Route to safety if:
         # 1. Has emergency keywords (highest priority)
         # 2. Has safety keywords AND safety context indicators
         # 3. Has high safety score (multiple safety keywords)
-        if has_emergency or (safety_score > 0 and any(
-            indicator in message_lower for indicator in safety_context_indicators
-        )) or safety_score >= 2:
+        if hits["emergency"] or (safety_score > 0 and hits["safety_context"]) or safety_score >= 2:
             return "safety"
 
         # Check for document-related keywords (but only if it's clearly document-related)
-        document_indicators = [
-            "document",
-            "upload",
-            "scan",
-            "extract",
-            "pdf",
-            "image",
-            "invoice",
-            "receipt",
-            "bol",
-            "bill of lading",
-            "purchase order",
-            "po",
-            "quality",
-            "validation",
-            "approve",
-            "review",
-            "ocr",
-            "text extraction",
-            "file",
-            "photo",
-            "picture",
-            "documentation",
-            "paperwork",
-            "neural",
-            "nemo",
-            "retriever",
-            "parse",
-            "vision",
-            "multimodal",
-            "document processing",
-            "document analytics",
-            "document search",
-            "document status",
-        ]
-        if any(keyword in message_lower for keyword in document_indicators):
+        if hits["document"]:
             return "document"
 
         # Check for equipment-specific queries (availability, status, assignment)
-        # But only if it's not a workflow operation AND not a safety issue
-        equipment_indicators = [
-            "available", "availability", "status", "utilization", "maintenance",
-            "telemetry", "assignment", "assign", "dispatch", "deploy"
-        ]
-        equipment_objects = [
-            "forklift", "forklifts", "scanner", "scanners", "conveyor", "conveyors",
-            "truck", "trucks", "amr", "agv", "equipment", "machine", "machines",
-            "asset", "assets"
-        ]
-
-        # Exclude safety-related equipment queries
-        safety_equipment_terms = [
-            "safety", "incident", "accident", "hazard", "danger", "unsafe",
-            "issue", "problem", "malfunction", "failure", "emergency", "urgent"
-        ]
-        is_safety_equipment_query = any(term in message_lower for term in safety_equipment_terms)
-
         # Only route to equipment if it's a pure equipment query (not workflow-related, not safety-related)
-        workflow_terms = ["wave", "order", "create", "pick", "pack", "task", "workflow"]
-        is_workflow_query = any(term in message_lower for term in workflow_terms)
-
         if (
-            not is_workflow_query
-            and not is_safety_equipment_query
-            and any(indicator in message_lower for indicator in equipment_indicators)
-            and any(obj in message_lower for obj in equipment_objects)
+            not hits["workflow"]
+            and not hits["safety_equipment"]
+            and hits["equipment_indicators"]
+            and hits["equipment_objects"]
         ):
             return "equipment"
 
         # Check for operations-related keywords (workflow, tasks, management)
-        operations_score = sum(
-            1 for keyword in cls.OPERATIONS_KEYWORDS if keyword in message_lower
-        )
-        if operations_score > 0:
-            # Prioritize operations for workflow-related terms
-            workflow_terms = [
-                "task",
-                "wave",
-                "order",
-                "create",
-                "pick",
-                "pack",
-                "management",
-                "workflow",
-                "dispatch",
-            ]
-            if any(term in message_lower for term in workflow_terms):
-                return "operations"
+        # Prioritize operations for workflow-related terms
+        if hits["operations"] and hits["operations_workflow"]:
+            return "operations"
 
         # Check for equipment-related keywords (fallback)
-        equipment_score = sum(
-            1 for keyword in cls.EQUIPMENT_KEYWORDS if keyword in message_lower
-        )
-        if equipment_score > 0:
+        if hits["equipment"]:
             return "equipment"
 
         # Handle ambiguous queries
-        ambiguous_patterns = [
-            "inventory",
-            "management",
-            "help",
-            "assistance",
-            "support",
-        ]
-        if any(pattern in message_lower for pattern in ambiguous_patterns):
+        if hits["ambiguous"]:
             return "ambiguous"
 
         # Default to equipment for general queries
         return "equipment"
 
+    @classmethod
+    def detect_intents(cls, message: str) -> List[str]:
+        """
+        Find the agent intents of a multi-intent message.
+
+        Each clause ("which forklifts are down" / "what does that do to
+        today's pick waves") is classified on its own.
+
+        Returns:
+            The distinct intents in clause order, or an empty list when the
+            message asks a single agent or requests an action
+        """
+        matcher = cls._get_keyword_matcher()
+        if matcher.match(message)["actions"]:
+            return []
+
+        intents: List[str] = []
+        for clause in _CLAUSE_SPLIT_RE.split(message):
+            if not clause.strip():
+                continue
+            intent = cls.classify_intent(clause)
+            if intent not in cls.INTENT_SIGNALS or intent in intents:
+                continue
+            # classify_intent defaults to equipment; count only real matches
+            hits = matcher.match(clause)
+            if any(hits[signal] for signal in cls.INTENT_SIGNALS[intent]):
+                intents.append(intent)
+        return intents if len(intents) > 1 else []
+
 
 class MCPPlannerGraph:
     """MCP-enabled planner graph for warehouse operations."""
@@ -667,7 +712,7 @@ class MCPPlannerGraph:
         workflow = StateGraph(MCPWarehouseState)
 
         # Add nodes
-        workflow.add_node("route_intent", self._mcp_route_intent)
+        workflow.add_node("route_intent", self._mcp_route_intent_gated)
         workflow.add_node("equipment", self._mcp_equipment_agent)
         workflow.add_node("operations", self._mcp_operations_agent)
         workflow.add_node("safety", self._mcp_safety_agent)
@@ -675,6 +720,7 @@ class MCPPlannerGraph:
         workflow.add_node("document", self._mcp_document_agent)
         workflow.add_node("general", self._mcp_general_agent)
         workflow.add_node("ambiguous", self._handle_ambiguous_query)
+        workflow.add_node("fan_out", self._mcp_fan_out)
         workflow.add_node("synthesize", self._mcp_synthesize_response)
 
         # Set entry point
@@ -692,6 +738,7 @@ class MCPPlannerGraph:
                 "document": "document",
                 "general": "general",
                 "ambiguous": "ambiguous",
+                "fan_out": "fan_out",
             },
         )
 
@@ -703,6 +750,7 @@ class MCPPlannerGraph:
         workflow.add_edge("document", "synthesize")
         workflow.add_edge("general", "synthesize")
         workflow.add_edge("ambiguous", "synthesize")
+        workflow.add_edge("fan_out", "synthesize")
 
         # Add edge from synthesis to end
         workflow.add_edge("synthesize", END)
@@ -712,6 +760,94 @@ class MCPPlannerGraph:
         # If persistence is needed, use a secure checkpoint backend (e.g., Postgres).
         return workflow.compile()  # No checkpointer = in-memory state
 
+    async def _mcp_route_intent_gated(self, state: MCPWarehouseState) -> MCPWarehouseState:
+        """
+        Route the message, then hold until the input safety verdict is known.
+
+        With speculative guardrails the chat endpoint runs the input safety check
+        concurrently with routing; every agent node follows this one, so no agent
+        work starts for a message that is later blocked.
+        """
+        state = await self._mcp_route_intent(state)
+        with span("guardrails.wait"):
+            await wait_for_input_safety()
+        return state
+
+    async def _classify_route(self, message_text: str) -> Tuple[str, float]:
+        """Classify a message with keyword, MCP and semantic routing. Returns (intent, confidence)."""
+        # Use MCP-enhanced intent classification (keyword-based)
+        with span("routing.keyword"):
+            intent_result = await self.intent_classifier.classify_intent_with_mcp(message_text)
+
+        # Extract intent string from result (it's a dict)
+        keyword_intent = intent_result.get("intent", "general") if isinstance(intent_result, dict) else intent_result
+        keyword_confidence = intent_result.get("confidence", 0.7) if isinstance(intent_result, dict) else 0.7
+
+        # Special handling: If keyword classification found worker-related terms, prioritize operations
+        # This prevents semantic router from overriding correct worker classification
+        message_lower = message_text.lower()
+        worker_keywords = ["worker", "workers", "workforce", "employee", "employees", "staff", "team members", "personnel"]
+        has_worker_keywords = any(keyword in message_lower for keyword in worker_keywords)
+
+        if has_worker_keywords and keyword_intent != "operations":
+            logger.info(f"🔧 Overriding intent from '{keyword_intent}' to 'operations' due to worker keywords")
+            keyword_intent = "operations"
+            keyword_confidence = 0.9  # High confidence for explicit worker queries
+
+        # Enhance with semantic routing
+        try:
+            from src.api.services.routing.semantic_router import get_semantic_router
+            semantic_router = await get_semantic_router()
+
+            # If we have high confidence worker keywords, skip semantic routing to avoid override
+            if has_worker_keywords:
+                intent = "operations"
+                confidence = 0.9
+                logger.info(f"🔧 Using operations intent directly for worker query (skipping semantic override)")
+            else:
+                with span("routing.semantic"):
+                    intent, confidence = await semantic_router.classify_intent_semantic(
+                        message_text,
+                        keyword_intent,
+                        keyword_confidence=keyword_confidence
+                    )
+                logger.info(f"Semantic routing: keyword={keyword_intent}, semantic={intent}, confidence={confidence:.2f}")
+        except Exception as e:
+            logger.warning(f"Semantic routing failed, using keyword-based: {e}")
+            intent = keyword_intent
+            confidence = keyword_confidence
+        return intent, confidence
+
+    async def route_messages(self, messages: List[str]) -> List[Tuple[str, float]]:
+        """
+        Classify several messages together.
+
+        All query embeddings are generated in one batched embedding call up
+        front, so the per-message semantic routing below reuses them.
+
+        Args:
+            messages: User messages
+
+        Returns:
+            (intent, confidence) per message
+        """
+        try:
+            from src.api.services.routing.semantic_router import get_semantic_router
+            semantic_router = await get_semantic_router()
+            await semantic_router.embed_queries(messages)
+        except Exception as e:
+            logger.warning(f"Batch query embedding failed, routing messages individually: {e}")
+
+        routes = []
+        for message in messages:
+            try:
+                routes.append(await self._classify_route(message))
+            except Exception as e:
+                logger.error(f"❌ Error routing batch message: {e}")
+                routes.append(("general", 0.5))
+        return routes
+
+    @traced("planner.route_intent")
     async def _mcp_route_intent(self, state: MCPWarehouseState) -> MCPWarehouseState:
         """Route user message using MCP-enhanced intent classification with semantic routing."""
         try:
@@ -722,62 +858,45 @@ class MCPPlannerGraph:
                 state["routing_decision"] = "general"
                 return state
 
-            # Use MCP-enhanced intent classification (keyword-based)
-            intent_result = await self.intent_classifier.classify_intent_with_mcp(message_text)
-            
-            # Extract intent string from result (it's a dict)
-            keyword_intent = intent_result.get("intent", "general") if isinstance(intent_result, dict) else intent_result
-            keyword_confidence = intent_result.get("confidence", 0.7) if isinstance(intent_result, dict) else 0.7
-            
-            # Special handling: If keyword classification found worker-related terms, prioritize operations
-            # This prevents semantic router from overriding correct worker classification
-            message_lower = message_text.lower()
-            worker_keywords = ["worker", "workers", "workforce", "employee", "employees", "staff", "team members", "personnel"]
-            has_worker_keywords = any(keyword in message_lower for keyword in worker_keywords)
-            
-            if has_worker_keywords and keyword_intent != "operations":
-                logger.info(f"🔧 Overriding intent from '{keyword_intent}' to 'operations' due to worker keywords")
-                keyword_intent = "operations"
-                keyword_confidence = 0.9  # High confidence for explicit worker queries
-            
-            # Enhance with semantic routing
-            try:
-                from src.api.services.routing.semantic_router import get_semantic_router
-                semantic_router = await get_semantic_router()
-                
-                # If we have high confidence worker keywords, skip semantic routing to avoid override
-                if has_worker_keywords:
-                    intent = "operations"
-                    confidence = 0.9
-                    logger.info(f"🔧 Using operations intent directly for worker query (skipping semantic override)")
-                else:
-                    intent, confidence = await semantic_router.classify_intent_semantic(
-                        message_text,
-                        keyword_intent,
-                        keyword_confidence=keyword_confidence
-                    )
-                    logger.info(f"Semantic routing: keyword={keyword_intent}, semantic={intent}, confidence={confidence:.2f}")
-            except Exception as e:
-                logger.warning(f"Semantic routing failed, using keyword-based: {e}")
-                intent = keyword_intent
-                confidence = keyword_confidence
+            route_hint = _route_hint.get()
+            if route_hint is not None and route_hint[0] == message_text:
+                # Already classified by a batch request (route_messages)
+                _, intent, confidence = route_hint
+            else:
+                intent, confidence = await self._classify_route(message_text)
             
             state["user_intent"] = intent
             state["routing_decision"] = intent
             state["routing_confidence"] = confidence
 
-            # Discover available tools for this query
-            if self.tool_discovery:
-                available_tools = await self.tool_discovery.get_available_tools()
-                state["available_tools"] = [
-                    {
-                        "tool_id": tool.tool_id,
-                        "name": tool.name,
-                        "description": tool.description,
-                        "category": tool.category.value,
-                    }
-                    for tool in available_tools
+            # Multi-intent queries fan out to every agent they ask about
+            intents = [intent]
+            if MULTI_INTENT_ENABLED and intent in FANOUT_INTENTS:
+                intents += [
+                    i for i in MCPIntentClassifier.detect_intents(message_text) if i != intent
                 ]
+            state["intents"] = intents[:MAX_FANOUT_INTENTS]
+            emit_chat_event(
+                EVENT_ROUTING,
+                {
+                    "intent": intent,
+                    "route": intent,
+                    "confidence": confidence,
+                    "intents": state["intents"],
+                },
+            )
+
+            # Available tools come from the current catalog snapshot, which
+            # is shared read-only by all requests
+            if self.tool_discovery:
+                catalog = self.tool_discovery.get_catalog()
+                state["available_tools"] = catalog.summaries
+                # With embedding retrieval, only the tools closest to the query
+                retrieved = await self.tool_discovery.retrieve_tools_for_query(message_text)
+                if retrieved is not None:
+                    state["available_tools"] = self.tool_discovery.get_catalog().summaries_for(
+                        tool.tool_id for tool in retrieved
+                    )
 
             # Sanitize user-controlled message before logging
             safe_message_text = sanitize_log_data(message_text, max_length=100)
@@ -899,6 +1018,7 @@ class MCPPlannerGraph:
 
         return state
 
+    @traced("agent.equipment")
     async def _mcp_equipment_agent(self, state: MCPWarehouseState) -> MCPWarehouseState:
         """Handle equipment queries using MCP-enabled Equipment Agent."""
         try:
@@ -979,6 +1099,7 @@ class MCPPlannerGraph:
 
         return state
 
+    @traced("agent.operations")
     async def _mcp_operations_agent(
         self, state: MCPWarehouseState
     ) -> MCPWarehouseState:
@@ -1052,6 +1173,7 @@ class MCPPlannerGraph:
 
         return state
 
+    @traced("agent.safety")
     async def _mcp_safety_agent(self, state: MCPWarehouseState) -> MCPWarehouseState:
         """Handle safety queries using MCP-enabled Safety Agent."""
         try:
@@ -1130,6 +1252,7 @@ class MCPPlannerGraph:
 
         return state
 
+    @traced("agent.forecasting")
     async def _mcp_forecasting_agent(self, state: MCPWarehouseState) -> MCPWarehouseState:
         """Handle forecasting queries using MCP-enabled Forecasting Agent."""
         try:
@@ -1195,6 +1318,7 @@ class MCPPlannerGraph:
 
         return state
 
+    @traced("agent.document")
     async def _mcp_document_agent(self, state: MCPWarehouseState) -> MCPWarehouseState:
         """Handle document-related queries with MCP tool discovery."""
         try:
@@ -1260,6 +1384,7 @@ class MCPPlannerGraph:
 
         return state
 
+    @traced("agent.general")
     async def _mcp_general_agent(self, state: MCPWarehouseState) -> MCPWarehouseState:
         """Handle general queries with MCP tool discovery."""
         try:
@@ -1271,8 +1396,11 @@ class MCPPlannerGraph:
 
             # Use MCP tools to help with general queries
             if self.tool_discovery and len(self.tool_discovery.discovered_tools) > 0:
-                # Search for relevant tools
-                relevant_tools = await self.tool_discovery.search_tools(message_text)
+                # Search for relevant tools; the tool is executed, so every
+                # word of the message has to match it
+                relevant_tools = await self.tool_discovery.search_tools(
+                    message_text, limit=1, match_all=True
+                )
 
                 if relevant_tools:
                     # Use the most relevant tool
@@ -1304,12 +1432,113 @@ class MCPPlannerGraph:
 
         return state
 
+    @traced("planner.fan_out")
+    async def _mcp_fan_out(self, state: MCPWarehouseState) -> MCPWarehouseState:
+        """
+        Run the agents of a multi-intent query concurrently.
+
+        All branches share one deadline (the agent timeout for the query), so
+        the query takes as long as its slowest branch rather than the sum of
+        them. A branch that misses the deadline is cancelled and answered with
+        a timeout response; the others are kept. Per-branch latency and status
+        are recorded in ``context["branches"]``.
+
+        Branches do not stream tokens: concurrent generations would interleave
+        in the one stream. The merged text is streamed once by synthesis.
+        """
+        agent_nodes = {
+            "equipment": self._mcp_equipment_agent,
+            "operations": self._mcp_operations_agent,
+            "safety": self._mcp_safety_agent,
+            "forecasting": self._mcp_forecasting_agent,
+            "document": self._mcp_document_agent,
+        }
+        intents = [i for i in state.get("intents") or [] if i in agent_nodes]
+        message_text = _extract_message_text(state) or ""
+        deadline = _calculate_agent_timeout(
+            state.get("enable_reasoning", False), _detect_complex_query(message_text)
+        )
+        branches: Dict[str, Dict[str, Any]] = {}
+
+        async def run_branch(intent: str) -> Tuple[float, Any, Optional[Exception]]:
+            # The task runs in a copy of the request context, so this only
+            # affects the branch
+            set_chat_stream_sink(None)
+            # Each branch gets its own response dict and context, so branches
+            # never see each other's partial results
+            branch_state = {
+                **state,
+                "agent_responses": {},
+                "context": dict(state.get("context") or {}),
+            }
+            start = time.perf_counter()
+            error = None
+            try:
+                await agent_nodes[intent](branch_state)
+            except Exception as e:
+                error = e
+            latency_ms = round((time.perf_counter() - start) * 1000, 1)
+            return latency_ms, branch_state["agent_responses"].get(intent), error
+
+        start = time.perf_counter()
+        tasks = {intent: asyncio.ensure_future(run_branch(intent)) for intent in intents}
+        try:
+            if tasks:
+                await asyncio.wait(tasks.values(), timeout=deadline)
+        finally:
+            # Also runs when the node itself is cancelled (query timeout,
+            # client disconnect): no branch outlives the fan-out
+            elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+            pending = [task for task in tasks.values() if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        for intent, task in tasks.items():
+            if task.cancelled():
+                error = TimeoutError(f"{intent} agent missed the {deadline}s multi-intent deadline")
+                state["agent_responses"][intent] = _create_error_response(
+                    intent, message_text, error, is_timeout=True
+                )
+                branches[intent] = {"latency_ms": elapsed_ms, "status": "timeout"}
+                continue
+
+            latency_ms, response, error = task.result()
+            if error is not None or response is None:
+                state["agent_responses"][intent] = _create_error_response(
+                    intent, message_text, error or RuntimeError(f"{intent} agent returned no response"),
+                    is_timeout=False,
+                )
+                branches[intent] = {"latency_ms": latency_ms, "status": "error"}
+            else:
+                state["agent_responses"][intent] = response
+                branches[intent] = {"latency_ms": latency_ms, "status": "ok"}
+
+        state["context"]["branches"] = branches
+        logger.info(
+            "Multi-intent fan-out: "
+            + ", ".join(f"{i}={b['latency_ms']}ms ({b['status']})" for i, b in branches.items())
+        )
+        return state
+
     def _mcp_synthesize_response(self, state: MCPWarehouseState) -> MCPWarehouseState:
         """Synthesize final response from MCP agent outputs."""
         try:
             routing_decision = state.get("routing_decision", "general")
             agent_responses = state.get("agent_responses", {})
 
+            intents = state.get("intents") or []
+            if len(intents) > 1:
+                # Fan-out: the branches' responses become one response for the route
+                merged = _merge_agent_responses(
+                    intents, agent_responses, state["context"].get("branches", {})
+                )
+                agent_responses = {**agent_responses, routing_decision: merged}
+                sink = get_chat_stream_sink()
+                if sink is not None:
+                    sink.text_segment(merged["natural_language"])
+
             logger.info(f"🔍 Synthesizing response for routing_decision: {routing_decision}")
             logger.info(f"🔍 Available agent_responses keys: {list(agent_responses.keys())}")
 
@@ -1485,8 +1714,11 @@ class MCPPlannerGraph:
     def _route_to_agent(self, state: MCPWarehouseState) -> str:
         """Route to the appropriate agent based on MCP intent classification."""
         routing_decision = state.get("routing_decision", "general")
+        if len(state.get("intents") or []) > 1:
+            return "fan_out"
         return routing_decision
 
+    @traced("planner")
     async def process_warehouse_query(
         self, message: str, session_id: str = "default", context: Optional[Dict] = None
     ) -> Dict[str, any]:
@@ -1536,6 +1768,7 @@ class MCPPlannerGraph:
                 enable_reasoning=enable_reasoning,
                 reasoning_types=reasoning_types,
                 reasoning_chain=None,
+                intents=None,
             )
 
             # Run the graph asynchronously with timeout
@@ -1592,6 +1825,7 @@ class MCPPlannerGraph:
                 "mcp_tools_used": context.get("mcp_tools_used", []),
                 "tool_execution_results": context.get("tool_execution_results", {}),
                 "available_tools": result.get("available_tools", []),
+                "intents": result.get("intents") or [result.get("routing_decision", "unknown")],
             }
 
         except Exception as e:
@@ -1637,17 +1871,19 @@ class MCPPlannerGraph:
         }
 
 
+async def _create_mcp_planner_graph() -> MCPPlannerGraph:
+    planner = MCPPlannerGraph()
+    await planner.initialize()
+    return planner
+
+
 # Global MCP planner graph instance
-_mcp_planner_graph = None
+_mcp_planner_graph: AsyncSingleton[MCPPlannerGraph] = AsyncSingleton(_create_mcp_planner_graph)
 
 
 async def get_mcp_planner_graph() -> MCPPlannerGraph:
     """Get the global MCP planner graph instance."""
-    global _mcp_planner_graph
-    if _mcp_planner_graph is None:
-        _mcp_planner_graph = MCPPlannerGraph()
-        await _mcp_planner_graph.initialize()
-    return _mcp_planner_graph
+    return await _mcp_planner_graph.get()
 
 
 async def process_mcp_warehouse_query(
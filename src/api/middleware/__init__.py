@@ -16,8 +16,20 @@
 """Middleware components for the API."""
 
 from .security_headers import SecurityHeadersMiddleware
-
-__all__ = ["SecurityHeadersMiddleware"]
+from .lazy_routers import LazyRouterMiddleware
+from .request_pipeline import (
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    RequestSizeLimitMiddleware,
+)
+
+__all__ = [
+    "SecurityHeadersMiddleware",
+    "LazyRouterMiddleware",
+    "MetricsMiddleware",
+    "RateLimitMiddleware",
+    "RequestSizeLimitMiddleware",
+]
 
 
 
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lazy Router Middleware
+
+Pure ASGI middleware that registers a deferred route group (see
+``src.api.services.startup.routers``) before the first request to its
+paths reaches the router, and every deferred group before the OpenAPI
+schema is served, so ``/docs`` stays complete.
+"""
+
+from fastapi import HTTPException, status
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.api.services.startup.routers import RouterRegistry
+from src.api.utils.error_handler import handle_http_exception
+
+
+class LazyRouterMiddleware:
+    """Load deferred route groups on first use."""
+
+    def __init__(self, app: ASGIApp, registry: RouterRegistry, openapi_path: str = "/openapi.json"):
+        self.app = app
+        self.registry = registry
+        self.openapi_path = openapi_path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket") or not self.registry.has_deferred:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path == self.openapi_path:
+            self.registry.load_all(trigger=path)
+        else:
+            group = self.registry.deferred_group_for(path)
+            if group is not None and not self.registry.load(group.name, trigger=path) and scope["type"] == "http":
+                response = await handle_http_exception(
+                    Request(scope, receive),
+                    HTTPException(
+                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        detail=f"The {group.name} API is unavailable",
+                    ),
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Request Pipeline Middleware
+
+Pure ASGI middleware for rate limiting, request size limits and request
+metrics. Unlike ``@app.middleware("http")`` functions these do not wrap the
+response in a background task and memory stream, so per-request overhead is
+lower and streaming responses (``/chat/stream``) pass through unbuffered.
+"""
+
+import logging
+import time
+from typing import Awaitable, Callable, FrozenSet, Optional
+
+from fastapi import HTTPException, status
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.services.monitoring.metrics import metrics_collector
+from src.api.services.security.rate_limiter import get_rate_limiter
+from src.api.utils.error_handler import handle_http_exception
+
+logger = logging.getLogger(__name__)
+
+# Paths that are never rate limited
+RATE_LIMIT_EXEMPT_PATHS: FrozenSet[str] = frozenset(
+    {
+        "/health",
+        "/api/v1/health",
+        "/api/v1/health/simple",
+        "/api/v1/metrics",
+        "/docs",
+        "/openapi.json",
+        "/",
+    }
+)
+
+
+async def _send_http_exception(scope: Scope, receive: Receive, send: Send, exc: HTTPException) -> None:
+    """Render an HTTPException with the app's standard error body."""
+    response = await handle_http_exception(Request(scope, receive), exc)
+    if exc.headers:
+        response.headers.update(exc.headers)
+    await response(scope, receive, send)
+
+
+class RateLimitMiddleware:
+    """Reject requests that exceed the configured rate limits (fails open)."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        exempt_paths: FrozenSet[str] = RATE_LIMIT_EXEMPT_PATHS,
+        limiter_factory: Callable[[], Awaitable] = get_rate_limiter,
+    ):
+        self.app = app
+        self.exempt_paths = exempt_paths
+        self.limiter_factory = limiter_factory
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            rate_limiter = await self.limiter_factory()
+            # check_rate_limit raises HTTPException if limit exceeded
+            await rate_limiter.check_rate_limit(Request(scope))
+        except HTTPException as http_exc:
+            await _send_http_exception(scope, receive, send, http_exc)
+            return
+        except Exception as e:
+            logger.error(f"Rate limiting error: {e}", exc_info=True)
+            # Fail open - allow request if rate limiter fails
+
+        await self.app(scope, receive, send)
+
+
+class RequestSizeLimitMiddleware:
+    """Reject requests whose Content-Length exceeds the endpoint's limit."""
+
+    def __init__(self, app: ASGIApp, max_request_size: int, max_upload_size: int):
+        self.app = app
+        self.max_request_size = max_request_size
+        self.max_upload_size = max_upload_size
+
+    def _limit_for(self, path: str) -> int:
+        # "/document/upload" is covered by the "/upload" check
+        return self.max_upload_size if "/upload" in path else self.max_request_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                content_length = value
+                break
+
+        if content_length:
+            try:
+                size = int(content_length)
+            except ValueError:
+                # Invalid content-length, let it through (will be caught by FastAPI)
+                size = 0
+            max_size = self._limit_for(scope["path"])
+            if size > max_size:
+                await _send_http_exception(
+                    scope,
+                    receive,
+                    send,
+                    HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Request too large. Maximum size: {max_size / 1024 / 1024:.1f}MB",
+                    ),
+                )
+                return
+
+        await self.app(scope, receive, send)
+
+
+class MetricsMiddleware:
+    """Record Prometheus request count and duration for every HTTP request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Duration covers the full response body, including streamed ones
+            metrics_collector.observe_http_request(
+                scope["method"], scope["path"], status_code, time.perf_counter() - start_time
+            )
@@ -19,15 +19,50 @@ Security Headers Middleware
 Adds security headers to all HTTP responses to improve security posture.
 """
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Content Security Policy
+# Allow same-origin, API endpoints, and common CDNs
+CONTENT_SECURITY_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "  # unsafe-inline/eval for React dev
+    "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com; "
+    "font-src 'self' https://fonts.gstatic.com; "
+    "img-src 'self' data: https:; "
+    "connect-src 'self' https://api.nvidia.com https://integrate.api.nvidia.com; "
+    "frame-ancestors 'none'; "
+    "base-uri 'self'; "
+    "form-action 'self'"
+)
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+# Permissions Policy (formerly Feature-Policy)
+PERMISSIONS_POLICY = (
+    "geolocation=(), "
+    "microphone=(), "
+    "camera=(), "
+    "payment=(), "
+    "usb=(), "
+    "magnetometer=(), "
+    "gyroscope=(), "
+    "speaker=()"
+)
+
+SECURITY_HEADERS = {
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Content-Security-Policy": CONTENT_SECURITY_POLICY,
+    "Permissions-Policy": PERMISSIONS_POLICY,
+}
+
+
+class SecurityHeadersMiddleware:
     """
     Middleware to add security headers to all responses.
     
@@ -39,51 +74,25 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - Referrer-Policy: Controls referrer information
     - Content-Security-Policy: Restricts resource loading
     - Permissions-Policy: Controls browser features
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        """Add security headers to response."""
-        response = await call_next(request)
-        
-        # Add security headers
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        
-        # Content Security Policy
-        # Allow same-origin, API endpoints, and common CDNs
-        csp = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "  # unsafe-inline/eval for React dev
-            "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com; "
-            "font-src 'self' https://fonts.gstatic.com; "
-            "img-src 'self' data: https:; "
-            "connect-src 'self' https://api.nvidia.com https://integrate.api.nvidia.com; "
-            "frame-ancestors 'none'; "
-            "base-uri 'self'; "
-            "form-action 'self'"
-        )
-        response.headers["Content-Security-Policy"] = csp
-        
-        # Permissions Policy (formerly Feature-Policy)
-        permissions_policy = (
-            "geolocation=(), "
-            "microphone=(), "
-            "camera=(), "
-            "payment=(), "
-            "usb=(), "
-            "magnetometer=(), "
-            "gyroscope=(), "
-            "speaker=()"
-        )
-        response.headers["Permissions-Policy"] = permissions_policy
-        
-        return response
-
 
+    Implemented as pure ASGI middleware: headers are set on the
+    ``http.response.start`` message, so response bodies (including
+    streamed ones) are passed through untouched.
+    """
 
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in SECURITY_HEADERS.items():
+                    headers[name] = value
+            await send(message)
 
+        await self.app(scope, receive, send_with_headers)
@@ -14,14 +14,26 @@
 # limitations under the License.
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 import logging
 import asyncio
+import os
 import re
 import time
-from src.api.graphs.mcp_integrated_planner_graph import get_mcp_planner_graph
+from src.api.graphs.mcp_integrated_planner_graph import (
+    get_mcp_planner_graph,
+    reset_route_hint,
+    set_route_hint,
+)
 from src.api.services.guardrails.guardrails_service import guardrails_service
+from src.api.services.guardrails.safety_gate import (
+    SafetyGate,
+    is_speculative_guardrails_enabled,
+    reset_safety_gate,
+    set_safety_gate,
+)
 from src.api.services.evidence.evidence_integration import (
     get_evidence_integration_service,
 )
@@ -36,9 +48,36 @@ from src.api.services.validation import (
     get_response_validator,
 )
 from src.api.utils.log_utils import sanitize_log_data
+from src.api.utils.serialization import (
+    FastJSONResponse,
+    serialize_reasoning_chain,
+    serialize_reasoning_step,
+    to_jsonable,
+)
 from src.api.services.cache.query_cache import get_query_cache
+from src.api.services.cache.semantic_cache import (
+    get_semantic_cache,
+    is_semantic_cache_enabled,
+)
 from src.api.services.deduplication.request_deduplicator import get_request_deduplicator
+from src.api.services.enrichment.enrichment_pipeline import (
+    get_enrichment_pipeline,
+    is_deferred_enrichment_default,
+)
 from src.api.services.monitoring.performance_monitor import get_performance_monitor
+from src.api.services.monitoring.tracing import span, start_trace
+from src.api.services.streaming.chat_stream import (
+    ChatStreamSink,
+    emit_chat_event,
+    format_sse,
+    get_chat_stream_sink,
+    reset_chat_stream_sink,
+    set_chat_stream_sink,
+    EVENT_DONE,
+    EVENT_ERROR,
+    EVENT_EVIDENCE,
+    EVENT_QUICK_ACTIONS,
+)
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -47,6 +86,14 @@ router = APIRouter(prefix="/api/v1", tags=["Chat"])
 # Alias for backward compatibility
 _sanitize_log_data = sanitize_log_data
 
+# Maximum time spent embedding a query for the semantic cache lookup
+SEMANTIC_CACHE_LOOKUP_TIMEOUT = 2.0
+
+# /chat/batch limits: items per request, concurrent items, concurrent items per agent
+CHAT_BATCH_MAX_ITEMS = int(os.getenv("CHAT_BATCH_MAX_ITEMS", "50"))
+CHAT_BATCH_MAX_CONCURRENCY = int(os.getenv("CHAT_BATCH_MAX_CONCURRENCY", "8"))
+CHAT_BATCH_AGENT_CONCURRENCY = int(os.getenv("CHAT_BATCH_AGENT_CONCURRENCY", "4"))
+
 
 def _get_confidence_indicator(confidence: float) -> str:
     """Get confidence indicator emoji based on confidence score."""
@@ -267,121 +314,6 @@ def _format_user_response(
         return base_response
 
 
-def _convert_reasoning_step_to_dict(step: Any) -> Dict[str, Any]:
-    """
-    Convert a single reasoning step (dataclass, dict, or other) to a dictionary.
-    
-    Args:
-        step: Reasoning step to convert
-        
-    Returns:
-        Dictionary representation of the step
-    """
-    from dataclasses import is_dataclass
-    
-    if is_dataclass(step):
-        try:
-            step_dict = {
-                "step_id": getattr(step, "step_id", ""),
-                "step_type": getattr(step, "step_type", ""),
-                "description": getattr(step, "description", ""),
-                "reasoning": getattr(step, "reasoning", ""),
-                "confidence": float(getattr(step, "confidence", 0.0)),
-            }
-            # Convert timestamp
-            if hasattr(step, "timestamp"):
-                timestamp = getattr(step, "timestamp")
-                if hasattr(timestamp, "isoformat"):
-                    step_dict["timestamp"] = timestamp.isoformat()
-                else:
-                    step_dict["timestamp"] = str(timestamp)
-            
-            # Handle input_data and output_data - skip to avoid circular references
-            step_dict["input_data"] = {}
-            step_dict["output_data"] = {}
-                
-            if hasattr(step, "dependencies"):
-                deps = getattr(step, "dependencies")
-                step_dict["dependencies"] = list(deps) if deps and isinstance(deps, (list, tuple)) else []
-            else:
-                step_dict["dependencies"] = []
-                
-            return step_dict
-        except Exception as e:
-            logger.warning(f"Error converting reasoning step: {_sanitize_log_data(str(e))}")
-            return {"step_id": "error", "step_type": "error", 
-                   "description": "Error converting step", "reasoning": "", "confidence": 0.0}
-    elif isinstance(step, dict):
-        # Already a dict, just ensure it's serializable
-        return {k: v for k, v in step.items() 
-               if isinstance(v, (str, int, float, bool, type(None), list, dict))}
-    else:
-        return {"step_id": "unknown", "step_type": "unknown", 
-               "description": str(step), "reasoning": "", "confidence": 0.0}
-
-
-def _convert_reasoning_steps_to_list(steps: List[Any]) -> List[Dict[str, Any]]:
-    """
-    Convert a list of reasoning steps to a list of dictionaries.
-    
-    Args:
-        steps: List of reasoning steps to convert
-        
-    Returns:
-        List of dictionary representations
-    """
-    return [_convert_reasoning_step_to_dict(step) for step in steps]
-
-
-def _convert_reasoning_chain_to_dict(
-    reasoning_chain: Any,
-    safe_convert_value: callable,
-) -> Optional[Dict[str, Any]]:
-    """
-    Convert a ReasoningChain dataclass to a dictionary.
-    
-    Args:
-        reasoning_chain: ReasoningChain dataclass instance
-        safe_convert_value: Function to safely convert values
-        
-    Returns:
-        Dictionary representation or None if conversion fails
-    """
-    from dataclasses import is_dataclass
-    
-    try:
-        reasoning_chain_dict = {
-            "chain_id": getattr(reasoning_chain, "chain_id", ""),
-            "query": getattr(reasoning_chain, "query", ""),
-            "reasoning_type": getattr(reasoning_chain, "reasoning_type", ""),
-            "final_conclusion": getattr(reasoning_chain, "final_conclusion", ""),
-            "overall_confidence": float(getattr(reasoning_chain, "overall_confidence", 0.0)),
-            "execution_time": float(getattr(reasoning_chain, "execution_time", 0.0)),
-        }
-        # Convert enum to string
-        if hasattr(reasoning_chain_dict["reasoning_type"], "value"):
-            reasoning_chain_dict["reasoning_type"] = reasoning_chain_dict["reasoning_type"].value
-        # Convert datetime to ISO string
-        if hasattr(reasoning_chain, "created_at"):
-            created_at = getattr(reasoning_chain, "created_at")
-            if hasattr(created_at, "isoformat"):
-                reasoning_chain_dict["created_at"] = created_at.isoformat()
-            else:
-                reasoning_chain_dict["created_at"] = str(created_at)
-        
-        # Convert steps manually - be very careful with nested data
-        if hasattr(reasoning_chain, "steps") and reasoning_chain.steps:
-            reasoning_chain_dict["steps"] = _convert_reasoning_steps_to_list(reasoning_chain.steps)
-        else:
-            reasoning_chain_dict["steps"] = []
-        
-        logger.info(f"✅ Successfully converted reasoning_chain to dict with {len(reasoning_chain_dict.get('steps', []))} steps")
-        return reasoning_chain_dict
-    except Exception as e:
-        logger.error(f"Error converting reasoning_chain to dict: {_sanitize_log_data(str(e))}", exc_info=True)
-        return None
-
-
 def _extract_equipment_entities(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract equipment entities from structured response data.
@@ -462,6 +394,8 @@ class ChatRequest(BaseModel):
     context: Optional[Dict[str, Any]] = None
     enable_reasoning: bool = False  # Enable advanced reasoning capability
     reasoning_types: Optional[List[str]] = None  # Specific reasoning types to use
+    # Return before evidence/quick actions/context enrichment; None uses CHAT_DEFER_ENRICHMENTS
+    defer_enrichments: Optional[bool] = None
 
 
 class ChatResponse(BaseModel):
@@ -497,6 +431,33 @@ class ChatResponse(BaseModel):
     # Reasoning fields
     reasoning_chain: Optional[Dict[str, Any]] = None  # Complete reasoning chain
     reasoning_steps: Optional[List[Dict[str, Any]]] = None  # Individual reasoning steps
+    # Deferred enrichment fields (see /chat/{response_id}/enrichments)
+    response_id: Optional[str] = None
+    enrichments_pending: Optional[bool] = None
+
+
+# Fields that belong to the request that produced a response (its session,
+# conversation context and deferred enrichment job); a semantic cache hit
+# must not serve them to another request
+_REQUEST_SCOPED_RESPONSE_FIELDS = frozenset(
+    {"session_id", "context", "context_info", "conversation_enhanced", "response_id", "enrichments_pending"}
+)
+
+
+def _semantic_cache_scope(session_id: Optional[str]) -> str:
+    """Semantic cache scope: the session, unless SEMANTIC_CACHE_SCOPE=global."""
+    if os.getenv("SEMANTIC_CACHE_SCOPE", "session").lower() == "global":
+        return "global"
+    return session_id or "default"
+
+
+def _shareable_response(response_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """A response without its request-scoped fields, for the semantic cache."""
+    return {
+        key: value
+        for key, value in response_dict.items()
+        if key not in _REQUEST_SCOPED_RESPONSE_FIELDS
+    }
 
 
 def _create_fallback_chat_response(
@@ -585,6 +546,92 @@ def _create_simple_fallback_response(message: str, session_id: str) -> ChatRespo
     )
 
 
+def _clean_evidence_fields(
+    result: Dict[str, Any]
+) -> Tuple[Optional[Dict[str, Any]], Optional[List[Any]]]:
+    """Keep only serializable evidence_summary values and key_findings entries."""
+    cleaned_evidence_summary = None
+    cleaned_key_findings = None
+    if result.get("evidence_summary") and isinstance(result.get("evidence_summary"), dict):
+        evidence = result.get("evidence_summary")
+        cleaned_evidence_summary = {k: v for k, v in evidence.items() 
+                                  if isinstance(v, (str, int, float, bool, type(None), list))}
+    if result.get("key_findings") and isinstance(result.get("key_findings"), list):
+        findings = result.get("key_findings")
+        cleaned_key_findings = [f for f in findings 
+                              if isinstance(f, (str, int, float, bool, type(None), dict))]
+        # Further clean dict items in key_findings
+        if cleaned_key_findings:
+            cleaned_key_findings = [
+                {k: v for k, v in f.items() if isinstance(v, (str, int, float, bool, type(None)))}
+                if isinstance(f, dict) else f
+                for f in cleaned_key_findings
+            ]
+    return cleaned_evidence_summary, cleaned_key_findings
+
+
+# Result keys written by the enrichment steps that are returned to clients
+_ENRICHMENT_FIELDS = (
+    "source_attributions",
+    "evidence_count",
+    "recommendations",
+    "confidence",
+    "quick_actions",
+    "action_suggestions",
+    "context_info",
+)
+
+# Keys dropped from structured_data; reasoning is returned in its own fields
+_STRUCTURED_DATA_SKIP_KEYS = frozenset({"reasoning_chain", "reasoning_steps", "__dict__", "__class__"})
+
+
+async def _build_deferred_enrichments(
+    base_result: Dict[str, Any],
+    enriched: Dict[str, Any],
+    structured_response: Dict[str, Any],
+    req: "ChatRequest",
+) -> Dict[str, Any]:
+    """
+    Turn an enriched planner result into the fields a client merges into its ChatResponse.
+
+    If evidence or context enrichment rewrote the answer, the new text is
+    formatted like the inline path and must pass the output guardrails before
+    it is offered as a replacement ``reply``.
+    """
+    enrichments = {
+        key: enriched[key]
+        for key in _ENRICHMENT_FIELDS
+        if key in enriched and enriched[key] != base_result.get(key)
+    }
+    evidence_summary, key_findings = _clean_evidence_fields(enriched)
+    if evidence_summary is not None:
+        enrichments["evidence_summary"] = evidence_summary
+    if key_findings is not None:
+        enrichments["key_findings"] = key_findings
+
+    enriched_text = enriched.get("response")
+    if enriched_text and enriched_text != base_result.get("response"):
+        reply = _format_user_response(
+            enriched_text,
+            structured_response or {},
+            enriched.get("confidence") or 0.75,
+            enriched.get("recommendations", []),
+        )
+        try:
+            output_safety = await asyncio.wait_for(
+                guardrails_service.check_output_safety(reply, req.context), timeout=5.0
+            )
+            if output_safety.is_safe:
+                enrichments["reply"] = reply
+            else:
+                logger.warning("Enriched reply failed output safety check, keeping original reply")
+        except Exception as safety_error:
+            logger.warning(
+                f"Output safety check for enriched reply failed: {_sanitize_log_data(str(safety_error))}"
+            )
+    return enrichments
+
+
 class ConversationSummaryRequest(BaseModel):
     session_id: str
 
@@ -595,7 +642,29 @@ class ConversationSearchRequest(BaseModel):
     limit: Optional[int] = 10
 
 
-@router.post("/chat", response_model=ChatResponse)
+class ChatBatchRequest(BaseModel):
+    items: List[ChatRequest]
+    # Lower the server's concurrency limit for this batch
+    max_concurrency: Optional[int] = None
+
+
+class ChatBatchItemResult(BaseModel):
+    index: int
+    route: str
+    routing_confidence: Optional[float] = None
+    latency_ms: float
+    response: Optional[ChatResponse] = None
+    error: Optional[str] = None
+
+
+class ChatBatchResponse(BaseModel):
+    results: List[ChatBatchItemResult]
+    routes: Dict[str, int]
+    routing_ms: float
+    total_latency_ms: float
+
+
+@router.post("/chat", response_model=ChatResponse, response_class=FastJSONResponse)
 async def chat(req: ChatRequest):
     """
     Process warehouse operational queries through the multi-agent planner with guardrails.
@@ -613,7 +682,14 @@ async def chat(req: ChatRequest):
     # Generate unique request ID for tracking
     request_id = str(uuid.uuid4())
     performance_monitor = get_performance_monitor()
-    await performance_monitor.start_request(request_id)
+    # Root span for the per-stage latency breakdown in /chat/performance/stats
+    trace = start_trace("chat", request_id=request_id)
+    await performance_monitor.start_request(request_id, trace=trace)
+    
+    # Link the request to its event stream when served by /chat/stream
+    stream_sink = get_chat_stream_sink()
+    if stream_sink is not None:
+        stream_sink.request_id = request_id
     
     # Check cache first (skip cache for reasoning queries as they may vary)
     query_cache = get_query_cache()
@@ -635,6 +711,41 @@ async def chat(req: ChatRequest):
             )
             return ChatResponse(**cached_result)
     
+    # Semantic cache - reuse answers to paraphrased queries (opt-in).
+    # Requests with a custom context are excluded because the answer may depend on it.
+    semantic_cache = None
+    query_embedding = None
+    semantic_scope = _semantic_cache_scope(req.session_id)
+    if is_semantic_cache_enabled() and not req.enable_reasoning and not req.context:
+        semantic_cache = get_semantic_cache()
+        try:
+            from src.api.services.routing.semantic_router import get_semantic_router
+            semantic_router = await get_semantic_router()
+            # The router memoizes this embedding, so the planner's semantic
+            # routing step reuses it instead of calling the embedding API again
+            query_embedding = await asyncio.wait_for(
+                semantic_router.embed_query(req.message),
+                timeout=SEMANTIC_CACHE_LOOKUP_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Semantic cache embedding timed out, skipping lookup")
+        except Exception as embed_error:
+            logger.warning(f"Semantic cache embedding failed: {_sanitize_log_data(str(embed_error))}")
+        
+        semantic_hit = semantic_cache.lookup(query_embedding, scope=semantic_scope)
+        if semantic_hit:
+            logger.info(
+                f"Semantic cache hit (similarity={semantic_hit.similarity:.3f}, "
+                f"intent={semantic_hit.intent}) for query: {_sanitize_log_data(req.message[:50])}..."
+            )
+            await performance_monitor.end_request(
+                request_id,
+                route=semantic_hit.result.get("route"),
+                intent=semantic_hit.result.get("intent"),
+                cache_hit=True
+            )
+            return ChatResponse(**semantic_hit.result, session_id=req.session_id or "default")
+    
     # Request deduplication - prevent duplicate concurrent requests
     deduplicator = get_request_deduplicator()
     request_key = deduplicator._generate_request_key(
@@ -654,50 +765,82 @@ async def chat(req: ChatRequest):
         guardrails_method = None
         guardrails_time_ms = None
         
-        try:
-            # Check input safety with guardrails (with timeout)
-            guardrails_start = time.time()
-            input_safety = await asyncio.wait_for(
-                guardrails_service.check_input_safety(req.message, req.context),
-                timeout=3.0  # 3 second timeout for safety check
-            )
-            guardrails_time_ms = (time.time() - guardrails_start) * 1000
-            guardrails_method = input_safety.method_used
+        async def run_input_guardrails() -> Optional[ChatResponse]:
+            """Check input safety; returns a violation response if the input is blocked."""
+            nonlocal guardrails_method, guardrails_time_ms
+            try:
+                # Check input safety with guardrails (with timeout)
+                guardrails_start = time.time()
+                input_safety = await asyncio.wait_for(
+                    guardrails_service.check_input_safety(req.message, req.context),
+                    timeout=3.0  # 3 second timeout for safety check
+                )
+                guardrails_time_ms = (time.time() - guardrails_start) * 1000
+                guardrails_method = input_safety.method_used
             
-            # Log guardrails method used
-            logger.info(
-                f"🔒 Guardrails check: method={guardrails_method}, "
-                f"safe={input_safety.is_safe}, "
-                f"time={guardrails_time_ms:.1f}ms, "
-                f"confidence={input_safety.confidence:.2f}"
-            )
+                # Log guardrails method used
+                logger.info(
+                    f"🔒 Guardrails check: method={guardrails_method}, "
+                    f"safe={input_safety.is_safe}, "
+                    f"time={guardrails_time_ms:.1f}ms, "
+                    f"confidence={input_safety.confidence:.2f}"
+                )
             
-            if not input_safety.is_safe:
+                if not input_safety.is_safe:
+                    logger.warning(
+                        f"Input safety violation ({guardrails_method}): "
+                        f"{_sanitize_log_data(str(input_safety.violations))}"
+                    )
+                    # Record metrics before returning
+                    await performance_monitor.end_request(
+                        request_id,
+                        route="safety",
+                        intent="safety_violation",
+                        cache_hit=False,
+                        guardrails_method=guardrails_method,
+                        guardrails_time_ms=guardrails_time_ms
+                    )
+                    return _create_safety_violation_response(
+                        input_safety.violations,
+                        input_safety.confidence,
+                        req.session_id or "default",
+                    )
+            except asyncio.TimeoutError:
+                logger.warning("Input safety check timed out, proceeding")
+                guardrails_time_ms = 3000.0  # Timeout duration
+            except Exception as safety_error:
                 logger.warning(
-                    f"Input safety violation ({guardrails_method}): "
-                    f"{_sanitize_log_data(str(input_safety.violations))}"
-                )
-                # Record metrics before returning
-                await performance_monitor.end_request(
-                    request_id,
-                    route="safety",
-                    intent="safety_violation",
-                    cache_hit=False,
-                    guardrails_method=guardrails_method,
-                    guardrails_time_ms=guardrails_time_ms
+                    f"Input safety check failed: {_sanitize_log_data(str(safety_error))}, proceeding"
                 )
-                return _create_safety_violation_response(
-                    input_safety.violations,
-                    input_safety.confidence,
-                    req.session_id or "default",
-                )
-        except asyncio.TimeoutError:
-            logger.warning("Input safety check timed out, proceeding")
-            guardrails_time_ms = 3000.0  # Timeout duration
-        except Exception as safety_error:
-            logger.warning(
-                f"Input safety check failed: {_sanitize_log_data(str(safety_error))}, proceeding"
-            )
+            return None
+
+        # Input guardrails. In speculative mode the check runs concurrently with
+        # planner startup and intent routing; the planner waits on the safety gate
+        # before any agent executes, and everything in flight is cancelled on a
+        # violation. Otherwise the check completes before routing starts.
+        speculative_safety = is_speculative_guardrails_enabled()
+        safety_task: Optional[asyncio.Task] = None
+        safety_gate_token = None
+        if speculative_safety:
+            safety_gate = SafetyGate()
+            safety_task = asyncio.create_task(run_input_guardrails())
+            safety_task.add_done_callback(safety_gate.resolve_from_task)
+            safety_gate_token = set_safety_gate(safety_gate)
+        else:
+            violation_response = await run_input_guardrails()
+            if violation_response is not None:
+                return violation_response
+
+        async def input_safety_verdict() -> Optional[ChatResponse]:
+            """Wait for the speculative safety check; returns a violation response if blocked."""
+            if safety_task is None:
+                return None
+            return await safety_task
+
+        async def gated(response: ChatResponse) -> ChatResponse:
+            """Only return a response for input that passed the safety check."""
+            violation_response = await input_safety_verdict()
+            return violation_response if violation_response is not None else response
 
         # Process the query through the MCP planner graph with error handling
         # Add timeout to prevent hanging on slow queries
@@ -738,14 +881,14 @@ async def chat(req: ChatRequest):
                 )
             except asyncio.TimeoutError:
                 logger.warning("MCP planner initialization timed out, using simple fallback")
-                return _create_simple_fallback_response(req.message, req.session_id)
+                return await gated(_create_simple_fallback_response(req.message, req.session_id))
             except Exception as init_error:
                 logger.error(f"MCP planner initialization failed: {_sanitize_log_data(str(init_error))}")
-                return _create_simple_fallback_response(req.message, req.session_id)
+                return await gated(_create_simple_fallback_response(req.message, req.session_id))
             
             if not mcp_planner:
                 logger.warning("MCP planner is None, using simple fallback")
-                return _create_simple_fallback_response(req.message, req.session_id)
+                return await gated(_create_simple_fallback_response(req.message, req.session_id))
             
             # Create task with timeout protection
             # Pass reasoning parameters to planner graph
@@ -767,6 +910,16 @@ async def chat(req: ChatRequest):
                     context=planner_context,
                 )
             )
+            if safety_gate_token is not None:
+                # query_task has captured the gate; later work doesn't need it
+                reset_safety_gate(safety_gate_token)
+                safety_gate_token = None
+            
+            # Routing runs while the speculative safety check finishes
+            violation_response = await input_safety_verdict()
+            if violation_response is not None:
+                query_task.cancel()
+                return violation_response
             
             try:
                 result = await asyncio.wait_for(query_task, timeout=MAIN_QUERY_TIMEOUT)
@@ -877,7 +1030,7 @@ async def chat(req: ChatRequest):
                 result["action_suggestions"] = []
                 result["evidence_count"] = 0
             else:
-                async def enhance_with_evidence():
+                async def enhance_with_evidence(base_response: str):
                     """Enhance response with evidence collection."""
                     try:
                         evidence_service = await get_evidence_integration_service()
@@ -887,7 +1040,7 @@ async def chat(req: ChatRequest):
                             entities=entities,
                             session_id=req.session_id or "default",
                             user_context=req.context,
-                            base_response=result["response"],
+                            base_response=base_response,
                         )
                         return enhanced_response
                     except Exception as e:
@@ -916,7 +1069,7 @@ async def chat(req: ChatRequest):
                         logger.warning(f"Quick actions generation failed: {_sanitize_log_data(str(e))}")
                         return []
 
-                async def enhance_with_context():
+                async def enhance_with_context(base_response: str):
                     """Enhance response with conversation memory and context."""
                     try:
                         context_enhancer = await get_context_enhancer()
@@ -926,7 +1079,7 @@ async def chat(req: ChatRequest):
                         context_enhanced = await context_enhancer.enhance_with_context(
                             session_id=req.session_id or "default",
                             user_message=req.message,
-                            base_response=result["response"],
+                            base_response=base_response,
                             intent=intent,
                             entities=memory_entities,
                             actions_taken=memory_actions,
@@ -936,98 +1089,140 @@ async def chat(req: ChatRequest):
                         logger.warning(f"Context enhancement failed: {_sanitize_log_data(str(e))}")
                         return None
 
-                # Run evidence and quick actions in parallel (context enhancement needs base response)
                 # Add timeout protection to prevent hanging requests
                 ENHANCEMENT_TIMEOUT = 25  # seconds - leave time for main response
                 
-                try:
-                    evidence_task = asyncio.create_task(enhance_with_evidence())
-                    quick_actions_task = asyncio.create_task(generate_quick_actions())
-                    
-                    # Wait for evidence first as quick actions can benefit from it (with timeout)
+                async def apply_enrichments(target: Dict[str, Any]) -> None:
+                    """Run evidence, quick actions and context enrichment, updating ``target``."""
+                    # Run evidence and quick actions in parallel (context enhancement needs base response)
                     try:
-                        enhanced_response = await asyncio.wait_for(evidence_task, timeout=ENHANCEMENT_TIMEOUT)
-                    except asyncio.TimeoutError:
-                        logger.warning("Evidence enhancement timed out")
-                        enhanced_response = None
-                    except Exception as e:
-                        logger.error(f"Evidence enhancement error: {_sanitize_log_data(str(e))}")
-                        enhanced_response = None
+                        evidence_task = asyncio.create_task(enhance_with_evidence(target["response"]))
+                        quick_actions_task = asyncio.create_task(generate_quick_actions())
                     
-                    # Update result with evidence if available
-                    if enhanced_response:
-                        result["response"] = enhanced_response.response
-                        result["evidence_summary"] = enhanced_response.evidence_summary
-                        result["source_attributions"] = enhanced_response.source_attributions
-                        result["evidence_count"] = enhanced_response.evidence_count
-                        result["key_findings"] = enhanced_response.key_findings
+                        # Wait for evidence first as quick actions can benefit from it (with timeout)
+                        try:
+                            enhanced_response = await asyncio.wait_for(evidence_task, timeout=ENHANCEMENT_TIMEOUT)
+                        except asyncio.TimeoutError:
+                            logger.warning("Evidence enhancement timed out")
+                            enhanced_response = None
+                        except Exception as e:
+                            logger.error(f"Evidence enhancement error: {_sanitize_log_data(str(e))}")
+                            enhanced_response = None
+                    
+                        # Update result with evidence if available
+                        if enhanced_response:
+                            target["response"] = enhanced_response.response
+                            target["evidence_summary"] = enhanced_response.evidence_summary
+                            target["source_attributions"] = enhanced_response.source_attributions
+                            target["evidence_count"] = enhanced_response.evidence_count
+                            target["key_findings"] = enhanced_response.key_findings
+                        
+                            if enhanced_response.confidence_score > 0:
+                                original_confidence = structured_response.get("confidence", 0.5)
+                                target["confidence"] = max(
+                                    original_confidence, enhanced_response.confidence_score
+                                )
                         
-                        if enhanced_response.confidence_score > 0:
-                            original_confidence = structured_response.get("confidence", 0.5)
-                            result["confidence"] = max(
-                                original_confidence, enhanced_response.confidence_score
+                            # Merge recommendations
+                            original_recommendations = structured_response.get("recommendations", [])
+                            evidence_recommendations = enhanced_response.recommendations or []
+                            all_recommendations = list(
+                                set(original_recommendations + evidence_recommendations)
                             )
+                            if all_recommendations:
+                                target["recommendations"] = all_recommendations
                         
-                        # Merge recommendations
-                        original_recommendations = structured_response.get("recommendations", [])
-                        evidence_recommendations = enhanced_response.recommendations or []
-                        all_recommendations = list(
-                            set(original_recommendations + evidence_recommendations)
-                        )
-                        if all_recommendations:
-                            result["recommendations"] = all_recommendations
-
-                    # Get quick actions (may have completed in parallel, with timeout)
-                    try:
-                        quick_actions = await asyncio.wait_for(quick_actions_task, timeout=ENHANCEMENT_TIMEOUT)
-                    except asyncio.TimeoutError:
-                        logger.warning("Quick actions generation timed out")
-                        quick_actions = []
-                    except Exception as e:
-                        logger.error(f"Quick actions generation error: {_sanitize_log_data(str(e))}")
-                        quick_actions = []
+                            emit_chat_event(EVENT_EVIDENCE, {
+                                "evidence_summary": target.get("evidence_summary"),
+                                "source_attributions": target.get("source_attributions"),
+                                "evidence_count": target.get("evidence_count"),
+                                "key_findings": target.get("key_findings"),
+                            })
+
+                        # Get quick actions (may have completed in parallel, with timeout)
+                        try:
+                            quick_actions = await asyncio.wait_for(quick_actions_task, timeout=ENHANCEMENT_TIMEOUT)
+                        except asyncio.TimeoutError:
+                            logger.warning("Quick actions generation timed out")
+                            quick_actions = []
+                        except Exception as e:
+                            logger.error(f"Quick actions generation error: {_sanitize_log_data(str(e))}")
+                            quick_actions = []
                     
-                    if quick_actions:
-                        # Convert actions to dictionary format
-                        actions_dict = []
-                        action_suggestions = []
+                        if quick_actions:
+                            # Convert actions to dictionary format
+                            actions_dict = []
+                            action_suggestions = []
                         
-                        for action in quick_actions:
-                            action_dict = {
-                                "action_id": action.action_id,
-                                "title": action.title,
-                                "description": action.description,
-                                "action_type": action.action_type.value,
-                                "priority": action.priority.value,
-                                "icon": action.icon,
-                                "command": action.command,
-                                "parameters": action.parameters,
-                                "requires_confirmation": action.requires_confirmation,
-                                "enabled": action.enabled,
-                            }
-                            actions_dict.append(action_dict)
-                            action_suggestions.append(action.title)
+                            for action in quick_actions:
+                                action_dict = {
+                                    "action_id": action.action_id,
+                                    "title": action.title,
+                                    "description": action.description,
+                                    "action_type": action.action_type.value,
+                                    "priority": action.priority.value,
+                                    "icon": action.icon,
+                                    "command": action.command,
+                                    "parameters": action.parameters,
+                                    "requires_confirmation": action.requires_confirmation,
+                                    "enabled": action.enabled,
+                                }
+                                actions_dict.append(action_dict)
+                                action_suggestions.append(action.title)
                         
-                        result["quick_actions"] = actions_dict
-                        result["action_suggestions"] = action_suggestions
-
-                    # Enhance with context (runs after evidence since it may use evidence summary, with timeout)
-                    try:
-                        context_enhanced = await asyncio.wait_for(
-                            enhance_with_context(), timeout=ENHANCEMENT_TIMEOUT
-                        )
-                        if context_enhanced and context_enhanced.get("context_enhanced", False):
-                            result["response"] = context_enhanced["response"]
-                            result["context_info"] = context_enhanced.get("context_info", {})
-                    except asyncio.TimeoutError:
-                        logger.warning("Context enhancement timed out")
-                    except Exception as e:
-                        logger.error(f"Context enhancement error: {_sanitize_log_data(str(e))}")
+                            target["quick_actions"] = actions_dict
+                            target["action_suggestions"] = action_suggestions
+                        
+                            emit_chat_event(EVENT_QUICK_ACTIONS, {
+                                "quick_actions": actions_dict,
+                                "action_suggestions": action_suggestions,
+                            })
+
+                        # Enhance with context (runs after evidence since it may use evidence summary, with timeout)
+                        try:
+                            context_enhanced = await asyncio.wait_for(
+                                enhance_with_context(target["response"]), timeout=ENHANCEMENT_TIMEOUT
+                            )
+                            if context_enhanced and context_enhanced.get("context_enhanced", False):
+                                target["response"] = context_enhanced["response"]
+                                target["context_info"] = context_enhanced.get("context_info", {})
+                        except asyncio.TimeoutError:
+                            logger.warning("Context enhancement timed out")
+                        except Exception as e:
+                            logger.error(f"Context enhancement error: {_sanitize_log_data(str(e))}")
                         
-                except Exception as enhancement_error:
-                    # Catch any unexpected errors in enhancement orchestration
-                    logger.error(f"Enhancement orchestration error: {_sanitize_log_data(str(enhancement_error))}")
-                    # Continue with base result if enhancements fail
+                    except Exception as enhancement_error:
+                        # Catch any unexpected errors in enhancement orchestration
+                        logger.error(f"Enhancement orchestration error: {_sanitize_log_data(str(enhancement_error))}")
+                        # Continue with base result if enhancements fail
+
+                defer_enrichments = (
+                    req.defer_enrichments
+                    if req.defer_enrichments is not None
+                    else is_deferred_enrichment_default()
+                )
+                if defer_enrichments:
+                    # Return the core answer now; enrichments are fetched later from
+                    # /chat/{response_id}/enrichments
+                    base_result = dict(result)
+
+                    async def run_deferred_enrichments() -> Dict[str, Any]:
+                        enriched = dict(base_result)
+                        await apply_enrichments(enriched)
+                        return await _build_deferred_enrichments(
+                            base_result, enriched, structured_response, req
+                        )
+
+                    response_id = uuid.uuid4().hex
+                    if get_enrichment_pipeline().submit(response_id, run_deferred_enrichments):
+                        result["response_id"] = response_id
+                        result["enrichments_pending"] = True
+                    result.setdefault("quick_actions", [])
+                    result.setdefault("action_suggestions", [])
+                    result.setdefault("evidence_count", 0)
+                else:
+                    with span("enrichment"):
+                        await apply_enrichments(result)
                     
         except asyncio.TimeoutError:
             logger.error("Main query processing timed out")
@@ -1056,13 +1251,17 @@ async def chat(req: ChatRequest):
             else:
                 user_message = "I encountered an error processing your query. Please try rephrasing your question or contact support if the issue persists."
 
-            return _create_error_chat_response(
+            return await gated(_create_error_chat_response(
                 user_message,
                 error_message,
                 error_type,
                 req.session_id or "default",
                 0.0,
-            )
+            ))
+
+        violation_response = await input_safety_verdict()
+        if violation_response is not None:
+            return violation_response
 
         # Check output safety with guardrails (with timeout protection)
         output_guardrails_method = None
@@ -1204,60 +1403,11 @@ async def chat(req: ChatRequest):
                 reasoning_steps = result.get("reasoning_steps")
                 logger.info(f"🔍 Found reasoning_steps in result: {reasoning_steps is not None}")
         
-        # Convert ReasoningChain dataclass to dict if needed (using safe manual conversion with depth limit)
+        # Convert ReasoningChain dataclass and reasoning steps to plain dicts
         if reasoning_chain is not None:
-            from dataclasses import is_dataclass
-            from datetime import datetime
-            from enum import Enum
-            
-            def safe_convert_value(value, depth=0, max_depth=5):
-                """Safely convert a value to JSON-serializable format with depth limit."""
-                if depth > max_depth:
-                    return str(value)
-                    
-                if isinstance(value, datetime):
-                    return value.isoformat()
-                elif isinstance(value, Enum):
-                    return value.value
-                elif isinstance(value, (str, int, float, bool, type(None))):
-                    return value
-                elif isinstance(value, dict):
-                    return {k: safe_convert_value(v, depth + 1, max_depth) for k, v in value.items()}
-                elif isinstance(value, (list, tuple)):
-                    return [safe_convert_value(item, depth + 1, max_depth) for item in value]
-                elif hasattr(value, "__dict__"):
-                    # For objects with __dict__, convert to dict but limit depth
-                    try:
-                        # Only convert simple attributes, skip complex nested objects
-                        result = {}
-                        for k, v in value.__dict__.items():
-                            if isinstance(v, (str, int, float, bool, type(None), datetime, Enum)):
-                                result[k] = safe_convert_value(v, depth + 1, max_depth)
-                            elif isinstance(v, (list, tuple, dict)):
-                                result[k] = safe_convert_value(v, depth + 1, max_depth)
-                            else:
-                                # For complex objects, just convert to string
-                                result[k] = str(v)
-                        return result
-                    except (RecursionError, AttributeError, TypeError) as e:
-                        logger.warning(f"Failed to convert value at depth {depth}: {_sanitize_log_data(str(e))}")  # Safe: depth is int
-                        return str(value)
-                else:
-                    return str(value)
-            
-            if is_dataclass(reasoning_chain):
-                reasoning_chain = _convert_reasoning_chain_to_dict(reasoning_chain, safe_convert_value)
-            elif not isinstance(reasoning_chain, dict):
-                # If it's not a dict and not a dataclass, try to convert it safely
-                try:
-                    reasoning_chain = safe_convert_value(reasoning_chain)
-                except (RecursionError, AttributeError, TypeError) as e:
-                    logger.warning(f"Failed to convert reasoning_chain to dict: {_sanitize_log_data(str(e))}")
-                    reasoning_chain = None
-        
-        # Convert reasoning_steps to list of dicts if needed (simplified to avoid recursion)
+            reasoning_chain = serialize_reasoning_chain(reasoning_chain)
         if reasoning_steps is not None and isinstance(reasoning_steps, list):
-            reasoning_steps = _convert_reasoning_steps_to_list(reasoning_steps)
+            reasoning_steps = [serialize_reasoning_step(step) for step in reasoning_steps]
 
         # Extract confidence from multiple possible sources with sensible defaults
         confidence = _extract_confidence_from_sources(result, structured_response)
@@ -1340,43 +1490,11 @@ async def chat(req: ChatRequest):
             enhancement_applied = False
             enhancement_summary = None
 
-        # Helper function to clean reasoning data for serialization
-        def clean_reasoning_data(data):
-            """Clean reasoning data to ensure it's JSON-serializable."""
-            if data is None:
-                return None
-            if isinstance(data, dict):
-                # Recursively clean dict, but limit depth to avoid issues
-                cleaned = {}
-                for k, v in data.items():
-                    if isinstance(v, (str, int, float, bool, type(None))):
-                        cleaned[k] = v
-                    elif isinstance(v, list):
-                        # Clean list items
-                        cleaned_list = []
-                        for item in v:
-                            if isinstance(item, (str, int, float, bool, type(None))):
-                                cleaned_list.append(item)
-                            elif isinstance(item, dict):
-                                cleaned_list.append(clean_reasoning_data(item))
-                            else:
-                                cleaned_list.append(str(item))
-                        cleaned[k] = cleaned_list
-                    elif isinstance(v, dict):
-                        cleaned[k] = clean_reasoning_data(v)
-                    else:
-                        cleaned[k] = str(v)
-                return cleaned
-            elif isinstance(data, list):
-                return [clean_reasoning_data(item) for item in data]
-            else:
-                return str(data)
-        
         # Clean reasoning data before adding to response
         # Only include reasoning if enable_reasoning is True
         if req.enable_reasoning:
-            cleaned_reasoning_chain = clean_reasoning_data(reasoning_chain) if reasoning_chain else None
-            cleaned_reasoning_steps = clean_reasoning_data(reasoning_steps) if reasoning_steps else None
+            cleaned_reasoning_chain = to_jsonable(reasoning_chain) if reasoning_chain else None
+            cleaned_reasoning_steps = to_jsonable(reasoning_steps) if reasoning_steps else None
         else:
             # Respect enable_reasoning: false - do not include reasoning in response
             cleaned_reasoning_chain = None
@@ -1426,48 +1544,15 @@ async def chat(req: ChatRequest):
                 logger.info(f"📤 Creating response with reasoning_chain: {cleaned_reasoning_chain is not None}, reasoning_steps: {cleaned_reasoning_steps is not None}")
             else:
                 logger.info(f"📤 Creating response without reasoning (enable_reasoning=False)")
-            # Clean all complex fields to avoid circular references
             # Allow nested structures for structured_data (it's meant to contain structured information)
-            # but prevent circular references by limiting depth
-            def clean_structured_data_recursive(obj, depth=0, max_depth=5, visited=None):
-                """Recursively clean structured data, allowing nested structures but preventing circular references."""
-                if visited is None:
-                    visited = set()
-                
-                if depth > max_depth:
-                    return str(obj)
-                
-                # Prevent circular references
-                obj_id = id(obj)
-                if obj_id in visited:
-                    return "[Circular Reference]"
-                visited.add(obj_id)
-                
-                try:
-                    if isinstance(obj, (str, int, float, bool, type(None))):
-                        return obj
-                    elif isinstance(obj, dict):
-                        cleaned = {}
-                        for k, v in obj.items():
-                            # Skip potentially problematic keys
-                            if k in ['reasoning_chain', 'reasoning_steps', '__dict__', '__class__']:
-                                continue
-                            cleaned[k] = clean_structured_data_recursive(v, depth + 1, max_depth, visited.copy())
-                        return cleaned
-                    elif isinstance(obj, (list, tuple)):
-                        return [clean_structured_data_recursive(item, depth + 1, max_depth, visited.copy()) for item in obj]
-                    else:
-                        # For other types, convert to string
-                        return str(obj)
-                except Exception as e:
-                    logger.warning(f"Error cleaning structured data at depth {depth}: {_sanitize_log_data(str(e))}")  # Safe: depth is int
-                    return str(obj)
-            
+            # but limit depth and replace circular references
             cleaned_structured_data = None
             if structured_response and structured_response.get("data"):
                 data = structured_response.get("data")
                 try:
-                    cleaned_structured_data = clean_structured_data_recursive(data, max_depth=5)
+                    cleaned_structured_data = to_jsonable(
+                        data, max_depth=5, skip_keys=_STRUCTURED_DATA_SKIP_KEYS
+                    )
                     logger.info(f"📊 Cleaned structured_data: {type(cleaned_structured_data)}, keys: {list(cleaned_structured_data.keys()) if isinstance(cleaned_structured_data, dict) else 'not a dict'}")
                 except Exception as e:
                     logger.error(f"Error cleaning structured_data: {_sanitize_log_data(str(e))}")
@@ -1482,21 +1567,7 @@ async def chat(req: ChatRequest):
             cleaned_evidence_summary = None
             cleaned_key_findings = None
             if result:
-                if result.get("evidence_summary") and isinstance(result.get("evidence_summary"), dict):
-                    evidence = result.get("evidence_summary")
-                    cleaned_evidence_summary = {k: v for k, v in evidence.items() 
-                                              if isinstance(v, (str, int, float, bool, type(None), list))}
-                if result.get("key_findings") and isinstance(result.get("key_findings"), list):
-                    findings = result.get("key_findings")
-                    cleaned_key_findings = [f for f in findings 
-                                          if isinstance(f, (str, int, float, bool, type(None), dict))]
-                    # Further clean dict items in key_findings
-                    if cleaned_key_findings:
-                        cleaned_key_findings = [
-                            {k: v for k, v in f.items() if isinstance(v, (str, int, float, bool, type(None)))}
-                            if isinstance(f, dict) else f
-                            for f in cleaned_key_findings
-                        ]
+                cleaned_evidence_summary, cleaned_key_findings = _clean_evidence_fields(result)
             
             # Try to create response with cleaned data
             response = ChatResponse(
@@ -1534,6 +1605,9 @@ async def chat(req: ChatRequest):
                 # Reasoning fields - use cleaned versions
                 reasoning_chain=cleaned_reasoning_chain,
                 reasoning_steps=cleaned_reasoning_steps,
+                # Deferred enrichment fields
+                response_id=result.get("response_id") if result else None,
+                enrichments_pending=result.get("enrichments_pending") if result else None,
             )
             logger.info("✅ Response created successfully")
             
@@ -1549,6 +1623,19 @@ async def chat(req: ChatRequest):
                         req.context,
                         ttl_seconds=300  # 5 minutes TTL
                     )
+                    if (
+                        semantic_cache is not None
+                        and query_embedding is not None
+                        and response.route not in ("error", "safety")
+                        and not result.get("is_fallback", False)
+                    ):
+                        semantic_cache.set(
+                            query_embedding,
+                            req.message,
+                            response.intent,
+                            _shareable_response(response_dict),
+                            scope=semantic_scope,
+                        )
                 except Exception as cache_error:
                     logger.warning(f"Failed to cache result: {cache_error}")
             
@@ -1665,9 +1752,27 @@ async def chat(req: ChatRequest):
             )
             return error_response
     
-    # Use deduplicator to process query (prevents duplicate concurrent requests)
+    # Single-flight: identical concurrent queries (e.g. a dashboard refresh burst)
+    # share one planner execution instead of each running it
     try:
-        result = await deduplicator.get_or_create_task(request_key, process_query)
+        flight = await deduplicator.single_flight(
+            request_key,
+            process_query,
+            codec=(
+                lambda response: response.model_dump_json(),
+                ChatResponse.model_validate_json,
+            ),
+            retain=lambda response: response.route != "error",
+        )
+        result = flight.value
+        if flight.shared:
+            # The leader recorded its own metrics; close out this request as coalesced
+            await performance_monitor.end_request(
+                request_id,
+                route=result.route,
+                intent=result.intent,
+                cache_hit=True
+            )
         return result
     except Exception as e:
         logger.error(f"Error in request deduplication: {_sanitize_log_data(str(e))}")
@@ -1691,6 +1796,210 @@ async def chat(req: ChatRequest):
         return error_response
 
 
+@router.post("/chat/stream")
+async def chat_stream(req: ChatRequest):
+    """
+    Stream a chat response as Server-Sent Events.
+
+    Runs the same pipeline as ``/chat`` and publishes progress while it runs:
+
+    - ``routing``: intent and route as soon as intent classification finishes
+    - ``token``: user-facing text from the agent's final LLM generation. A new
+      ``segment`` number means the text restarts (e.g. after a retry)
+    - ``evidence`` / ``quick_actions``: enrichments once they are available
+    - ``done``: the complete ``ChatResponse``. Its ``reply`` is authoritative,
+      because formatting and output guardrails run after token streaming
+    - ``error``: processing failed
+
+    Time to first event and time to first token are recorded in the
+    performance monitor.
+    """
+    logger.info(f"📥 Received streaming chat request: message='{_sanitize_log_data(req.message[:100])}...'")
+    sink = ChatStreamSink()
+    performance_monitor = get_performance_monitor()
+
+    async def run_chat():
+        token = set_chat_stream_sink(sink)
+        try:
+            response = await chat(req)
+            payload = response.dict() if isinstance(response, BaseModel) else response
+            sink.emit(EVENT_DONE, payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Streaming chat request failed: {_sanitize_log_data(str(e))}")
+            from src.api.utils.error_handler import sanitize_error_message
+            sink.emit(EVENT_ERROR, {"error": sanitize_error_message(e, "Streaming chat")})
+        finally:
+            reset_chat_stream_sink(token)
+            sink.close()
+
+    async def event_stream():
+        chat_task = asyncio.create_task(run_chat())
+        first_byte_ms = None
+        try:
+            while True:
+                item = await sink.queue.get()
+                if item is None:
+                    break
+                if first_byte_ms is None:
+                    first_byte_ms = (time.time() - sink.started_at) * 1000
+                yield format_sse(item["event"], item["data"])
+        finally:
+            # Client disconnected before completion - stop the pipeline
+            if not chat_task.done():
+                chat_task.cancel()
+            if sink.request_id and first_byte_ms is not None:
+                await performance_monitor.record_stream_timing(
+                    sink.request_id,
+                    time_to_first_byte_ms=first_byte_ms,
+                    time_to_first_token_ms=sink.time_to_first_token_ms(),
+                )
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/chat/batch", response_model=ChatBatchResponse, response_class=FastJSONResponse)
+async def chat_batch(req: ChatBatchRequest):
+    """
+    Answer several independent chat messages in one request.
+
+    All messages are embedded in one batched embedding call and routed
+    together, then grouped by target agent. Each item runs through the same
+    pipeline as ``/chat`` (guardrails, caches, deduplication) without being
+    re-classified. At most ``CHAT_BATCH_MAX_CONCURRENCY`` items run at once,
+    and at most ``CHAT_BATCH_AGENT_CONCURRENCY`` per agent, so one busy agent
+    cannot take every slot.
+
+    A failing item doesn't fail the batch; its ``error`` is set instead.
+    Results are returned in request order.
+    """
+    if not req.items:
+        raise HTTPException(status_code=400, detail="Batch must contain at least one item")
+    if len(req.items) > CHAT_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch too large: {len(req.items)} items (max {CHAT_BATCH_MAX_ITEMS})",
+        )
+
+    batch_start = time.time()
+    messages = [item.message for item in req.items]
+    try:
+        mcp_planner = await get_mcp_planner_graph()
+        routes = await mcp_planner.route_messages(messages)
+    except Exception as e:
+        logger.warning(f"Batch routing failed, items will be routed individually: {_sanitize_log_data(str(e))}")
+        routes = [None] * len(messages)
+    routing_ms = (time.time() - batch_start) * 1000
+
+    # Group by agent so each agent's items share its concurrency budget
+    groups: Dict[str, List[int]] = {}
+    for index, route in enumerate(routes):
+        groups.setdefault(route[0] if route else "unrouted", []).append(index)
+    logger.info(
+        f"📦 Batch chat: {len(messages)} items routed in {routing_ms:.0f}ms "
+        f"({', '.join(f'{agent}={len(indexes)}' for agent, indexes in groups.items())})"
+    )
+
+    max_concurrency = CHAT_BATCH_MAX_CONCURRENCY
+    if req.max_concurrency:
+        max_concurrency = min(max_concurrency, req.max_concurrency)
+    batch_slots = asyncio.Semaphore(max(1, max_concurrency))
+    agent_slots = {
+        agent: asyncio.Semaphore(max(1, CHAT_BATCH_AGENT_CONCURRENCY)) for agent in groups
+    }
+
+    async def run_item(index: int, agent: str) -> ChatBatchItemResult:
+        item = req.items[index]
+        route = routes[index]
+        async with agent_slots[agent], batch_slots:
+            item_start = time.time()
+            token = set_route_hint(item.message, route[0], route[1]) if route else None
+            try:
+                response = await chat(item)
+                if not isinstance(response, ChatResponse):
+                    response = ChatResponse(**response)
+                error = None
+            except Exception as e:
+                logger.error(f"Batch item {index} failed: {_sanitize_log_data(str(e))}")
+                from src.api.utils.error_handler import sanitize_error_message
+                response = None
+                error = sanitize_error_message(e, "Batch chat item")
+            finally:
+                if token is not None:
+                    reset_route_hint(token)
+            return ChatBatchItemResult(
+                index=index,
+                route=response.route if response else agent,
+                routing_confidence=route[1] if route else None,
+                latency_ms=(time.time() - item_start) * 1000,
+                response=response,
+                error=error,
+            )
+
+    results = await asyncio.gather(*(
+        run_item(index, agent) for agent, indexes in groups.items() for index in indexes
+    ))
+    results.sort(key=lambda result: result.index)
+
+    return ChatBatchResponse(
+        results=results,
+        routes={agent: len(indexes) for agent, indexes in groups.items()},
+        routing_ms=routing_ms,
+        total_latency_ms=(time.time() - batch_start) * 1000,
+    )
+
+
+@router.get("/chat/{response_id}/enrichments")
+async def get_chat_enrichments(response_id: str, wait_seconds: float = 0.0):
+    """
+    Get deferred enrichments (evidence, quick actions, context) for a chat response.
+
+    Args:
+        response_id: ``response_id`` from a ``/chat`` response with ``enrichments_pending``
+        wait_seconds: Long-poll up to this many seconds (max 30) for the enrichments to finish
+
+    Returns:
+        Status (``pending``, ``running``, ``completed`` or ``failed``) and, once
+        completed, the ChatResponse fields to merge. ``reply`` is only present
+        when enrichment rewrote the answer.
+    """
+    pipeline = get_enrichment_pipeline()
+    record = pipeline.get(response_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired response_id")
+    if wait_seconds > 0:
+        record = await pipeline.wait(response_id, timeout=min(wait_seconds, 30.0)) or record
+    return record.to_dict()
+
+
+@router.get("/chat/{response_id}/enrichments/stream")
+async def stream_chat_enrichments(response_id: str):
+    """
+    Subscribe to deferred enrichments as Server-Sent Events.
+
+    Emits an ``enrichments`` event with the current state, then one per status
+    change; the stream ends once the status is ``completed`` or ``failed``.
+    """
+    pipeline = get_enrichment_pipeline()
+    if pipeline.get(response_id) is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired response_id")
+
+    async def event_stream():
+        async for snapshot in pipeline.subscribe(response_id):
+            yield format_sse("enrichments", snapshot)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/chat/conversation/summary")
 async def get_conversation_summary(req: ConversationSummaryRequest):
     """
@@ -1829,7 +2138,8 @@ async def get_performance_stats(time_window_minutes: int = 60, include_alerts: b
     Get performance statistics for chat requests.
 
     Returns metrics including latency, cache hits, errors, routing accuracy,
-    and tool execution statistics for the specified time window.
+    tool execution statistics and per-stage latency percentiles (``stages``,
+    from request traces) for the specified time window.
 
     Args:
         time_window_minutes: Time window in minutes (default: 60)
@@ -1855,8 +2165,28 @@ async def get_performance_stats(time_window_minutes: int = 60, include_alerts: b
             "performance": stats,
             "deduplication": dedup_stats,
             "cache": cache_stats,
+            "enrichment": get_enrichment_pipeline().get_stats(),
         }
         
+        # Semantic cache stats (hit rate and similarity histogram for threshold tuning)
+        if is_semantic_cache_enabled():
+            result["semantic_cache"] = await get_semantic_cache().get_stats()
+        else:
+            result["semantic_cache"] = {"enabled": False}
+        
+        # LLM response cache (bytes held, evictions, shared L2 hits)
+        from src.api.services.llm.nim_client import get_nim_client
+        nim_client = await get_nim_client()
+        result["llm_cache"] = nim_client.get_cache_stats()
+        # NIM concurrency limits and queue wait per priority class
+        result["llm_concurrency"] = nim_client.get_concurrency_stats()
+        # Hedged NIM calls (hedge rate against budget, hedge win rate)
+        result["llm_hedging"] = nim_client.get_hedging_stats()
+        
+        # Embedding cache hits and micro-batch sizes
+        from src.retrieval.vector.embedding_service import get_embedding_stats
+        result["embeddings"] = get_embedding_stats() or {"initialized": False}
+        
         # Include alerts if requested
         if include_alerts:
             alerts = await performance_monitor.check_alerts()
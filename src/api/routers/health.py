@@ -306,6 +306,63 @@ async def readiness_check():
         raise HTTPException(status_code=503, detail=f"Service not ready: {str(e)}")
 
 
+@router.get("/health/ready")
+async def warmup_readiness_check():
+    """
+    Readiness of the chat pipeline.
+
+    Not ready (503) while the startup warm-up is still building the planner,
+    agents, tool catalog and semantic router. Once it has finished, returns
+    200 with the per-component status; the state is "degraded" if a required
+    component failed (it will be built on first use instead).
+
+    Returns:
+        dict: Warm-up state and component status
+    """
+    from src.api.services.startup.warmup import get_startup_warmup
+
+    startup_warmup = get_startup_warmup()
+    if startup_warmup is None:
+        return {
+            "status": "ready",
+            "warmup": {"state": "disabled"},
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    warmup_status = startup_warmup.get_status()
+    if not startup_warmup.finished:
+        raise HTTPException(
+            status_code=503,
+            detail={"status": "warming", "warmup": warmup_status},
+        )
+    return {
+        "status": "ready",
+        "warmup": warmup_status,
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
+@router.get("/health/startup")
+async def startup_profile():
+    """
+    Route group states and the router import profile.
+
+    For each router module imported so far: import time, process RSS growth
+    and the number of modules it pulled in, and whether it was imported at
+    startup or by a first request. Deferred and disabled groups are listed
+    with their state.
+
+    Returns:
+        dict: Group states and import profile
+    """
+    from src.api.services.startup.routers import get_router_registry
+
+    return {
+        **get_router_registry().get_status(),
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
 @router.get("/live")
 async def liveness_check():
     """
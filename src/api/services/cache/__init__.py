@@ -16,6 +16,17 @@
 """Cache services for query result caching."""
 
 from src.api.services.cache.query_cache import get_query_cache, QueryCache
+from src.api.services.cache.semantic_cache import (
+    get_semantic_cache,
+    is_semantic_cache_enabled,
+    SemanticResponseCache,
+)
 
-__all__ = ["get_query_cache", "QueryCache"]
+__all__ = [
+    "get_query_cache",
+    "QueryCache",
+    "get_semantic_cache",
+    "is_semantic_cache_enabled",
+    "SemanticResponseCache",
+]
 
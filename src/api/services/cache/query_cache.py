@@ -17,73 +17,221 @@
 Query Result Cache Service
 
 Provides caching for chat query results to avoid reprocessing identical queries.
+
+The cache is bounded by entry count and by approximate payload size. Entries are
+kept in per-stripe ``OrderedDict`` instances so LRU promotion and eviction are
+O(1), and expiry is driven by a min-heap of deadlines so expired entries are
+reclaimed on every write instead of only when statistics are requested.
 """
 
-import hashlib
+import heapq
 import json
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
-import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, Hashable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+@dataclass
+class _CacheEntry:
+    """A single cached result with its expiry deadline and size estimate."""
+
+    result: Dict[str, Any]
+    expires_at: float
+    cached_at: float
+    size_bytes: int
+
+
+class _CacheStripe:
+    """One independently locked LRU segment of the cache."""
+
+    __slots__ = ("entries", "expiry_heap", "lock", "bytes_used", "sequence", "max_entries", "max_bytes")
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self.expiry_heap: List[Tuple[float, int, Hashable]] = []
+        self.lock = threading.Lock()
+        self.bytes_used = 0
+        # Tie-breaker so heap records never compare cache keys
+        self.sequence = 0
+
+
+def _split(total: int, parts: int) -> List[int]:
+    """Divide ``total`` into ``parts`` shares that differ by at most one."""
+    share, remainder = divmod(total, parts)
+    return [share + (1 if i < remainder else 0) for i in range(parts)]
+
 
 class QueryCache:
-    """Simple in-memory cache for query results with TTL support."""
+    """
+    Bounded in-memory cache for query results with TTL and LRU eviction.
+
+    Keys are spread over ``num_stripes`` segments, each with its own lock, so
+    concurrent lookups for different queries do not contend. The locks are
+    plain ``threading.Lock`` objects held only for dictionary operations (never
+    across an ``await``), which keeps the cache safe when it is touched from
+    worker threads as well as from the event loop.
+    """
 
-    def __init__(self, default_ttl_seconds: int = 300):  # 5 minutes default
-        self.cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(
+        self,
+        default_ttl_seconds: int = 300,  # 5 minutes default
+        max_entries: int = 1000,
+        max_bytes: int = 64 * 1024 * 1024,
+        num_stripes: int = 16,
+    ):
         self.default_ttl = default_ttl_seconds
-        self._lock = asyncio.Lock()
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        # Every stripe holds at least one entry, so there are never more
+        # stripes than entries
+        self.num_stripes = max(1, min(num_stripes, self.max_entries, self.max_bytes))
+        # Budgets are enforced per stripe so eviction never needs a global
+        # lock; they add up to exactly max_entries and max_bytes
+        self._stripes = [
+            _CacheStripe(max_entries, max_bytes)
+            for max_entries, max_bytes in zip(
+                _split(self.max_entries, self.num_stripes),
+                _split(self.max_bytes, self.num_stripes),
+            )
+        ]
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "rejected_oversize": 0,
+        }
+
+    @staticmethod
+    def _freeze_context(context: Optional[Dict[str, Any]]) -> Tuple:
+        """Reduce a request context to a hashable tuple of its simple values."""
+        if not context:
+            return ()
+        frozen = []
+        for k, v in context.items():
+            if isinstance(v, _PRIMITIVE_TYPES):
+                frozen.append((k, v))
+            elif isinstance(v, dict):
+                # Only include simple dict values
+                nested = tuple(
+                    sorted(
+                        (k2, v2) for k2, v2 in v.items()
+                        if isinstance(v2, _PRIMITIVE_TYPES)
+                    )
+                )
+                frozen.append((k, nested))
+        frozen.sort(key=lambda item: item[0])
+        return tuple(frozen)
 
-    def _generate_cache_key(self, message: str, session_id: str, context: Optional[Dict[str, Any]] = None) -> str:
-        """Generate a cache key from query parameters."""
+    def _generate_cache_key(
+        self, message: str, session_id: str, context: Optional[Dict[str, Any]] = None
+    ) -> Hashable:
+        """
+        Generate a cache key from query parameters.
+
+        The key is a plain tuple rather than a digest: tuples of strings hash
+        in C and avoid serialising the context on every lookup.
+        """
         # Normalize the message (lowercase, strip whitespace)
         normalized_message = message.lower().strip()
-        
-        # Normalize context - only include non-empty values and sort keys for consistency
-        normalized_context = {}
-        if context:
-            # Only include simple, serializable values
-            for k, v in context.items():
-                if isinstance(v, (str, int, float, bool, type(None))):
-                    normalized_context[k] = v
-                elif isinstance(v, dict):
-                    # Only include simple dict values
-                    normalized_context[k] = {k2: v2 for k2, v2 in v.items() 
-                                           if isinstance(v2, (str, int, float, bool, type(None)))}
-        
-        # Create a hash of the query
-        cache_data = {
-            "message": normalized_message,
-            "session_id": session_id,
-            "context": normalized_context,
-        }
-        cache_string = json.dumps(cache_data, sort_keys=True)
-        cache_key = hashlib.sha256(cache_string.encode()).hexdigest()
-        
-        return cache_key
+        return (normalized_message, session_id, self._freeze_context(context))
+
+    def _stripe_for(self, cache_key: Hashable) -> _CacheStripe:
+        return self._stripes[hash(cache_key) % self.num_stripes]
+
+    @staticmethod
+    def _estimate_size(result: Dict[str, Any]) -> int:
+        """Approximate the memory held by a cached result by its JSON length."""
+        try:
+            return len(json.dumps(result, default=str))
+        except (TypeError, ValueError, RecursionError):
+            return len(str(result))
 
-    async def get(self, message: str, session_id: str, context: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    def _bump(self, counter: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[counter] += amount
+
+    def _remove_entry(self, stripe: _CacheStripe, cache_key: Hashable) -> None:
+        """Remove an entry from a stripe. Caller must hold the stripe lock."""
+        entry = stripe.entries.pop(cache_key, None)
+        if entry is not None:
+            stripe.bytes_used -= entry.size_bytes
+
+    def _purge_expired(self, stripe: _CacheStripe, now: float) -> int:
+        """Pop expired deadlines off the stripe heap. Caller must hold the lock."""
+        purged = 0
+        heap = stripe.expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, _, cache_key = heapq.heappop(heap)
+            entry = stripe.entries.get(cache_key)
+            # Heap records go stale when a key is overwritten or evicted
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove_entry(stripe, cache_key)
+                purged += 1
+        # Compact the heap if stale records dominate it
+        if len(heap) > 2 * len(stripe.entries) + 64:
+            stripe.expiry_heap = []
+            for key, entry in stripe.entries.items():
+                stripe.sequence += 1
+                stripe.expiry_heap.append((entry.expires_at, stripe.sequence, key))
+            heapq.heapify(stripe.expiry_heap)
+        return purged
+
+    def _evict_to_budget(self, stripe: _CacheStripe) -> int:
+        """Evict least recently used entries until the stripe fits its budget."""
+        evicted = 0
+        while stripe.entries and (
+            len(stripe.entries) > stripe.max_entries
+            or stripe.bytes_used > stripe.max_bytes
+        ):
+            _, entry = stripe.entries.popitem(last=False)
+            stripe.bytes_used -= entry.size_bytes
+            evicted += 1
+        return evicted
+
+    async def get(
+        self, message: str, session_id: str, context: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """Get a cached result if available and not expired."""
-        async with self._lock:
-            cache_key = self._generate_cache_key(message, session_id, context)
-            
-            if cache_key not in self.cache:
-                return None
-            
-            cached_item = self.cache[cache_key]
-            expires_at = cached_item.get("expires_at")
-            
-            # Check if expired
-            if expires_at and datetime.utcnow() > expires_at:
-                del self.cache[cache_key]
-                logger.debug(f"Cache entry expired for key: {cache_key[:16]}...")
-                return None
-            
-            logger.info(f"Cache hit for query: {message[:50]}...")
-            return cached_item.get("result")
+        cache_key = self._generate_cache_key(message, session_id, context)
+        stripe = self._stripe_for(cache_key)
+        now = time.monotonic()
+
+        with stripe.lock:
+            entry = stripe.entries.get(cache_key)
+            if entry is None:
+                hit = None
+            elif now >= entry.expires_at:
+                self._remove_entry(stripe, cache_key)
+                hit = False
+            else:
+                stripe.entries.move_to_end(cache_key)
+                hit = True
+
+        if hit is None:
+            self._bump("misses")
+            return None
+        if hit is False:
+            self._bump("misses")
+            self._bump("expirations")
+            logger.debug("Cache entry expired for query")
+            return None
+
+        self._bump("hits")
+        logger.info(f"Cache hit for query: {message[:50]}...")
+        return entry.result
 
     async def set(
         self,
@@ -94,49 +242,89 @@ class QueryCache:
         ttl_seconds: Optional[int] = None,
     ) -> None:
         """Cache a query result with optional TTL."""
-        async with self._lock:
-            cache_key = self._generate_cache_key(message, session_id, context)
-            ttl = ttl_seconds or self.default_ttl
-            expires_at = datetime.utcnow() + timedelta(seconds=ttl)
-            
-            self.cache[cache_key] = {
-                "result": result,
-                "expires_at": expires_at,
-                "cached_at": datetime.utcnow(),
-            }
-            
-            logger.info(f"Cached result for query: {message[:50]}... (TTL: {ttl}s)")
+        cache_key = self._generate_cache_key(message, session_id, context)
+        stripe = self._stripe_for(cache_key)
+        ttl = ttl_seconds or self.default_ttl
+        size_bytes = self._estimate_size(result)
+
+        if size_bytes > stripe.max_bytes:
+            self._bump("rejected_oversize")
+            logger.debug(f"Result too large to cache ({size_bytes} bytes)")
+            return
+
+        now = time.monotonic()
+        entry = _CacheEntry(
+            result=result,
+            expires_at=now + ttl,
+            cached_at=now,
+            size_bytes=size_bytes,
+        )
+
+        with stripe.lock:
+            expired = self._purge_expired(stripe, now)
+            self._remove_entry(stripe, cache_key)
+            stripe.entries[cache_key] = entry
+            stripe.bytes_used += size_bytes
+            stripe.sequence += 1
+            heapq.heappush(
+                stripe.expiry_heap, (entry.expires_at, stripe.sequence, cache_key)
+            )
+            evicted = self._evict_to_budget(stripe)
+
+        self._bump("sets")
+        if expired:
+            self._bump("expirations", expired)
+        if evicted:
+            self._bump("evictions", evicted)
+
+        logger.info(f"Cached result for query: {message[:50]}... (TTL: {ttl}s)")
 
     async def clear(self) -> None:
         """Clear all cached entries."""
-        async with self._lock:
-            self.cache.clear()
-            logger.info("Query cache cleared")
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.entries.clear()
+                stripe.expiry_heap.clear()
+                stripe.bytes_used = 0
+        logger.info("Query cache cleared")
 
     async def clear_expired(self) -> None:
         """Remove expired entries from cache."""
-        async with self._lock:
-            now = datetime.utcnow()
-            expired_keys = [
-                key for key, item in self.cache.items()
-                if item.get("expires_at") and now > item["expires_at"]
-            ]
-            
-            for key in expired_keys:
-                del self.cache[key]
-            
-            if expired_keys:
-                logger.info(f"Cleared {len(expired_keys)} expired cache entries")
+        now = time.monotonic()
+        total = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                total += self._purge_expired(stripe, now)
+
+        if total:
+            self._bump("expirations", total)
+            logger.info(f"Cleared {total} expired cache entries")
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        async with self._lock:
-            await self.clear_expired()  # Clean up expired entries first
-            
-            return {
-                "total_entries": len(self.cache),
-                "default_ttl_seconds": self.default_ttl,
-            }
+        await self.clear_expired()  # Clean up expired entries first
+
+        total_entries = 0
+        total_bytes = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                total_entries += len(stripe.entries)
+                total_bytes += stripe.bytes_used
+
+        with self._stats_lock:
+            counters = dict(self._stats)
+        lookups = counters["hits"] + counters["misses"]
+
+        return {
+            "total_entries": total_entries,
+            "total_bytes": total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "num_stripes": self.num_stripes,
+            "default_ttl_seconds": self.default_ttl,
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+            **counters,
+        }
 
 
 # Global cache instance
@@ -147,6 +335,10 @@ def get_query_cache() -> QueryCache:
     """Get the global query cache instance."""
     global _query_cache
     if _query_cache is None:
-        _query_cache = QueryCache()
+        _query_cache = QueryCache(
+            default_ttl_seconds=int(os.getenv("QUERY_CACHE_TTL_SECONDS", "300")),
+            max_entries=int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "1000")),
+            max_bytes=int(os.getenv("QUERY_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            num_stripes=int(os.getenv("QUERY_CACHE_STRIPES", "16")),
+        )
     return _query_cache
-
@@ -0,0 +1,318 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Semantic Response Cache Service
+
+Provides embedding-similarity caching for chat responses so paraphrased queries
+("show forklift status", "what's the forklift status") reuse a recent answer
+instead of running the planner again.
+
+Cached query vectors are stored L2-normalised in one contiguous float32 matrix,
+so a lookup is a single matrix-vector product followed by masking of expired
+and out-of-scope rows.
+"""
+
+import logging
+import os
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+
+# Intents whose answers are more sensitive to small wording changes
+DEFAULT_INTENT_THRESHOLDS: Dict[str, float] = {
+    "safety": 0.96,
+    "document": 0.96,
+}
+
+# Bucket edges used to report the similarity of the best candidate per lookup
+_SIMILARITY_BUCKETS = (0.80, 0.85, 0.90, 0.92, 0.94, 0.96, 0.98)
+
+
+@dataclass
+class SemanticCacheHit:
+    """Result of a successful semantic cache lookup."""
+
+    result: Dict[str, Any]
+    similarity: float
+    intent: str
+    cached_query: str
+
+
+def _parse_thresholds(raw: Optional[str]) -> Dict[str, float]:
+    """Parse ``intent=threshold`` pairs separated by commas."""
+    thresholds = dict(DEFAULT_INTENT_THRESHOLDS)
+    if not raw:
+        return thresholds
+    for pair in raw.split(","):
+        if "=" not in pair:
+            continue
+        intent, value = pair.split("=", 1)
+        try:
+            thresholds[intent.strip()] = float(value.strip())
+        except ValueError:
+            logger.warning(f"Ignoring invalid semantic cache threshold: {pair.strip()}")
+    return thresholds
+
+
+class SemanticResponseCache:
+    """
+    Embedding-similarity cache for chat responses with TTL and LRU eviction.
+
+    Rows of ``_vectors`` are slots; ``_lru`` orders the occupied slots from
+    least to most recently used and ``_free_slots`` holds the rest. The
+    matrix grows geometrically up to ``max_entries`` rows.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2000,
+        default_ttl_seconds: int = 300,
+        default_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        intent_thresholds: Optional[Dict[str, float]] = None,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.default_ttl = default_ttl_seconds
+        self.default_threshold = default_threshold
+        self.intent_thresholds = (
+            dict(intent_thresholds) if intent_thresholds is not None
+            else dict(DEFAULT_INTENT_THRESHOLDS)
+        )
+
+        self._dim: Optional[int] = None
+        self._vectors: Optional[np.ndarray] = None
+        self._expires_at = np.zeros(0, dtype=np.float64)
+        self._thresholds = np.zeros(0, dtype=np.float32)
+        self._scope_ids = np.zeros(0, dtype=np.int64)
+        self._payloads: List[Optional[Tuple[str, str, Dict[str, Any]]]] = []
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+        self._free_slots: List[int] = []
+        self._scope_codes: Dict[str, int] = {}
+
+        self._stats = {
+            "lookups": 0,
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+        self._hits_by_intent: Dict[str, int] = defaultdict(int)
+        self._best_similarity_histogram: Dict[str, int] = defaultdict(int)
+
+    def threshold_for(self, intent: Optional[str]) -> float:
+        """Get the similarity threshold that applies to an intent."""
+        return self.intent_thresholds.get(intent or "", self.default_threshold)
+
+    def _scope_code(self, scope: str) -> int:
+        code = self._scope_codes.get(scope)
+        if code is None:
+            code = len(self._scope_codes)
+            self._scope_codes[scope] = code
+        return code
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if vector.ndim != 1 or norm == 0.0:
+            return None
+        return vector / norm
+
+    def _ensure_capacity(self, dim: int) -> None:
+        """Allocate or grow the slot arrays so at least one slot is free."""
+        if self._vectors is None:
+            self._dim = dim
+            capacity = min(self.max_entries, 64)
+        elif self._free_slots or len(self._payloads) >= self.max_entries:
+            return
+        else:
+            capacity = min(self.max_entries, max(1, len(self._payloads)) * 2)
+
+        old_capacity = len(self._payloads)
+        vectors = np.zeros((capacity, dim), dtype=np.float32)
+        expires_at = np.zeros(capacity, dtype=np.float64)
+        thresholds = np.ones(capacity, dtype=np.float32)
+        scope_ids = np.full(capacity, -1, dtype=np.int64)
+        if self._vectors is not None and old_capacity:
+            vectors[:old_capacity] = self._vectors
+            expires_at[:old_capacity] = self._expires_at
+            thresholds[:old_capacity] = self._thresholds
+            scope_ids[:old_capacity] = self._scope_ids
+
+        self._vectors = vectors
+        self._expires_at = expires_at
+        self._thresholds = thresholds
+        self._scope_ids = scope_ids
+        self._payloads.extend([None] * (capacity - old_capacity))
+        self._free_slots.extend(range(capacity - 1, old_capacity - 1, -1))
+
+    def _release_slot(self, slot: int) -> None:
+        self._payloads[slot] = None
+        self._expires_at[slot] = 0.0
+        self._scope_ids[slot] = -1
+        self._lru.pop(slot, None)
+        self._free_slots.append(slot)
+
+    def _record_best_similarity(self, similarity: float) -> None:
+        bucket = "<0.80"
+        for edge in _SIMILARITY_BUCKETS:
+            if similarity >= edge:
+                bucket = f">={edge:.2f}"
+        self._best_similarity_histogram[bucket] += 1
+
+    def lookup(
+        self, embedding: Optional[List[float]], scope: str = "global"
+    ) -> Optional[SemanticCacheHit]:
+        """
+        Find the most similar cached response above its intent threshold.
+
+        Args:
+            embedding: Query embedding (as produced by ``SemanticRouter``)
+            scope: Partition key; only entries stored under the same scope match
+
+        Returns:
+            SemanticCacheHit if a cached response is close enough, else None
+        """
+        self._stats["lookups"] += 1
+        query = self._normalize(embedding) if embedding else None
+        if query is None or self._vectors is None or not self._lru:
+            self._stats["misses"] += 1
+            return None
+        if query.shape[0] != self._dim:
+            self._stats["misses"] += 1
+            return None
+
+        scope_code = self._scope_codes.get(scope)
+        if scope_code is None:
+            self._stats["misses"] += 1
+            return None
+
+        now = time.monotonic()
+        expired = (self._scope_ids >= 0) & (self._expires_at <= now)
+        if expired.any():
+            for slot in np.flatnonzero(expired):
+                self._release_slot(int(slot))
+            self._stats["expirations"] += int(expired.sum())
+
+        similarities = self._vectors @ query
+        similarities[self._scope_ids != scope_code] = -1.0
+        best_slot = int(np.argmax(similarities))
+        best_similarity = float(similarities[best_slot])
+        self._record_best_similarity(best_similarity)
+
+        if best_similarity < float(self._thresholds[best_slot]) or self._payloads[best_slot] is None:
+            self._stats["misses"] += 1
+            return None
+
+        cached_query, intent, result = self._payloads[best_slot]
+        self._lru.move_to_end(best_slot)
+        self._stats["hits"] += 1
+        self._hits_by_intent[intent] += 1
+        return SemanticCacheHit(
+            result=result,
+            similarity=best_similarity,
+            intent=intent,
+            cached_query=cached_query,
+        )
+
+    def set(
+        self,
+        embedding: Optional[List[float]],
+        query: str,
+        intent: str,
+        result: Dict[str, Any],
+        scope: str = "global",
+        ttl_seconds: Optional[int] = None,
+    ) -> bool:
+        """
+        Store a response under its query embedding.
+
+        Returns:
+            True if the response was cached
+        """
+        vector = self._normalize(embedding) if embedding else None
+        if vector is None or (self._dim is not None and vector.shape[0] != self._dim):
+            return False
+
+        self._ensure_capacity(vector.shape[0])
+        if not self._free_slots:
+            lru_slot, _ = self._lru.popitem(last=False)
+            self._release_slot(lru_slot)
+            self._stats["evictions"] += 1
+
+        slot = self._free_slots.pop()
+        self._vectors[slot] = vector
+        self._expires_at[slot] = time.monotonic() + (ttl_seconds or self.default_ttl)
+        self._thresholds[slot] = self.threshold_for(intent)
+        self._scope_ids[slot] = self._scope_code(scope)
+        self._payloads[slot] = (query, intent, result)
+        self._lru[slot] = None
+        self._stats["sets"] += 1
+        return True
+
+    async def clear(self) -> None:
+        """Clear all cached entries."""
+        for slot in list(self._lru):
+            self._release_slot(slot)
+        logger.info("Semantic response cache cleared")
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics, including data useful for threshold tuning."""
+        lookups = self._stats["lookups"]
+        return {
+            "enabled": True,
+            "total_entries": len(self._lru),
+            "capacity": len(self._payloads),
+            "max_entries": self.max_entries,
+            "default_ttl_seconds": self.default_ttl,
+            "default_threshold": self.default_threshold,
+            "intent_thresholds": dict(self.intent_thresholds),
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            **self._stats,
+            "hits_by_intent": dict(self._hits_by_intent),
+            "best_similarity_histogram": dict(self._best_similarity_histogram),
+        }
+
+
+# Global semantic cache instance
+_semantic_cache: Optional[SemanticResponseCache] = None
+
+
+def is_semantic_cache_enabled() -> bool:
+    """Check whether the semantic response cache is enabled for this deployment."""
+    return os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+
+
+def get_semantic_cache() -> SemanticResponseCache:
+    """Get the global semantic response cache instance."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        _semantic_cache = SemanticResponseCache(
+            max_entries=int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "2000")),
+            default_ttl_seconds=int(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "300")),
+            default_threshold=float(
+                os.getenv("SEMANTIC_CACHE_THRESHOLD", str(DEFAULT_SIMILARITY_THRESHOLD))
+            ),
+            intent_thresholds=_parse_thresholds(os.getenv("SEMANTIC_CACHE_INTENT_THRESHOLDS")),
+        )
+    return _semantic_cache
@@ -15,7 +15,11 @@
 
 """Request deduplication services."""
 
-from src.api.services.deduplication.request_deduplicator import get_request_deduplicator, RequestDeduplicator
+from src.api.services.deduplication.request_deduplicator import (
+    get_request_deduplicator,
+    RequestDeduplicator,
+    SingleFlightResult,
+)
 
-__all__ = ["get_request_deduplicator", "RequestDeduplicator"]
+__all__ = ["get_request_deduplicator", "RequestDeduplicator", "SingleFlightResult"]
 
@@ -16,29 +16,98 @@
 """
 Request Deduplication Service
 
-Prevents duplicate concurrent requests from being processed simultaneously.
-Uses request hashing and async locks to ensure only one instance of identical requests runs at a time.
+Single-flight coalescing of identical concurrent requests.
+
+The first caller for a request key (the leader) starts the work in its own
+task; later callers (followers) await the same shared future instead of
+queueing on a lock. The task is cancelled only when every caller waiting on
+it has gone away. Completed results are kept for a short, bounded window so
+a burst that arrives just after the leader finishes is still coalesced.
+
+When ``DEDUP_REDIS_ENABLED=true`` and the caller supplies a result codec,
+leaders are also elected across workers through Redis: the worker that wins
+``SET NX`` on the request key runs the work and publishes the encoded result;
+other workers poll for it and fall back to running locally if the leader
+disappears or the wait times out. The leader keeps extending its lock while
+the work runs, so a long query does not outlive the lock and get elected a
+second leader; a leader that dies stops extending it and the lock expires.
 """
 
 import hashlib
 import json
 import logging
 import asyncio
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+import os
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Any, Awaitable, Callable, Optional, Tuple
+
+# Try to import redis, fallback to None if not available
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
 
 logger = logging.getLogger(__name__)
 
+# (encode, decode) pair used to share results between workers through Redis
+ResultCodec = Tuple[Callable[[Any], str], Callable[[str], Any]]
+
+
+@dataclass
+class _Flight:
+    """An in-progress execution shared by every caller with the same key."""
+
+    task: asyncio.Task
+    waiters: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class SingleFlightResult:
+    """Result of a coalesced call."""
+
+    value: Any
+    shared: bool  # True if this caller did not start the work itself
+    source: str  # "leader", "inflight", "recent" or "remote"
+
 
 class RequestDeduplicator:
-    """Service to deduplicate concurrent requests."""
+    """Single-flight deduplication of concurrent identical requests."""
+
+    def __init__(
+        self,
+        result_ttl_seconds: float = 5.0,
+        max_results: int = 256,
+        redis_enabled: bool = False,
+        redis_lock_ttl_seconds: float = 30.0,
+        # Covers the longest chat query timeout (230s)
+        redis_wait_timeout_seconds: float = 240.0,
+        redis_poll_interval_seconds: float = 0.1,
+    ):
+        self.active_requests: Dict[str, _Flight] = {}
+        self.request_results: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._result_ttl = result_ttl_seconds
+        self._max_results = max(0, max_results)
+
+        self.redis_enabled = redis_enabled
+        self.redis_client = None
+        self._redis_initialized = False
+        self._redis_lock_ttl_ms = int(redis_lock_ttl_seconds * 1000)
+        self._redis_wait_timeout = redis_wait_timeout_seconds
+        self._redis_poll_interval = redis_poll_interval_seconds
+        self._worker_token = uuid.uuid4().hex
 
-    def __init__(self):
-        self.active_requests: Dict[str, asyncio.Task] = {}
-        self.request_results: Dict[str, Any] = {}
-        self.request_locks: Dict[str, asyncio.Lock] = {}
-        self._cleanup_interval = 300  # 5 minutes
-        self._result_ttl = 600  # 10 minutes
+        self._stats = {
+            "leaders": 0,
+            "coalesced_inflight": 0,
+            "coalesced_recent": 0,
+            "coalesced_remote": 0,
+            "cancelled_flights": 0,
+            "failed_flights": 0,
+        }
 
     def _generate_request_key(
         self,
@@ -56,15 +125,91 @@ class RequestDeduplicator:
             "session_id": session_id,
             "context": context or {},
         }
-        request_string = json.dumps(request_data, sort_keys=True)
+        request_string = json.dumps(request_data, sort_keys=True, default=str)
         request_key = hashlib.sha256(request_string.encode()).hexdigest()
         
         return request_key
 
+    def _purge_results(self, now: float) -> None:
+        """Drop expired results; entries are ordered by completion time."""
+        while self.request_results:
+            key, (expires_at, _) = next(iter(self.request_results.items()))
+            if expires_at > now:
+                break
+            del self.request_results[key]
+
+    def _retain_result(self, request_key: str, result: Any) -> None:
+        if self._max_results == 0 or self._result_ttl <= 0:
+            return
+        self.request_results.pop(request_key, None)
+        self.request_results[request_key] = (time.monotonic() + self._result_ttl, result)
+        while len(self.request_results) > self._max_results:
+            self.request_results.popitem(last=False)
+
+    async def single_flight(
+        self,
+        request_key: str,
+        task_factory: Callable[[], Awaitable[Any]],
+        codec: Optional[ResultCodec] = None,
+        retain: Optional[Callable[[Any], bool]] = None,
+    ) -> SingleFlightResult:
+        """
+        Run ``task_factory`` once per key, sharing the result with concurrent callers.
+
+        Args:
+            request_key: Unique key for the request
+            task_factory: Async function that produces the result
+            codec: Optional (encode, decode) pair; enables cross-worker sharing via Redis
+            retain: Optional predicate deciding whether a result may be reused
+                by requests that arrive after it completed (defaults to always)
+
+        Returns:
+            SingleFlightResult with the value and whether it was shared
+        """
+        now = time.monotonic()
+        self._purge_results(now)
+        recent = self.request_results.get(request_key)
+        if recent is not None:
+            self._stats["coalesced_recent"] += 1
+            return SingleFlightResult(value=recent[1], shared=True, source="recent")
+
+        flight = self.active_requests.get(request_key)
+        is_leader = flight is None
+        if is_leader:
+            self._stats["leaders"] += 1
+            task = asyncio.create_task(self._execute(request_key, task_factory, codec, retain))
+            flight = _Flight(task=task)
+            self.active_requests[request_key] = flight
+        else:
+            self._stats["coalesced_inflight"] += 1
+            logger.info(f"Joining in-flight request: {request_key[:16]}...")
+
+        flight.waiters += 1
+        try:
+            value, source = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Last interested caller went away; stop the shared work
+                flight.task.cancel()
+                self._stats["cancelled_flights"] += 1
+                if self.active_requests.get(request_key) is flight:
+                    del self.active_requests[request_key]
+            raise
+        flight.waiters -= 1
+
+        if source == "remote":
+            return SingleFlightResult(value=value, shared=True, source="remote")
+        return SingleFlightResult(
+            value=value,
+            shared=not is_leader,
+            source="leader" if is_leader else "inflight",
+        )
+
     async def get_or_create_task(
         self,
         request_key: str,
-        task_factory: callable
+        task_factory: Callable[[], Awaitable[Any]]
     ) -> Any:
         """
         Get existing task result or create a new task if not already running.
@@ -76,86 +221,135 @@ class RequestDeduplicator:
         Returns:
             Result from the task
         """
-        # Check if we have a cached result
-        if request_key in self.request_results:
-            result_data = self.request_results[request_key]
-            if result_data.get("expires_at") and datetime.utcnow() < result_data["expires_at"]:
-                logger.info(f"Returning cached result for duplicate request: {request_key[:16]}...")
-                return result_data["result"]
+        return (await self.single_flight(request_key, task_factory)).value
+
+    async def _execute(
+        self,
+        request_key: str,
+        task_factory: Callable[[], Awaitable[Any]],
+        codec: Optional[ResultCodec],
+        retain: Optional[Callable[[Any], bool]],
+    ) -> Tuple[Any, str]:
+        """Body of a flight: optional cross-worker election, then the work itself."""
+        try:
+            client = await self._get_redis() if codec is not None else None
+            if client is None:
+                result, source = await task_factory(), "leader"
             else:
-                # Expired, remove it
-                del self.request_results[request_key]
-
-        # Get or create lock for this request
-        if request_key not in self.request_locks:
-            self.request_locks[request_key] = asyncio.Lock()
-
-        lock = self.request_locks[request_key]
-
-        async with lock:
-            # Check again after acquiring lock (double-check pattern)
-            if request_key in self.request_results:
-                result_data = self.request_results[request_key]
-                if result_data.get("expires_at") and datetime.utcnow() < result_data["expires_at"]:
-                    logger.info(f"Returning cached result (after lock): {request_key[:16]}...")
-                    return result_data["result"]
-
-            # Check if there's an active task
-            if request_key in self.active_requests:
-                active_task = self.active_requests[request_key]
-                if not active_task.done():
-                    logger.info(f"Waiting for existing task for duplicate request: {request_key[:16]}...")
-                    try:
-                        result = await active_task
-                        # Cache the result
-                        self.request_results[request_key] = {
-                            "result": result,
-                            "expires_at": datetime.utcnow() + timedelta(seconds=self._result_ttl),
-                            "cached_at": datetime.utcnow(),
-                        }
-                        return result
-                    except Exception as e:
-                        logger.error(f"Error waiting for duplicate request task: {e}")
-                        # Remove failed task and continue to create new one
-                        del self.active_requests[request_key]
-
-            # Create new task
-            logger.info(f"Creating new task for request: {request_key[:16]}...")
-            task = asyncio.create_task(task_factory())
-            self.active_requests[request_key] = task
+                result, source = await self._execute_distributed(client, request_key, task_factory, codec)
+            if source != "remote" and (retain is None or retain(result)):
+                self._retain_result(request_key, result)
+            return result, source
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._stats["failed_flights"] += 1
+            raise
+        finally:
+            flight = self.active_requests.get(request_key)
+            if flight is not None and flight.task is asyncio.current_task():
+                del self.active_requests[request_key]
+
+    async def _execute_distributed(
+        self,
+        client,
+        request_key: str,
+        task_factory: Callable[[], Awaitable[Any]],
+        codec: ResultCodec,
+    ) -> Tuple[Any, str]:
+        """Elect a leader across workers; followers wait for the published result."""
+        encode, decode = codec
+        lock_key = f"dedup:lock:{request_key}"
+        result_key = f"dedup:result:{request_key}"
+
+        try:
+            acquired = await client.set(lock_key, self._worker_token, nx=True, px=self._redis_lock_ttl_ms)
+        except Exception as e:
+            logger.warning(f"Redis leader election failed, running locally: {e}")
+            return await task_factory(), "leader"
+
+        if not acquired:
+            deadline = time.monotonic() + self._redis_wait_timeout
+            while time.monotonic() < deadline:
+                try:
+                    encoded = await client.get(result_key)
+                    if encoded is not None:
+                        self._stats["coalesced_remote"] += 1
+                        return decode(encoded), "remote"
+                    if not await client.exists(lock_key):
+                        break  # Leader finished without publishing (error) or died
+                except Exception as e:
+                    logger.warning(f"Redis result wait failed, running locally: {e}")
+                    break
+                await asyncio.sleep(self._redis_poll_interval)
+            return await task_factory(), "leader"
 
+        refresher = asyncio.ensure_future(self._refresh_lock(client, lock_key))
+        try:
+            result = await task_factory()
             try:
-                result = await task
-                # Cache the result
-                self.request_results[request_key] = {
-                    "result": result,
-                    "expires_at": datetime.utcnow() + timedelta(seconds=self._result_ttl),
-                    "cached_at": datetime.utcnow(),
-                }
-                return result
-            finally:
-                # Clean up active task
-                if request_key in self.active_requests:
-                    del self.active_requests[request_key]
+                await client.set(result_key, encode(result), px=max(1, int(self._result_ttl * 1000)))
+            except Exception as e:
+                logger.warning(f"Failed to publish deduplicated result to Redis: {e}")
+            return result, "leader"
+        finally:
+            refresher.cancel()
+            try:
+                if await client.get(lock_key) == self._worker_token:
+                    await client.delete(lock_key)
+            except Exception as e:
+                logger.debug(f"Failed to release Redis dedup lock: {e}")
+
+    async def _refresh_lock(self, client, lock_key: str) -> None:
+        """Extend the leader lock every third of its TTL while the work runs."""
+        while True:
+            await asyncio.sleep(self._redis_lock_ttl_ms / 3000)
+            try:
+                if await client.get(lock_key) != self._worker_token:
+                    return
+                await client.pexpire(lock_key, self._redis_lock_ttl_ms)
+            except Exception as e:
+                logger.debug(f"Failed to extend Redis dedup lock: {e}")
+
+    async def _get_redis(self):
+        """Lazily connect to Redis when cross-worker deduplication is enabled."""
+        if not self.redis_enabled:
+            return None
+        if self._redis_initialized:
+            return self.redis_client
+        self._redis_initialized = True
+        if redis is None:
+            logger.warning("Redis not available, request deduplication is per-worker only")
+            return None
+        try:
+            redis_host = os.getenv("REDIS_HOST", "localhost")
+            redis_port = int(os.getenv("REDIS_PORT", "6379"))
+            redis_password = os.getenv("REDIS_PASSWORD")
+            redis_db = int(os.getenv("REDIS_DB", "0"))
+
+            if redis_password:
+                redis_url = f"redis://:{redis_password}@{redis_host}:{redis_port}/{redis_db}"
+            else:
+                redis_url = f"redis://{redis_host}:{redis_port}/{redis_db}"
+
+            client = redis.from_url(
+                redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+            await client.ping()
+            self.redis_client = client
+            logger.info("✅ Request deduplicator using Redis for cross-worker leader election")
+        except Exception as e:
+            logger.warning(f"Redis not available for request deduplication, using per-worker only: {e}")
+            self.redis_client = None
+        return self.redis_client
 
     async def cleanup_expired(self) -> None:
-        """Remove expired results and clean up locks."""
-        now = datetime.utcnow()
-        
-        # Remove expired results
-        expired_keys = [
-            key for key, data in self.request_results.items()
-            if data.get("expires_at") and now > data["expires_at"]
-        ]
-        
-        for key in expired_keys:
-            del self.request_results[key]
-            # Also clean up lock if no active request
-            if key in self.request_locks and key not in self.active_requests:
-                del self.request_locks[key]
-        
-        if expired_keys:
-            logger.debug(f"Cleaned up {len(expired_keys)} expired request results")
+        """Remove expired results."""
+        self._purge_results(time.monotonic())
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get deduplication statistics."""
@@ -163,8 +357,12 @@ class RequestDeduplicator:
         
         return {
             "active_requests": len(self.active_requests),
+            "waiting_callers": sum(f.waiters for f in self.active_requests.values()),
             "cached_results": len(self.request_results),
-            "active_locks": len(self.request_locks),
+            "max_results": self._max_results,
+            "result_ttl_seconds": self._result_ttl,
+            "redis_enabled": self.redis_client is not None,
+            **self._stats,
         }
 
 
@@ -176,6 +374,11 @@ def get_request_deduplicator() -> RequestDeduplicator:
     """Get the global request deduplicator instance."""
     global _request_deduplicator
     if _request_deduplicator is None:
-        _request_deduplicator = RequestDeduplicator()
+        _request_deduplicator = RequestDeduplicator(
+            result_ttl_seconds=float(os.getenv("DEDUP_RESULT_TTL_SECONDS", "5")),
+            max_results=int(os.getenv("DEDUP_MAX_RESULTS", "256")),
+            redis_enabled=os.getenv("DEDUP_REDIS_ENABLED", "false").lower() == "true",
+            redis_lock_ttl_seconds=float(os.getenv("DEDUP_REDIS_LOCK_TTL_SECONDS", "30")),
+            redis_wait_timeout_seconds=float(os.getenv("DEDUP_REDIS_WAIT_TIMEOUT_SECONDS", "240")),
+        )
     return _request_deduplicator
-
@@ -0,0 +1,272 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Deferred Enrichment Pipeline
+
+Runs post-response chat enrichments (evidence, quick actions, conversation
+context) in the background so ``/chat`` can return the core answer first.
+
+Jobs are keyed by a response id. A fixed number of worker tasks drain a
+bounded queue, so a burst of enrichment work can never hold more than
+``max_workers`` concurrent slots; when the queue is full new jobs are
+rejected instead of competing with primary chat traffic. Clients fetch the
+result or subscribe to status updates through ``/chat/{response_id}/enrichments``.
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from src.api.services.llm.concurrency import LLMPriority, llm_priority
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+FINAL_STATUSES = (STATUS_COMPLETED, STATUS_FAILED)
+
+EnrichmentJob = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+@dataclass
+class EnrichmentRecord:
+    """State of the enrichments for one chat response."""
+
+    response_id: str
+    status: str = STATUS_PENDING
+    enrichments: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    completed_at: Optional[float] = None
+    _subscribers: List["asyncio.Queue[Dict[str, Any]]"] = field(default_factory=list, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "response_id": self.response_id,
+            "status": self.status,
+            "enrichments": self.enrichments,
+            "error": self.error,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+        }
+
+    def _publish(self) -> None:
+        snapshot = self.to_dict()
+        for queue in self._subscribers:
+            queue.put_nowait(snapshot)
+
+
+class EnrichmentPipeline:
+    """Bounded background worker pool for deferred chat enrichments."""
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue_size: int = 256,
+        job_timeout_seconds: float = 60.0,
+        result_ttl_seconds: float = 600.0,
+        max_records: int = 2000,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(1, max_queue_size)
+        self.job_timeout = job_timeout_seconds
+        self.result_ttl = result_ttl_seconds
+        self.max_records = max(1, max_records)
+
+        self._queue: Optional["asyncio.Queue[tuple]"] = None
+        self._workers: List[asyncio.Task] = []
+        self._records: "OrderedDict[str, EnrichmentRecord]" = OrderedDict()
+        self._stats = {
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+        }
+
+    def _ensure_workers(self) -> None:
+        """Start the worker tasks on first use (inside the running event loop)."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.max_queue_size)
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self.max_workers:
+            # Fresh context: workers must not inherit the first submitter's
+            # request-scoped state (trace, stream sink, safety gate)
+            self._workers.append(asyncio.create_task(self._worker(), context=contextvars.Context()))
+
+    def _evict(self) -> None:
+        """
+        Drop finished records past their TTL, and the oldest finished ones if
+        over capacity.
+
+        Pending and running records are kept (clients are polling them); the
+        queue bounds them to ``max_queue_size + max_workers``.
+        """
+        cutoff = time.time() - self.result_ttl
+        excess = len(self._records) - self.max_records
+        evicted = []
+        for response_id, record in self._records.items():
+            if record.status not in FINAL_STATUSES:
+                continue
+            if excess <= 0 and record.created_at > cutoff:
+                break
+            evicted.append(response_id)
+            excess -= 1
+        for response_id in evicted:
+            del self._records[response_id]
+
+    def submit(self, response_id: str, job: EnrichmentJob) -> bool:
+        """
+        Queue enrichment work for a response.
+
+        Returns:
+            True if the job was accepted, False if the pool is saturated
+        """
+        self._ensure_workers()
+        self._evict()
+        record = EnrichmentRecord(response_id=response_id)
+        try:
+            self._queue.put_nowait((record, job))
+        except asyncio.QueueFull:
+            self._stats["rejected"] += 1
+            logger.warning("Enrichment queue full, skipping enrichments for this response")
+            return False
+        self._records[response_id] = record
+        self._stats["submitted"] += 1
+        return True
+
+    async def _worker(self) -> None:
+        while True:
+            record, job = await self._queue.get()
+            try:
+                # Enrichments must not compete with chat requests for NIM slots
+                with llm_priority(LLMPriority.BACKGROUND):
+                    await self._run(record, job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, record: EnrichmentRecord, job: EnrichmentJob) -> None:
+        record.status = STATUS_RUNNING
+        record._publish()
+        try:
+            record.enrichments = await asyncio.wait_for(job(), timeout=self.job_timeout) or {}
+            record.status = STATUS_COMPLETED
+            self._stats["completed"] += 1
+        except asyncio.TimeoutError:
+            record.status = STATUS_FAILED
+            record.error = "Enrichment timed out"
+            self._stats["timed_out"] += 1
+        except Exception as e:
+            logger.warning(f"Deferred enrichment failed: {e}")
+            record.status = STATUS_FAILED
+            record.error = type(e).__name__
+            self._stats["failed"] += 1
+        record.completed_at = time.time()
+        record._publish()
+
+    def get(self, response_id: str) -> Optional[EnrichmentRecord]:
+        """Get the enrichment record for a response, if it is still retained."""
+        self._evict()
+        return self._records.get(response_id)
+
+    async def wait(self, response_id: str, timeout: float) -> Optional[EnrichmentRecord]:
+        """Wait up to ``timeout`` seconds for a record to reach a final status."""
+        async for _ in self.subscribe(response_id, timeout=timeout):
+            pass
+        return self._records.get(response_id)
+
+    async def subscribe(
+        self, response_id: str, timeout: float = 60.0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield record snapshots as the status changes, ending at a final status.
+
+        The current state is yielded first, so late subscribers still see the result.
+        """
+        record = self._records.get(response_id)
+        if record is None:
+            return
+        queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        record._subscribers.append(queue)
+        try:
+            yield record.to_dict()
+            deadline = time.monotonic() + timeout
+            while record.status not in FINAL_STATUSES:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    snapshot = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    return
+                yield snapshot
+        finally:
+            record._subscribers.remove(queue)
+
+    async def close(self) -> None:
+        """Cancel the worker tasks and fail the records they will not finish."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        # Subscribers waiting on queued or cancelled jobs get a final status
+        for record in self._records.values():
+            if record.status not in FINAL_STATUSES:
+                record.status = STATUS_FAILED
+                record.error = "Shutting down"
+                record.completed_at = time.time()
+                record._publish()
+        self._queue = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pipeline statistics."""
+        return {
+            "max_workers": self.max_workers,
+            "active_workers": len([w for w in self._workers if not w.done()]),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_size": self.max_queue_size,
+            "retained_records": len(self._records),
+            **self._stats,
+        }
+
+
+# Global enrichment pipeline instance
+_enrichment_pipeline: Optional[EnrichmentPipeline] = None
+
+
+def is_deferred_enrichment_default() -> bool:
+    """Whether /chat defers enrichments when the request doesn't say."""
+    return os.getenv("CHAT_DEFER_ENRICHMENTS", "false").lower() == "true"
+
+
+def get_enrichment_pipeline() -> EnrichmentPipeline:
+    """Get the global enrichment pipeline instance."""
+    global _enrichment_pipeline
+    if _enrichment_pipeline is None:
+        _enrichment_pipeline = EnrichmentPipeline(
+            max_workers=int(os.getenv("ENRICHMENT_MAX_WORKERS", "4")),
+            max_queue_size=int(os.getenv("ENRICHMENT_MAX_QUEUE", "256")),
+            job_timeout_seconds=float(os.getenv("ENRICHMENT_JOB_TIMEOUT_SECONDS", "60")),
+            result_ttl_seconds=float(os.getenv("ENRICHMENT_RESULT_TTL_SECONDS", "600")),
+        )
+    return _enrichment_pipeline
@@ -34,6 +34,7 @@ from pathlib import Path
 import os
 import httpx
 from dotenv import load_dotenv
+from src.api.services.monitoring.tracing import traced
 
 load_dotenv()
 
@@ -300,6 +301,7 @@ class GuardrailsService:
             logger.warning(f"Guardrails API call failed: {e}. Falling back to pattern matching.")
             return None
 
+    @traced("guardrails.input")
     async def check_input_safety(
         self, user_input: str, context: Optional[Dict[str, Any]] = None
     ) -> GuardrailsResult:
@@ -485,6 +487,7 @@ class GuardrailsService:
             method_used="pattern_matching",
         )
 
+    @traced("guardrails.output")
     async def check_output_safety(
         self, response: str, context: Optional[Dict[str, Any]] = None
     ) -> GuardrailsResult:
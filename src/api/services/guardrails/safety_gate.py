@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Speculative input safety gate.
+
+Lets intent routing start while the input guardrails check is still running.
+The chat endpoint installs a ``SafetyGate`` in a ``ContextVar`` before it
+starts the planner; the planner awaits the gate after routing, so no agent
+(and no agent LLM/tool call) runs before the input has been cleared. When no
+gate is installed waiting is a no-op.
+"""
+
+import asyncio
+import os
+from contextvars import ContextVar
+from typing import Optional
+
+_safety_gate: ContextVar[Optional["SafetyGate"]] = ContextVar("safety_gate", default=None)
+
+
+def is_speculative_guardrails_enabled() -> bool:
+    """Check whether input guardrails may run concurrently with intent routing."""
+    return os.getenv("GUARDRAILS_SPECULATIVE_ROUTING", "false").lower() == "true"
+
+
+class SafetyGate:
+    """One-shot verdict shared between the guardrails check and the planner."""
+
+    def __init__(self):
+        self._verdict: "asyncio.Future[bool]" = asyncio.get_running_loop().create_future()
+
+    def resolve(self, allowed: bool) -> None:
+        """Record the verdict; later calls are ignored."""
+        if not self._verdict.done():
+            self._verdict.set_result(allowed)
+
+    def resolve_from_task(self, task: "asyncio.Task") -> None:
+        """
+        Done-callback for the guardrails task.
+
+        The task returns a violation response when the input is unsafe and
+        ``None`` otherwise. Errors and timeouts fail open, matching the
+        non-speculative path.
+        """
+        if task.cancelled():
+            if not self._verdict.done():
+                self._verdict.cancel()
+            return
+        self.resolve(task.exception() is not None or task.result() is None)
+
+    async def wait(self) -> None:
+        """Wait for the verdict; raise ``CancelledError`` if the input was blocked."""
+        if not await asyncio.shield(self._verdict):
+            raise asyncio.CancelledError("Input safety violation")
+
+
+def set_safety_gate(gate: Optional[SafetyGate]):
+    """Install a safety gate for the current context. Returns a reset token."""
+    return _safety_gate.set(gate)
+
+
+def reset_safety_gate(token) -> None:
+    """Restore the safety gate that was active before ``set_safety_gate``."""
+    _safety_gate.reset(token)
+
+
+async def wait_for_input_safety() -> None:
+    """Block until the current request's input is cleared (no-op without a gate)."""
+    gate = _safety_gate.get()
+    if gate is not None:
+        await gate.wait()
@@ -0,0 +1,248 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Adaptive Concurrency Limiting for NIM Endpoints
+
+``AdaptiveConcurrencyLimiter`` caps the number of in-flight calls to one
+endpoint and adjusts the cap from observed behaviour (AIMD):
+
+- Additive increase: after a full window of successful calls that finished
+  while at least half the limit was in use, the limit grows by one.
+- Multiplicative decrease: on an overload signal (HTTP 429, timeout) or when
+  latency rises well above the best latency seen (the latency gradient), the
+  limit is multiplied by ``backoff_ratio``. Decreases are spaced out so one
+  burst of failures counts once.
+
+Callers that cannot get a slot wait in a priority queue; interactive chat is
+served before document judging, which is served before background work.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+
+class LLMPriority(IntEnum):
+    """Priority classes for NIM calls (lower value is served first)."""
+
+    INTERACTIVE = 0  # Chat requests a user is waiting on
+    JUDGE = 1  # Document quality judging
+    BACKGROUND = 2  # Forecasting, indexing and other background work
+
+
+_current_priority: ContextVar[LLMPriority] = ContextVar(
+    "llm_priority", default=LLMPriority.INTERACTIVE
+)
+
+
+def get_llm_priority() -> LLMPriority:
+    """Get the NIM call priority for the current context."""
+    return _current_priority.get()
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """Run NIM calls made inside the block (and tasks it starts) at ``priority``."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+# Queue-wait samples kept per priority class for percentiles
+_WAIT_SAMPLES = 500
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit with a priority wait queue for one endpoint."""
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_ratio: float = 0.7,
+        latency_tolerance: Optional[float] = 2.5,
+        is_overload: Optional[Callable[[BaseException], bool]] = None,
+    ):
+        """
+        Args:
+            name: Endpoint name used in statistics
+            initial_limit: Starting concurrency limit
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            backoff_ratio: Factor applied to the limit on overload
+            latency_tolerance: A successful call slower than this multiple of the
+                best observed latency counts as an overload signal (None to
+                adjust on errors only, for calls whose latency depends on the
+                request, such as LLM output length)
+            is_overload: Classifies exceptions raised inside ``acquire`` as
+                overload (e.g. 429); other exceptions leave the limit unchanged
+        """
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.is_overload = is_overload or (lambda e: False)
+
+        self.in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._min_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._successes_in_window = 0
+
+        self._wait_samples: Dict[LLMPriority, Deque[float]] = {
+            p: deque(maxlen=_WAIT_SAMPLES) for p in LLMPriority
+        }
+        self._stats = {
+            "acquired": 0,
+            "queued": 0,
+            "increases": 0,
+            "decreases": 0,
+            "overloads": 0,
+        }
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    def has_capacity(self) -> bool:
+        """Whether a call could start now without queueing."""
+        return self.in_flight < int(self.limit)
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to waiters in priority order."""
+        while self._waiters and self.has_capacity():
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():  # Cancelled while waiting
+                continue
+            self.in_flight += 1
+            future.set_result(None)
+
+    async def _acquire_slot(self, priority: LLMPriority) -> None:
+        if self.has_capacity() and not self.queue_depth:
+            self.in_flight += 1
+            return
+        self._stats["queued"] += 1
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just before cancellation; hand it on
+                self._release_slot()
+            raise
+
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        self._wake_waiters()
+
+    def _on_success(self, latency: float, saturated: bool) -> None:
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        if self.latency_tolerance is not None and latency > self._min_latency * self.latency_tolerance:
+            self._decrease()
+            return
+        if not saturated:
+            return
+        self._successes_in_window += 1
+        if self._successes_in_window >= int(self.limit):
+            self._successes_in_window = 0
+            if self.limit < self.max_limit:
+                self.limit = min(self.max_limit, self.limit + 1)
+                self._stats["increases"] += 1
+                self._wake_waiters()
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        # One decrease per best-latency interval, so a burst of failures from
+        # calls that were already in flight counts once
+        cooldown = max(self._min_latency or 0.0, 0.1)
+        if now - self._last_decrease < cooldown:
+            return
+        self._last_decrease = now
+        self._successes_in_window = 0
+        new_limit = max(self.min_limit, self.limit * self.backoff_ratio)
+        if new_limit < self.limit:
+            self.limit = new_limit
+            self._stats["decreases"] += 1
+
+    @asynccontextmanager
+    async def acquire(self, priority: Optional[LLMPriority] = None) -> AsyncIterator[float]:
+        """
+        Hold a slot for the duration of the block.
+
+        Yields the time spent waiting in the queue, in milliseconds. The
+        outcome of the block (success, overload exception, other exception)
+        feeds the limit adjustment.
+        """
+        priority = get_llm_priority() if priority is None else priority
+        queued_at = time.perf_counter()
+        await self._acquire_slot(priority)
+        started_at = time.perf_counter()
+        wait_ms = (started_at - queued_at) * 1000
+        self._wait_samples[priority].append(wait_ms)
+        self._stats["acquired"] += 1
+        try:
+            yield wait_ms
+        except BaseException as e:
+            if not isinstance(e, asyncio.CancelledError) and self.is_overload(e):
+                self._stats["overloads"] += 1
+                self._decrease()
+            raise
+        else:
+            # Only grow when the current limit is actually being used
+            saturated = self.in_flight * 2 >= int(self.limit)
+            self._on_success(time.perf_counter() - started_at, saturated)
+        finally:
+            self._release_slot()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limit, occupancy and queue-wait statistics."""
+        queue_wait: Dict[str, Dict[str, float]] = {}
+        for priority, samples in self._wait_samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            queue_wait[priority.name.lower()] = {
+                "count": len(ordered),
+                "mean_ms": round(sum(ordered) / len(ordered), 3),
+                "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))], 3),
+                "max_ms": round(ordered[-1], 3),
+            }
+        return {
+            "name": self.name,
+            "limit": int(self.limit),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "min_latency_ms": round(self._min_latency * 1000, 3) if self._min_latency else None,
+            "queue_wait": queue_wait,
+            **self._stats,
+        }
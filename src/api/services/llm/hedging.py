@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Hedged Requests for NIM Calls
+
+``RequestHedger`` trims tail latency: when a call has not finished after the
+hedge delay (by default the observed p90 latency for the model), an identical
+second call is started, the first successful result is used and the other
+call is cancelled.
+
+Hedges are capped by a token-bucket budget: every call earns
+``budget_percent / 100`` of a hedge, a hedge spends one, and unspent budget
+is capped at ``budget_burst`` hedges. A long healthy period therefore cannot
+save up budget for an incident, when hedging every call would double the load
+on an endpoint that is already slow. No hedge is sent until enough latency
+samples have been collected to pick a delay.
+
+The delay percentile is taken over primary attempts only. A primary that
+loses to its hedge is recorded with the time it ran before being cancelled,
+so slow calls are not dropped from the distribution.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from src.api.services.monitoring.tracing import current_span
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Latency samples kept per model for the hedge delay percentile
+_LATENCY_SAMPLES = 200
+
+
+class RequestHedger:
+    """Sends a backup call when the first one is slower than the hedge delay."""
+
+    def __init__(
+        self,
+        name: str,
+        enabled: bool = False,
+        delay_percentile: float = 90.0,
+        fixed_delay_ms: Optional[float] = None,
+        min_delay_ms: float = 50.0,
+        budget_percent: float = 5.0,
+        budget_burst: float = 10.0,
+        min_samples: int = 20,
+    ):
+        """
+        Args:
+            name: Endpoint name used in statistics
+            enabled: Whether calls are hedged at all
+            delay_percentile: Latency percentile used as the hedge delay
+            fixed_delay_ms: Use this delay instead of the observed percentile
+            min_delay_ms: Lower bound for the hedge delay
+            budget_percent: Maximum hedges as a percentage of calls
+            budget_burst: Maximum hedges that can be saved up from quiet periods
+            min_samples: Latency samples needed before the percentile is used
+        """
+        self.name = name
+        self.enabled = enabled
+        self.delay_percentile = delay_percentile
+        self.fixed_delay_ms = fixed_delay_ms
+        self.min_delay_ms = min_delay_ms
+        self.budget_percent = budget_percent
+        self.budget_burst = max(1.0, budget_burst)
+        self.min_samples = min_samples
+
+        self._budget_tokens = 0.0
+
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._stats = {
+            "calls": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "primary_wins": 0,
+            "budget_exhausted": 0,
+        }
+
+    def _record_latency(self, key: str, latency_ms: float) -> None:
+        samples = self._latencies.get(key)
+        if samples is None:
+            samples = self._latencies[key] = deque(maxlen=_LATENCY_SAMPLES)
+        samples.append(latency_ms)
+
+    def hedge_delay_ms(self, key: str) -> Optional[float]:
+        """Current hedge delay for ``key`` (None until enough samples exist)."""
+        if self.fixed_delay_ms is not None:
+            return max(self.min_delay_ms, self.fixed_delay_ms)
+        samples = self._latencies.get(key)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.delay_percentile / 100))
+        return max(self.min_delay_ms, ordered[index])
+
+    def _earn_budget(self) -> None:
+        self._budget_tokens = min(self.budget_burst, self._budget_tokens + self.budget_percent / 100)
+
+    def _spend_budget(self) -> bool:
+        if self._budget_tokens < 1.0:
+            return False
+        self._budget_tokens -= 1.0
+        return True
+
+    async def _timed(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        result = await call()
+        self._record_latency(key, (time.perf_counter() - started) * 1000)
+        return result
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        key: str = "default",
+        can_hedge: Optional[Callable[[], bool]] = None,
+    ) -> T:
+        """
+        Run ``call``, hedging it if it is slower than the hedge delay.
+
+        Args:
+            call: Creates a new attempt each time it is invoked
+            key: Latency bucket, normally the model name
+            can_hedge: Extra check made when the delay expires (e.g. skip the
+                hedge while the endpoint is at its concurrency limit)
+
+        Returns:
+            The result of the first attempt to succeed. If both fail, the
+            primary's exception is raised.
+        """
+        self._stats["calls"] += 1
+        self._earn_budget()
+        delay_ms = self.hedge_delay_ms(key) if self.enabled else None
+        if delay_ms is None:
+            return await self._timed(key, call)
+
+        primary_started = time.perf_counter()
+        primary = asyncio.ensure_future(self._timed(key, call))
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay_ms / 1000)
+            if done:
+                return primary.result()
+            if (can_hedge is not None and not can_hedge()) or not self._spend_budget():
+                self._stats["budget_exhausted"] += 1
+                return await primary
+
+            self._stats["hedged"] += 1
+            # Only primaries are timed; a hedge's latency is conditioned on
+            # the primary being slow
+            hedge = asyncio.ensure_future(call())
+            hedge_span = current_span()
+            if hedge_span is not None:
+                hedge_span.set(hedged=True, hedge_delay_ms=round(delay_ms, 3))
+            try:
+                pending = {primary, hedge}
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    winner = next((t for t in done if not t.cancelled() and t.exception() is None), None)
+                    if winner is not None:
+                        won_by_hedge = winner is hedge
+                        if won_by_hedge and not primary.done():
+                            # The primary took at least this long
+                            self._record_latency(key, (time.perf_counter() - primary_started) * 1000)
+                        self._stats["hedge_wins" if won_by_hedge else "primary_wins"] += 1
+                        if hedge_span is not None:
+                            hedge_span.set(hedge_won=won_by_hedge)
+                        return winner.result()
+                # Both attempts failed
+                return primary.result()
+            finally:
+                hedge.cancel()
+        finally:
+            primary.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hedge counts, win rate and current delays."""
+        hedged = self._stats["hedged"]
+        return {
+            "name": self.name,
+            "enabled": self.enabled,
+            "budget_percent": self.budget_percent,
+            "budget_available": round(self._budget_tokens, 3),
+            "hedge_rate_percent": round(hedged / self._stats["calls"] * 100, 2) if self._stats["calls"] else 0.0,
+            "hedge_win_rate_percent": round(self._stats["hedge_wins"] / hedged * 100, 2) if hedged else 0.0,
+            "delay_ms": {
+                key: round(delay, 3)
+                for key in self._latencies
+                if (delay := self.hedge_delay_ms(key)) is not None
+            },
+            **self._stats,
+        }
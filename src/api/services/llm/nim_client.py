@@ -25,13 +25,19 @@ import json
 import asyncio
 import hashlib
 import math
+import re
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta, timezone
 from urllib.parse import urlparse
 import os
 from dotenv import load_dotenv
 
+from src.api.services.streaming.chat_stream import ChatStreamSink, get_chat_stream_sink
+from src.api.services.monitoring.tracing import current_span, traced
+from src.api.services.llm.response_cache import LLMResponseCache
+from src.api.services.llm.concurrency import AdaptiveConcurrencyLimiter, LLMPriority
+from src.api.services.llm.hedging import RequestHedger
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -61,6 +67,26 @@ def _getenv_float(key: str, default: float) -> float:
         return default
 
 
+# Variable data stripped from prompts before computing the response cache key
+_CACHE_KEY_NORMALIZERS = [
+    # Timestamps (various formats)
+    (re.compile(r'\d{4}-\d{2}-\d{2}[\sT]\d{2}:\d{2}:\d{2}[.\d]*Z?'), ''),
+    # Task IDs and similar patterns (e.g., TASK_PICK_20251207_121327)
+    (re.compile(r'TASK_[A-Z_]+_\d{8}_\d{6}'), 'TASK_ID'),
+    # UUIDs
+    (re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.IGNORECASE), 'UUID'),
+    # Specific dates in various formats
+    (re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'), 'DATE'),
+]
+
+
+def _is_overload_error(error: BaseException) -> bool:
+    """Whether an error means the NIM endpoint is overloaded (429 or timeout)."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in (429, 503)
+    return isinstance(error, (httpx.TimeoutException, asyncio.TimeoutError))
+
+
 @dataclass
 class NIMConfig:
     """NVIDIA NIM configuration."""
@@ -80,6 +106,10 @@ class NIMConfig:
     default_top_p: float = _getenv_float("LLM_TOP_P", 1.0)
     default_frequency_penalty: float = _getenv_float("LLM_FREQUENCY_PENALTY", 0.0)
     default_presence_penalty: float = _getenv_float("LLM_PRESENCE_PENALTY", 0.0)
+    # Embedding request limits: larger inputs are split into parallel sub-batches
+    embedding_max_batch_texts: int = _getenv_int("EMBEDDING_MAX_BATCH_TEXTS", 50)
+    embedding_max_batch_tokens: int = _getenv_int("EMBEDDING_MAX_BATCH_TOKENS", 16000)
+    embedding_max_parallel_batches: int = _getenv_int("EMBEDDING_MAX_PARALLEL_BATCHES", 4)
 
 
 @dataclass
@@ -113,9 +143,55 @@ class NIMClient:
         self.config = config or NIMConfig()
         self.enable_cache = enable_cache
         self.cache_ttl = cache_ttl  # Default 5 minutes
-        self._response_cache: Dict[str, Dict[str, Any]] = {}
-        self._cache_lock = asyncio.Lock()
-        self._cache_stats = {"hits": 0, "misses": 0}
+        self._response_cache = LLMResponseCache(
+            codec=(
+                lambda response: json.dumps(asdict(response)),
+                lambda encoded: LLMResponse(**json.loads(encoded)),
+            ),
+            ttl_seconds=cache_ttl,
+            max_entries=_getenv_int("LLM_CACHE_MAX_ENTRIES", 2048),
+            max_bytes=_getenv_int("LLM_CACHE_MAX_BYTES", 32 * 1024 * 1024),
+            redis_enabled=os.getenv("LLM_CACHE_REDIS_ENABLED", "false").lower() == "true",
+        )
+        # Adaptive in-flight limits per endpoint. LLM latency depends on output
+        # length and embedding latency on batch size, so by default both limits
+        # only back off on 429s and timeouts.
+        self.llm_limiter = AdaptiveConcurrencyLimiter(
+            "llm",
+            initial_limit=_getenv_int("LLM_CONCURRENCY_INITIAL", 8),
+            min_limit=_getenv_int("LLM_CONCURRENCY_MIN", 1),
+            max_limit=_getenv_int("LLM_CONCURRENCY_MAX", 32),
+            latency_tolerance=None,
+            is_overload=_is_overload_error,
+        )
+        self.embedding_limiter = AdaptiveConcurrencyLimiter(
+            "embeddings",
+            initial_limit=_getenv_int("EMBEDDING_CONCURRENCY_INITIAL", 8),
+            min_limit=_getenv_int("EMBEDDING_CONCURRENCY_MIN", 1),
+            max_limit=_getenv_int("EMBEDDING_CONCURRENCY_MAX", 32),
+            latency_tolerance=_getenv_float("EMBEDDING_CONCURRENCY_LATENCY_TOLERANCE", 0.0) or None,
+            is_overload=_is_overload_error,
+        )
+        # Opt-in hedging: duplicate a call that is slower than the observed p90
+        hedge_budget = _getenv_float("NIM_HEDGE_BUDGET_PERCENT", 5.0)
+        hedge_burst = _getenv_float("NIM_HEDGE_BUDGET_BURST", 10.0)
+        hedge_percentile = _getenv_float("NIM_HEDGE_DELAY_PERCENTILE", 90.0)
+        self.llm_hedger = RequestHedger(
+            "llm",
+            enabled=os.getenv("LLM_HEDGING_ENABLED", "false").lower() == "true",
+            delay_percentile=hedge_percentile,
+            fixed_delay_ms=_getenv_float("LLM_HEDGE_DELAY_MS", 0.0) or None,
+            budget_percent=hedge_budget,
+            budget_burst=hedge_burst,
+        )
+        self.embedding_hedger = RequestHedger(
+            "embeddings",
+            enabled=os.getenv("EMBEDDING_HEDGING_ENABLED", "false").lower() == "true",
+            delay_percentile=hedge_percentile,
+            fixed_delay_ms=_getenv_float("EMBEDDING_HEDGE_DELAY_MS", 0.0) or None,
+            budget_percent=hedge_budget,
+            budget_burst=hedge_burst,
+        )
         
         # Validate configuration
         self._validate_config()
@@ -182,18 +258,10 @@ class NIMClient:
 
     def _normalize_content_for_cache(self, content: str) -> str:
         """Normalize content to improve cache hit rates by removing variable data."""
-        import re
-        # Remove timestamps (various formats)
-        content = re.sub(r'\d{4}-\d{2}-\d{2}[\sT]\d{2}:\d{2}:\d{2}[.\d]*Z?', '', content)
-        # Remove task IDs and similar patterns (e.g., TASK_PICK_20251207_121327)
-        content = re.sub(r'TASK_[A-Z_]+_\d{8}_\d{6}', 'TASK_ID', content)
-        # Remove UUIDs
-        content = re.sub(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', 'UUID', content, flags=re.IGNORECASE)
-        # Remove specific dates in various formats
-        content = re.sub(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b', 'DATE', content)
+        for pattern, replacement in _CACHE_KEY_NORMALIZERS:
+            content = pattern.sub(replacement, content)
         # Normalize whitespace
-        content = ' '.join(content.split())
-        return content.strip()
+        return ' '.join(content.split())
     
     def _generate_cache_key(
         self,
@@ -240,65 +308,64 @@ class NIMClient:
         if not self.enable_cache:
             return None
         
-        async with self._cache_lock:
-            if cache_key not in self._response_cache:
-                return None
-            
-            cached_item = self._response_cache[cache_key]
-            expires_at = cached_item.get("expires_at")
-            
-            # Check if expired
-            if expires_at and datetime.now(timezone.utc) > expires_at:
-                del self._response_cache[cache_key]
-                logger.debug(f"Cache entry expired for key: {cache_key[:16]}...")
-                return None
-            
-            self._cache_stats["hits"] += 1
+        response = await self._response_cache.get(cache_key)
+        if response is not None:
             logger.info(f"✅ Cache hit for LLM request (key: {cache_key[:16]}...)")
-            return cached_item.get("response")
+        return response
     
     async def _cache_response(self, cache_key: str, response: LLMResponse) -> None:
         """Cache LLM response."""
         if not self.enable_cache:
             return
         
-        async with self._cache_lock:
-            now = datetime.now(timezone.utc)
-            expires_at = now + timedelta(seconds=self.cache_ttl)
-            
-            self._response_cache[cache_key] = {
-                "response": response,
-                "expires_at": expires_at,
-                "cached_at": now,
-            }
-            
-            logger.debug(f"Cached LLM response (key: {cache_key[:16]}..., TTL: {self.cache_ttl}s)")
+        await self._response_cache.set(cache_key, response)
+        logger.debug(f"Cached LLM response (key: {cache_key[:16]}..., TTL: {self.cache_ttl}s)")
     
     async def clear_cache(self) -> None:
         """Clear all cached responses."""
-        async with self._cache_lock:
-            self._response_cache.clear()
-            logger.info("LLM response cache cleared")
+        await self._response_cache.clear()
+        logger.info("LLM response cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        total_requests = self._cache_stats["hits"] + self._cache_stats["misses"]
-        hit_rate = (self._cache_stats["hits"] / total_requests * 100) if total_requests > 0 else 0
+        stats = self._response_cache.get_stats()
+        total_requests = stats["hits"] + stats["misses"]
+        hit_rate = (stats["hits"] / total_requests * 100) if total_requests > 0 else 0
         
         return {
-            "hits": self._cache_stats["hits"],
-            "misses": self._cache_stats["misses"],
+            **stats,
             "total_requests": total_requests,
             "hit_rate_percent": round(hit_rate, 2),
-            "cached_entries": len(self._response_cache),
             "cache_enabled": self.enable_cache,
         }
     
+    @staticmethod
+    def _record_queue_wait(queue_wait_ms: float) -> None:
+        """Attach time spent waiting for a concurrency slot to the current span."""
+        call_span = current_span()
+        if call_span is not None:
+            call_span.set(queue_wait_ms=round(queue_wait_ms, 3))
+
+    def get_concurrency_stats(self) -> Dict[str, Any]:
+        """Get adaptive concurrency limiter statistics per endpoint."""
+        return {
+            "llm": self.llm_limiter.get_stats(),
+            "embeddings": self.embedding_limiter.get_stats(),
+        }
+
+    def get_hedging_stats(self) -> Dict[str, Any]:
+        """Get request hedging statistics per endpoint."""
+        return {
+            "llm": self.llm_hedger.get_stats(),
+            "embeddings": self.embedding_hedger.get_stats(),
+        }
+
     async def close(self):
         """Close HTTP clients."""
         await self.llm_client.aclose()
         await self.embedding_client.aclose()
 
+    @traced("llm.generate")
     async def generate_response(
         self,
         messages: List[Dict[str, str]],
@@ -309,6 +376,8 @@ class NIMClient:
         presence_penalty: Optional[float] = None,
         stream: bool = False,
         max_retries: int = 3,
+        stream_to_client: bool = False,
+        priority: Optional[LLMPriority] = None,
     ) -> LLMResponse:
         """
         Generate response using NVIDIA NIM LLM with retry logic.
@@ -320,8 +389,15 @@ class NIMClient:
             top_p: Nucleus sampling parameter (0.0 to 1.0). If None, uses config default.
             frequency_penalty: Frequency penalty (-2.0 to 2.0). If None, uses config default.
             presence_penalty: Presence penalty (-2.0 to 2.0). If None, uses config default.
-            stream: Whether to stream the response
+            stream: Whether to stream the response from the endpoint. The streamed
+                chunks are assembled, so the return value is the same either way.
             max_retries: Maximum number of retry attempts
+            stream_to_client: Mark this call as the user-facing final response. When
+                the current request is served by ``/chat/stream`` the tokens are
+                forwarded to the client as they arrive.
+            priority: Queue priority when the endpoint is at its concurrency
+                limit. If None, uses the priority set with ``llm_priority``
+                (interactive by default).
 
         Returns:
             LLMResponse with generated content
@@ -333,16 +409,25 @@ class NIMClient:
         frequency_penalty = frequency_penalty if frequency_penalty is not None else self.config.default_frequency_penalty
         presence_penalty = presence_penalty if presence_penalty is not None else self.config.default_presence_penalty
         
-        # Check cache first (skip for streaming)
-        if not stream and self.enable_cache:
+        # Forward tokens to the client when this request is being streamed
+        sink = get_chat_stream_sink() if stream_to_client else None
+        if sink is not None:
+            stream = True
+        
+        # Check cache first (streamed responses are assembled, so they are cacheable too)
+        if self.enable_cache:
             cache_key = self._generate_cache_key(
                 messages, temperature, max_tokens, top_p, frequency_penalty, presence_penalty
             )
             cached_response = await self._get_cached_response(cache_key)
             if cached_response:
+                llm_span = current_span()
+                if llm_span is not None:
+                    llm_span.set(cache_hit=True)
+                if sink is not None:
+                    sink.begin_llm_segment()
+                    sink.llm_delta(cached_response.content)
                 return cached_response
-            else:
-                self._cache_stats["misses"] += 1
         
         payload = {
             "model": self.config.llm_model,
@@ -366,20 +451,23 @@ class NIMClient:
         for attempt in range(max_retries):
             try:
                 logger.info(f"LLM generation attempt {attempt + 1}/{max_retries}")
-                response = await self.llm_client.post("/chat/completions", json=payload)
-                response.raise_for_status()
-
-                data = response.json()
-
-                llm_response = LLMResponse(
-                    content=data["choices"][0]["message"]["content"],
-                    usage=data.get("usage", {}),
-                    model=data.get("model", self.config.llm_model),
-                    finish_reason=data["choices"][0].get("finish_reason", "stop"),
-                )
+                if stream:
+                    # Streamed calls are not hedged: tokens may already be on their way to the client
+                    async with self.llm_limiter.acquire(priority) as queue_wait_ms:
+                        self._record_queue_wait(queue_wait_ms)
+                        if sink is not None:
+                            # Each attempt starts a new segment that replaces partial output
+                            sink.begin_llm_segment()
+                        llm_response = await self._post_streaming_completion(payload, sink)
+                else:
+                    llm_response = await self.llm_hedger.run(
+                        lambda: self._post_completion(payload, priority),
+                        key=payload["model"],
+                        can_hedge=self.llm_limiter.has_capacity,
+                    )
                 
-                # Cache the response (skip for streaming)
-                if not stream and self.enable_cache:
+                # Cache the response
+                if self.enable_cache:
                     cache_key = self._generate_cache_key(
                         messages, temperature, max_tokens, top_p, frequency_penalty, presence_penalty
                     )
@@ -492,36 +580,215 @@ class NIMClient:
                         "LLM service error occurred. Please try again or contact support if the issue persists."
                     ) from e
 
+    async def _post_completion(
+        self, payload: Dict[str, Any], priority: Optional[LLMPriority] = None
+    ) -> LLMResponse:
+        """Make one non-streaming chat completions call within the LLM concurrency limit."""
+        async with self.llm_limiter.acquire(priority) as queue_wait_ms:
+            self._record_queue_wait(queue_wait_ms)
+            response = await self.llm_client.post("/chat/completions", json=payload)
+            response.raise_for_status()
+
+        data = response.json()
+
+        return LLMResponse(
+            content=data["choices"][0]["message"]["content"],
+            usage=data.get("usage", {}),
+            model=data.get("model", self.config.llm_model),
+            finish_reason=data["choices"][0].get("finish_reason", "stop"),
+        )
+
+    async def _post_streaming_completion(
+        self, payload: Dict[str, Any], sink: Optional[ChatStreamSink] = None
+    ) -> LLMResponse:
+        """
+        Call the chat completions endpoint in streaming mode and assemble the result.
+
+        Args:
+            payload: Request payload (``stream`` must be True)
+            sink: Optional chat stream sink that receives each content delta
+
+        Returns:
+            LLMResponse with the concatenated content
+        """
+        content_parts: List[str] = []
+        usage: Dict[str, int] = {}
+        model = self.config.llm_model
+        finish_reason = "stop"
+
+        async with self.llm_client.stream("POST", "/chat/completions", json=payload) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data_str = line[5:].strip()
+                if data_str == "[DONE]":
+                    break
+                try:
+                    chunk = json.loads(data_str)
+                except json.JSONDecodeError:
+                    continue
+
+                model = chunk.get("model", model)
+                if chunk.get("usage"):
+                    usage = chunk["usage"]
+                choices = chunk.get("choices") or []
+                if not choices:
+                    continue
+                delta = (choices[0].get("delta") or {}).get("content") or ""
+                if delta:
+                    content_parts.append(delta)
+                    if sink is not None:
+                        sink.llm_delta(delta)
+                if choices[0].get("finish_reason"):
+                    finish_reason = choices[0]["finish_reason"]
+
+        return LLMResponse(
+            content="".join(content_parts),
+            usage=usage,
+            model=model,
+            finish_reason=finish_reason,
+        )
+
+    def _split_embedding_batches(self, texts: List[str]) -> List[List[str]]:
+        """
+        Split texts into sub-batches within the provider's per-request limits.
+
+        Limits are a text count and an estimated token count (about four
+        characters per token); a single oversized text gets a batch of its own.
+        """
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = len(text) // 4 + 1
+            if current and (
+                len(current) >= self.config.embedding_max_batch_texts
+                or current_tokens + tokens > self.config.embedding_max_batch_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _embed_sub_batch(
+        self,
+        texts: List[str],
+        model: str,
+        input_type: str,
+        priority: Optional[LLMPriority],
+        max_retries: int,
+    ) -> EmbeddingResponse:
+        """Embed one sub-batch, retrying it alone on rate limits, timeouts and 5xx errors."""
+        payload = {
+            "model": model,
+            "input": texts,
+            "input_type": input_type,
+        }
+
+        async def post_embeddings() -> httpx.Response:
+            async with self.embedding_limiter.acquire(priority) as queue_wait_ms:
+                self._record_queue_wait(queue_wait_ms)
+                response = await self.embedding_client.post("/embeddings", json=payload)
+                response.raise_for_status()
+                return response
+
+        for attempt in range(max_retries):
+            try:
+                response = await self.embedding_hedger.run(
+                    post_embeddings,
+                    key=model,
+                    can_hedge=self.embedding_limiter.has_capacity,
+                )
+                break
+            except (httpx.HTTPStatusError, httpx.RequestError) as e:
+                retryable = not isinstance(e, httpx.HTTPStatusError) or (
+                    e.response.status_code == 429 or e.response.status_code >= 500
+                )
+                if not retryable or attempt == max_retries - 1:
+                    raise
+                wait_time = 0.5 * 2**attempt
+                logger.warning(
+                    f"Embedding sub-batch of {len(texts)} texts failed ({e}), retrying in {wait_time}s"
+                )
+                await asyncio.sleep(wait_time)
+
+        data = response.json()
+        items = sorted(data["data"], key=lambda item: item.get("index", 0))
+
+        return EmbeddingResponse(
+            embeddings=[item["embedding"] for item in items],
+            usage=data.get("usage", {}),
+            model=data.get("model", model),
+        )
+
+    @traced("llm.embeddings")
     async def generate_embeddings(
-        self, texts: List[str], model: Optional[str] = None, input_type: str = "query"
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        input_type: str = "query",
+        priority: Optional[LLMPriority] = None,
+        max_retries: int = 3,
     ) -> EmbeddingResponse:
         """
         Generate embeddings using NVIDIA NIM embedding service.
 
+        Large inputs are split into sub-batches (``EMBEDDING_MAX_BATCH_TEXTS`` /
+        ``EMBEDDING_MAX_BATCH_TOKENS``) that are sent in parallel, at most
+        ``EMBEDDING_MAX_PARALLEL_BATCHES`` at a time. A failed sub-batch is
+        retried on its own; once one has failed for good, the remaining
+        sub-batches are cancelled.
+
         Args:
             texts: List of texts to embed
             model: Embedding model to use (optional)
             input_type: Type of input ("query" or "passage")
+            priority: Queue priority (see ``generate_response``)
+            max_retries: Attempts per sub-batch
 
         Returns:
-            EmbeddingResponse with embeddings
+            EmbeddingResponse with embeddings in the order of ``texts``
         """
         try:
-            payload = {
-                "model": model or self.config.embedding_model,
-                "input": texts,
-                "input_type": input_type,
-            }
+            model = model or self.config.embedding_model
+            batches = self._split_embedding_batches(list(texts))
+            if len(batches) <= 1:
+                return await self._embed_sub_batch(list(texts), model, input_type, priority, max_retries)
 
-            response = await self.embedding_client.post("/embeddings", json=payload)
-            response.raise_for_status()
+            embeddings_span = current_span()
+            if embeddings_span is not None:
+                embeddings_span.set(sub_batches=len(batches))
+            semaphore = asyncio.Semaphore(self.config.embedding_max_parallel_batches)
 
-            data = response.json()
+            async def run(batch: List[str]) -> EmbeddingResponse:
+                async with semaphore:
+                    return await self._embed_sub_batch(batch, model, input_type, priority, max_retries)
 
+            tasks = [asyncio.ensure_future(run(batch)) for batch in batches]
+            try:
+                responses = await asyncio.gather(*tasks)
+            except BaseException:
+                # The whole call fails with the first sub-batch; stop the others
+                # so they release their limiter slots instead of calling the
+                # endpoint for a result nobody will use
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            usage: Dict[str, int] = {}
+            for response in responses:
+                for name, value in response.usage.items():
+                    if isinstance(value, int):
+                        usage[name] = usage.get(name, 0) + value
             return EmbeddingResponse(
-                embeddings=[item["embedding"] for item in data["data"]],
-                usage=data.get("usage", {}),
-                model=data.get("model", self.config.embedding_model),
+                embeddings=[embedding for response in responses for embedding in response.embeddings],
+                usage=usage,
+                model=responses[0].model,
             )
 
         except Exception as e:
@@ -0,0 +1,257 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+LLM Response Cache
+
+Two-tier cache for LLM completions used by ``NIMClient``.
+
+- L1: in-process LRU bounded by entry count and by the encoded size of the
+  cached responses. Expired entries are purged from the LRU end on every
+  write and swept completely when statistics are read, so memory does not
+  grow with keys that are never requested again.
+- L2 (optional): Redis, shared by every API worker. L2 hits are promoted
+  into L1 with their remaining TTL.
+
+Values are stored together with their encoded form, produced by the
+``codec`` the caller supplies; the encoded length is the size charged to
+the byte budget and the string that is written to Redis.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Try to import redis, fallback to None if not available
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Encode a value to a string and decode it back
+Codec = Tuple[Callable[[Any], str], Callable[[str], Any]]
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    encoded: str
+    expires_at: float  # time.time() deadline, shared with the L2 copy
+    size_bytes: int
+
+
+class LLMResponseCache:
+    """Byte-bounded LRU cache with TTL and an optional Redis L2 tier."""
+
+    def __init__(
+        self,
+        codec: Codec,
+        ttl_seconds: int = 300,
+        max_entries: int = 2048,
+        max_bytes: int = 32 * 1024 * 1024,
+        redis_enabled: bool = False,
+        redis_key_prefix: str = "llm_cache:",
+    ):
+        self._encode, self._decode = codec
+        self.ttl = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self.redis_enabled = redis_enabled
+        self.redis_key_prefix = redis_key_prefix
+        self.redis_client = None
+        self._redis_initialized = False
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._bytes_used = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "rejected_oversize": 0,
+            "l2_errors": 0,
+        }
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry. Caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes_used -= entry.size_bytes
+
+    def _store(self, key: str, entry: _CacheEntry) -> None:
+        """Insert an entry and evict to budget. Caller must hold the lock."""
+        now = time.time()
+        # Purge expired entries sitting at the LRU end
+        while self._entries:
+            oldest_key, oldest = next(iter(self._entries.items()))
+            if oldest.expires_at > now:
+                break
+            self._remove(oldest_key)
+            self._stats["expirations"] += 1
+
+        self._remove(key)
+        self._entries[key] = entry
+        self._bytes_used += entry.size_bytes
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes_used > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes_used -= evicted.size_bytes
+            self._stats["evictions"] += 1
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value from L1, then L2. Returns None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return entry.value
+                self._remove(key)
+                self._stats["expirations"] += 1
+
+        entry = await self._get_l2(key, now)
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._stats["l2_hits"] += 1
+            self._store(key, entry)
+        return entry.value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Cache a value in L1 and, if enabled, in L2."""
+        encoded = self._encode(value)
+        size_bytes = len(encoded.encode("utf-8")) + len(key)
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            if size_bytes > self.max_bytes:
+                self._stats["rejected_oversize"] += 1
+                return
+            self._store(key, _CacheEntry(value, encoded, expires_at, size_bytes))
+            self._stats["sets"] += 1
+        await self._set_l2(key, encoded)
+
+    async def clear(self) -> None:
+        """Clear the local tier (the shared Redis tier expires on its own)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes_used = 0
+
+    def clear_expired(self) -> int:
+        """Remove all expired local entries. Returns how many were removed."""
+        now = time.time()
+        with self._lock:
+            expired = [k for k, e in self._entries.items() if e.expires_at <= now]
+            for key in expired:
+                self._remove(key)
+            self._stats["expirations"] += len(expired)
+        return len(expired)
+
+    async def _get_redis(self):
+        """Lazily connect to Redis when the shared tier is enabled."""
+        if not self.redis_enabled:
+            return None
+        if self._redis_initialized:
+            return self.redis_client
+        self._redis_initialized = True
+        if redis is None:
+            logger.warning("Redis not available, LLM response cache is per-worker only")
+            return None
+        try:
+            redis_host = os.getenv("REDIS_HOST", "localhost")
+            redis_port = int(os.getenv("REDIS_PORT", "6379"))
+            redis_password = os.getenv("REDIS_PASSWORD")
+            redis_db = int(os.getenv("REDIS_DB", "0"))
+
+            if redis_password:
+                redis_url = f"redis://:{redis_password}@{redis_host}:{redis_port}/{redis_db}"
+            else:
+                redis_url = f"redis://{redis_host}:{redis_port}/{redis_db}"
+
+            client = redis.from_url(
+                redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+            await client.ping()
+            self.redis_client = client
+            logger.info("✅ LLM response cache using Redis as shared L2")
+        except Exception as e:
+            logger.warning(f"Redis not available for LLM response cache, using per-worker only: {e}")
+            self.redis_client = None
+        return self.redis_client
+
+    async def _get_l2(self, key: str, now: float) -> Optional[_CacheEntry]:
+        client = await self._get_redis()
+        if client is None:
+            return None
+        try:
+            redis_key = self.redis_key_prefix + key
+            encoded = await client.get(redis_key)
+            if encoded is None:
+                return None
+            ttl_ms = await client.pttl(redis_key)
+            value = self._decode(encoded)
+        except Exception as e:
+            with self._lock:
+                self._stats["l2_errors"] += 1
+            logger.debug(f"LLM cache L2 read failed: {e}")
+            return None
+        remaining = ttl_ms / 1000 if ttl_ms and ttl_ms > 0 else self.ttl
+        size_bytes = len(encoded.encode("utf-8")) + len(key)
+        return _CacheEntry(value, encoded, now + remaining, size_bytes)
+
+    async def _set_l2(self, key: str, encoded: str) -> None:
+        client = await self._get_redis()
+        if client is None:
+            return
+        try:
+            await client.set(self.redis_key_prefix + key, encoded, px=int(self.ttl * 1000))
+        except Exception as e:
+            with self._lock:
+                self._stats["l2_errors"] += 1
+            logger.debug(f"LLM cache L2 write failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        self.clear_expired()
+        with self._lock:
+            counters = dict(self._stats)
+            entries = len(self._entries)
+            bytes_used = self._bytes_used
+        return {
+            "cached_entries": entries,
+            "bytes_used": bytes_used,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "l2_enabled": self.redis_client is not None,
+            **counters,
+        }
@@ -45,6 +45,8 @@ from .base import (
     ToolCategory,
 )
 from .tool_discovery import ToolDiscoveryService, DiscoveredTool, ToolDiscoveryConfig
+from .tool_catalog import ToolCatalogSnapshot
+from .tool_index import ToolSearchIndex
 from .tool_binding import (
     ToolBindingService,
     ToolBinding,
@@ -99,6 +101,8 @@ __all__ = [
     "ToolDiscoveryService",
     "DiscoveredTool",
     "ToolDiscoveryConfig",
+    "ToolCatalogSnapshot",
+    "ToolSearchIndex",
     # Tool Binding
     "ToolBindingService",
     "ToolBinding",
@@ -348,7 +348,7 @@ class ToolBindingService:
                 entity_tools.extend(tools)
 
             # Search for tools based on query
-            query_tools = await self.tool_discovery.search_tools(query)
+            query_tools = await self.tool_discovery.search_tools(query, match_all=True)
 
             # Combine and deduplicate
             all_tools = intent_tools + entity_tools + query_tools
@@ -546,7 +546,7 @@ class ToolBindingService:
     ) -> Dict[str, Any]:
         """Prepare arguments for tool execution."""
         # Get tool details
-        tool = self.tool_discovery.discovered_tools.get(binding.tool_id)
+        tool = self.tool_discovery.get_catalog().get(binding.tool_id)
         if not tool:
             return {}
 
@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Versioned Tool Catalog Snapshots
+
+The tool discovery service publishes the set of registered tools as an
+immutable ``ToolCatalogSnapshot``. A new snapshot, with the next version
+number, is built only when the catalog changes (tools added, changed or
+removed). Request handlers read the current snapshot without locking or
+copying, and anything derived from the catalog can be cached by its version.
+
+A snapshot holds the per-request views that used to be rebuilt from
+``discovered_tools`` on every call: tool summaries, per-category and per-tag
+lists, capability bitsets and (once computed) the description embeddings,
+which ``top_k`` ranks against a query embedding with one matrix product.
+The ``DiscoveredTool`` objects themselves are shared with the registry, so
+their usage statistics stay live.
+"""
+
+import time
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:  # tool_discovery imports this module
+    from .tool_discovery import DiscoveredTool, ToolCategory
+
+
+def tool_description_text(tool: "DiscoveredTool") -> str:
+    """Text embedded for a tool: its name, category and description."""
+    return f"{tool.name.replace('_', ' ')} ({tool.category.value}): {tool.description}"
+
+
+def tool_tags(tool: "DiscoveredTool") -> List[str]:
+    """Tags a tool can be filtered by: its capabilities and metadata tags."""
+    return list(tool.capabilities) + list(tool.metadata.get("tags", []))
+
+
+@dataclass(frozen=True)
+class ToolCatalogSnapshot:
+    """Immutable view of the registered tools at one catalog version."""
+
+    version: int
+    tools: Mapping[str, "DiscoveredTool"]
+    tool_ids: Tuple[str, ...]
+    # tool_id -> row in tool_ids, summaries and the embedding matrix
+    rows: Mapping[str, int]
+    # Summary dicts (tool_id, name, description, category, source) for
+    # routing state; shared by all readers, do not modify
+    summaries: Tuple[Dict[str, Any], ...]
+    by_category: Mapping["ToolCategory", Tuple[str, ...]]
+    by_tag: Mapping[str, FrozenSet[str]]
+    # Capability name -> bit, and tool_id -> bitset of its capabilities
+    capability_bits: Mapping[str, int]
+    capability_masks: Mapping[str, int]
+    description_texts: Tuple[str, ...]
+    # Embedding row numbers of each category's tools
+    category_rows: Mapping["ToolCategory", np.ndarray]
+    # Row i embeds description_texts[i] (L2-normalized), once computed
+    description_embeddings: Optional[np.ndarray] = None
+    created_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def build(cls, version: int, tools: Mapping[str, "DiscoveredTool"]) -> "ToolCatalogSnapshot":
+        """Build a snapshot from the registry's tools."""
+        tools = dict(tools)
+        tool_ids = tuple(tools)
+        row_of = {tool_id: row for row, tool_id in enumerate(tool_ids)}
+        by_category: Dict["ToolCategory", List[str]] = {}
+        by_tag: Dict[str, set] = {}
+        capability_bits: Dict[str, int] = {}
+        capability_masks: Dict[str, int] = {}
+        for tool_id, tool in tools.items():
+            by_category.setdefault(tool.category, []).append(tool_id)
+            for tag in tool_tags(tool):
+                by_tag.setdefault(tag.lower(), set()).add(tool_id)
+            mask = 0
+            for capability in tool.capabilities:
+                bit = capability_bits.setdefault(capability, 1 << len(capability_bits))
+                mask |= bit
+            capability_masks[tool_id] = mask
+
+        return cls(
+            version=version,
+            tools=MappingProxyType(tools),
+            tool_ids=tool_ids,
+            rows=MappingProxyType(row_of),
+            summaries=tuple(
+                {
+                    "tool_id": tool_id,
+                    "name": tool.name,
+                    "description": tool.description,
+                    "category": tool.category.value,
+                    "source": tool.source,
+                }
+                for tool_id, tool in tools.items()
+            ),
+            by_category=MappingProxyType({c: tuple(ids) for c, ids in by_category.items()}),
+            by_tag=MappingProxyType({t: frozenset(ids) for t, ids in by_tag.items()}),
+            capability_bits=MappingProxyType(capability_bits),
+            capability_masks=MappingProxyType(capability_masks),
+            description_texts=tuple(tool_description_text(tools[t]) for t in tool_ids),
+            category_rows=MappingProxyType({
+                c: np.array([row_of[t] for t in ids], dtype=np.intp)
+                for c, ids in by_category.items()
+            }),
+        )
+
+    def __len__(self) -> int:
+        return len(self.tool_ids)
+
+    def get(self, tool_id: str) -> Optional["DiscoveredTool"]:
+        return self.tools.get(tool_id)
+
+    def summaries_for(self, tool_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Summaries of the given tools, in the given order (unknown ids skipped)."""
+        return [self.summaries[self.rows[t]] for t in tool_ids if t in self.rows]
+
+    def tools_in_category(self, category: "ToolCategory") -> List["DiscoveredTool"]:
+        return [self.tools[t] for t in self.by_category.get(category, ())]
+
+    def tools_with_tag(self, tag: str) -> List["DiscoveredTool"]:
+        ids = self.by_tag.get(tag.lower(), frozenset())
+        return [self.tools[t] for t in self.tool_ids if t in ids]
+
+    def capability_mask(self, capabilities: Iterable[str]) -> Optional[int]:
+        """Bitset for ``capabilities`` (None if no tool has one of them)."""
+        mask = 0
+        for capability in capabilities:
+            bit = self.capability_bits.get(capability)
+            if bit is None:
+                return None
+            mask |= bit
+        return mask
+
+    def tools_with_capabilities(self, capabilities: Iterable[str]) -> List["DiscoveredTool"]:
+        """Tools that have all of ``capabilities``."""
+        mask = self.capability_mask(capabilities)
+        if mask is None:
+            return []
+        return [
+            self.tools[t] for t in self.tool_ids if self.capability_masks[t] & mask == mask
+        ]
+
+    def with_description_embeddings(self, embeddings: Any) -> "ToolCatalogSnapshot":
+        """Same catalog version with the description embeddings attached."""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.shape[0] != len(self.tool_ids):
+            raise ValueError(
+                f"Expected {len(self.tool_ids)} description embeddings, got {matrix.shape[0]}"
+            )
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms == 0, 1.0, norms)
+        matrix.setflags(write=False)
+        return replace(self, description_embeddings=matrix)
+
+    def top_k(
+        self,
+        query_embedding: Any,
+        k: int = 10,
+        category: Optional["ToolCategory"] = None,
+        min_score: Optional[float] = None,
+    ) -> List[Tuple["DiscoveredTool", float]]:
+        """
+        Rank tools by cosine similarity of their descriptions to a query.
+
+        Args:
+            query_embedding: Query vector from the same embedding model
+            k: Number of tools to return
+            category: Only rank tools in this category
+            min_score: Drop tools below this similarity
+
+        Returns:
+            (tool, similarity) pairs, best first. Empty until the description
+            embeddings are attached.
+        """
+        if self.description_embeddings is None or k <= 0:
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape != (self.description_embeddings.shape[1],):
+            raise ValueError(
+                f"Query embedding has shape {query.shape}, catalog embeddings have "
+                f"dimension {self.description_embeddings.shape[1]}"
+            )
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+
+        if category is None:
+            rows = None
+            scores = self.description_embeddings @ (query / norm)
+        else:
+            rows = self.category_rows.get(category)
+            if rows is None:
+                return []
+            scores = self.description_embeddings[rows] @ (query / norm)
+
+        k = min(k, scores.shape[0])
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        results = []
+        for i in best:
+            score = float(scores[i])
+            if min_score is not None and score < min_score:
+                break
+            row = int(i) if rows is None else int(rows[i])
+            results.append((self.tools[self.tool_ids[row]], score))
+        return results
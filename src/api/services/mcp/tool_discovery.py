@@ -23,7 +23,8 @@ tools from various MCP servers and adapters.
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Set, Callable
+import os
+from typing import Awaitable, Dict, Iterable, List, Any, Optional, Set, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
@@ -33,6 +34,9 @@ import uuid
 from .server import MCPServer, MCPTool, MCPToolType
 from .client import MCPClient, MCPConnectionType
 from .base import MCPAdapter, MCPManager, AdapterType
+from .tool_catalog import ToolCatalogSnapshot, tool_tags
+from .tool_index import ToolSearchIndex
+from src.api.services.llm.concurrency import LLMPriority, llm_priority
 from .security import (
     validate_tool_security,
     is_tool_blocked,
@@ -103,6 +107,20 @@ class ToolDiscoveryConfig:
     categories_to_discover: List[ToolCategory] = field(
         default_factory=lambda: list(ToolCategory)
     )
+    # Embed tool descriptions per catalog version and retrieve tools by
+    # similarity to the query embedding
+    enable_embedding_retrieval: bool = (
+        os.getenv("TOOL_EMBEDDING_RETRIEVAL_ENABLED", "false").lower() == "true"
+    )
+    retrieval_top_k: int = int(os.getenv("TOOL_RETRIEVAL_TOP_K", "10"))
+
+
+async def embed_tool_descriptions(texts: List[str]) -> List[List[float]]:
+    """Embed tool description texts with the shared embedding service."""
+    from src.retrieval.vector.embedding_service import get_embedding_service
+
+    embedding_service = await get_embedding_service()
+    return await embedding_service.generate_embeddings(texts, input_type="passage")
 
 
 class ToolDiscoveryService:
@@ -127,6 +145,15 @@ class ToolDiscoveryService:
         self.discovery_tasks: Dict[str, asyncio.Task] = {}
         self.usage_stats: Dict[str, Dict[str, Any]] = {}
         self.performance_metrics: Dict[str, Dict[str, Any]] = {}
+        self.search_index = ToolSearchIndex()
+        # Embeds tool description texts for the catalog (optional)
+        self.description_embedder: Optional[
+            Callable[[List[str]], Awaitable[List[List[float]]]]
+        ] = embed_tool_descriptions if self.config.enable_embedding_retrieval else None
+        self._tool_keys: Dict[Tuple[str, str], str] = {}  # (source, name) -> tool key
+        self._catalog = ToolCatalogSnapshot.build(0, {})
+        self._catalog_dirty = False
+        self._embedding_task: Optional[asyncio.Task] = None
         self._discovery_lock = asyncio.Lock()
         self._running = False
 
@@ -216,6 +243,9 @@ class ToolDiscoveryService:
             f"Tool discovery completed: {total_discovered} tools discovered from {len(results)} sources"
         )
 
+        # Publish the refreshed catalog now rather than on the next request
+        self.get_catalog()
+
         return results
 
     async def discover_tools_from_source(self, source_name: str) -> int:
@@ -372,7 +402,8 @@ class ToolDiscoveryService:
 
     async def _register_discovered_tool(self, tool: DiscoveredTool) -> None:
         """Register a discovered tool with security validation."""
-        tool_key = tool.tool_id
+        # Rediscovery of a known tool updates its entry instead of adding a copy
+        tool_key = self._tool_keys.get((tool.source, tool.name), tool.tool_id)
 
         # Security check: Validate tool before registration
         try:
@@ -424,6 +455,13 @@ class ToolDiscoveryService:
         # Update existing tool or add new one
         if tool_key in self.discovered_tools:
             existing_tool = self.discovered_tools[tool_key]
+            if (
+                existing_tool.description != tool.description
+                or existing_tool.parameters != tool.parameters
+                or existing_tool.capabilities != tool.capabilities
+                or existing_tool.metadata != tool.metadata
+            ):
+                self._catalog_dirty = True
             existing_tool.description = tool.description
             existing_tool.parameters = tool.parameters
             existing_tool.capabilities = tool.capabilities
@@ -432,6 +470,11 @@ class ToolDiscoveryService:
             existing_tool.status = ToolDiscoveryStatus.DISCOVERED
         else:
             self.discovered_tools[tool_key] = tool
+            self._tool_keys[(tool.source, tool.name)] = tool_key
+            self._catalog_dirty = True
+
+        # Update search index
+        self._index_tool(tool_key, self.discovered_tools[tool_key])
 
         # Update category index
         if tool.category not in self.tool_categories:
@@ -459,6 +502,132 @@ class ToolDiscoveryService:
                 "last_health_check": None,
             }
 
+    def _index_tool(self, tool_key: str, tool: DiscoveredTool) -> None:
+        """Add or refresh a tool in the search index."""
+        self.search_index.add(
+            tool_key,
+            name=tool.name,
+            description=tool.description,
+            tags=tool_tags(tool),
+            category=tool.category,
+        )
+
+    def get_catalog(self) -> ToolCatalogSnapshot:
+        """
+        Get the current tool catalog snapshot.
+
+        A new version is published on the first call after the registered
+        tools change; otherwise the same immutable snapshot is returned.
+        """
+        if self._catalog_dirty or len(self._catalog) != len(self.discovered_tools):
+            self._catalog_dirty = False
+            self._catalog = ToolCatalogSnapshot.build(
+                self._catalog.version + 1, self.discovered_tools
+            )
+            logger.info(
+                f"Published tool catalog version {self._catalog.version} "
+                f"({len(self._catalog)} tools)"
+            )
+            self._schedule_catalog_embeddings()
+        return self._catalog
+
+    def _schedule_catalog_embeddings(self) -> None:
+        """Embed the current catalog's descriptions in the background."""
+        if self.description_embedder is None or not len(self._catalog):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No event loop; ensure_catalog_embeddings() embeds on demand
+        if self._embedding_task is not None and not self._embedding_task.done():
+            self._embedding_task.cancel()
+        self._embedding_task = loop.create_task(self._embed_catalog(self._catalog))
+
+    async def _embed_catalog(self, snapshot: ToolCatalogSnapshot) -> None:
+        try:
+            with llm_priority(LLMPriority.BACKGROUND):
+                embeddings = await self.description_embedder(list(snapshot.description_texts))
+            embedded = snapshot.with_description_embeddings(embeddings)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to embed tool catalog version {snapshot.version}: {e}")
+            return
+        # Attach only if no newer version was published meanwhile
+        if self._catalog.version == snapshot.version:
+            self._catalog = embedded
+
+    async def ensure_catalog_embeddings(self) -> ToolCatalogSnapshot:
+        """Get the current catalog snapshot with its description embeddings."""
+        snapshot = self.get_catalog()
+        if snapshot.description_embeddings is not None or self.description_embedder is None:
+            return snapshot
+        if self._embedding_task is None or self._embedding_task.done():
+            self._embedding_task = asyncio.ensure_future(self._embed_catalog(snapshot))
+        task = self._embedding_task
+        try:
+            await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise  # This caller was cancelled, not the embedding
+        return self._catalog
+
+    async def retrieve_tools(
+        self,
+        query_embedding: List[float],
+        k: Optional[int] = None,
+        category: Optional[ToolCategory] = None,
+    ) -> List[Tuple[DiscoveredTool, float]]:
+        """
+        Rank tools by description similarity to a query embedding.
+
+        Returns:
+            Top (tool, similarity) pairs, or an empty list when the catalog
+            has no description embeddings
+        """
+        if self.description_embedder is None:
+            return []
+        snapshot = await self.ensure_catalog_embeddings()
+        try:
+            return snapshot.top_k(
+                query_embedding, k=k or self.config.retrieval_top_k, category=category
+            )
+        except ValueError as e:
+            logger.warning(f"Tool retrieval skipped: {e}")
+            return []
+
+    async def retrieve_tools_for_query(
+        self,
+        query: str,
+        k: Optional[int] = None,
+        category: Optional[ToolCategory] = None,
+    ) -> Optional[List[DiscoveredTool]]:
+        """
+        Retrieve tools for a user query by embedding similarity.
+
+        The query embedding comes from the semantic router, which has normally
+        embedded the message already while routing it, so no extra embedding
+        call is made.
+
+        Returns:
+            The top tools, or None when embedding retrieval is unavailable
+            (callers fall back to keyword search)
+        """
+        if self.description_embedder is None or not self.discovered_tools:
+            return None
+        try:
+            from src.api.services.routing.semantic_router import get_semantic_router
+
+            semantic_router = await get_semantic_router()
+            query_embedding = await semantic_router.embed_query(query)
+        except Exception as e:
+            logger.warning(f"Query embedding unavailable for tool retrieval: {e}")
+            return None
+        if query_embedding is None:
+            return None
+        retrieved = await self.retrieve_tools(query_embedding, k=k, category=category)
+        return [tool for tool, _ in retrieved] or None
+
     def _categorize_tool(self, name: str, description: str) -> ToolCategory:
         """Categorize a tool based on its name and description."""
         name_lower = name.lower()
@@ -586,15 +755,7 @@ class ToolDiscoveryService:
         self, category: ToolCategory
     ) -> List[DiscoveredTool]:
         """Get tools by category."""
-        if category not in self.tool_categories:
-            return []
-
-        tools = []
-        for tool_key in self.tool_categories[category]:
-            if tool_key in self.discovered_tools:
-                tools.append(self.discovered_tools[tool_key])
-
-        return tools
+        return self.get_catalog().tools_in_category(category)
 
     async def get_tools_by_source(self, source: str) -> List[DiscoveredTool]:
         """Get tools by source."""
@@ -606,32 +767,44 @@ class ToolDiscoveryService:
         return tools
 
     async def search_tools(
-        self, query: str, category: Optional[ToolCategory] = None
+        self,
+        query: str,
+        category: Optional[ToolCategory] = None,
+        tags: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        match_all: bool = False,
     ) -> List[DiscoveredTool]:
-        """Search tools by query."""
-        query_lower = query.lower()
-        results = []
-
-        for tool in self.discovered_tools.values():
-            if category and tool.category != category:
-                continue
+        """
+        Search tools by query.
 
-            if (
-                query_lower in tool.name.lower()
-                or query_lower in tool.description.lower()
-                or any(query_lower in cap.lower() for cap in tool.capabilities)
-            ):
-                results.append(tool)
+        Tools sharing a term with the query are ranked with BM25 over name,
+        description and tags (name matches rank first). An empty query
+        returns every tool that passes the filters.
 
-        # Sort by relevance (name matches first, then description)
-        results.sort(
-            key=lambda t: (
-                query_lower not in t.name.lower(),
-                query_lower not in t.description.lower(),
-            )
+        Args:
+            query: Search text (a keyword or a full user message)
+            category: Only return tools in this category
+            tags: Only return tools with all of these tags (capabilities or
+                metadata tags)
+            limit: Maximum number of tools to return
+            match_all: Only return tools that contain every query term. Use
+                it when the query is a whole user message, where any single
+                word would otherwise match
+        """
+        # Tools added to discovered_tools directly are indexed on first search
+        if len(self.search_index) != len(self.discovered_tools):
+            for tool_key, tool in self.discovered_tools.items():
+                if tool_key not in self.search_index:
+                    self._index_tool(tool_key, tool)
+
+        results = self.search_index.search(
+            query, category=category, tags=tags, limit=limit, match_all=match_all
         )
-
-        return results
+        return [
+            self.discovered_tools[tool_key]
+            for tool_key, _ in results
+            if tool_key in self.discovered_tools
+        ]
 
     async def get_available_tools(self) -> List[Dict[str, Any]]:
         """
@@ -642,7 +815,7 @@ class ToolDiscoveryService:
         """
         try:
             tools = []
-            for tool in self.discovered_tools.values():
+            for tool in self.get_catalog().tools.values():
                 tools.append(
                     {
                         "tool_id": tool.tool_id,
@@ -794,6 +967,9 @@ class ToolDiscoveryService:
                     t for t in self.tool_categories[tool.category] if t != tool_key
                 ]
             del self.discovered_tools[tool_key]
+            self.search_index.remove(tool_key)
+            self._tool_keys.pop((tool.source, tool.name), None)
+            self._catalog_dirty = True
 
         if tools_to_remove:
             logger.info(f"Cleaned up {len(tools_to_remove)} old tools")
@@ -807,6 +983,8 @@ class ToolDiscoveryService:
             "categories": {
                 cat.value: len(tools) for cat, tools in self.tool_categories.items()
             },
+            "search_index": self.search_index.get_stats(),
+            "catalog_version": self._catalog.version,
             "config": {
                 "discovery_interval": self.config.discovery_interval,
                 "max_discovery_attempts": self.config.max_discovery_attempts,
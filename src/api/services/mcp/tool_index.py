@@ -0,0 +1,245 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Inverted Index for Tool Search
+
+This module provides a token inverted index over discovered tools with
+BM25 scoring, so a tool search only touches the tools that share a term with
+the query instead of scanning every registered tool. Entries are added,
+replaced and removed one tool at a time as tools are registered.
+
+Terms from the tool name and tags count more than terms from the
+description, so a tool named after the query ranks above tools that only
+mention it.
+"""
+
+import heapq
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Words too common in queries and descriptions to say anything about a tool
+_STOPWORDS = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "for",
+        "from", "get", "give", "how", "i", "in", "is", "it", "me", "my", "of",
+        "on", "or", "please", "show", "that", "the", "this", "to", "what",
+        "when", "where", "which", "with", "you",
+    }
+)
+
+# Term weight per field (BM25F-style: weighted term frequencies)
+DEFAULT_FIELD_WEIGHTS = {"name": 3.0, "tags": 2.0, "description": 1.0}
+
+
+def _normalize(token: str) -> str:
+    """Fold simple plurals so "forklifts" finds "forklift"."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into normalized search terms (snake_case names split too)."""
+    return [
+        _normalize(token)
+        for token in _TOKEN_RE.findall(text.lower())
+        if token not in _STOPWORDS
+    ]
+
+
+@dataclass
+class _IndexedTool:
+    terms: Dict[str, float]
+    length: float
+    category: Optional[Hashable]
+    tags: frozenset
+    order: int
+
+
+class ToolSearchIndex:
+    """BM25 inverted index over tool names, descriptions and tags."""
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        field_weights: Optional[Dict[str, float]] = None,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.field_weights = field_weights or dict(DEFAULT_FIELD_WEIGHTS)
+        self._tools: Dict[str, _IndexedTool] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._by_category: Dict[Hashable, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._total_length = 0.0
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._tools
+
+    def add(
+        self,
+        key: str,
+        name: str,
+        description: str = "",
+        tags: Iterable[str] = (),
+        category: Optional[Hashable] = None,
+    ) -> None:
+        """Index a tool, replacing any previous entry for ``key``."""
+        order = self._tools[key].order if key in self._tools else None
+        self.remove(key)
+
+        tags = frozenset(t.lower() for t in tags)
+        terms: Dict[str, float] = {}
+        for field_name, text in (
+            ("name", name),
+            ("description", description),
+            ("tags", " ".join(tags)),
+        ):
+            weight = self.field_weights.get(field_name, 1.0)
+            for term in tokenize(text):
+                terms[term] = terms.get(term, 0.0) + weight
+
+        length = sum(terms.values())
+        if order is None:
+            order = self._next_order
+            self._next_order += 1
+        self._tools[key] = _IndexedTool(terms, length, category, tags, order)
+        self._total_length += length
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[key] = frequency
+        if category is not None:
+            self._by_category.setdefault(category, set()).add(key)
+        for tag in tags:
+            self._by_tag.setdefault(tag, set()).add(key)
+
+    def remove(self, key: str) -> bool:
+        """Drop a tool from the index. Returns False if it was not indexed."""
+        entry = self._tools.pop(key, None)
+        if entry is None:
+            return False
+        self._total_length -= entry.length
+        for term in entry.terms:
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del self._postings[term]
+        if entry.category is not None:
+            self._discard(self._by_category, entry.category, key)
+        for tag in entry.tags:
+            self._discard(self._by_tag, tag, key)
+        return True
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[str]], value: Any, key: str) -> None:
+        keys = index.get(value)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[value]
+
+    def _allowed_keys(
+        self, category: Optional[Hashable], tags: Optional[Iterable[str]]
+    ) -> Optional[Set[str]]:
+        """Keys passing the filters (None when there are no filters)."""
+        allowed: Optional[Set[str]] = None
+        if category is not None:
+            allowed = set(self._by_category.get(category, ()))
+        for tag in tags or ():
+            tagged = self._by_tag.get(tag.lower(), set())
+            allowed = set(tagged) if allowed is None else allowed & tagged
+        return allowed
+
+    def search(
+        self,
+        query: str,
+        category: Optional[Hashable] = None,
+        tags: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        match_all: bool = False,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank indexed tools against a query.
+
+        Args:
+            query: Free text; any query term can match (best matches first)
+            category: Only return tools in this category
+            tags: Only return tools that have all of these tags
+            limit: Maximum number of results
+            match_all: Only return tools that contain every query term
+
+        Returns:
+            (key, score) pairs, best first. A query without search terms
+            returns every tool that passes the filters, in indexing order,
+            with score 0.
+        """
+        allowed = self._allowed_keys(category, tags)
+        query_terms = set(tokenize(query))
+
+        if not query_terms:
+            keys = self._tools if allowed is None else allowed
+            ordered = sorted(keys, key=lambda k: self._tools[k].order)
+            return [(key, 0.0) for key in ordered[:limit]]
+
+        if match_all:
+            for term in query_terms:
+                posting = self._postings.get(term, {})
+                allowed = set(posting) if allowed is None else allowed & posting.keys()
+                if not allowed:
+                    return []
+
+        count = len(self._tools)
+        average_length = self._total_length / count if count else 1.0
+        scores: Dict[str, float] = {}
+        for term in query_terms:
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for key, frequency in posting.items():
+                if allowed is not None and key not in allowed:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self._tools[key].length / average_length)
+                scores[key] = scores.get(key, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        def rank(item: Tuple[str, float]) -> Tuple[float, int]:
+            # Ties keep indexing order so results are stable
+            return -item[1], self._tools[item[0]].order
+
+        if limit is not None:
+            return heapq.nsmallest(limit, scores.items(), key=rank)
+        return sorted(scores.items(), key=rank)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index size statistics."""
+        return {
+            "tools": len(self._tools),
+            "terms": len(self._postings),
+            "categories": len(self._by_category),
+            "tags": len(self._by_tag),
+            "average_length": round(self._total_length / len(self._tools), 2) if self._tools else 0.0,
+        }
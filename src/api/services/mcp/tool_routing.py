@@ -28,13 +28,16 @@ from enum import Enum
 from datetime import datetime, timedelta
 import json
 import math
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
 from .tool_discovery import ToolDiscoveryService, DiscoveredTool, ToolCategory
 from .tool_binding import ToolBindingService, BindingStrategy, ExecutionMode
 
 logger = logging.getLogger(__name__)
 
+# Candidate tool lists cached per catalog version
+_CANDIDATE_CACHE_SIZE = 256
+
 
 class RoutingStrategy(Enum):
     """Tool routing strategies."""
@@ -44,6 +47,7 @@ class RoutingStrategy(Enum):
     BALANCED = "balanced"
     COST_OPTIMIZED = "cost_optimized"
     LATENCY_OPTIMIZED = "latency_optimized"
+    SEMANTIC = "semantic"  # Description-embedding similarity to the query
 
 
 class QueryComplexity(Enum):
@@ -70,6 +74,8 @@ class RoutingContext:
     required_capabilities: List[str] = field(default_factory=list)
     performance_requirements: Dict[str, Any] = field(default_factory=dict)
     cost_constraints: Dict[str, Any] = field(default_factory=dict)
+    # Query embedding from the semantic router, used by SEMANTIC routing
+    query_embedding: Optional[List[float]] = None
 
 
 @dataclass
@@ -126,6 +132,8 @@ class ToolRoutingService:
         self.complexity_analyzer = QueryComplexityAnalyzer()
         self.capability_matcher = CapabilityMatcher()
         self.context_analyzer = ContextAnalyzer()
+        self._candidate_cache: "OrderedDict[Tuple, Tuple[str, ...]]" = OrderedDict()
+        self._candidate_cache_version: Optional[int] = None
 
         # Initialize routing strategies after methods are defined
         self._setup_routing_strategies()
@@ -153,11 +161,20 @@ class ToolRoutingService:
                 context.query
             )
 
-            # Discover candidate tools
-            candidate_tools = await self._discover_candidate_tools(context)
+            tool_scores: List[ToolScore] = []
+            if strategy == RoutingStrategy.SEMANTIC:
+                # Top tools straight from the catalog's embedding matrix
+                tool_scores = await self._semantic_routing(context, max_tools + 3)
+                if not tool_scores:
+                    # No query or description embeddings: use the heuristics
+                    strategy = RoutingStrategy.BALANCED
+
+            if strategy != RoutingStrategy.SEMANTIC:
+                # Discover candidate tools
+                candidate_tools = await self._discover_candidate_tools(context)
 
-            # Score tools based on strategy
-            tool_scores = await self._score_tools(candidate_tools, context, strategy)
+                # Score tools based on strategy
+                tool_scores = await self._score_tools(candidate_tools, context, strategy)
 
             # Select tools based on scores
             selected_tools, fallback_tools = self._select_tools(tool_scores, max_tools)
@@ -206,6 +223,23 @@ class ToolRoutingService:
     ) -> List[DiscoveredTool]:
         """Discover candidate tools for routing."""
         try:
+            # Candidates depend only on the catalog and these inputs, so they
+            # are cached until the catalog version changes
+            catalog = self.tool_discovery.get_catalog()
+            if catalog.version != self._candidate_cache_version:
+                self._candidate_cache.clear()
+                self._candidate_cache_version = catalog.version
+            cache_key = (
+                context.intent,
+                context.query,
+                tuple(sorted((str(k), str(v)) for k, v in context.entities.items())),
+                tuple(context.required_capabilities),
+            )
+            cached = self._candidate_cache.get(cache_key)
+            if cached is not None:
+                self._candidate_cache.move_to_end(cache_key)
+                return [catalog.tools[t] for t in cached if t in catalog.tools]
+
             candidate_tools = []
 
             # Search by intent
@@ -234,6 +268,10 @@ class ToolRoutingService:
                 if tool.tool_id not in unique_tools:
                     unique_tools[tool.tool_id] = tool
 
+            self._candidate_cache[cache_key] = tuple(unique_tools)
+            if len(self._candidate_cache) > _CANDIDATE_CACHE_SIZE:
+                self._candidate_cache.popitem(last=False)
+
             return list(unique_tools.values())
 
         except Exception as e:
@@ -401,15 +439,17 @@ class ToolRoutingService:
         selected_tools = []
         fallback_tools = []
 
+        catalog = self.tool_discovery.get_catalog()
+
         # Select top tools
         for score in tool_scores[:max_tools]:
-            tool = self.tool_discovery.discovered_tools.get(score.tool_id)
+            tool = catalog.get(score.tool_id)
             if tool:
                 selected_tools.append(tool)
 
         # Select fallback tools
         for score in tool_scores[max_tools : max_tools + 3]:
-            tool = self.tool_discovery.discovered_tools.get(score.tool_id)
+            tool = catalog.get(score.tool_id)
             if tool:
                 fallback_tools.append(tool)
 
@@ -527,101 +567,6 @@ class ToolRoutingService:
             "strategy_usage": dict(strategy_usage),
         }
 
-
-class QueryComplexityAnalyzer:
-    """Analyzes query complexity for routing decisions."""
-
-    async def analyze_complexity(self, query: str) -> QueryComplexity:
-        """Analyze query complexity."""
-        # Simple heuristics for complexity analysis
-        query_lower = query.lower()
-
-        # Count complexity indicators
-        complexity_indicators = 0
-
-        # Multiple entities
-        if len(query.split()) > 10:
-            complexity_indicators += 1
-
-        # Complex operations
-        complex_ops = ["analyze", "compare", "evaluate", "optimize", "calculate"]
-        if any(op in query_lower for op in complex_ops):
-            complexity_indicators += 1
-
-        # Multiple intents
-        intent_indicators = ["and", "or", "also", "additionally", "furthermore"]
-        if any(indicator in query_lower for indicator in intent_indicators):
-            complexity_indicators += 1
-
-        # Conditional logic
-        conditional_indicators = ["if", "when", "unless", "provided that"]
-        if any(indicator in query_lower for indicator in conditional_indicators):
-            complexity_indicators += 1
-
-        # Determine complexity level
-        if complexity_indicators == 0:
-            return QueryComplexity.SIMPLE
-        elif complexity_indicators == 1:
-            return QueryComplexity.MODERATE
-        elif complexity_indicators == 2:
-            return QueryComplexity.COMPLEX
-        else:
-            return QueryComplexity.VERY_COMPLEX
-
-
-class CapabilityMatcher:
-    """Matches tool capabilities to requirements."""
-
-    async def match_capabilities(
-        self, tool: DiscoveredTool, context: RoutingContext
-    ) -> float:
-        """Match tool capabilities to context requirements."""
-        if not context.required_capabilities:
-            return 0.8  # Default score if no requirements
-
-        matches = 0
-        for capability in context.required_capabilities:
-            if capability.lower() in tool.description.lower():
-                matches += 1
-            elif capability.lower() in tool.name.lower():
-                matches += 1
-            elif any(capability.lower() in cap.lower() for cap in tool.capabilities):
-                matches += 1
-
-        return matches / len(context.required_capabilities)
-
-
-class ContextAnalyzer:
-    """Analyzes context relevance for tool selection."""
-
-    async def analyze_context_relevance(
-        self, tool: DiscoveredTool, context: RoutingContext
-    ) -> float:
-        """Analyze context relevance of a tool."""
-        relevance_score = 0.0
-
-        # Intent relevance
-        if context.intent.lower() in tool.description.lower():
-            relevance_score += 0.3
-
-        # Entity relevance
-        for entity_type, entity_value in context.entities.items():
-            if entity_value.lower() in tool.description.lower():
-                relevance_score += 0.2
-
-        # Query relevance
-        query_words = context.query.lower().split()
-        tool_words = tool.description.lower().split()
-        common_words = set(query_words) & set(tool_words)
-        if common_words:
-            relevance_score += 0.3 * (len(common_words) / len(query_words))
-
-        # Category relevance
-        if tool.category.value in context.user_context.get("preferred_categories", []):
-            relevance_score += 0.2
-
-        return min(1.0, relevance_score)
-
     async def _performance_optimized_routing(
         self, tools: List[DiscoveredTool], context: RoutingContext
     ) -> List[ToolScore]:
@@ -805,6 +750,32 @@ class ContextAnalyzer:
 
         return sorted(scores, key=lambda x: x.overall_score, reverse=True)
 
+    async def _semantic_routing(
+        self, context: RoutingContext, limit: int
+    ) -> List[ToolScore]:
+        """Semantic routing: rank tools by description similarity to the query."""
+        if context.query_embedding is None:
+            return []
+        retrieved = await self.tool_discovery.retrieve_tools(
+            context.query_embedding, k=limit
+        )
+        return [
+            ToolScore(
+                tool_id=tool.tool_id,
+                tool_name=tool.name,
+                overall_score=similarity,
+                performance_score=0.0,  # Not used in semantic routing
+                accuracy_score=0.0,  # Not used in semantic routing
+                cost_score=0.0,  # Not used in semantic routing
+                latency_score=0.0,  # Not used in semantic routing
+                capability_match_score=0.0,  # Not used in semantic routing
+                context_relevance_score=similarity,
+                confidence=min(1.0, max(0.0, similarity)),
+                reasoning=f"Semantic: {tool.name} (similarity: {similarity:.2f})",
+            )
+            for tool, similarity in retrieved
+        ]
+
     def _setup_routing_strategies(self):
         """Setup routing strategies after methods are defined."""
         self.routing_strategies: Dict[RoutingStrategy, Callable] = {
@@ -814,3 +785,98 @@ class ContextAnalyzer:
             RoutingStrategy.COST_OPTIMIZED: self._cost_optimized_routing,
             RoutingStrategy.LATENCY_OPTIMIZED: self._latency_optimized_routing,
         }
+
+
+class QueryComplexityAnalyzer:
+    """Analyzes query complexity for routing decisions."""
+
+    async def analyze_complexity(self, query: str) -> QueryComplexity:
+        """Analyze query complexity."""
+        # Simple heuristics for complexity analysis
+        query_lower = query.lower()
+
+        # Count complexity indicators
+        complexity_indicators = 0
+
+        # Multiple entities
+        if len(query.split()) > 10:
+            complexity_indicators += 1
+
+        # Complex operations
+        complex_ops = ["analyze", "compare", "evaluate", "optimize", "calculate"]
+        if any(op in query_lower for op in complex_ops):
+            complexity_indicators += 1
+
+        # Multiple intents
+        intent_indicators = ["and", "or", "also", "additionally", "furthermore"]
+        if any(indicator in query_lower for indicator in intent_indicators):
+            complexity_indicators += 1
+
+        # Conditional logic
+        conditional_indicators = ["if", "when", "unless", "provided that"]
+        if any(indicator in query_lower for indicator in conditional_indicators):
+            complexity_indicators += 1
+
+        # Determine complexity level
+        if complexity_indicators == 0:
+            return QueryComplexity.SIMPLE
+        elif complexity_indicators == 1:
+            return QueryComplexity.MODERATE
+        elif complexity_indicators == 2:
+            return QueryComplexity.COMPLEX
+        else:
+            return QueryComplexity.VERY_COMPLEX
+
+
+class CapabilityMatcher:
+    """Matches tool capabilities to requirements."""
+
+    async def match_capabilities(
+        self, tool: DiscoveredTool, context: RoutingContext
+    ) -> float:
+        """Match tool capabilities to context requirements."""
+        if not context.required_capabilities:
+            return 0.8  # Default score if no requirements
+
+        matches = 0
+        for capability in context.required_capabilities:
+            if capability.lower() in tool.description.lower():
+                matches += 1
+            elif capability.lower() in tool.name.lower():
+                matches += 1
+            elif any(capability.lower() in cap.lower() for cap in tool.capabilities):
+                matches += 1
+
+        return matches / len(context.required_capabilities)
+
+
+class ContextAnalyzer:
+    """Analyzes context relevance for tool selection."""
+
+    async def analyze_context_relevance(
+        self, tool: DiscoveredTool, context: RoutingContext
+    ) -> float:
+        """Analyze context relevance of a tool."""
+        relevance_score = 0.0
+
+        # Intent relevance
+        if context.intent.lower() in tool.description.lower():
+            relevance_score += 0.3
+
+        # Entity relevance
+        for entity_type, entity_value in context.entities.items():
+            if entity_value.lower() in tool.description.lower():
+                relevance_score += 0.2
+
+        # Query relevance
+        query_words = context.query.lower().split()
+        tool_words = tool.description.lower().split()
+        common_words = set(query_words) & set(tool_words)
+        if common_words:
+            relevance_score += 0.3 * (len(common_words) / len(query_words))
+
+        # Category relevance
+        if tool.category.value in context.user_context.get("preferred_categories", []):
+            relevance_score += 0.2
+
+        return min(1.0, relevance_score)
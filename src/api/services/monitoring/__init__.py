@@ -16,6 +16,15 @@
 """Performance monitoring services."""
 
 from src.api.services.monitoring.performance_monitor import get_performance_monitor, PerformanceMonitor
+from src.api.services.monitoring.tracing import Span, current_span, span, start_trace, traced
 
-__all__ = ["get_performance_monitor", "PerformanceMonitor"]
+__all__ = [
+    "get_performance_monitor",
+    "PerformanceMonitor",
+    "Span",
+    "current_span",
+    "span",
+    "start_trace",
+    "traced",
+]
 
@@ -166,12 +166,16 @@ class MetricsCollector:
         self, request: Request, response: Response, duration: float
     ):
         """Record HTTP request metrics."""
-        method = request.method
-        endpoint = request.url.path
-        status = str(response.status_code)
+        self.observe_http_request(
+            request.method, request.url.path, response.status_code, duration
+        )
 
+    def observe_http_request(
+        self, method: str, endpoint: str, status_code: int, duration: float
+    ):
+        """Record HTTP request metrics from raw ASGI values."""
         http_requests_total.labels(
-            method=method, endpoint=endpoint, status=status
+            method=method, endpoint=endpoint, status=str(status_code)
         ).inc()
 
         http_request_duration_seconds.labels(method=method, endpoint=endpoint).observe(
@@ -27,6 +27,8 @@ from datetime import datetime
 from collections import defaultdict
 import asyncio
 
+from src.api.services.monitoring.tracing import Span, summarize_stages
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +56,11 @@ class RequestMetrics:
     tool_execution_time_ms: float = 0.0
     guardrails_method: Optional[str] = None  # "sdk", "pattern_matching", "api", or None
     guardrails_time_ms: Optional[float] = None  # Time spent in guardrails check
+    streamed: bool = False  # Served by /chat/stream
+    time_to_first_byte_ms: Optional[float] = None  # First SSE event sent to the client
+    time_to_first_token_ms: Optional[float] = None  # First LLM token sent to the client
+    trace: Optional[Span] = None  # Span tree for the request, if traced
+    stage_timings: Dict[str, Dict[str, float]] = field(default_factory=dict)  # Per-stage totals from the trace
 
 
 class PerformanceMonitor:
@@ -66,12 +73,13 @@ class PerformanceMonitor:
         self._max_metrics = 10000  # Keep last 10k metrics
         self._max_requests = 1000  # Keep last 1k requests
 
-    async def start_request(self, request_id: str) -> None:
-        """Start tracking a request."""
+    async def start_request(self, request_id: str, trace: Optional[Span] = None) -> None:
+        """Start tracking a request, optionally with its root trace span."""
         async with self._lock:
             self.request_metrics[request_id] = RequestMetrics(
                 request_id=request_id,
-                start_time=time.time()
+                start_time=time.time(),
+                trace=trace
             )
 
     async def end_request(
@@ -103,6 +111,7 @@ class PerformanceMonitor:
             request_metric.tool_execution_time_ms = tool_execution_time_ms
             request_metric.guardrails_method = guardrails_method
             request_metric.guardrails_time_ms = guardrails_time_ms
+            self._finish_trace(request_metric)
 
             # Record guardrails metrics if available
             if guardrails_method:
@@ -155,6 +164,32 @@ class PerformanceMonitor:
                 )
                 del self.request_metrics[oldest_request[0]]
 
+    async def record_stream_timing(
+        self,
+        request_id: str,
+        time_to_first_byte_ms: Optional[float],
+        time_to_first_token_ms: Optional[float] = None
+    ) -> None:
+        """
+        Record time-to-first-byte and time-to-first-token for a streamed request.
+        
+        Args:
+            request_id: ID of the streamed request
+            time_to_first_byte_ms: Time until the first event was sent to the client
+            time_to_first_token_ms: Time until the first LLM token was sent, if any
+        """
+        async with self._lock:
+            if request_id in self.request_metrics:
+                request_metric = self.request_metrics[request_id]
+                request_metric.streamed = True
+                request_metric.time_to_first_byte_ms = time_to_first_byte_ms
+                request_metric.time_to_first_token_ms = time_to_first_token_ms
+            
+            if time_to_first_byte_ms is not None:
+                await self._record_metric("time_to_first_byte_ms", time_to_first_byte_ms, {})
+            if time_to_first_token_ms is not None:
+                await self._record_metric("time_to_first_token_ms", time_to_first_token_ms, {})
+
     async def record_timeout(
         self,
         request_id: str,
@@ -192,6 +227,7 @@ class PerformanceMonitor:
                 request_metric.error = f"timeout_{timeout_location}"
                 request_metric.end_time = time.time()
                 request_metric.latency_ms = timeout_duration * 1000  # Convert to ms
+                self._finish_trace(request_metric)
             
             logger.warning(
                 f"⏱️ Timeout recorded: location={timeout_location}, "
@@ -199,6 +235,13 @@ class PerformanceMonitor:
                 f"reasoning={reasoning_enabled}, request_id={request_id}"
             )
 
+    def _finish_trace(self, request_metric: RequestMetrics) -> None:
+        """Close the request's trace and record its per-stage timings."""
+        if request_metric.trace is None or request_metric.trace.end_time is not None:
+            return
+        request_metric.trace.finish()
+        request_metric.stage_timings = summarize_stages(request_metric.trace)
+
     async def _record_metric(
         self,
         name: str,
@@ -286,8 +329,45 @@ class PerformanceMonitor:
                 "intent_distribution": dict(intent_counts),
             }
 
+            # Streaming latency (only requests served by /chat/stream)
+            streamed_requests = [r for r in recent_requests if r.streamed]
+            if streamed_requests:
+                ttfb = [r.time_to_first_byte_ms for r in streamed_requests if r.time_to_first_byte_ms is not None]
+                ttft = [r.time_to_first_token_ms for r in streamed_requests if r.time_to_first_token_ms is not None]
+                stats["streaming"] = {
+                    "total_requests": len(streamed_requests),
+                    "time_to_first_byte_ms": self._latency_summary(ttfb),
+                    "time_to_first_token_ms": self._latency_summary(ttft),
+                }
+
+            # Per-stage latency from request traces: time per request spent in each stage
+            stage_totals: Dict[str, List[float]] = defaultdict(list)
+            stage_calls: Dict[str, int] = defaultdict(int)
+            for r in recent_requests:
+                for stage, timing in r.stage_timings.items():
+                    stage_totals[stage].append(timing["total_ms"])
+                    stage_calls[stage] += int(timing["calls"])
+            if stage_totals:
+                stats["stages"] = {
+                    stage: {
+                        **self._latency_summary(totals),
+                        "requests": len(totals),
+                        "calls": stage_calls[stage],
+                    }
+                    for stage, totals in sorted(stage_totals.items())
+                }
+
             return stats
 
+    def _latency_summary(self, values: List[float]) -> Dict[str, float]:
+        """Summarize a list of latencies as percentiles and mean."""
+        return {
+            "p50": self._percentile(values, 50) if values else 0.0,
+            "p95": self._percentile(values, 95) if values else 0.0,
+            "p99": self._percentile(values, 99) if values else 0.0,
+            "mean": sum(values) / len(values) if values else 0.0,
+        }
+
     def _percentile(self, data: List[float], percentile: int) -> float:
         """Calculate percentile of a list."""
         if not data:
@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Request Tracing
+
+Lightweight hierarchical spans for the chat pipeline, kept in process (no
+external collector). ``start_trace`` installs a root span in a ``ContextVar``;
+``span`` / ``traced`` add timed child spans under whatever span is current,
+including from tasks started by the request. The finished tree is attached to
+the request's ``RequestMetrics`` and aggregated into per-stage percentiles by
+``PerformanceMonitor.get_stats``.
+
+Outside a traced request, or once the trace has finished, ``span`` is a no-op.
+"""
+
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Upper bound on spans recorded per request (e.g. SQL queries in a loop)
+MAX_SPANS_PER_TRACE = 500
+
+
+@dataclass
+class Span:
+    """A timed stage of a request."""
+
+    name: str
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_time: float = field(default_factory=time.perf_counter)
+    end_time: Optional[float] = None
+    error: Optional[str] = None
+    children: List["Span"] = field(default_factory=list)
+    root: Optional["Span"] = field(default=None, repr=False)
+    span_count: int = 0  # Spans recorded in this trace (root only)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) * 1000
+
+    def set(self, **attributes: Any) -> None:
+        """Add attributes (e.g. ``cache_hit=True``) to the span."""
+        self.attributes.update(attributes)
+
+    def finish(self) -> None:
+        if self.end_time is None:
+            self.end_time = time.perf_counter()
+
+    def walk(self) -> Iterator["Span"]:
+        """Iterate over this span and all its descendants."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self, origin: Optional[float] = None) -> Dict[str, Any]:
+        """Convert the span tree to a dictionary; ``start_ms`` is relative to the root."""
+        origin = self.start_time if origin is None else origin
+        return {
+            "name": self.name,
+            "start_ms": round((self.start_time - origin) * 1000, 3),
+            "duration_ms": round(self.duration_ms, 3) if self.duration_ms is not None else None,
+            "attributes": self.attributes,
+            "error": self.error,
+            "children": [child.to_dict(origin) for child in self.children],
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def start_trace(name: str, **attributes: Any) -> Span:
+    """Start a new trace and make its root span current for this context."""
+    root = Span(name=name, attributes=attributes)
+    root.root = root
+    _current_span.set(root)
+    return root
+
+
+def current_span() -> Optional[Span]:
+    """Get the innermost active span, if any."""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Time a block as a child of the current span.
+
+    Yields the new span (or None when not tracing). Exceptions are recorded
+    on the span and re-raised.
+    """
+    parent = _current_span.get()
+    root = parent.root if parent is not None else None
+    if root is None or root.end_time is not None or root.span_count >= MAX_SPANS_PER_TRACE:
+        yield None
+        return
+
+    child = Span(name=name, attributes=attributes, root=root)
+    root.span_count += 1
+    parent.children.append(child)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.error = type(e).__name__
+        raise
+    finally:
+        child.finish()
+        _current_span.reset(token)
+
+
+def traced(name: str) -> Callable:
+    """Decorator that runs an async function inside ``span(name)``."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def summarize_stages(root: Span) -> Dict[str, Dict[str, float]]:
+    """
+    Total time and call count per stage name in a finished trace.
+
+    Stages that run several times in one request (e.g. two LLM calls) are summed.
+    """
+    stages: Dict[str, Dict[str, float]] = {}
+    for s in root.walk():
+        if s is root or s.duration_ms is None:
+            continue
+        stage = stages.setdefault(s.name, {"total_ms": 0.0, "calls": 0})
+        stage["total_ms"] += s.duration_ms
+        stage["calls"] += 1
+    return stages
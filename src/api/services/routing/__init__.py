@@ -15,7 +15,8 @@
 
 """Routing services for intent classification."""
 
+from src.api.services.routing.keyword_matcher import KeywordMatcher
 from src.api.services.routing.semantic_router import get_semantic_router, SemanticRouter
 
-__all__ = ["get_semantic_router", "SemanticRouter"]
+__all__ = ["get_semantic_router", "KeywordMatcher", "SemanticRouter"]
 
@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compiled Keyword Matcher for Intent Routing
+
+``KeywordMatcher`` compiles every keyword of every category into one regular
+expression (the alternation is built from a prefix trie, so the regex engine
+walks shared prefixes once) and finds the hits for all categories in a
+single scan of the message.
+
+Keywords match whole words only: "pm" does not match "shipment" and "po"
+does not match "report". A keyword may be followed by a common inflection
+("forklifts", "picking"), and multi-word keywords also count as hits for the
+keywords they contain ("pick wave" is a hit for "pick" and "wave").
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Set, Tuple
+
+# Inflections accepted after a keyword
+DEFAULT_SUFFIXES = ("s", "es", "ed", "ing")
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex alternation for ``words`` that shares common prefixes."""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        is_end = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not is_end:
+            return branches[0]
+        pattern = "(?:" + "|".join(branches) + ")"
+        return pattern + "?" if is_end else pattern
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Whole-word multi-keyword matcher returning hits for every category."""
+
+    def __init__(
+        self,
+        categories: Mapping[str, Iterable[str]],
+        suffixes: Iterable[str] = DEFAULT_SUFFIXES,
+    ):
+        """
+        Args:
+            categories: Category name -> keywords (matched case-insensitively)
+            suffixes: Inflections allowed after a keyword
+        """
+        self.categories = {
+            name: frozenset(k.lower().strip() for k in keywords if k.strip())
+            for name, keywords in categories.items()
+        }
+        keywords = set().union(*self.categories.values()) if self.categories else set()
+        suffix_pattern = "(?:" + "|".join(map(re.escape, sorted(suffixes, key=len, reverse=True))) + ")?"
+
+        # Categories each keyword belongs to
+        owners: Dict[str, Set[str]] = {k: set() for k in keywords}
+        for name, category_keywords in self.categories.items():
+            for keyword in category_keywords:
+                owners[keyword].add(name)
+
+        # A match of a longer keyword is also a hit for the keywords inside it,
+        # which the scan below would otherwise skip when they start at the
+        # same position ("document" within "document search")
+        contained: Dict[str, List[str]] = {k: [] for k in keywords}
+        for inner in keywords:
+            inner_re = re.compile(r"(?<!\w)" + re.escape(inner) + suffix_pattern + r"(?!\w)")
+            for outer in keywords:
+                if len(outer) > len(inner) and inner_re.search(outer):
+                    contained[outer].append(inner)
+
+        self._hits: Dict[str, List[Tuple[str, FrozenSet[str]]]] = {}
+        for keyword in keywords:
+            hits: Dict[str, Set[str]] = {}
+            for term in [keyword, *contained[keyword]]:
+                for name in owners[term]:
+                    hits.setdefault(name, set()).add(term)
+            self._hits[keyword] = [(name, frozenset(terms)) for name, terms in hits.items()]
+
+        # Zero-width lookahead so overlapping keywords ("demand forecast",
+        # "forecast accuracy") are all found; the greedy trie picks the
+        # longest keyword at each word start. The leading character class
+        # skips positions no keyword can start at without entering the trie.
+        first_chars = "".join(sorted({re.escape(k[0]) for k in keywords}))
+        self._pattern = re.compile(
+            r"(?<!\w)(?=[" + first_chars + "])"
+            r"(?=(" + _trie_pattern(keywords) + ")" + suffix_pattern + r"(?!\w))"
+        ) if keywords else None
+
+    def match(self, text: str) -> Dict[str, Set[str]]:
+        """
+        Find keyword hits for all categories in one pass.
+
+        Returns:
+            Category name -> keywords found (every category is present, with an
+            empty set when nothing matched)
+        """
+        result: Dict[str, Set[str]] = {name: set() for name in self.categories}
+        if self._pattern is None:
+            return result
+        for keyword in set(self._pattern.findall(text.lower())):
+            for name, terms in self._hits[keyword]:
+                result[name].update(terms)
+        return result
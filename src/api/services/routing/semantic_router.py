@@ -18,12 +18,22 @@ Semantic Routing Service
 
 Provides embedding-based semantic intent classification to complement keyword-based routing.
 Uses cosine similarity between query embeddings and intent category embeddings.
+
+Category vectors (one per category text plus one per exemplar) are kept as a
+pre-normalized float32 matrix, so scoring a query is a single matrix-vector
+product followed by a per-category max. The vectors are persisted to disk
+keyed by a hash of the embedded text, so restarts need no embedding calls
+unless a description changes.
 """
 
+import hashlib
 import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
@@ -35,15 +45,30 @@ class IntentCategory:
     description: str
     keywords: List[str]
     embedding: Optional[List[float]] = None
+    # Extra texts (e.g. typical queries) embedded as additional category
+    # vectors; a query scores the max similarity over all of them
+    exemplars: List[str] = field(default_factory=list)
 
 
 class SemanticRouter:
     """Semantic routing service using embeddings for intent classification."""
 
-    def __init__(self):
+    # Number of recent query embeddings kept so callers in the same request
+    # (e.g. the semantic response cache and the planner) share one API call
+    QUERY_EMBEDDING_MEMO_SIZE = 512
+
+    def __init__(self, embeddings_path: Optional[str] = None):
         self.embedding_service = None
         self.intent_categories: Dict[str, IntentCategory] = {}
         self._initialized = False
+        self._query_embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.embeddings_path = embeddings_path if embeddings_path is not None else os.getenv(
+            "SEMANTIC_ROUTER_EMBEDDINGS_PATH", "data/cache/semantic_router_embeddings.npz"
+        )
+        # Row-normalized category vectors, grouped by category
+        self._category_matrix: Optional[np.ndarray] = None
+        self._category_names: List[str] = []
+        self._category_row_starts: Optional[np.ndarray] = None
 
     async def initialize(self) -> None:
         """Initialize the semantic router with embedding service and intent categories."""
@@ -171,46 +196,195 @@ class SemanticRouter:
             # Continue without semantic routing - will fall back to keyword-based
             self._initialized = False
 
+    @staticmethod
+    def _category_text(category: IntentCategory) -> str:
+        """Enhanced semantic text for a category: description, keywords and examples."""
+        # This provides richer context for better embedding quality
+        keywords_text = ', '.join(category.keywords[:15])  # Use more keywords
+        return (
+            f"Category: {category.name}. "
+            f"{category.description} "
+            f"Related terms: {keywords_text}"
+        )
+
+    def _text_key(self, text: str) -> str:
+        model = getattr(self.embedding_service, "model_name", "")
+        return hashlib.sha256(f"{model}\0passage\0{text}".encode("utf-8")).hexdigest()
+
+    def _load_persisted_embeddings(self) -> Dict[str, np.ndarray]:
+        if not self.embeddings_path or not os.path.exists(self.embeddings_path):
+            return {}
+        try:
+            with np.load(self.embeddings_path) as data:
+                return dict(zip(data["keys"].tolist(), data["vectors"]))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable semantic router embeddings file: {e}")
+            return {}
+
+    def _persist_embeddings(self, vectors_by_key: Dict[str, np.ndarray]) -> None:
+        if not self.embeddings_path:
+            return
+        try:
+            path = Path(self.embeddings_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.savez(f, keys=np.array(list(vectors_by_key)),
+                         vectors=np.stack(list(vectors_by_key.values())).astype(np.float32))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to persist semantic router embeddings: {e}")
+
     async def _precompute_category_embeddings(self) -> None:
-        """Pre-compute embeddings for all intent categories with enhanced semantic text."""
+        """
+        Load or compute the vectors for all intent categories and their exemplars.
+
+        Vectors persisted by an earlier run are reused; texts that are new or
+        changed are embedded together in one batched call.
+        """
         if not self.embedding_service:
             return
             
         try:
-            for category_name, category in self.intent_categories.items():
-                # Create enhanced semantic text with description, keywords, and examples
-                # This provides richer context for better embedding quality
-                keywords_text = ', '.join(category.keywords[:15])  # Use more keywords
-                semantic_text = (
-                    f"Category: {category.name}. "
-                    f"{category.description} "
-                    f"Related terms: {keywords_text}"
-                )
-                category.embedding = await self.embedding_service.generate_embedding(
-                    semantic_text,
-                    input_type="passage"
-                )
-                logger.debug(f"Pre-computed embedding for intent category: {category_name}")
+            texts_by_category = {
+                name: [self._category_text(category)] + list(category.exemplars)
+                for name, category in self.intent_categories.items()
+            }
+            persisted = self._load_persisted_embeddings()
+            missing = list(dict.fromkeys(
+                text
+                for texts in texts_by_category.values()
+                for text in texts
+                if self._text_key(text) not in persisted
+            ))
+            if missing:
+                embeddings = await self.embedding_service.generate_embeddings(missing, input_type="passage")
+                for text, embedding in zip(missing, embeddings):
+                    persisted[self._text_key(text)] = np.asarray(embedding, dtype=np.float32)
+                wanted = {self._text_key(t) for texts in texts_by_category.values() for t in texts}
+                self._persist_embeddings({k: v for k, v in persisted.items() if k in wanted})
+                logger.info(f"Computed {len(missing)} semantic router category embeddings")
+            else:
+                logger.info("Loaded semantic router category embeddings from disk")
+
+            vectors_by_category = {
+                name: [persisted[self._text_key(text)] for text in texts]
+                for name, texts in texts_by_category.items()
+            }
+            for name, vectors in vectors_by_category.items():
+                self.intent_categories[name].embedding = vectors[0].tolist()
+            self._build_category_matrix(vectors_by_category)
         except Exception as e:
             logger.warning(f"Failed to pre-compute category embeddings: {e}")
 
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        try:
-            v1 = np.array(vec1)
-            v2 = np.array(vec2)
-            
-            dot_product = np.dot(v1, v2)
-            norm1 = np.linalg.norm(v1)
-            norm2 = np.linalg.norm(v2)
-            
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            
-            return float(dot_product / (norm1 * norm2))
-        except Exception as e:
-            logger.error(f"Error calculating cosine similarity: {e}")
-            return 0.0
+    def _build_category_matrix(self, vectors_by_category: Dict[str, List[np.ndarray]]) -> None:
+        """Stack category vectors into a row-normalized matrix grouped by category."""
+        names: List[str] = []
+        rows: List[np.ndarray] = []
+        starts: List[int] = []
+        for name, vectors in vectors_by_category.items():
+            if not vectors:
+                continue
+            names.append(name)
+            starts.append(len(rows))
+            rows.extend(vectors)
+        if not rows:
+            return
+        matrix = np.stack(rows).astype(np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self._category_matrix = matrix / norms
+        self._category_names = names
+        self._category_row_starts = np.array(starts, dtype=np.intp)
+
+    def score_categories(self, query_embedding: List[float]) -> Dict[str, float]:
+        """
+        Cosine similarity of a query to each category (max over its vectors).
+
+        Args:
+            query_embedding: Query embedding
+
+        Returns:
+            Similarity per category name (empty if no category vectors are loaded)
+        """
+        if self._category_matrix is None:
+            return {}
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return {name: 0.0 for name in self._category_names}
+        scores = self._category_matrix @ (query / norm)
+        best = np.maximum.reduceat(scores, self._category_row_starts)
+        return dict(zip(self._category_names, best.tolist()))
+
+    async def embed_query(self, message: str) -> Optional[List[float]]:
+        """
+        Get the query embedding for a message, reusing recently computed vectors.
+
+        Args:
+            message: User message
+
+        Returns:
+            Query embedding, or None if semantic routing is unavailable
+        """
+        if not self._initialized or not self.embedding_service:
+            return None
+
+        memo_key = message.strip().lower()
+        embedding = self._query_embeddings.get(memo_key)
+        if embedding is not None:
+            self._query_embeddings.move_to_end(memo_key)
+            return embedding
+
+        embedding = await self.embedding_service.generate_embedding(
+            message,
+            input_type="query"
+        )
+        self._query_embeddings[memo_key] = embedding
+        if len(self._query_embeddings) > self.QUERY_EMBEDDING_MEMO_SIZE:
+            self._query_embeddings.popitem(last=False)
+        return embedding
+
+    async def embed_queries(self, messages: List[str]) -> List[Optional[List[float]]]:
+        """
+        Get query embeddings for several messages with at most one embedding call.
+
+        Messages that are not memoized yet are embedded together through
+        ``generate_embeddings`` and added to the memo, so later
+        ``classify_intent_semantic`` calls for them don't hit the API.
+
+        Args:
+            messages: User messages
+
+        Returns:
+            One embedding (or None if semantic routing is unavailable) per message
+        """
+        if not self._initialized or not self.embedding_service:
+            return [None] * len(messages)
+
+        memo_keys = [message.strip().lower() for message in messages]
+        missing: Dict[str, str] = {}
+        for memo_key, message in zip(memo_keys, messages):
+            if memo_key not in self._query_embeddings and memo_key not in missing:
+                missing[memo_key] = message
+
+        if missing:
+            embeddings = await self.embedding_service.generate_embeddings(
+                list(missing.values()),
+                input_type="query"
+            )
+            for memo_key, embedding in zip(missing, embeddings):
+                self._query_embeddings[memo_key] = embedding
+            while len(self._query_embeddings) > self.QUERY_EMBEDDING_MEMO_SIZE:
+                self._query_embeddings.popitem(last=False)
+
+        results = []
+        for memo_key in memo_keys:
+            embedding = self._query_embeddings.get(memo_key)
+            if embedding is not None:
+                self._query_embeddings.move_to_end(memo_key)
+            results.append(embedding)
+        return results
 
     async def classify_intent_semantic(
         self,
@@ -234,18 +408,11 @@ class SemanticRouter:
             return (keyword_intent, keyword_confidence)
         
         try:
-            # Generate embedding for the query
-            query_embedding = await self.embedding_service.generate_embedding(
-                message,
-                input_type="query"
-            )
+            # Generate embedding for the query (shared with the semantic response cache)
+            query_embedding = await self.embed_query(message)
             
-            # Calculate similarity to each intent category
-            similarities: Dict[str, float] = {}
-            for category_name, category in self.intent_categories.items():
-                if category.embedding:
-                    similarity = self._cosine_similarity(query_embedding, category.embedding)
-                    similarities[category_name] = similarity
+            # Calculate similarity to each intent category (one matrix-vector product)
+            similarities = self.score_categories(query_embedding)
             
             if not similarities:
                 # No similarities calculated, fall back to keyword
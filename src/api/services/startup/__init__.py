@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Application startup services."""
+
+from src.api.services.startup.routers import (
+    ROUTER_GROUPS,
+    RouterGroup,
+    RouterRegistry,
+    get_router_registry,
+)
+from src.api.services.startup.warmup import (
+    StartupWarmup,
+    WarmupComponent,
+    default_components,
+    get_startup_warmup,
+)
+
+__all__ = [
+    "ROUTER_GROUPS",
+    "RouterGroup",
+    "RouterRegistry",
+    "get_router_registry",
+    "StartupWarmup",
+    "WarmupComponent",
+    "default_components",
+    "get_startup_warmup",
+]
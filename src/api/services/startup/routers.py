@@ -0,0 +1,266 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Router Registry
+
+The API is made of route groups, one router module each. Importing a router
+module imports everything behind it (agents, pandas/numpy, forecasting
+models, document processing, Milvus clients), so the registry decides per
+group whether that happens at startup, on the first request to the group's
+paths, or never:
+
+- ``ROUTER_GROUPS_DISABLED``: groups that are not registered at all.
+- ``ROUTER_LAZY_GROUPS``: groups (or ``all``) whose module is imported and
+  registered by ``LazyRouterMiddleware`` on the first request to one of
+  their path prefixes. Health and chat are always loaded at startup.
+
+Every router import is profiled: wall time, process RSS growth and the
+number of newly imported modules. Modules shared between groups are charged
+to the first group that imports them. The profile is logged at startup and
+served by ``/api/v1/health/startup``.
+"""
+
+import importlib
+import logging
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import APIRouter, FastAPI
+
+logger = logging.getLogger(__name__)
+
+# Group states
+LOADED = "loaded"
+DEFERRED = "deferred"  # Loaded on first request
+DISABLED = "disabled"
+FAILED = "failed"  # Deferred import raised; requests get 503
+
+
+@dataclass(frozen=True)
+class RouterGroup:
+    """A router module and the path prefixes its routes live under."""
+
+    name: str
+    module: str
+    path_prefixes: Tuple[str, ...]
+    deferrable: bool = True
+
+    def matches(self, path: str) -> bool:
+        return any(path == prefix or path.startswith(prefix + "/") for prefix in self.path_prefixes)
+
+
+@dataclass
+class RouterImportProfile:
+    """Cost of importing one router module."""
+
+    group: str
+    module: str
+    trigger: str  # "startup" or the request path that loaded the group
+    import_ms: float
+    rss_delta_mb: Optional[float]
+    new_modules: int
+
+
+# In registration order; prefixes must not overlap between groups
+ROUTER_GROUPS: Tuple[RouterGroup, ...] = (
+    RouterGroup(
+        "health",
+        "src.api.routers.health",
+        ("/api/v1/health", "/api/v1/live", "/api/v1/ready", "/api/v1/version"),
+        deferrable=False,
+    ),
+    RouterGroup("chat", "src.api.routers.chat", ("/api/v1/chat",), deferrable=False),
+    RouterGroup("equipment", "src.api.routers.equipment", ("/api/v1/equipment",)),
+    RouterGroup("operations", "src.api.routers.operations", ("/api/v1/operations",)),
+    RouterGroup("safety", "src.api.routers.safety", ("/api/v1/safety",)),
+    RouterGroup("auth", "src.api.routers.auth", ("/api/v1/auth",)),
+    RouterGroup("wms", "src.api.routers.wms", ("/api/v1/wms",)),
+    RouterGroup("iot", "src.api.routers.iot", ("/api/v1/iot",)),
+    RouterGroup("erp", "src.api.routers.erp", ("/api/v1/erp",)),
+    RouterGroup("scanning", "src.api.routers.scanning", ("/api/v1/scanning",)),
+    RouterGroup("attendance", "src.api.routers.attendance", ("/api/v1/attendance",)),
+    RouterGroup("reasoning", "src.api.routers.reasoning", ("/api/v1/reasoning",)),
+    RouterGroup("migration", "src.api.routers.migration", ("/api/v1/migrations",)),
+    RouterGroup("mcp", "src.api.routers.mcp", ("/api/v1/mcp",)),
+    RouterGroup("document", "src.api.routers.document", ("/api/v1/document",)),
+    RouterGroup("inventory", "src.api.routers.inventory", ("/api/v1/inventory",)),
+    RouterGroup("forecasting", "src.api.routers.advanced_forecasting", ("/api/v1/forecasting",)),
+    RouterGroup("training", "src.api.routers.training", ("/api/v1/training",)),
+)
+
+
+def _rss_mb() -> Optional[float]:
+    """Current resident set size of the process (Linux only)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _names(value: str) -> List[str]:
+    return [name.strip().lower() for name in value.split(",") if name.strip()]
+
+
+class RouterRegistry:
+    """Registers route groups on the app eagerly, lazily or not at all."""
+
+    def __init__(
+        self,
+        groups: Iterable[RouterGroup] = ROUTER_GROUPS,
+        disabled: Iterable[str] = (),
+        lazy: Iterable[str] = (),
+    ):
+        self.groups: Dict[str, RouterGroup] = {group.name: group for group in groups}
+        disabled, lazy = set(disabled), set(lazy)
+        unknown = (disabled | lazy) - set(self.groups) - {"all"}
+        if unknown:
+            logger.warning(f"Unknown router groups ignored: {', '.join(sorted(unknown))}")
+
+        self.states: Dict[str, str] = {}
+        for group in self.groups.values():
+            if group.name in disabled and group.deferrable:
+                self.states[group.name] = DISABLED
+            elif group.deferrable and ("all" in lazy or group.name in lazy):
+                self.states[group.name] = DEFERRED
+        self.errors: Dict[str, str] = {}
+        self.profiles: List[RouterImportProfile] = []
+        self.app: Optional[FastAPI] = None
+
+    @classmethod
+    def from_env(cls) -> "RouterRegistry":
+        return cls(
+            disabled=_names(os.getenv("ROUTER_GROUPS_DISABLED", "")),
+            lazy=_names(os.getenv("ROUTER_LAZY_GROUPS", "")),
+        )
+
+    def install(self, app: FastAPI) -> None:
+        """Register every group that is neither deferred nor disabled."""
+        self.app = app
+        for group in self.groups.values():
+            if group.name not in self.states:
+                self._include(group, "startup")
+
+        logger.info(
+            "Router import profile: "
+            + ", ".join(
+                f"{p.group}={p.import_ms:.0f}ms/{p.rss_delta_mb if p.rss_delta_mb is not None else '?'}MB"
+                for p in self.profiles
+            )
+        )
+        skipped = {name: state for name, state in self.states.items() if state != LOADED}
+        if skipped:
+            logger.info(f"Router groups not loaded at startup: {skipped}")
+
+    def _import(self, group: RouterGroup, trigger: str) -> APIRouter:
+        modules_before = len(sys.modules)
+        rss_before = _rss_mb()
+        start = time.perf_counter()
+        module = importlib.import_module(group.module)
+        import_ms = (time.perf_counter() - start) * 1000
+        rss_after = _rss_mb()
+
+        self.profiles.append(
+            RouterImportProfile(
+                group=group.name,
+                module=group.module,
+                trigger=trigger,
+                import_ms=round(import_ms, 1),
+                rss_delta_mb=(
+                    round(rss_after - rss_before, 1)
+                    if rss_before is not None and rss_after is not None
+                    else None
+                ),
+                new_modules=len(sys.modules) - modules_before,
+            )
+        )
+        return module.router
+
+    def _include(self, group: RouterGroup, trigger: str) -> None:
+        self.app.include_router(self._import(group, trigger))
+        # Regenerate the OpenAPI schema with the new routes
+        self.app.openapi_schema = None
+        self.states[group.name] = LOADED
+
+    @property
+    def has_deferred(self) -> bool:
+        return any(state in (DEFERRED, FAILED) for state in self.states.values())
+
+    def deferred_group_for(self, path: str) -> Optional[RouterGroup]:
+        """The deferred (or failed) group that serves ``path``, if any."""
+        for name, state in self.states.items():
+            if state in (DEFERRED, FAILED) and self.groups[name].matches(path):
+                return self.groups[name]
+        return None
+
+    def load(self, name: str, trigger: str) -> bool:
+        """
+        Import and register a deferred group; False if its import failed.
+
+        The import runs on the event loop thread: router modules create
+        loop-bound singletons at import time, and it happens once per worker.
+        """
+        state = self.states.get(name, LOADED)
+        if state == DEFERRED:
+            try:
+                self._include(self.groups[name], trigger)
+                logger.info(f"Loaded router group {name} on first request to {trigger}")
+            except Exception as e:
+                self.states[name] = FAILED
+                self.errors[name] = str(e)[:200] or type(e).__name__
+                logger.error(f"Failed to load router group {name}: {e}", exc_info=True)
+            state = self.states[name]
+        return state == LOADED
+
+    def load_all(self, trigger: str) -> None:
+        """Load every deferred group (for the OpenAPI schema)."""
+        for name, state in list(self.states.items()):
+            if state == DEFERRED:
+                self.load(name, trigger)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get group states and the router import profile."""
+        measured = [p.rss_delta_mb for p in self.profiles if p.rss_delta_mb is not None]
+        rss = _rss_mb()
+        return {
+            "groups": {
+                name: {
+                    "state": self.states.get(name, "pending"),
+                    "module": group.module,
+                    **({"error": self.errors[name]} if name in self.errors else {}),
+                }
+                for name, group in self.groups.items()
+            },
+            "profile": [asdict(profile) for profile in self.profiles],
+            "total_import_ms": round(sum(p.import_ms for p in self.profiles), 1),
+            "total_rss_delta_mb": round(sum(measured), 1) if measured else None,
+            "rss_mb": round(rss, 1) if rss is not None else None,
+        }
+
+
+# Global router registry instance
+_router_registry: Optional[RouterRegistry] = None
+
+
+def get_router_registry() -> RouterRegistry:
+    """Get the global router registry."""
+    global _router_registry
+    if _router_registry is None:
+        _router_registry = RouterRegistry.from_env()
+    return _router_registry
@@ -0,0 +1,326 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Startup Warm-Up
+
+The planner graph, the MCP agents, the tool catalog and the semantic router
+are process-wide singletons that initialize on first use (tool discovery,
+adapter registration, NIM client construction, category embeddings). The
+warm-up builds them from the application lifespan instead, so the first chat
+request does not pay for it, and ``/api/v1/health/ready`` reports not ready
+until it has finished.
+
+Components run concurrently. A component waits only for the components it
+depends on; shared singletons (NIM client, embedding service, retrievers,
+reasoning engine) are built before the components that use them, so two
+components never initialize the same singleton at the same time. The planner
+and agent factories share one initialization between the warm-up and early
+requests, and publish an instance only once it is initialized.
+
+Optionally, connection pools to NIM, Postgres, Redis and Milvus are opened
+ahead of traffic as well. Those components are best-effort: their failure
+is reported but does not affect readiness.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Component states
+PENDING = "pending"
+RUNNING = "running"
+READY = "ready"
+FAILED = "failed"
+SKIPPED = "skipped"  # A dependency failed
+
+
+@dataclass
+class WarmupComponent:
+    """One thing to build at startup."""
+
+    name: str
+    build: Callable[[], Awaitable[Any]]
+    depends_on: Sequence[str] = ()
+    required: bool = True  # Failure makes the warm-up "degraded"
+    status: str = PENDING
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class StartupWarmup:
+    """Builds the startup components concurrently and tracks their status."""
+
+    components: List[WarmupComponent]
+    timeout: float = 60.0  # Per component
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    _task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    def start(self) -> asyncio.Task:
+        """Run the warm-up in the background (idempotent)."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def run(self) -> None:
+        """Build every component, each after its dependencies."""
+        self.started_at = time.time()
+        by_name = {component.name: component for component in self.components}
+        tasks: Dict[str, asyncio.Future] = {}
+
+        async def build(component: WarmupComponent) -> None:
+            for dependency in component.depends_on:
+                if dependency in tasks:
+                    await asyncio.shield(tasks[dependency])
+                if by_name.get(dependency) is not None and by_name[dependency].status != READY:
+                    component.status = SKIPPED
+                    component.error = f"dependency {dependency} not ready"
+                    return
+            component.status = RUNNING
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(component.build(), timeout=self.timeout)
+                component.status = READY
+            except Exception as e:
+                component.status = FAILED
+                component.error = str(e)[:200] or type(e).__name__
+                log = logger.warning if component.required else logger.info
+                log(f"Warm-up of {component.name} failed: {component.error}")
+            finally:
+                component.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+
+        for component in self.components:
+            tasks[component.name] = asyncio.ensure_future(build(component))
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        self.finished_at = time.time()
+        logger.info(
+            f"Startup warm-up finished in {self.finished_at - self.started_at:.1f}s: "
+            + ", ".join(f"{c.name}={c.status} ({c.duration_ms}ms)" for c in self.components)
+        )
+
+    async def stop(self) -> None:
+        """Cancel a warm-up that is still running (application shutdown)."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    @property
+    def state(self) -> str:
+        """"warming", "ready" or "degraded" (a required component failed)."""
+        if not self.finished:
+            return "warming"
+        if any(c.required and c.status != READY for c in self.components):
+            return "degraded"
+        return "ready"
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get the warm-up state and per-component status."""
+        return {
+            "state": self.state,
+            "duration_seconds": (
+                round(self.finished_at - self.started_at, 2) if self.finished else None
+            ),
+            "components": {
+                c.name: {
+                    "status": c.status,
+                    "required": c.required,
+                    "duration_ms": c.duration_ms,
+                    **({"error": c.error} if c.error else {}),
+                }
+                for c in self.components
+            },
+        }
+
+
+async def _warm_nim_client() -> None:
+    from src.api.services.llm.nim_client import get_nim_client
+
+    await get_nim_client()
+
+
+async def _warm_hybrid_retriever() -> None:
+    from src.retrieval.hybrid_retriever import get_hybrid_retriever
+
+    await get_hybrid_retriever()
+
+
+async def _warm_embedding_service() -> None:
+    from src.retrieval.vector.embedding_service import get_embedding_service
+
+    await get_embedding_service()
+
+
+async def _warm_reasoning_engine() -> None:
+    from src.api.services.reasoning.reasoning_engine import get_reasoning_engine
+
+    await get_reasoning_engine()
+
+
+async def _warm_planner() -> None:
+    from src.api.graphs.mcp_integrated_planner_graph import get_mcp_planner_graph
+
+    planner = await get_mcp_planner_graph()
+    # initialize() logs and swallows its failures; the first query retries it
+    if not planner.initialized:
+        raise RuntimeError("planner initialization failed")
+
+
+async def _warm_tool_catalog() -> None:
+    from src.api.graphs.mcp_integrated_planner_graph import get_mcp_planner_graph
+
+    planner = await get_mcp_planner_graph()
+    if planner.tool_discovery is not None:
+        # Publishes the catalog and embeds its descriptions when enabled
+        await planner.tool_discovery.ensure_catalog_embeddings()
+
+
+async def _warm_semantic_router() -> None:
+    from src.api.services.routing.semantic_router import get_semantic_router
+
+    router = await get_semantic_router()
+    if not router._initialized:
+        raise RuntimeError("category embeddings unavailable")
+
+
+async def _warm_equipment_agent() -> None:
+    from src.api.agents.inventory.mcp_equipment_agent import get_mcp_equipment_agent
+
+    await get_mcp_equipment_agent()
+
+
+async def _warm_operations_agent() -> None:
+    from src.api.agents.operations.mcp_operations_agent import get_mcp_operations_agent
+
+    await get_mcp_operations_agent()
+
+
+async def _warm_safety_agent() -> None:
+    from src.api.agents.safety.mcp_safety_agent import get_mcp_safety_agent
+
+    await get_mcp_safety_agent()
+
+
+async def _warm_document_agent() -> None:
+    from src.api.agents.document.mcp_document_agent import get_mcp_document_agent
+
+    await get_mcp_document_agent()
+
+
+async def _warm_forecasting_agent() -> None:
+    from src.api.agents.forecasting.forecasting_agent import get_forecasting_agent
+
+    await get_forecasting_agent()
+
+
+def _connections_per_pool() -> int:
+    return max(1, int(os.getenv("STARTUP_PREWARM_CONNECTIONS", "2")))
+
+
+async def _prewarm_nim_connections() -> None:
+    """Open TLS connections to the LLM and embedding endpoints."""
+    from src.api.services.llm.nim_client import get_nim_client
+
+    nim_client = await get_nim_client()
+    # Any response will do: the point is the pooled connection
+    await asyncio.gather(*(
+        client.get("models")
+        for client in (nim_client.llm_client, nim_client.embedding_client)
+        for _ in range(_connections_per_pool())
+    ))
+
+
+async def _prewarm_postgres_connections() -> None:
+    from src.retrieval.structured.sql_retriever import get_sql_retriever
+
+    sql_retriever = await get_sql_retriever()
+
+    async def ping() -> None:
+        async with sql_retriever.get_connection() as connection:
+            await connection.execute("SELECT 1")
+
+    await asyncio.gather(*(ping() for _ in range(_connections_per_pool())))
+
+
+async def _prewarm_redis_connections() -> None:
+    from src.retrieval.caching.redis_cache_service import get_cache_service
+
+    cache_service = await get_cache_service()
+    if cache_service.redis is None:
+        raise RuntimeError("Redis unavailable")
+    await asyncio.gather(*(cache_service.redis.ping() for _ in range(_connections_per_pool())))
+
+
+async def _prewarm_milvus_connection() -> None:
+    from src.retrieval.vector.milvus_retriever import get_milvus_retriever
+
+    await get_milvus_retriever()
+
+
+def default_components(prewarm_connections: bool = False) -> List[WarmupComponent]:
+    """The planner, agents, tool catalog and semantic router (plus connection pools)."""
+    shared = ("nim_client", "hybrid_retriever", "reasoning_engine")
+    components = [
+        WarmupComponent("nim_client", _warm_nim_client),
+        WarmupComponent("hybrid_retriever", _warm_hybrid_retriever),
+        WarmupComponent("reasoning_engine", _warm_reasoning_engine, ("nim_client", "hybrid_retriever")),
+        WarmupComponent("embedding_service", _warm_embedding_service),
+        WarmupComponent("planner", _warm_planner),
+        WarmupComponent("tool_catalog", _warm_tool_catalog, ("planner", "embedding_service")),
+        WarmupComponent("semantic_router", _warm_semantic_router, ("embedding_service",)),
+        WarmupComponent("equipment_agent", _warm_equipment_agent, shared),
+        WarmupComponent("operations_agent", _warm_operations_agent, shared),
+        WarmupComponent("safety_agent", _warm_safety_agent, shared),
+        WarmupComponent("document_agent", _warm_document_agent, shared),
+        WarmupComponent("forecasting_agent", _warm_forecasting_agent, shared),
+    ]
+    if prewarm_connections:
+        components += [
+            WarmupComponent("nim_connections", _prewarm_nim_connections, ("nim_client",), required=False),
+            WarmupComponent("postgres_connections", _prewarm_postgres_connections, ("hybrid_retriever",), required=False),
+            WarmupComponent("redis_connections", _prewarm_redis_connections, required=False),
+            WarmupComponent("milvus_connection", _prewarm_milvus_connection, ("hybrid_retriever",), required=False),
+        ]
+    return components
+
+
+# Global startup warm-up instance
+_startup_warmup: Optional[StartupWarmup] = None
+
+
+def get_startup_warmup() -> Optional[StartupWarmup]:
+    """Get the global startup warm-up (None when disabled)."""
+    global _startup_warmup
+    if os.getenv("STARTUP_WARMUP_ENABLED", "true").lower() != "true":
+        return None
+    if _startup_warmup is None:
+        _startup_warmup = StartupWarmup(
+            components=default_components(
+                prewarm_connections=os.getenv("STARTUP_PREWARM_CONNECTIONS_ENABLED", "false").lower() == "true"
+            ),
+            timeout=float(os.getenv("STARTUP_WARMUP_TIMEOUT_SECONDS", "60")),
+        )
+    return _startup_warmup
@@ -0,0 +1,226 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Chat Streaming Service
+
+Provides a request-scoped event sink used by the ``/chat/stream`` endpoint.
+
+The sink is installed in a ``ContextVar`` before the chat pipeline starts, so
+the planner, the agents' LLM calls and the enrichment steps can publish
+progress without any of them taking a new parameter. When no sink is
+installed every publish call is a no-op, which keeps ``/chat`` unchanged.
+"""
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from src.api.utils.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+# Event names emitted over the stream
+EVENT_ROUTING = "routing"
+EVENT_TOKEN = "token"
+EVENT_EVIDENCE = "evidence"
+EVENT_QUICK_ACTIONS = "quick_actions"
+EVENT_DONE = "done"
+EVENT_ERROR = "error"
+
+_chat_stream_sink: ContextVar[Optional["ChatStreamSink"]] = ContextVar(
+    "chat_stream_sink", default=None
+)
+
+
+class _NaturalLanguageExtractor:
+    """
+    Incrementally extract the ``natural_language`` string from streamed JSON.
+
+    Agents ask the LLM for a JSON object and only its ``natural_language``
+    field is user facing. This scanner consumes the raw token stream and
+    returns the decoded characters of that field as they arrive. If the
+    output does not start with ``{`` it is treated as plain text.
+    """
+
+    _FIELD = '"natural_language"'
+
+    def __init__(self):
+        self._mode: Optional[str] = None  # "json" or "text"
+        self._buffer = ""
+        self._state = "seek"  # seek -> colon -> open_quote -> value -> done
+        self._escape = False
+        self._unicode: Optional[str] = None
+
+    def feed(self, chunk: str) -> str:
+        if self._mode is None:
+            stripped = (self._buffer + chunk).lstrip()
+            if not stripped:
+                self._buffer += chunk
+                return ""
+            self._mode = "json" if stripped[0] in "{`" else "text"
+            chunk = self._buffer + chunk
+            self._buffer = ""
+        if self._mode == "text":
+            return chunk
+        return self._feed_json(chunk)
+
+    def _feed_json(self, chunk: str) -> str:
+        out = []
+        i = 0
+        while i < len(chunk):
+            if self._state == "seek":
+                self._buffer += chunk[i:]
+                idx = self._buffer.find(self._FIELD)
+                if idx == -1:
+                    # Keep a tail long enough to match a field name split across chunks
+                    self._buffer = self._buffer[-len(self._FIELD):]
+                    return "".join(out)
+                rest = self._buffer[idx + len(self._FIELD):]
+                self._buffer = ""
+                self._state = "colon"
+                chunk, i = rest, 0
+                continue
+            ch = chunk[i]
+            if self._state == "colon":
+                if ch == ":":
+                    self._state = "open_quote"
+            elif self._state == "open_quote":
+                if ch == '"':
+                    self._state = "value"
+                elif not ch.isspace():
+                    # Not a string value; give up on this field
+                    self._state = "done"
+            elif self._state == "value":
+                if self._unicode is not None:
+                    self._unicode += ch
+                    if len(self._unicode) == 4:
+                        try:
+                            out.append(chr(int(self._unicode, 16)))
+                        except ValueError:
+                            pass
+                        self._unicode = None
+                elif self._escape:
+                    self._escape = False
+                    if ch == "u":
+                        self._unicode = ""
+                    else:
+                        out.append({"n": "\n", "t": "\t", "r": "", "b": "", "f": ""}.get(ch, ch))
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._state = "done"
+                else:
+                    out.append(ch)
+            else:
+                break
+            i += 1
+        return "".join(out)
+
+
+class ChatStreamSink:
+    """Queue of server-sent events for one streaming chat request."""
+
+    def __init__(self, max_queue_size: int = 0):
+        self.queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue(max_queue_size)
+        self.request_id: Optional[str] = None
+        self.started_at = time.time()
+        self.first_event_at: Optional[float] = None
+        self.first_token_at: Optional[float] = None
+        self._segment = 0
+        self._extractor: Optional[_NaturalLanguageExtractor] = None
+        self._closed = False
+
+    def emit(self, event: str, data: Dict[str, Any]) -> None:
+        """Publish an event; never blocks the producer."""
+        if self._closed:
+            return
+        now = time.time()
+        if self.first_event_at is None:
+            self.first_event_at = now
+        if event == EVENT_TOKEN and self.first_token_at is None:
+            self.first_token_at = now
+        try:
+            self.queue.put_nowait({"event": event, "data": data})
+        except asyncio.QueueFull:
+            logger.debug(f"Chat stream queue full, dropping {event} event")
+
+    def begin_llm_segment(self) -> None:
+        """Start a new streamed LLM generation (replaces any previous segment)."""
+        self._segment += 1
+        self._extractor = _NaturalLanguageExtractor()
+
+    def llm_delta(self, delta: str) -> None:
+        """Forward an LLM content delta as user-facing token text."""
+        if not delta:
+            return
+        if self._extractor is None:
+            self.begin_llm_segment()
+        text = self._extractor.feed(delta)
+        if text:
+            self.emit(EVENT_TOKEN, {"text": text, "segment": self._segment})
+
+    def text_segment(self, text: str) -> None:
+        """Publish final user-facing text as a new segment (not LLM JSON)."""
+        self._segment += 1
+        self._extractor = None
+        if text:
+            self.emit(EVENT_TOKEN, {"text": text, "segment": self._segment})
+
+    def close(self) -> None:
+        """Signal the consumer that no more events will follow."""
+        if not self._closed:
+            self._closed = True
+            self.queue.put_nowait(None)
+
+    def time_to_first_event_ms(self) -> Optional[float]:
+        if self.first_event_at is None:
+            return None
+        return (self.first_event_at - self.started_at) * 1000
+
+    def time_to_first_token_ms(self) -> Optional[float]:
+        if self.first_token_at is None:
+            return None
+        return (self.first_token_at - self.started_at) * 1000
+
+
+def get_chat_stream_sink() -> Optional[ChatStreamSink]:
+    """Get the stream sink for the current request, if it is being streamed."""
+    return _chat_stream_sink.get()
+
+
+def set_chat_stream_sink(sink: Optional[ChatStreamSink]):
+    """Install a stream sink for the current context. Returns a reset token."""
+    return _chat_stream_sink.set(sink)
+
+
+def reset_chat_stream_sink(token) -> None:
+    """Restore the stream sink that was active before ``set_chat_stream_sink``."""
+    _chat_stream_sink.reset(token)
+
+
+def emit_chat_event(event: str, data: Dict[str, Any]) -> None:
+    """Publish an event to the current request's stream (no-op when not streaming)."""
+    sink = _chat_stream_sink.get()
+    if sink is not None:
+        sink.emit(event, data)
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Encode one server-sent event."""
+    payload = dumps(data).decode("utf-8")
+    return f"event: {event}\ndata: {payload}\n\n"
@@ -17,7 +17,25 @@
 API utility functions for common operations.
 """
 
+from .async_singleton import AsyncSingleton
 from .log_utils import sanitize_log_data
+from .serialization import (
+    CIRCULAR_REFERENCE,
+    FastJSONResponse,
+    dumps,
+    serialize_reasoning_chain,
+    serialize_reasoning_step,
+    to_jsonable,
+)
 
-__all__ = ["sanitize_log_data"]
+__all__ = [
+    "AsyncSingleton",
+    "sanitize_log_data",
+    "CIRCULAR_REFERENCE",
+    "FastJSONResponse",
+    "dumps",
+    "serialize_reasoning_chain",
+    "serialize_reasoning_step",
+    "to_jsonable",
+]
 
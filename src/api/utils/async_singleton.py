@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lazily created, asynchronously initialized singletons.
+
+Agents and the planner graph are created on first use and need an awaited
+``initialize()`` before they can serve requests. ``AsyncSingleton`` runs that
+creation once for all concurrent first callers (the startup warm-up and early
+requests), publishes the instance only once it is ready, and shields the
+creation from callers that give up waiting, so the next caller finds it done.
+A failed creation is retried by the next caller.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncSingleton(Generic[T]):
+    """An instance created by an async factory on first use."""
+
+    def __init__(self, create: Callable[[], Awaitable[T]]):
+        """
+        Args:
+            create: Creates and initializes the instance
+        """
+        self._create = create
+        self.instance: Optional[T] = None
+        self._pending: Optional[asyncio.Future] = None
+
+    async def _create_and_publish(self) -> T:
+        instance = await self._create()
+        self.instance = instance
+        return instance
+
+    async def get(self) -> T:
+        """Get the instance, creating it (or joining its creation) if needed."""
+        if self.instance is not None:
+            return self.instance
+        if self._pending is None or self._pending.done():
+            self._pending = asyncio.ensure_future(self._create_and_publish())
+        return await asyncio.shield(self._pending)
+
+    def reset(self) -> None:
+        """Forget the instance; the next ``get`` creates a new one."""
+        self.instance = None
+        self._pending = None
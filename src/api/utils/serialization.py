@@ -0,0 +1,275 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Response serialization utilities.
+
+``to_jsonable`` converts agent/tool results (dicts, lists, dataclasses,
+pydantic models, enums, datetimes, Decimals, numpy scalars and arrays) into
+JSON-safe Python values in a single walk. Cycles are detected by object
+identity along the current path and replaced with ``CIRCULAR_REFERENCE``;
+shared (non-cyclic) sub-objects are serialized normally.
+
+``dumps`` encodes with orjson when it is installed and falls back to the
+standard library otherwise. ``FastJSONResponse`` uses it for FastAPI routes.
+"""
+
+import dataclasses
+import json
+import logging
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+
+# Try to import optional accelerators, fallback to None if not available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+CIRCULAR_REFERENCE = "[Circular Reference]"
+
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Scalar conversions, checked in order with isinstance; bool must precede int
+_SCALAR_BASES: List[Tuple[type, Callable[[Any], Any]]] = [
+    (Enum, lambda v: to_jsonable(v.value)),
+    (datetime, lambda v: v.isoformat()),
+    (date, lambda v: v.isoformat()),
+    (time, lambda v: v.isoformat()),
+    (timedelta, lambda v: v.total_seconds()),
+    (Decimal, float),
+    (UUID, str),
+    (str, str),
+    (bool, bool),
+    (int, int),
+    (float, float),
+]
+if np is not None:
+    _SCALAR_BASES.append((np.generic, lambda v: v.item()))
+
+# Per-type cache of the matching scalar conversion (None for containers/objects)
+_scalar_converters: Dict[type, Optional[Callable[[Any], Any]]] = {}
+
+
+def _scalar_converter(value_type: type) -> Optional[Callable[[Any], Any]]:
+    """Look up how to convert a non-container type, caching the isinstance walk."""
+    try:
+        return _scalar_converters[value_type]
+    except KeyError:
+        pass
+    converter = None
+    for base, fn in _SCALAR_BASES:
+        if issubclass(value_type, base):
+            converter = fn
+            break
+    _scalar_converters[value_type] = converter
+    return converter
+
+
+def to_jsonable(
+    obj: Any,
+    max_depth: Optional[int] = None,
+    skip_keys: FrozenSet[str] = frozenset(),
+    expand_objects: bool = False,
+) -> Any:
+    """
+    Convert ``obj`` to JSON-serializable Python values in one pass.
+
+    Args:
+        obj: Value to convert
+        max_depth: Containers nested deeper than this are replaced by ``str()``
+            (None for no limit)
+        skip_keys: Dict keys to drop at every level
+        expand_objects: Convert plain objects through their ``__dict__`` instead
+            of ``str()``
+
+    Returns:
+        A tree of dicts, lists and primitives
+    """
+    on_path: set = set()
+
+    def convert(value: Any, depth: int) -> Any:
+        value_type = type(value)
+        if value_type in _PASSTHROUGH_TYPES:
+            return value
+        scalar = _scalar_converter(value_type)
+        if scalar is not None:
+            return scalar(value)
+        if np is not None and value_type is np.ndarray:
+            value = value.tolist()
+
+        if max_depth is not None and depth > max_depth:
+            return str(value)
+
+        value_id = id(value)
+        if value_id in on_path:
+            return CIRCULAR_REFERENCE
+        on_path.add(value_id)
+        child_depth = depth + 1
+        try:
+            if isinstance(value, dict):
+                return {
+                    (k if type(k) is str else str(convert(k, child_depth))):
+                        v if type(v) in _PASSTHROUGH_TYPES else convert(v, child_depth)
+                    for k, v in value.items()
+                    if k not in skip_keys
+                }
+            if isinstance(value, (list, tuple, set, frozenset)):
+                return [
+                    item if type(item) in _PASSTHROUGH_TYPES else convert(item, child_depth)
+                    for item in value
+                ]
+            if dataclasses.is_dataclass(value) and not isinstance(value, type):
+                return {
+                    f.name: convert(getattr(value, f.name), child_depth)
+                    for f in dataclasses.fields(value)
+                    if f.name not in skip_keys
+                }
+            if hasattr(value, "model_dump"):
+                return convert(value.model_dump(), depth)
+            if expand_objects and hasattr(value, "__dict__"):
+                return {
+                    k: convert(v, child_depth)
+                    for k, v in vars(value).items()
+                    if k not in skip_keys
+                }
+            return str(value)
+        except (RecursionError, AttributeError, TypeError) as e:
+            logger.warning(f"Failed to serialize value of type {value_type.__name__}: {e}")
+            return str(value)
+        finally:
+            on_path.discard(value_id)
+
+    return convert(obj, 0)
+
+
+def _default(value: Any) -> Any:
+    """Fallback hook for encoders: convert anything they don't know natively."""
+    converted = to_jsonable(value)
+    if converted is value:
+        return str(value)
+    return converted
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any) -> bytes:
+        """Encode ``obj`` as JSON bytes (orjson)."""
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except (TypeError, orjson.JSONEncodeError):
+            # Cycles, integers beyond 64 bits, etc. orjson rejects big integers
+            # outright, so the converted tree goes through the standard library
+            return json.dumps(
+                to_jsonable(obj), default=str, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Encode ``obj`` as JSON bytes (standard library)."""
+        try:
+            return json.dumps(
+                obj, default=_default, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+        except (TypeError, ValueError):
+            return json.dumps(
+                to_jsonable(obj), ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with ``dumps`` (orjson when available)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def serialize_reasoning_step(step: Any) -> Dict[str, Any]:
+    """
+    Convert a reasoning step (dataclass, dict, or other) to a dictionary.
+
+    ``input_data`` and ``output_data`` are dropped; they can hold whole tool
+    results and are not shown to users.
+    """
+    if dataclasses.is_dataclass(step):
+        try:
+            dependencies = getattr(step, "dependencies", None)
+            step_dict = {
+                "step_id": getattr(step, "step_id", ""),
+                "step_type": to_jsonable(getattr(step, "step_type", "")),
+                "description": getattr(step, "description", ""),
+                "reasoning": getattr(step, "reasoning", ""),
+                "confidence": float(getattr(step, "confidence", 0.0)),
+                "input_data": {},
+                "output_data": {},
+                "dependencies": list(dependencies) if isinstance(dependencies, (list, tuple)) else [],
+            }
+            if hasattr(step, "timestamp"):
+                step_dict["timestamp"] = to_jsonable(getattr(step, "timestamp"))
+            return step_dict
+        except Exception as e:
+            logger.warning(f"Error converting reasoning step: {e}")
+            return {"step_id": "error", "step_type": "error",
+                    "description": "Error converting step", "reasoning": "", "confidence": 0.0}
+    if isinstance(step, dict):
+        return {k: v for k, v in step.items()
+                if isinstance(v, (str, int, float, bool, type(None), list, dict))}
+    return {"step_id": "unknown", "step_type": "unknown",
+            "description": str(step), "reasoning": "", "confidence": 0.0}
+
+
+def serialize_reasoning_chain(reasoning_chain: Any) -> Optional[Dict[str, Any]]:
+    """
+    Convert a ReasoningChain dataclass to a dictionary.
+
+    Dicts are returned unchanged; other values are converted with ``to_jsonable``.
+    Returns None if conversion fails.
+    """
+    if isinstance(reasoning_chain, dict):
+        return reasoning_chain
+    if not dataclasses.is_dataclass(reasoning_chain):
+        converted = to_jsonable(reasoning_chain, max_depth=5, expand_objects=True)
+        return converted if isinstance(converted, dict) else None
+    try:
+        chain_dict = {
+            "chain_id": getattr(reasoning_chain, "chain_id", ""),
+            "query": getattr(reasoning_chain, "query", ""),
+            "reasoning_type": to_jsonable(getattr(reasoning_chain, "reasoning_type", "")),
+            "final_conclusion": getattr(reasoning_chain, "final_conclusion", ""),
+            "overall_confidence": float(getattr(reasoning_chain, "overall_confidence", 0.0)),
+            "execution_time": float(getattr(reasoning_chain, "execution_time", 0.0)),
+        }
+        if hasattr(reasoning_chain, "created_at"):
+            chain_dict["created_at"] = to_jsonable(getattr(reasoning_chain, "created_at"))
+        steps: List[Any] = getattr(reasoning_chain, "steps", None) or []
+        chain_dict["steps"] = [serialize_reasoning_step(step) for step in steps]
+        return chain_dict
+    except Exception as e:
+        logger.error(f"Error converting reasoning_chain to dict: {e}", exc_info=True)
+        return None
@@ -29,6 +29,7 @@ import asyncio
 import uuid
 
 from src.api.services.llm.nim_client import get_nim_client, LLMResponse
+from src.api.services.llm.concurrency import LLMPriority
 from src.retrieval.structured.sql_retriever import get_sql_retriever
 
 logger = logging.getLogger(__name__)
@@ -559,7 +560,9 @@ Provide a concise summary:
                 {"role": "user", "content": prompt}
             ]
             
-            response = await self.nim_client.generate_response(messages, temperature=0.3)
+            response = await self.nim_client.generate_response(
+                messages, temperature=0.3, priority=LLMPriority.BACKGROUND
+            )
             return response.content.strip()
             
         except Exception as e:
@@ -28,6 +28,7 @@ import asyncpg
 from contextlib import asynccontextmanager
 import os
 from dotenv import load_dotenv
+from src.api.services.monitoring.tracing import traced
 
 load_dotenv()
 
@@ -137,6 +138,7 @@ class SQLRetriever:
             if connection:
                 await self._pool.release(connection)
     
+    @traced("sql.query")
     async def execute_query(
         self, 
         query: str, 
@@ -176,6 +178,7 @@ class SQLRetriever:
             logger.error(f"Params: {params}")
             raise
     
+    @traced("sql.query")
     async def fetch_all(
         self, 
         query: str, 
@@ -206,6 +209,7 @@ class SQLRetriever:
             logger.error(f"Fetch all failed: {e}")
             raise
 
+    @traced("sql.query")
     async def fetch_one(
         self, 
         query: str, 
@@ -236,6 +240,7 @@ class SQLRetriever:
             logger.error(f"Fetch one failed: {e}")
             raise
 
+    @traced("sql.query")
     async def fetch_scalar(
         self, 
         query: str, 
@@ -265,6 +270,7 @@ class SQLRetriever:
             logger.error(f"Fetch scalar failed: {e}")
             raise
 
+    @traced("sql.query")
     async def execute_scalar(
         self, 
         query: str, 
@@ -297,6 +303,7 @@ class SQLRetriever:
             logger.error(f"Scalar query execution failed: {e}")
             raise
     
+    @traced("sql.query")
     async def execute_command(
         self, 
         command: str, 
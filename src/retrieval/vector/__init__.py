@@ -22,6 +22,8 @@ for semantic search over SOPs, manuals, and other unstructured content.
 
 from .milvus_retriever import MilvusRetriever
 from .embedding_service import EmbeddingService
+from .embedding_cache import EmbeddingCache, MmapEmbeddingStore, get_embedding_cache
+from .embedding_batcher import EmbeddingBatcher
 from .hybrid_ranker import HybridRanker
 from .chunking_service import ChunkingService, Chunk, ChunkMetadata
 from .enhanced_retriever import EnhancedVectorRetriever, EnhancedSearchResult, RetrievalConfig
@@ -31,6 +33,10 @@ from .clarifying_questions import ClarifyingQuestionsEngine, QuestionSet, Clarif
 __all__ = [
     "MilvusRetriever",
     "EmbeddingService", 
+    "EmbeddingCache",
+    "MmapEmbeddingStore",
+    "get_embedding_cache",
+    "EmbeddingBatcher",
     "HybridRanker",
     "ChunkingService",
     "Chunk",
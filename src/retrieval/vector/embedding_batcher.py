@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Embedding Micro-Batching
+
+``EmbeddingBatcher`` coalesces concurrent single-text embedding requests:
+texts submitted within ``max_wait_ms`` of each other (up to
+``max_batch_size``) are sent to the embedding endpoint as one array call and
+the results are handed back to each waiting caller.
+
+Requests are grouped by input type and by NIM call priority, so a batch is
+never sent at a higher priority than its callers asked for.
+"""
+
+import asyncio
+import contextvars
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple
+
+from src.api.services.llm.concurrency import LLMPriority, get_llm_priority, llm_priority
+
+logger = logging.getLogger(__name__)
+
+# Batch-size histogram buckets (upper bounds)
+_BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+_OVERFLOW_BUCKET = f">{_BATCH_SIZE_BUCKETS[-1]}"
+
+
+class EmbeddingBatcher:
+    """Gathers single-text embedding requests into batched calls."""
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str], str], Awaitable[List[List[float]]]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        """
+        Args:
+            embed_batch: Embeds a list of texts for an input type in one call
+            max_batch_size: Texts per call; a full batch is sent immediately
+            max_wait_ms: How long the first text in a batch waits for others
+        """
+        self.embed_batch = embed_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self._pending: Dict[Tuple[str, LLMPriority], List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[Tuple[str, LLMPriority], asyncio.TimerHandle] = {}
+        self._in_flight: Set[asyncio.Task] = set()
+        self._histogram: Dict[str, int] = {f"<={b}": 0 for b in _BATCH_SIZE_BUCKETS}
+        self._histogram[_OVERFLOW_BUCKET] = 0
+        self._stats = {
+            "requests": 0,
+            "batches": 0,
+            "texts_sent": 0,
+            "flushed_full": 0,
+            "flushed_timer": 0,
+            "errors": 0,
+        }
+
+    async def embed(self, text: str, input_type: str = "query") -> List[float]:
+        """Embed one text as part of the next batch."""
+        key = (input_type, get_llm_priority())
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(key, [])
+        pending.append((text, future))
+        self._stats["requests"] += 1
+
+        if len(pending) >= self.max_batch_size:
+            self._stats["flushed_full"] += 1
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = asyncio.get_running_loop().call_later(
+                self.max_wait_ms / 1000, self._flush_on_timer, key
+            )
+        return await future
+
+    def _flush_on_timer(self, key: Tuple[str, LLMPriority]) -> None:
+        self._stats["flushed_timer"] += 1
+        self._flush(key)
+
+    def _flush(self, key: Tuple[str, LLMPriority]) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, [])
+        if batch:
+            # Fresh context: the batch belongs to no single caller's request
+            task = asyncio.get_running_loop().create_task(
+                self._send(key, batch), context=contextvars.Context()
+            )
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, key: Tuple[str, LLMPriority], batch: List[Tuple[str, asyncio.Future]]) -> None:
+        input_type, priority = key
+        # Duplicate texts in a batch are embedded once
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        self._record_batch(len(texts))
+        try:
+            with llm_priority(priority):
+                embeddings = await self.embed_batch(texts, input_type)
+            if len(embeddings) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Batched embedding call for {len(texts)} texts failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_text = dict(zip(texts, embeddings))
+        for text, future in batch:
+            if not future.done():  # Caller may have been cancelled
+                future.set_result(by_text[text])
+
+    def _record_batch(self, size: int) -> None:
+        self._stats["batches"] += 1
+        self._stats["texts_sent"] += size
+        bucket = next((f"<={b}" for b in _BATCH_SIZE_BUCKETS if size <= b), _OVERFLOW_BUCKET)
+        self._histogram[bucket] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request/batch counts and the batch-size distribution."""
+        batches = self._stats["batches"]
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "mean_batch_size": round(self._stats["texts_sent"] / batches, 2) if batches else 0.0,
+            "batch_size_histogram": dict(self._histogram),
+            **self._stats,
+        }
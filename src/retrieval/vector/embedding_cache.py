@@ -0,0 +1,333 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Content-Addressed Embedding Cache
+
+Embeddings are keyed by a hash of (model, input_type, text) and kept in two
+tiers:
+
+- An in-process LRU of float32 vectors.
+- A persistent store of memory-mapped float32 files on disk, shared by all
+  API workers on the host and kept across restarts. It is an append-only
+  vector file plus an open-addressing hash index; writers serialize with a
+  file lock, readers do not lock.
+
+``get_or_embed`` returns cached vectors and calls the embedding API once
+for the texts that are missing. New vectors are written to disk on a worker
+thread, since the write waits for the file lock and flushes the mapping.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: the disk tier is used by a single process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Index layout: row 0 is the header [magic, dimension], row 1 is
+# [rows used, capacity], each slot after that is [key fingerprint, vector row + 1]
+_INDEX_MAGIC = 0x45424D4331  # "EBMC1"
+_HEADER_ROWS = 2
+
+
+def embedding_key(model: str, input_type: str, text: str) -> int:
+    """64-bit content hash of an embedding request (never 0, which marks an empty slot)."""
+    digest = hashlib.blake2b(
+        f"{model}\0{input_type}\0{text}".encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class MmapEmbeddingStore:
+    """Append-only float32 vector file with a memory-mapped hash index."""
+
+    def __init__(self, directory: str, name: str, dimension: int, capacity: int = 50_000):
+        self.dimension = dimension
+        base = Path(directory)
+        base.mkdir(parents=True, exist_ok=True)
+        self._lock_path = base / f"{name}.lock"
+        self._lock_path.touch(exist_ok=True)
+        index_path = base / f"{name}.index"
+        vectors_path = base / f"{name}.f32"
+
+        with self._file_lock():
+            if not index_path.exists():
+                # Load factor <= 0.5 keeps probe chains short
+                index = np.memmap(index_path, dtype=np.uint64, mode="w+",
+                                  shape=(_HEADER_ROWS + capacity * 2, 2))
+                index[0] = (_INDEX_MAGIC, dimension)
+                index[1] = (0, capacity)
+                np.memmap(vectors_path, dtype=np.float32, mode="w+", shape=(capacity, dimension)).flush()
+                index.flush()
+                del index
+
+        self._index = np.memmap(index_path, dtype=np.uint64, mode="r+").reshape(-1, 2)
+        if int(self._index[0, 0]) != _INDEX_MAGIC or int(self._index[0, 1]) != dimension:
+            raise ValueError(f"Embedding store {index_path} has a different format or dimension")
+        self.capacity = int(self._index[1, 1])
+        self.slots = self._index.shape[0] - _HEADER_ROWS
+        self._vectors = np.memmap(vectors_path, dtype=np.float32, mode="r+").reshape(-1, dimension)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock shared by all processes using this store."""
+        with open(self._lock_path, "r+") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    @property
+    def rows_used(self) -> int:
+        return int(self._index[1, 0])
+
+    def _probe(self, key: int) -> Iterator[Tuple[int, int]]:
+        """Yield (index row, stored key) along the probe sequence for ``key``."""
+        slot = key % self.slots
+        for _ in range(self.slots):
+            row = _HEADER_ROWS + slot
+            yield row, int(self._index[row, 0])
+            slot = (slot + 1) % self.slots
+
+    def get(self, key: int) -> Optional[np.ndarray]:
+        for row, stored in self._probe(key):
+            if stored == 0:
+                return None
+            if stored == key:
+                vector_row = int(self._index[row, 1])
+                if vector_row == 0:  # Being written by another process
+                    return None
+                return np.array(self._vectors[vector_row - 1])
+        return None
+
+    def put_many(self, items: Sequence[Tuple[int, np.ndarray]]) -> int:
+        """
+        Store (key, vector) pairs that are not present yet.
+
+        Returns:
+            Number of vectors written (stops once the store is full)
+        """
+        written = 0
+        with self._file_lock():
+            rows = self.rows_used
+            for key, vector in items:
+                if rows >= self.capacity:
+                    break
+                for row, stored in self._probe(key):
+                    if stored == key:
+                        break
+                    if stored == 0:
+                        # Write the vector and claim its row before publishing the
+                        # index entry, so an interrupted write never leaves an
+                        # entry pointing at a row that will be reused
+                        self._vectors[rows] = vector
+                        rows += 1
+                        self._index[1, 0] = rows
+                        self._index[row, 1] = rows
+                        self._index[row, 0] = key
+                        written += 1
+                        break
+            if written:
+                self._vectors.flush()
+                self._index.flush()
+        return written
+
+
+class EmbeddingCache:
+    """LRU of embedding vectors in front of an optional shared disk store."""
+
+    def __init__(
+        self,
+        dimension: int,
+        max_entries: int = 10_000,
+        store_dir: Optional[str] = None,
+        store_capacity: int = 50_000,
+    ):
+        self.dimension = dimension
+        self.max_entries = max(1, max_entries)
+        self.store_dir = store_dir
+        self.store_capacity = store_capacity
+        self._entries: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._stores: Dict[str, Optional[MmapEmbeddingStore]] = {}
+        self._lock = threading.Lock()
+        self._store_lock = threading.Lock()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "disk_writes": 0, "disk_full": 0}
+
+    def _store_for(self, model: str) -> Optional[MmapEmbeddingStore]:
+        """Disk store for a model (one file set per model and dimension)."""
+        if not self.store_dir:
+            return None
+        # Stores are opened from the event loop (reads) and worker threads (writes)
+        with self._store_lock:
+            if model not in self._stores:
+                name = "".join(c if c.isalnum() else "_" for c in model) + f"_{self.dimension}"
+                try:
+                    self._stores[model] = MmapEmbeddingStore(
+                        self.store_dir, name, self.dimension, self.store_capacity
+                    )
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Embedding disk cache unavailable, using memory only: {e}")
+                    self._stores[model] = None
+            return self._stores[model]
+
+    def _remember(self, key: int, vector: np.ndarray) -> None:
+        """Add to the LRU. Caller must hold the lock."""
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, model: str, input_type: str, text: str) -> Optional[np.ndarray]:
+        """Look up one vector in memory, then on disk."""
+        key = embedding_key(model, input_type, text)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return vector
+        store = self._store_for(model)
+        vector = store.get(key) if store is not None else None
+        with self._lock:
+            if vector is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._remember(key, vector)
+        return vector
+
+    def put_many(self, model: str, input_type: str, texts: Sequence[str], vectors: Sequence[Any]) -> None:
+        """Cache vectors for texts in both tiers."""
+        self._write_to_disk(model, self._remember_many(model, input_type, texts, vectors))
+
+    def _remember_many(
+        self, model: str, input_type: str, texts: Sequence[str], vectors: Sequence[Any]
+    ) -> List[Tuple[int, np.ndarray]]:
+        """Add vectors to the LRU; returns the (key, vector) pairs."""
+        items = []
+        with self._lock:
+            for text, vector in zip(texts, vectors):
+                key = embedding_key(model, input_type, text)
+                array = np.asarray(vector, dtype=np.float32)
+                self._remember(key, array)
+                items.append((key, array))
+        return items
+
+    def _write_to_disk(self, model: str, items: List[Tuple[int, np.ndarray]]) -> None:
+        """Write vectors to the model's disk store (blocking)."""
+        store = self._store_for(model)
+        if store is None or not items:
+            return
+        if any(array.shape != (self.dimension,) for _, array in items):
+            return
+        try:
+            written = store.put_many(items)
+        except OSError as e:
+            logger.warning(f"Embedding disk cache write failed: {e}")
+            return
+        with self._lock:
+            self._stats["disk_writes"] += written
+            if written < len(items) and store.rows_used >= store.capacity:
+                self._stats["disk_full"] += 1
+
+    async def get_or_embed(
+        self,
+        texts: Sequence[str],
+        model: str,
+        input_type: str,
+        embed: Callable[[List[str]], Awaitable[List[List[float]]]],
+    ) -> List[List[float]]:
+        """
+        Return embeddings for ``texts``, calling ``embed`` once for the missing ones.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model name (part of the cache key)
+            input_type: "query" or "passage" (part of the cache key)
+            embed: Embeds a list of texts through the API
+
+        Returns:
+            One embedding per input text, in order
+        """
+        results: List[Optional[List[float]]] = []
+        missing: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            vector = self.get(model, input_type, text)
+            if vector is None:
+                missing.setdefault(text, []).append(i)
+                results.append(None)
+            else:
+                results.append(vector.tolist())
+
+        if missing:
+            missing_texts = list(missing)
+            embeddings = await embed(missing_texts)
+            if len(embeddings) != len(missing_texts):
+                raise ValueError(f"Expected {len(missing_texts)} embeddings, got {len(embeddings)}")
+            items = self._remember_many(model, input_type, missing_texts, embeddings)
+            await asyncio.to_thread(self._write_to_disk, model, items)
+            for text, embedding in zip(missing_texts, embeddings):
+                for i in missing[text]:
+                    results[i] = list(embedding)
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cached_entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate_percent"] = (
+            round((stats["hits"] + stats["disk_hits"]) / lookups * 100, 2) if lookups else 0.0
+        )
+        stats["disk_entries"] = {
+            model: store.rows_used for model, store in self._stores.items() if store is not None
+        }
+        return stats
+
+
+# Global embedding cache instance
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache(dimension: int = 1024) -> Optional[EmbeddingCache]:
+    """Get or create the global embedding cache (None when disabled)."""
+    global _embedding_cache
+    if os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() != "true":
+        return None
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache(
+            dimension=dimension,
+            max_entries=int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "10000")),
+            store_dir=os.getenv("EMBEDDING_CACHE_DIR", "data/cache/embeddings") or None,
+            store_capacity=int(os.getenv("EMBEDDING_CACHE_DISK_CAPACITY", "50000")),
+        )
+    return _embedding_cache
@@ -26,6 +26,9 @@ import numpy as np
 import os
 from dotenv import load_dotenv
 
+from .embedding_cache import EmbeddingCache, get_embedding_cache
+from .embedding_batcher import EmbeddingBatcher
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -42,6 +45,16 @@ class EmbeddingService:
         self.dimension = dimension
         self._initialized = False
         self.nim_client = None
+        # Content-addressed cache shared with other services (None when disabled)
+        self.cache: Optional[EmbeddingCache] = get_embedding_cache(dimension)
+        # Coalesces concurrent single-text calls into one array request
+        self.batcher: Optional[EmbeddingBatcher] = None
+        if os.getenv("EMBEDDING_BATCH_ENABLED", "true").lower() == "true":
+            self.batcher = EmbeddingBatcher(
+                lambda texts, input_type: self._embed_batch_with_nim_for(input_type)(texts),
+                max_batch_size=int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "32")),
+                max_wait_ms=float(os.getenv("EMBEDDING_BATCH_MAX_WAIT_MS", "5")),
+            )
     
     async def initialize(self) -> None:
         """Initialize the embedding service with NVIDIA NIM client."""
@@ -85,6 +98,28 @@ class EmbeddingService:
             logger.error(f"Failed to generate embedding with NIM: {e}")
             raise
     
+    def _embed_batch_with_nim_for(self, input_type: str):
+        """Build a batch embedding call for ``input_type`` (used directly or by the cache)."""
+
+        async def embed(texts: List[str]) -> List[List[float]]:
+            if not self.nim_client:
+                raise RuntimeError("NIM client not initialized")
+
+            # Use batch processing for better performance
+            response = await self.nim_client.generate_embeddings(
+                texts=texts,
+                model=self.model_name,
+                input_type=input_type
+            )
+
+            if not response.embeddings or len(response.embeddings) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings, got {len(response.embeddings) if response.embeddings else 0}")
+
+            logger.info(f"Generated {len(response.embeddings)} embeddings using NVIDIA NIM")
+            return response.embeddings
+
+        return embed
+
     async def generate_embedding(self, text: str, input_type: str = "query") -> List[float]:
         """
         Generate embedding for a single text using NVIDIA NIM.
@@ -100,8 +135,16 @@ class EmbeddingService:
             if not self._initialized:
                 await self.initialize()
             
-            # Generate embedding using NVIDIA NIM
-            embedding = await self._generate_embedding_with_nim(text, input_type)
+            # Generate embedding using NVIDIA NIM (or reuse a cached one)
+            if self.batcher is not None:
+                async def embed(texts: List[str]) -> List[List[float]]:
+                    return [await self.batcher.embed(texts[0], input_type)]
+            else:
+                embed = self._embed_batch_with_nim_for(input_type)
+            if self.cache is not None:
+                embedding = (await self.cache.get_or_embed([text], self.model_name, input_type, embed))[0]
+            else:
+                embedding = (await embed([text]))[0]
             
             logger.debug(f"Generated embedding for text: {text[:50]}... (dim: {len(embedding)})")
             return embedding
@@ -125,21 +168,11 @@ class EmbeddingService:
             if not self._initialized:
                 await self.initialize()
             
-            if not self.nim_client:
-                raise RuntimeError("NIM client not initialized")
-            
-            # Use batch processing for better performance
-            response = await self.nim_client.generate_embeddings(
-                texts=texts,
-                model=self.model_name,
-                input_type=input_type
-            )
-            
-            if not response.embeddings or len(response.embeddings) != len(texts):
-                raise ValueError(f"Expected {len(texts)} embeddings, got {len(response.embeddings) if response.embeddings else 0}")
-            
-            logger.info(f"Generated {len(response.embeddings)} embeddings using NVIDIA NIM")
-            return response.embeddings
+            embed = self._embed_batch_with_nim_for(input_type)
+            if self.cache is not None:
+                # Only texts that are not cached are sent to NIM
+                return await self.cache.get_or_embed(texts, self.model_name, input_type, embed)
+            return await embed(list(texts))
             
         except Exception as e:
             logger.error(f"Failed to generate embeddings: {e}")
@@ -176,6 +209,13 @@ class EmbeddingService:
             logger.error(f"Failed to calculate similarity: {e}")
             return 0.0
     
+    def get_stats(self) -> Dict[str, Any]:
+        """Get embedding cache and micro-batching statistics."""
+        return {
+            "cache": self.cache.get_stats() if self.cache is not None else {"enabled": False},
+            "batching": self.batcher.get_stats() if self.batcher is not None else {"enabled": False},
+        }
+
     def get_dimension(self) -> int:
         """Get the embedding dimension."""
         return self.dimension
@@ -187,6 +227,10 @@ class EmbeddingService:
 # Global embedding service instance
 _embedding_service: Optional[EmbeddingService] = None
 
+def get_embedding_stats() -> Optional[Dict[str, Any]]:
+    """Get statistics of the global embedding service, if it has been created."""
+    return _embedding_service.get_stats() if _embedding_service is not None else None
+
 async def get_embedding_service() -> EmbeddingService:
     """Get or create the global embedding service instance."""
     global _embedding_service
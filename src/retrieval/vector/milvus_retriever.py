@@ -30,6 +30,7 @@ from pymilvus import (
 )
 import os
 from dotenv import load_dotenv
+from src.api.services.monitoring.tracing import traced
 
 load_dotenv()
 
@@ -219,6 +220,7 @@ class MilvusRetriever:
             logger.error(f"Failed to insert documents: {e}")
             return False
     
+    @traced("milvus.search")
     async def search_similar(
         self,
         query_embedding: List[float],
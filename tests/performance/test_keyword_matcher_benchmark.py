@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark for keyword intent routing.
+
+Compares the previous ``MCPIntentClassifier.classify_intent`` keyword scan
+(one substring ``in`` check per keyword, several lists scanned more than
+once) with the compiled ``KeywordMatcher`` scan on representative chat
+queries. The previous scan stopped at the first list that decided the route,
+so the gain is largest for queries that reach the later checks. Run with ``pytest tests/performance/test_keyword_matcher_benchmark.py -s``
+to print the numbers; set ``PERF_ROUTING_ITERATIONS`` to change the sample size.
+"""
+
+import os
+import statistics
+import time
+
+import pytest
+
+from src.api.graphs.mcp_integrated_planner_graph import MCPIntentClassifier as C
+
+ITERATIONS = int(os.getenv("PERF_ROUTING_ITERATIONS", "200"))
+
+QUERIES = [
+    "Show me the status of forklift FL-001",
+    "How many workers are active in Zone A today?",
+    "Report a safety incident with temperature sensor TS-001",
+    "Upload and extract data from this invoice PDF",
+    "What is the demand forecast for SKU-123 next month?",
+    "Create a pick wave for orders 1001 and 1002 and assign them to the picking team in zone B",
+    "Which forklifts are available for the afternoon shift?",
+    "What's the inventory level?",
+    "Tell me something",
+    "Check transport status for truck T1 and the conveyor utilization in the packing area",
+]
+
+# Queries decided by the last checks (operations, equipment fallback, ambiguous)
+LATE_QUERIES = [
+    "How many workers are active in Zone A today?",
+    "What's the inventory level?",
+    "Tell me something",
+]
+
+
+def _legacy_classify(message: str) -> str:
+    """The substring keyword scan classify_intent used before the compiled matcher."""
+    m = message.lower()
+    if sum(1 for k in C.FORECASTING_KEYWORDS if k in m) > 0:
+        return "forecasting"
+    safety_score = sum(1 for k in C.SAFETY_KEYWORDS if k in m)
+    has_emergency = any(k in m for k in C.EMERGENCY_KEYWORDS)
+    if has_emergency or (safety_score > 0 and any(k in m for k in C.SAFETY_CONTEXT_INDICATORS)) or safety_score >= 2:
+        return "safety"
+    if any(k in m for k in C.DOCUMENT_INDICATORS):
+        return "document"
+    is_safety_equipment_query = any(k in m for k in C.SAFETY_EQUIPMENT_TERMS)
+    is_workflow_query = any(k in m for k in C.WORKFLOW_TERMS)
+    if (
+        not is_workflow_query
+        and not is_safety_equipment_query
+        and any(k in m for k in C.EQUIPMENT_INDICATORS)
+        and any(k in m for k in C.EQUIPMENT_OBJECTS)
+    ):
+        return "equipment"
+    if sum(1 for k in C.OPERATIONS_KEYWORDS if k in m) > 0:
+        if any(k in m for k in C.OPERATIONS_WORKFLOW_TERMS):
+            return "operations"
+    if sum(1 for k in C.EQUIPMENT_KEYWORDS if k in m) > 0:
+        return "equipment"
+    if any(k in m for k in C.AMBIGUOUS_PATTERNS):
+        return "ambiguous"
+    return "equipment"
+
+
+def _legacy_hits(message: str) -> dict:
+    """Every list's hits found with substring checks."""
+    m = message.lower()
+    return {
+        name: {k for k in keywords if k in m}
+        for name, keywords in C._get_keyword_matcher().categories.items()
+    }
+
+
+def _time(fn, queries) -> list:
+    for query in queries:
+        fn(query)
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        for query in queries:
+            fn(query)
+        samples.append((time.perf_counter() - start) * 1e6 / len(queries))
+    return samples
+
+
+def _compare(label, legacy_fn, current_fn, queries):
+    legacy = statistics.median(_time(legacy_fn, queries))
+    current = statistics.median(_time(current_fn, queries))
+    print(
+        f"\n{label}: legacy {legacy:.2f} us/query, current {current:.2f} us/query "
+        f"({legacy / current:.1f}x)"
+    )
+    return legacy, current
+
+
+class TestKeywordRoutingBenchmark:
+    """Benchmark keyword intent routing before and after the compiled matcher."""
+
+    @pytest.mark.performance
+    def test_all_hits_speedup(self):
+        matcher = C._get_keyword_matcher()
+        legacy, current = _compare("all category hits", _legacy_hits, matcher.match, QUERIES)
+
+        assert current < legacy
+
+    @pytest.mark.performance
+    def test_classify_intent_speedup(self):
+        _compare("classify_intent (mixed)", _legacy_classify, C.classify_intent, QUERIES)
+        legacy, current = _compare("classify_intent (late)", _legacy_classify, C.classify_intent, LATE_QUERIES)
+
+        assert current < legacy
+
+    @pytest.mark.performance
+    def test_matcher_is_built_once(self):
+        C.classify_intent("forklift status")
+        matcher = C._get_keyword_matcher()
+        C.classify_intent("pick wave")
+
+        assert C._get_keyword_matcher() is matcher
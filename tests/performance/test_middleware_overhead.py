@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark for the API middleware stack.
+
+Compares per-request overhead on ``/api/v1/health/simple`` for:
+- no middleware (baseline)
+- the legacy ``@app.middleware("http")`` / ``BaseHTTPMiddleware`` chain
+- the pure ASGI request pipeline used by ``src/api/app.py``
+
+The health handler is replaced by a constant response so only middleware
+cost is measured. The stacks are measured in interleaved rounds and compared
+by the median of the round medians, so a burst of load on the machine hits
+every stack alike. Run with ``pytest tests/performance/test_middleware_overhead.py -s``
+to print the numbers; set ``PERF_MIDDLEWARE_REQUESTS`` (per round) and
+``PERF_MIDDLEWARE_ROUNDS`` to change the sample size.
+"""
+
+import os
+import statistics
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.api.middleware.request_pipeline import (
+    RATE_LIMIT_EXEMPT_PATHS,
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    RequestSizeLimitMiddleware,
+)
+from src.api.middleware.security_headers import SECURITY_HEADERS, SecurityHeadersMiddleware
+from src.api.services.monitoring.metrics import record_request_metrics
+
+HEALTH_PATH = "/api/v1/health/simple"
+NUM_REQUESTS = int(os.getenv("PERF_MIDDLEWARE_REQUESTS", "500"))
+NUM_ROUNDS = int(os.getenv("PERF_MIDDLEWARE_ROUNDS", "5"))
+# The pure ASGI stack may be at most this much slower than the legacy one
+# before the benchmark fails; smaller differences are noise on a busy runner
+MAX_SLOWDOWN = 1.2
+WARMUP_REQUESTS = 200
+MAX_REQUEST_SIZE = 10485760
+MAX_UPLOAD_SIZE = 52428800
+
+
+def _add_routes(app: FastAPI) -> FastAPI:
+    @app.get(HEALTH_PATH)
+    async def health_simple():
+        return {"ok": True, "status": "healthy"}
+
+    @app.get("/api/v1/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+class _LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    """The previous BaseHTTPMiddleware implementation, kept for comparison."""
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        for name, value in SECURITY_HEADERS.items():
+            response.headers[name] = value
+        return response
+
+
+def build_bare_app() -> FastAPI:
+    return _add_routes(FastAPI())
+
+
+def build_legacy_app() -> FastAPI:
+    app = _add_routes(FastAPI())
+    app.add_middleware(_LegacySecurityHeadersMiddleware)
+
+    @app.middleware("http")
+    async def rate_limit_middleware(request: Request, call_next):
+        if request.url.path in RATE_LIMIT_EXEMPT_PATHS:
+            return await call_next(request)
+        return await call_next(request)
+
+    @app.middleware("http")
+    async def request_size_middleware(request: Request, call_next):
+        content_length = request.headers.get("content-length")
+        if content_length:
+            max_size = MAX_UPLOAD_SIZE if "/upload" in request.url.path else MAX_REQUEST_SIZE
+            if int(content_length) > max_size:
+                return JSONResponse(status_code=413, content={"error": True})
+        return await call_next(request)
+
+    @app.middleware("http")
+    async def metrics_middleware(request: Request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        record_request_metrics(request, response, time.time() - start_time)
+        return response
+
+    return app
+
+
+def build_asgi_app() -> FastAPI:
+    app = _add_routes(FastAPI())
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(
+        RequestSizeLimitMiddleware,
+        max_request_size=MAX_REQUEST_SIZE,
+        max_upload_size=MAX_UPLOAD_SIZE,
+    )
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def _measure(app: FastAPI, num_requests: int) -> list:
+    """Return per-request latencies in microseconds."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(WARMUP_REQUESTS):
+            await client.get(HEALTH_PATH)
+
+        latencies = []
+        for _ in range(num_requests):
+            start = time.perf_counter()
+            response = await client.get(HEALTH_PATH)
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+            assert response.status_code == 200
+        return latencies
+
+
+class TestMiddlewareOverhead:
+    """Benchmark middleware overhead before and after the pure ASGI rewrite."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_pure_asgi_stack_overhead(self):
+        apps = {"bare": build_bare_app(), "legacy": build_legacy_app(), "asgi": build_asgi_app()}
+        rounds = {name: [] for name in apps}
+        for _ in range(NUM_ROUNDS):
+            for name, app in apps.items():
+                rounds[name].append(statistics.median(await _measure(app, NUM_REQUESTS)))
+        bare, legacy, asgi = (statistics.median(rounds[name]) for name in apps)
+
+        legacy_overhead = legacy - bare
+        asgi_overhead = asgi - bare
+        print(
+            f"\n{HEALTH_PATH} median latency, {NUM_ROUNDS} rounds of {NUM_REQUESTS} requests:"
+            f"\n  no middleware:      {bare:8.1f} us"
+            f"\n  legacy middleware:  {legacy:8.1f} us (+{legacy_overhead:.1f} us)"
+            f"\n  pure ASGI pipeline: {asgi:8.1f} us (+{asgi_overhead:.1f} us)"
+        )
+
+        assert asgi < legacy * MAX_SLOWDOWN
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_stacks_produce_same_headers(self):
+        for path in (HEALTH_PATH, "/api/v1/stream"):
+            responses = []
+            for app in (build_legacy_app(), build_asgi_app()):
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                    responses.append(await client.get(path))
+
+            legacy, asgi = responses
+            assert asgi.content == legacy.content
+            for name, value in SECURITY_HEADERS.items():
+                assert asgi.headers[name] == legacy.headers[name] == value
@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark for chat response serialization.
+
+Compares the previous ``/chat`` structured-data cleaning (recursive walk that
+copies the visited set per branch, then ``json.dumps(default=str)``) with
+``to_jsonable`` + ``dumps`` on representative equipment and forecast payloads.
+Run with ``pytest tests/performance/test_serializer_benchmark.py -s`` to print
+the numbers; set ``PERF_SERIALIZER_ITERATIONS`` to change the sample size.
+"""
+
+import json
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+
+import numpy as np
+import pytest
+
+from src.api.utils.serialization import dumps, to_jsonable
+
+ITERATIONS = int(os.getenv("PERF_SERIALIZER_ITERATIONS", "50"))
+SKIP_KEYS = frozenset({"reasoning_chain", "reasoning_steps", "__dict__", "__class__"})
+
+
+class EquipmentStatus(Enum):
+    AVAILABLE = "available"
+    ASSIGNED = "assigned"
+    MAINTENANCE = "maintenance"
+
+
+def _legacy_clean(obj, depth=0, max_depth=5, visited=None):
+    """The structured-data cleaner /chat used before the shared serializer."""
+    if visited is None:
+        visited = set()
+    if depth > max_depth:
+        return str(obj)
+    obj_id = id(obj)
+    if obj_id in visited:
+        return "[Circular Reference]"
+    visited.add(obj_id)
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
+    if isinstance(obj, dict):
+        return {
+            k: _legacy_clean(v, depth + 1, max_depth, visited.copy())
+            for k, v in obj.items()
+            if k not in SKIP_KEYS
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_legacy_clean(item, depth + 1, max_depth, visited.copy()) for item in obj]
+    return str(obj)
+
+
+def _equipment_payload(count: int = 500) -> dict:
+    now = datetime(2025, 1, 15, 8, 0)
+    return {
+        "equipment": [
+            {
+                "asset_id": f"FL-{i:04d}",
+                "type": "forklift",
+                "status": list(EquipmentStatus)[i % 3],
+                "zone": f"Zone {chr(65 + i % 6)}",
+                "owner_user": None if i % 2 else f"operator_{i}",
+                "last_maintenance": now - timedelta(days=i % 90),
+                "utilization": np.float64(0.35 + (i % 50) / 100),
+                "hourly_cost": Decimal("42.50"),
+                "telemetry": {
+                    "battery_soc": np.float32(80 - i % 40),
+                    "temperature": 21.5,
+                    "readings": [{"ts": now + timedelta(minutes=m), "value": m * 0.5} for m in range(5)],
+                },
+            }
+            for i in range(count)
+        ],
+        "summary": {"total": count, "available": count // 3},
+    }
+
+
+def _forecast_payload(skus: int = 200, horizon: int = 30) -> dict:
+    rng = np.random.default_rng(0)
+    start = datetime(2025, 1, 15)
+    return {
+        "forecasts": [
+            {
+                "sku": f"SKU{i:05d}",
+                "predictions": rng.random(horizon) * 100,
+                "confidence_interval": rng.random((horizon, 2)) * 10,
+                "dates": [start + timedelta(days=d) for d in range(horizon)],
+                "model_metrics": {"mape": np.float64(0.08), "rmse": np.float64(3.2)},
+            }
+            for i in range(skus)
+        ],
+        "generated_at": start,
+    }
+
+
+def _time(fn, payload) -> list:
+    fn(payload)
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        fn(payload)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _legacy(payload) -> bytes:
+    return json.dumps(_legacy_clean(payload), default=str).encode("utf-8")
+
+
+def _current(payload) -> bytes:
+    return dumps(to_jsonable(payload, max_depth=5, skip_keys=SKIP_KEYS))
+
+
+class TestSerializerBenchmark:
+    """Benchmark structured-data serialization before and after the shared serializer."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("name,builder", [
+        ("equipment", _equipment_payload),
+        ("forecast", _forecast_payload),
+    ])
+    def test_serializer_speedup(self, name, builder):
+        payload = builder()
+        legacy = statistics.median(_time(_legacy, payload))
+        current = statistics.median(_time(_current, payload))
+
+        print(
+            f"\n{name}: legacy {legacy:.2f} ms, current {current:.2f} ms "
+            f"({legacy / current:.1f}x)"
+        )
+        assert current < legacy
+
+    @pytest.mark.performance
+    def test_equipment_output_is_typed(self):
+        decoded = json.loads(_current(_equipment_payload(count=1)))
+        item = decoded["equipment"][0]
+
+        assert item["status"] == "available"
+        assert item["last_maintenance"] == "2025-01-15T08:00:00"
+        assert item["hourly_cost"] == 42.5
+        assert isinstance(item["utilization"], float)
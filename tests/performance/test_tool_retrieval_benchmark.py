@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark for embedding-based tool retrieval.
+
+Compares ``ToolRoutingService.route_tools`` with the heuristic BALANCED
+strategy (keyword candidate search, then per-tool scoring) against the
+SEMANTIC strategy (one matrix product against the catalog's description
+embeddings) at 1k registered tools, and the size of the tool summaries the
+planner carries for a request: the whole catalog before, the top-k after.
+Embeddings are random 1024-dimensional vectors, so only the cost is
+measured, not the ranking quality. Run with
+``pytest tests/performance/test_tool_retrieval_benchmark.py -s`` to print the
+numbers; set ``PERF_TOOL_RETRIEVAL_ITERATIONS`` to change the sample size.
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import time
+
+import numpy as np
+import pytest
+
+from src.api.services.mcp.tool_routing import RoutingContext, RoutingStrategy, ToolRoutingService
+from tests.performance.test_tool_search_benchmark import QUERIES, _service
+
+ITERATIONS = int(os.getenv("PERF_TOOL_RETRIEVAL_ITERATIONS", "20"))
+DIMENSION = 1024
+TOP_K = 10
+
+
+def _random_vectors(count: int, seed: int) -> list:
+    return np.random.default_rng(seed).standard_normal((count, DIMENSION)).astype(np.float32).tolist()
+
+
+async def _embed(texts):
+    return _random_vectors(len(texts), len(texts))
+
+
+def _contexts() -> list:
+    embeddings = _random_vectors(len(QUERIES), 7)
+    return [
+        RoutingContext(
+            query=query, intent="equipment", entities={}, user_context={},
+            session_id="bench", agent_id="equipment", query_embedding=embedding,
+        )
+        for query, embedding in zip(QUERIES, embeddings)
+    ]
+
+
+async def _time(routing: ToolRoutingService, strategy: RoutingStrategy) -> float:
+    contexts = _contexts()
+    for context in contexts:
+        await routing.route_tools(context, strategy, max_tools=TOP_K)
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        for context in contexts:
+            await routing.route_tools(context, strategy, max_tools=TOP_K)
+        samples.append((time.perf_counter() - start) * 1000 / len(contexts))
+    return statistics.median(samples)
+
+
+class TestToolRetrievalBenchmark:
+    """Benchmark heuristic routing against embedding retrieval."""
+
+    @pytest.mark.performance
+    def test_semantic_routing_speedup(self):
+        service = _service(1_000)
+        service.description_embedder = _embed
+        routing = ToolRoutingService(service, tool_binding=None)
+
+        async def run():
+            await service.ensure_catalog_embeddings()
+            return await _time(routing, RoutingStrategy.BALANCED), await _time(
+                routing, RoutingStrategy.SEMANTIC
+            )
+
+        legacy, current = asyncio.run(run())
+
+        print(
+            f"\n1000 tools: balanced {legacy:.3f} ms/query, "
+            f"semantic {current:.3f} ms/query ({legacy / current:.1f}x)"
+        )
+        assert current < legacy
+
+    @pytest.mark.performance
+    def test_tool_summary_payload(self):
+        service = _service(1_000)
+        service.description_embedder = _embed
+
+        async def run():
+            catalog = await service.ensure_catalog_embeddings()
+            retrieved = catalog.top_k(_contexts()[0].query_embedding, k=TOP_K)
+            return catalog, catalog.summaries_for(tool.tool_id for tool, _ in retrieved)
+
+        catalog, top_k = asyncio.run(run())
+        legacy = len(json.dumps(list(catalog.summaries)))
+        current = len(json.dumps(top_k))
+
+        print(f"\ntool summaries per request: catalog {legacy} chars, top-{TOP_K} {current} chars")
+        assert len(top_k) == TOP_K
+        assert current < legacy
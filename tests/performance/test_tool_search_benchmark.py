@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark for MCP tool search.
+
+Compares the previous ``ToolDiscoveryService.search_tools`` linear scan
+(substring checks against every tool's name, description and capabilities)
+with the inverted-index search at 1k and 10k registered tools, using the
+keyword and full-message queries that tool routing issues per chat request.
+Run with ``pytest tests/performance/test_tool_search_benchmark.py -s`` to
+print the numbers; set ``PERF_TOOL_SEARCH_ITERATIONS`` to change the sample size.
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import time
+
+import pytest
+
+from src.api.services.mcp.tool_discovery import DiscoveredTool, ToolCategory, ToolDiscoveryService
+
+ITERATIONS = int(os.getenv("PERF_TOOL_SEARCH_ITERATIONS", "20"))
+
+ADAPTERS = ["erp", "wms", "iot", "rfid", "attendance", "forecasting", "documents"]
+NOUNS = [
+    "equipment", "forklift", "scanner", "conveyor", "inventory", "stock", "order",
+    "shipment", "worker", "shift", "task", "zone", "sensor", "temperature", "incident",
+    "invoice", "receipt", "forecast", "demand", "battery", "maintenance", "dock",
+]
+VERBS = ["get", "list", "update", "create", "assign", "track", "check", "sync", "report"]
+
+QUERIES = [
+    "equipment",
+    "forklift status",
+    "safety",
+    "operations",
+    "Show me the battery level of forklift FL-001 in zone B",
+    "What is the demand forecast for SKU-123 next month?",
+]
+
+
+def _build_tools(count: int) -> list:
+    rng = random.Random(count)
+    tools = []
+    for i in range(count):
+        adapter = ADAPTERS[i % len(ADAPTERS)]
+        verb, noun, other = rng.choice(VERBS), rng.choice(NOUNS), rng.choice(NOUNS)
+        tools.append(
+            DiscoveredTool(
+                name=f"{adapter}_{verb}_{noun}_{i}",
+                description=f"{verb.title()} {noun} records and related {other} data from the {adapter} system",
+                category=list(ToolCategory)[i % len(ToolCategory)],
+                source=adapter,
+                source_type="mcp_adapter",
+                parameters={},
+                capabilities=["executable", "function"],
+            )
+        )
+    return tools
+
+
+def _legacy_search(service: ToolDiscoveryService, query: str) -> list:
+    """The linear scan search_tools used before the inverted index."""
+    query_lower = query.lower()
+    results = []
+    for tool in service.discovered_tools.values():
+        if (
+            query_lower in tool.name.lower()
+            or query_lower in tool.description.lower()
+            or any(query_lower in cap.lower() for cap in tool.capabilities)
+        ):
+            results.append(tool)
+    results.sort(
+        key=lambda t: (
+            query_lower not in t.name.lower(),
+            query_lower not in t.description.lower(),
+        )
+    )
+    return results
+
+
+def _service(count: int) -> ToolDiscoveryService:
+    service = ToolDiscoveryService()
+
+    async def register():
+        for tool in _build_tools(count):
+            await service._register_discovered_tool(tool)
+
+    asyncio.run(register())
+    return service
+
+
+def _time(fn) -> float:
+    for query in QUERIES:
+        fn(query)
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        for query in QUERIES:
+            fn(query)
+        samples.append((time.perf_counter() - start) * 1000 / len(QUERIES))
+    return statistics.median(samples)
+
+
+class TestToolSearchBenchmark:
+    """Benchmark tool search before and after the inverted index."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("count", [1_000, 10_000])
+    def test_index_speedup(self, count):
+        service = _service(count)
+        assert len(service.search_index) == count
+
+        legacy = _time(lambda q: _legacy_search(service, q))
+        current = _time(lambda q: service.search_index.search(q, limit=10))
+
+        print(
+            f"\n{count} tools: linear scan {legacy:.3f} ms/query, "
+            f"index {current:.3f} ms/query ({legacy / current:.1f}x)"
+        )
+        assert current < legacy
+
+    @pytest.mark.performance
+    def test_registration_is_incremental(self):
+        service = _service(1_000)
+        extra = _build_tools(1_001)[-1]
+
+        start = time.perf_counter()
+        asyncio.run(service._register_discovered_tool(extra))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\nregistering one tool at 1k tools: {elapsed_ms:.3f} ms")
+        assert asyncio.run(service.search_tools(extra.name, limit=1)) == [extra]
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the batch chat endpoint and batched query embedding.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.graphs import mcp_integrated_planner_graph as planner_module
+from src.api.routers import chat as chat_module
+from src.api.routers.chat import ChatBatchRequest, ChatRequest, ChatResponse, chat_batch
+from src.api.services.routing.semantic_router import SemanticRouter
+
+
+class _FakeEmbeddingService:
+    def __init__(self):
+        self.batch_calls = []
+
+    async def generate_embeddings(self, texts, input_type="query"):
+        self.batch_calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+    async def generate_embedding(self, text, input_type="query"):
+        raise AssertionError("single embedding call made")
+
+
+class _FakePlanner:
+    async def route_messages(self, messages):
+        return [("equipment", 0.9) if "forklift" in m else ("safety", 0.8) for m in messages]
+
+
+def _install_fakes(monkeypatch, seen, delay=0.02):
+    async def fake_get_planner():
+        return _FakePlanner()
+
+    async def fake_chat(item):
+        seen["active"] += 1
+        seen["peak"] = max(seen["peak"], seen["active"])
+        seen["hints"].append(planner_module._route_hint.get())
+        await asyncio.sleep(delay)
+        seen["active"] -= 1
+        if item.message == "boom":
+            raise RuntimeError("agent failed")
+        hint = planner_module._route_hint.get()
+        return ChatResponse(reply=f"re: {item.message}", route=hint[1], intent=hint[1],
+                            session_id=item.session_id)
+
+    monkeypatch.setattr(chat_module, "get_mcp_planner_graph", fake_get_planner)
+    monkeypatch.setattr(chat_module, "chat", fake_chat)
+
+
+class TestEmbedQueries:
+    """Test that batched embedding uses one API call and fills the memo."""
+
+    @pytest.mark.asyncio
+    async def test_one_call_for_uncached_messages(self):
+        router = SemanticRouter()
+        router.embedding_service = _FakeEmbeddingService()
+        router._initialized = True
+
+        first = await router.embed_queries(["Forklift status?", "forklift status?", "PPE rules"])
+        await router.embed_queries(["PPE rules"])
+        assert await router.embed_query("PPE rules") == first[2]
+
+        assert router.embedding_service.batch_calls == [["Forklift status?", "PPE rules"]]
+        assert first[0] == first[1]
+
+
+class TestChatBatch:
+    """Test grouping, concurrency limits and per-item results."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_order_with_route_hints(self, monkeypatch):
+        seen = {"active": 0, "peak": 0, "hints": []}
+        _install_fakes(monkeypatch, seen)
+        messages = ["forklift FL-01", "spill in aisle 3", "forklift FL-02", "boom"]
+
+        result = await chat_batch(ChatBatchRequest(items=[ChatRequest(message=m) for m in messages]))
+
+        assert [r.index for r in result.results] == [0, 1, 2, 3]
+        assert [r.route for r in result.results[:3]] == ["equipment", "safety", "equipment"]
+        assert result.results[0].response.reply == "re: forklift FL-01"
+        assert result.results[3].response is None and result.results[3].error
+        assert result.routes == {"equipment": 2, "safety": 2}
+        assert ("forklift FL-01", "equipment", 0.9) in seen["hints"]
+        assert all(r.latency_ms > 0 for r in result.results)
+        assert planner_module._route_hint.get() is None
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, monkeypatch):
+        seen = {"active": 0, "peak": 0, "hints": []}
+        _install_fakes(monkeypatch, seen)
+        items = [ChatRequest(message=f"spill {i}") for i in range(10)]
+
+        await chat_batch(ChatBatchRequest(items=items, max_concurrency=3))
+
+        assert seen["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_batch(self, monkeypatch):
+        monkeypatch.setattr(chat_module, "CHAT_BATCH_MAX_ITEMS", 2)
+        items = [ChatRequest(message="x") for _ in range(3)]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await chat_batch(ChatBatchRequest(items=items))
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for token streaming of chat responses.
+"""
+
+import json
+
+import httpx
+import pytest
+
+from src.api.services.llm.nim_client import NIMClient, NIMConfig
+from src.api.services.streaming.chat_stream import (
+    ChatStreamSink,
+    _NaturalLanguageExtractor,
+    emit_chat_event,
+    format_sse,
+    reset_chat_stream_sink,
+    set_chat_stream_sink,
+    EVENT_TOKEN,
+)
+
+
+def _drain(sink: ChatStreamSink):
+    events = []
+    while not sink.queue.empty():
+        item = sink.queue.get_nowait()
+        if item is not None:
+            events.append(item)
+    return events
+
+
+class TestNaturalLanguageExtractor:
+    """Test incremental extraction of the natural_language field."""
+
+    def test_extracts_field_split_across_chunks(self):
+        raw = json.dumps({"response_type": "x", "natural_language": "FL-01 is \"ready\"\nnow", "data": {}})
+        extractor = _NaturalLanguageExtractor()
+        text = "".join(extractor.feed(raw[i:i + 3]) for i in range(0, len(raw), 3))
+        assert text == 'FL-01 is "ready"\nnow'
+
+    def test_plain_text_passes_through(self):
+        extractor = _NaturalLanguageExtractor()
+        assert extractor.feed("  Forklift ") == "  Forklift "
+        assert extractor.feed("FL-01") == "FL-01"
+
+
+class TestChatStreamSink:
+    """Test event publishing through the context-local sink."""
+
+    def test_emit_is_noop_without_sink(self):
+        emit_chat_event("routing", {"intent": "equipment"})  # Must not raise
+
+    def test_events_reach_installed_sink(self):
+        sink = ChatStreamSink()
+        token = set_chat_stream_sink(sink)
+        try:
+            emit_chat_event("routing", {"intent": "equipment"})
+        finally:
+            reset_chat_stream_sink(token)
+        sink.llm_delta('{"natural_language": "Hi')
+        events = _drain(sink)
+
+        assert events[0] == {"event": "routing", "data": {"intent": "equipment"}}
+        assert events[1]["event"] == EVENT_TOKEN
+        assert events[1]["data"]["text"] == "Hi"
+        assert sink.time_to_first_token_ms() is not None
+
+    def test_format_sse(self):
+        assert format_sse("token", {"text": "a"}) == 'event: token\ndata: {"text":"a"}\n\n'
+
+
+class TestNIMClientStreaming:
+    """Test that streamed completions are assembled and forwarded."""
+
+    @pytest.mark.asyncio
+    async def test_stream_to_client_forwards_tokens(self):
+        chunks = ['{"natural_', 'language": "Three fork', 'lifts are available."}']
+        body = "".join(
+            f"data: {json.dumps({'choices': [{'delta': {'content': c}}]})}\n\n" for c in chunks
+        ) + "data: [DONE]\n\n"
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert json.loads(request.content)["stream"] is True
+            return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+        client = NIMClient(config=NIMConfig(llm_api_key="test"), enable_cache=False)
+        client.llm_client = httpx.AsyncClient(
+            base_url="http://nim.test", transport=httpx.MockTransport(handler)
+        )
+
+        sink = ChatStreamSink()
+        token = set_chat_stream_sink(sink)
+        try:
+            response = await client.generate_response(
+                [{"role": "user", "content": "forklifts?"}], stream_to_client=True
+            )
+        finally:
+            reset_chat_stream_sink(token)
+
+        assert response.content == "".join(chunks)
+        streamed = "".join(e["data"]["text"] for e in _drain(sink) if e["event"] == EVENT_TOKEN)
+        assert streamed == "Three forklifts are available."
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for embedding micro-batching.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.services.llm.concurrency import LLMPriority, llm_priority
+from src.api.services.llm.nim_client import EmbeddingResponse
+from src.retrieval.vector.embedding_batcher import EmbeddingBatcher
+from src.retrieval.vector.embedding_cache import EmbeddingCache
+from src.retrieval.vector.embedding_service import EmbeddingService
+
+
+class _RecordingEmbedder:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    async def __call__(self, texts, input_type):
+        self.calls.append((list(texts), input_type))
+        if self.fail:
+            raise RuntimeError("embedding endpoint down")
+        return [[float(len(text))] for text in texts]
+
+
+class TestEmbeddingBatcher:
+    """Test coalescing, flushing and error fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        embedder = _RecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder, max_batch_size=32, max_wait_ms=5)
+
+        results = await asyncio.gather(
+            *(batcher.embed(text) for text in ["a", "bb", "a", "ccc"]),
+            batcher.embed("dddd", input_type="passage"),
+        )
+
+        assert results == [[1.0], [2.0], [1.0], [3.0], [4.0]]
+        assert embedder.calls == [(["a", "bb", "ccc"], "query"), (["dddd"], "passage")]
+        stats = batcher.get_stats()
+        assert stats["batches"] == 2 and stats["flushed_timer"] == 2
+        assert stats["batch_size_histogram"]["<=4"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_immediately_and_priorities_are_separate(self):
+        embedder = _RecordingEmbedder()
+        batcher = EmbeddingBatcher(embedder, max_batch_size=2, max_wait_ms=10_000)
+
+        async def background(text):
+            with llm_priority(LLMPriority.BACKGROUND):
+                return await batcher.embed(text)
+
+        await asyncio.wait_for(
+            asyncio.gather(batcher.embed("a"), batcher.embed("b"), background("c"), background("d")),
+            timeout=1,
+        )
+
+        assert sorted(call[0] for call in embedder.calls) == [["a", "b"], ["c", "d"]]
+        assert batcher.get_stats()["flushed_full"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_caller(self):
+        batcher = EmbeddingBatcher(_RecordingEmbedder(fail=True), max_wait_ms=1)
+
+        results = await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert batcher.get_stats()["errors"] == 1
+
+
+class TestEmbeddingServiceBatching:
+    """Test that concurrent generate_embedding calls reach NIM as one request."""
+
+    @pytest.mark.asyncio
+    async def test_generate_embedding_is_coalesced(self):
+        class _FakeNIM:
+            def __init__(self):
+                self.calls = []
+
+            async def generate_embeddings(self, texts, model=None, input_type="query"):
+                self.calls.append(list(texts))
+                return EmbeddingResponse(embeddings=[[1.0, 0.0] for _ in texts], usage={}, model="m")
+
+        service = EmbeddingService(dimension=2)
+        service.nim_client = _FakeNIM()
+        service._initialized = True
+        service.cache = EmbeddingCache(dimension=2)
+
+        await asyncio.gather(*(service.generate_embedding(f"query {i}") for i in range(6)))
+        await service.generate_embedding("query 0")
+
+        assert service.nim_client.calls == [[f"query {i}" for i in range(6)]]
+        assert service.get_stats()["cache"]["hits"] == 1
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the content-addressed embedding cache.
+"""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.retrieval.vector import embedding_cache
+from src.retrieval.vector.embedding_cache import EmbeddingCache, MmapEmbeddingStore, embedding_key
+
+DIM = 8
+
+
+class _CountingEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text))] * DIM for text in texts]
+
+
+class TestEmbeddingCache:
+    """Test memory and disk tiers, keying and batching of misses."""
+
+    @pytest.mark.asyncio
+    async def test_only_missing_texts_are_embedded(self):
+        cache = EmbeddingCache(dimension=DIM)
+        embed = _CountingEmbedder()
+
+        first = await cache.get_or_embed(["pallet", "forklift", "pallet"], "m", "query", embed)
+        second = await cache.get_or_embed(["forklift", "dock"], "m", "query", embed)
+        await cache.get_or_embed(["dock"], "m", "passage", embed)  # input_type is part of the key
+
+        assert embed.calls == [["pallet", "forklift"], ["dock"], ["dock"]]
+        assert first[0] == first[2] == [6.0] * DIM
+        assert second[0] == [8.0] * DIM
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_is_shared_across_instances(self, tmp_path):
+        embed = _CountingEmbedder()
+        writer = EmbeddingCache(dimension=DIM, store_dir=str(tmp_path), store_capacity=16)
+        await writer.get_or_embed(["forklift status", "PPE rules"], "nv-embed", "query", embed)
+
+        # A second worker (or a restart) reads the same files
+        reader = EmbeddingCache(dimension=DIM, store_dir=str(tmp_path), store_capacity=16)
+        result = await reader.get_or_embed(["PPE rules"], "nv-embed", "query", embed)
+
+        assert len(embed.calls) == 1
+        assert result == [[9.0] * DIM]
+        stats = reader.get_stats()
+        assert stats["disk_hits"] == 1
+        assert stats["disk_entries"] == {"nv-embed": 2}
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(embedding_cache.fcntl is None, reason="needs file locks")
+    async def test_disk_write_does_not_block_event_loop(self, tmp_path):
+        cache = EmbeddingCache(dimension=DIM, store_dir=str(tmp_path), store_capacity=16)
+        store = cache._store_for("nv-embed")
+
+        # Another worker holds the store's file lock for a while
+        with open(store._lock_path, "r+") as handle:
+            embedding_cache.fcntl.flock(handle, embedding_cache.fcntl.LOCK_EX)
+            release = threading.Timer(0.3, embedding_cache.fcntl.flock, (handle, embedding_cache.fcntl.LOCK_UN))
+            release.start()
+            task = asyncio.ensure_future(
+                cache.get_or_embed(["forklift status"], "nv-embed", "query", _CountingEmbedder())
+            )
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            elapsed = time.perf_counter() - start
+            assert not task.done()
+            assert await task == [[15.0] * DIM]
+            release.join()
+
+        assert elapsed < 0.2
+        assert cache.get_stats()["disk_entries"] == {"nv-embed": 1}
+
+    def test_store_stops_writing_when_full(self, tmp_path):
+        store = MmapEmbeddingStore(str(tmp_path), "small", DIM, capacity=2)
+        items = [(embedding_key("m", "query", str(i)), np.full(DIM, i, dtype=np.float32)) for i in range(3)]
+
+        assert store.put_many(items) == 2
+        assert store.put_many(items[:1]) == 0  # Already present
+        assert store.get(items[1][0]).tolist() == [1.0] * DIM
+        assert store.get(items[2][0]) is None
+        with pytest.raises(ValueError):
+            MmapEmbeddingStore(str(tmp_path), "small", DIM + 1)
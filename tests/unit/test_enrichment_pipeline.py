@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the deferred enrichment pipeline.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.services.enrichment.enrichment_pipeline import EnrichmentPipeline
+from src.api.services.llm.concurrency import LLMPriority, get_llm_priority
+
+
+class TestEnrichmentPipeline:
+    """Test background execution, subscription and bounding."""
+
+    @pytest.mark.asyncio
+    async def test_job_result_is_retrievable(self):
+        pipeline = EnrichmentPipeline()
+
+        async def job():
+            await asyncio.sleep(0.01)
+            return {"evidence_count": 3}
+
+        assert pipeline.submit("r1", job)
+        assert pipeline.get("r1").status in ("pending", "running")
+
+        record = await pipeline.wait("r1", timeout=1.0)
+        assert record.status == "completed"
+        assert record.enrichments == {"evidence_count": 3}
+        await pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_at_background_llm_priority(self):
+        pipeline = EnrichmentPipeline()
+
+        async def job():
+            return {"priority": get_llm_priority()}
+
+        pipeline.submit("r1", job)
+
+        record = await pipeline.wait("r1", timeout=1.0)
+        assert record.enrichments == {"priority": LLMPriority.BACKGROUND}
+        await pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_subscribe_yields_until_final_status(self):
+        pipeline = EnrichmentPipeline()
+        release = asyncio.Event()
+
+        async def job():
+            await release.wait()
+            return {"quick_actions": []}
+
+        pipeline.submit("r1", job)
+        statuses = []
+
+        async def consume():
+            async for snapshot in pipeline.subscribe("r1", timeout=1.0):
+                statuses.append(snapshot["status"])
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        release.set()
+        await consumer
+
+        assert statuses[0] in ("pending", "running")
+        assert statuses[-1] == "completed"
+        await pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_bounds_concurrency_and_queue(self):
+        pipeline = EnrichmentPipeline(max_workers=2, max_queue_size=2)
+        running = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+            return {}
+
+        accepted = [pipeline.submit(f"r{i}", job) for i in range(2)]
+        await asyncio.sleep(0.01)  # Workers pick up the first two jobs
+        accepted += [pipeline.submit(f"r{i}", job) for i in range(2, 5)]
+
+        assert accepted == [True, True, True, True, False]
+        assert pipeline.get_stats()["rejected"] == 1
+
+        release.set()
+        await pipeline.wait("r3", timeout=1.0)
+        assert peak == 2
+        await pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_and_timed_out_jobs(self):
+        pipeline = EnrichmentPipeline(job_timeout_seconds=0.05)
+
+        async def failing():
+            raise RuntimeError("evidence service down")
+
+        async def slow():
+            await asyncio.sleep(1)
+
+        pipeline.submit("fail", failing)
+        pipeline.submit("slow", slow)
+
+        assert (await pipeline.wait("fail", timeout=1.0)).status == "failed"
+        slow_record = await pipeline.wait("slow", timeout=1.0)
+        assert slow_record.status == "failed"
+        assert slow_record.error == "Enrichment timed out"
+        await pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_capacity_evicts_only_finished_records(self):
+        pipeline = EnrichmentPipeline(max_workers=2, max_records=2)
+        release = asyncio.Event()
+
+        async def blocked():
+            await release.wait()
+            return {"evidence_count": 1}
+
+        async def quick():
+            return {}
+
+        pipeline.submit("running", blocked)
+        await asyncio.sleep(0.01)
+        for response_id in ("done1", "done2", "done3"):
+            pipeline.submit(response_id, quick)
+        await pipeline.wait("done3", timeout=1.0)
+        pipeline.submit("latest", quick)
+        await pipeline.wait("latest", timeout=1.0)
+
+        # The oldest record is still running, so finished ones go instead
+        assert pipeline.get("running").status == "running"
+        assert pipeline.get("done1") is None
+        assert list(pipeline._records) == ["running", "latest"]
+
+        release.set()
+        assert (await pipeline.wait("running", timeout=1.0)).status == "completed"
+        await pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_close_fails_unfinished_records(self):
+        pipeline = EnrichmentPipeline(max_workers=1)
+
+        async def blocked():
+            await asyncio.Event().wait()
+
+        pipeline.submit("running", blocked)
+        pipeline.submit("queued", blocked)
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(pipeline.wait("queued", timeout=5.0))
+        await asyncio.sleep(0)
+
+        await pipeline.close()
+
+        assert (await asyncio.wait_for(waiter, timeout=1.0)).status == "failed"
+        assert pipeline.get("running").error == "Shutting down"
+        assert pipeline.get_stats()["active_workers"] == 0
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the compiled keyword matcher and MCP keyword intent routing.
+"""
+
+import pytest
+
+from src.api.graphs.mcp_integrated_planner_graph import MCPIntentClassifier
+from src.api.services.routing.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test KeywordMatcher hit detection."""
+
+    @pytest.fixture
+    def matcher(self):
+        return KeywordMatcher({
+            "equipment": ["forklift", "pm", "scan"],
+            "document": ["po", "purchase order", "document", "document search"],
+            "operations": ["pick", "pick wave", "wave", "order"],
+            "forecasting": ["demand forecast", "forecast accuracy"],
+        })
+
+    def test_whole_words_only(self, matcher):
+        hits = matcher.match("Check the shipment report and the scanner")
+
+        assert hits == {"equipment": set(), "document": set(), "operations": set(), "forecasting": set()}
+
+    def test_all_categories_in_one_pass(self, matcher):
+        hits = matcher.match("Is there a PO for forklift PM parts?")
+
+        assert hits["equipment"] == {"forklift", "pm"}
+        assert hits["document"] == {"po"}
+        assert hits["operations"] == set()
+
+    def test_inflections_and_contained_keywords(self, matcher):
+        hits = matcher.match("Create pick waves for purchase orders; run a document search")
+
+        assert hits["operations"] == {"pick", "pick wave", "wave", "order"}
+        assert hits["document"] == {"purchase order", "document", "document search"}
+        assert matcher.match("Picking forklifts")["operations"] == {"pick"}
+
+    def test_overlapping_keywords(self, matcher):
+        hits = matcher.match("demand forecast accuracy")
+
+        assert hits["forecasting"] == {"demand forecast", "forecast accuracy"}
+
+
+class TestKeywordIntentRouting:
+    """Golden routing cases for MCPIntentClassifier.classify_intent."""
+
+    @pytest.mark.parametrize("query,intent", [
+        ("Show me the status of forklift FL-001", "equipment"),
+        ("Which forklifts are available?", "equipment"),
+        ("Dispatch forklift FL-02 to zone B", "equipment"),
+        ("Create a pick wave for orders 1001 and 1002", "operations"),
+        ("Assign tasks to the picking team", "operations"),
+        ("Report a safety incident with temperature sensor TS-001", "safety"),
+        ("There is a spill near aisle 4", "safety"),
+        ("What are the PPE requirements?", "safety"),
+        ("Upload and extract data from this invoice PDF", "document"),
+        ("Show me the PO for supplier X", "document"),
+        ("What is the demand forecast for SKU-123 next month?", "forecasting"),
+        ("Forecasts for next week", "forecasting"),
+        ("help me please", "ambiguous"),
+    ])
+    def test_golden_routes(self, query, intent):
+        assert MCPIntentClassifier.classify_intent(query) == intent
+
+    @pytest.mark.parametrize("query,intent", [
+        # "scan" inside "scanner" used to route to document
+        ("Is scanner SC-1 available?", "equipment"),
+        # "ppe" inside "stopped" used to route to safety
+        ("The conveyor stopped in zone B", "equipment"),
+        # "po" inside "position"/"transport" used to route to document
+        ("What's the position of AMR 3?", "equipment"),
+        ("Check transport status for truck T1", "equipment"),
+        # "action" inside "transaction" used to route to safety
+        ("Show transaction history for forklift FL-3", "equipment"),
+    ])
+    def test_substrings_inside_words_do_not_route(self, query, intent):
+        assert MCPIntentClassifier.classify_intent(query) == intent
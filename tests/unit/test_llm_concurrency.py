@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the adaptive NIM concurrency limiter.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.api.services.llm.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    LLMPriority,
+    llm_priority,
+)
+from src.api.services.llm.nim_client import _is_overload_error
+
+
+def _rate_limited() -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://nim/v1/chat/completions")
+    return httpx.HTTPStatusError("429", request=request, response=httpx.Response(429, request=request))
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test limit enforcement, priority order and AIMD adjustment."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_by_priority(self):
+        limiter = AdaptiveConcurrencyLimiter("llm", initial_limit=1, max_limit=1)
+        order = []
+        release = asyncio.Event()
+
+        async def holder():
+            async with limiter.acquire(LLMPriority.INTERACTIVE):
+                await release.wait()
+
+        async def call(name, priority):
+            async with limiter.acquire(priority):
+                order.append(name)
+
+        first = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(call("background", LLMPriority.BACKGROUND)),
+            asyncio.create_task(call("judge", LLMPriority.JUDGE)),
+            asyncio.create_task(call("chat", LLMPriority.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 3
+
+        release.set()
+        await asyncio.gather(first, *waiters)
+
+        assert order == ["chat", "judge", "background"]
+        assert limiter.in_flight == 0
+        assert set(limiter.get_stats()["queue_wait"]) == {"interactive", "judge", "background"}
+
+    @pytest.mark.asyncio
+    async def test_overload_decreases_and_saturated_success_increases(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            "llm", initial_limit=10, latency_tolerance=None, is_overload=_is_overload_error
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            async with limiter.acquire():
+                raise _rate_limited()
+        assert limiter.get_stats()["limit"] == 7
+
+        with pytest.raises(ValueError):
+            async with limiter.acquire():
+                raise ValueError("bad payload")
+        assert limiter.get_stats()["limit"] == 7
+
+        async def call():
+            async with limiter.acquire():
+                await asyncio.sleep(0.01)
+
+        # Each wave at the limit gives four samples with at least half in use
+        for _ in range(2):
+            await asyncio.gather(*(call() for _ in range(7)))
+        stats = limiter.get_stats()
+        assert stats["limit"] == 8
+        assert stats["increases"] == 1 and stats["overloads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_a_slot(self):
+        limiter = AdaptiveConcurrencyLimiter("embeddings", initial_limit=1, max_limit=1)
+        release = asyncio.Event()
+
+        async def holder():
+            async with limiter.acquire():
+                await release.wait()
+
+        first = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        with llm_priority(LLMPriority.BACKGROUND):
+            waiter = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await first
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        async with limiter.acquire():
+            assert limiter.in_flight == 1
+        assert limiter.in_flight == 0
+        assert limiter.queue_depth == 0
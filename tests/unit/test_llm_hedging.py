@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for hedged NIM requests.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.services.llm.hedging import RequestHedger
+
+
+def _scripted_calls(delays, errors=()):
+    """Build a call factory whose n-th attempt sleeps delays[n] (and fails if n in errors)."""
+    state = {"started": 0, "cancelled": 0}
+
+    async def call():
+        attempt = state["started"]
+        state["started"] += 1
+        try:
+            await asyncio.sleep(delays[attempt])
+        except asyncio.CancelledError:
+            state["cancelled"] += 1
+            raise
+        if attempt in errors:
+            raise RuntimeError(f"attempt {attempt} failed")
+        return attempt
+
+    return call, state
+
+
+class TestRequestHedger:
+    """Test hedge timing, budget and failure handling."""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        hedger = RequestHedger("llm", enabled=True, fixed_delay_ms=20, min_delay_ms=0, budget_percent=100)
+        call, state = _scripted_calls([1.0, 0.01])
+
+        result = await hedger.run(call)
+        await asyncio.sleep(0)
+
+        stats = hedger.get_stats()
+        assert result == 1
+        assert state["cancelled"] == 1
+        assert stats["hedged"] == 1 and stats["hedge_wins"] == 1
+        assert stats["hedge_win_rate_percent"] == 100.0
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_samples_or_budget(self):
+        hedger = RequestHedger("llm", enabled=True, min_delay_ms=0, min_samples=3, budget_percent=25)
+        call, state = _scripted_calls([0.01] * 3 + [0.1, 0.01, 0.1])
+
+        for _ in range(3):  # Collect samples; no delay known yet
+            await hedger.run(call)
+        assert hedger.hedge_delay_ms("default") is not None
+        assert state["started"] == 3
+
+        await hedger.run(call)  # 4 calls: one hedge allowed
+        await hedger.run(call)  # 5 calls: budget for 1.25 hedges, so none
+
+        stats = hedger.get_stats()
+        assert stats["hedged"] == 1
+        assert stats["budget_exhausted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_first_success_wins_and_double_failure_raises_primary_error(self):
+        hedger = RequestHedger("embeddings", enabled=True, fixed_delay_ms=10, min_delay_ms=0, budget_percent=100)
+
+        call, _ = _scripted_calls([0.03, 0.0], errors={1})
+        assert await hedger.run(call) == 0
+        assert hedger.get_stats()["primary_wins"] == 1
+
+        call, _ = _scripted_calls([0.03, 0.0], errors={0, 1})
+        with pytest.raises(RuntimeError, match="attempt 0"):
+            await hedger.run(call)
+
+    @pytest.mark.asyncio
+    async def test_budget_saved_while_healthy_is_capped(self):
+        hedger = RequestHedger(
+            "llm", enabled=True, fixed_delay_ms=5, min_delay_ms=0, budget_percent=10, budget_burst=2
+        )
+        healthy, _ = _scripted_calls([0.0] * 100)
+        for _ in range(100):  # Would be budget for 10 hedges without the cap
+            await hedger.run(healthy)
+
+        slow, state = _scripted_calls([0.02] * 40)
+        for _ in range(10):
+            await hedger.run(slow)
+
+        # Only the 2 saved hedges; the slow calls earn 0.9 of another
+        assert hedger.get_stats()["hedged"] == 2
+        assert state["started"] == 12
+
+    @pytest.mark.asyncio
+    async def test_primary_that_loses_to_hedge_is_still_sampled(self):
+        hedger = RequestHedger("llm", enabled=True, fixed_delay_ms=20, min_delay_ms=0, budget_percent=100)
+        call, _ = _scripted_calls([1.0, 0.01])
+
+        await hedger.run(call)
+
+        samples = list(hedger._latencies["default"])
+        assert len(samples) == 1 and samples[0] >= 25
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the two-tier LLM response cache.
+"""
+
+import json
+from dataclasses import asdict
+
+import pytest
+
+from src.api.services.llm.nim_client import LLMResponse, NIMClient, NIMConfig
+from src.api.services.llm.response_cache import LLMResponseCache
+
+CODEC = (lambda r: json.dumps(asdict(r)), lambda s: LLMResponse(**json.loads(s)))
+
+
+class _FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio commands used."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def pttl(self, key):
+        return 60000 if key in self.data else -2
+
+    async def set(self, key, value, px=None):
+        self.data[key] = value
+
+
+def _response(content: str) -> LLMResponse:
+    return LLMResponse(content=content, usage={"total_tokens": 1}, model="m", finish_reason="stop")
+
+
+def _with_redis(cache: LLMResponseCache, client) -> LLMResponseCache:
+    cache.redis_enabled = True
+    cache.redis_client = client
+    cache._redis_initialized = True
+    return cache
+
+
+class TestLLMResponseCache:
+    """Test byte budget, expiry and the shared L2 tier."""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_by_bytes(self):
+        cache = LLMResponseCache(codec=CODEC, max_bytes=450)  # three entries
+        for key in ("a", "b", "c"):
+            await cache.set(key, _response(key * 60))
+        await cache.get("a")  # a becomes most recent
+        await cache.set("d", _response("d" * 60))
+
+        stats = cache.get_stats()
+        assert await cache.get("b") is None
+        assert (await cache.get("a")).content == "a" * 60
+        assert stats["evictions"] >= 1
+        assert 0 < stats["bytes_used"] <= 450
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_purged_without_reads(self):
+        cache = LLMResponseCache(codec=CODEC, ttl_seconds=0)
+        for key in ("a", "b"):
+            await cache.set(key, _response(key))
+
+        stats = cache.get_stats()
+        assert stats["cached_entries"] == 0
+        assert stats["bytes_used"] == 0
+        assert stats["expirations"] == 2
+
+    @pytest.mark.asyncio
+    async def test_l2_is_shared_between_workers(self):
+        redis_client = _FakeRedis()
+        worker_a = _with_redis(LLMResponseCache(codec=CODEC), redis_client)
+        worker_b = _with_redis(LLMResponseCache(codec=CODEC), redis_client)
+
+        await worker_a.set("k", _response("shared"))
+        result = await worker_b.get("k")
+
+        assert result == _response("shared")
+        assert worker_b.get_stats()["l2_hits"] == 1
+        assert worker_b.get_stats()["cached_entries"] == 1
+
+
+class TestNIMClientCacheKey:
+    """Test that variable data is normalized out of cache keys."""
+
+    def test_normalizes_timestamps_ids_and_whitespace(self):
+        client = NIMClient(config=NIMConfig(llm_api_key="test"))
+        normalized = client._normalize_content_for_cache(
+            "Task TASK_PICK_20251207_121327 at 2025-12-07T12:13:27Z\n id "
+            "123e4567-e89b-12d3-a456-426614174000 due 12/07/2025"
+        )
+        assert normalized == "Task TASK_ID at id UUID due DATE"
@@ -976,7 +976,7 @@ class TestModuleFunctions:
         """Test getting MCP planner graph singleton."""
         # Clear the global instance
         import src.api.graphs.mcp_integrated_planner_graph as mcp_module
-        mcp_module._mcp_planner_graph = None
+        mcp_module._mcp_planner_graph.reset()
 
         with patch("src.api.graphs.mcp_integrated_planner_graph.MCPPlannerGraph") as mock_graph_class:
             mock_graph = AsyncMock()
@@ -985,13 +985,13 @@ class TestModuleFunctions:
 
             result = await get_mcp_planner_graph()
             assert result == mock_graph
-            assert mcp_module._mcp_planner_graph == mock_graph
+            assert mcp_module._mcp_planner_graph.instance == mock_graph
 
     @pytest.mark.asyncio
     async def test_get_mcp_planner_graph_singleton(self):
         """Test that get_mcp_planner_graph returns same instance."""
         import src.api.graphs.mcp_integrated_planner_graph as mcp_module
-        mcp_module._mcp_planner_graph = None
+        mcp_module._mcp_planner_graph.reset()
 
         with patch("src.api.graphs.mcp_integrated_planner_graph.MCPPlannerGraph") as mock_graph_class:
             mock_graph = AsyncMock()
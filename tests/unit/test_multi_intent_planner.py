@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for multi-intent fan-out in the MCP planner graph.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from src.api.graphs.mcp_integrated_planner_graph import MCPIntentClassifier, MCPPlannerGraph
+from src.api.services.streaming.chat_stream import (
+    EVENT_TOKEN,
+    ChatStreamSink,
+    get_chat_stream_sink,
+    reset_chat_stream_sink,
+    set_chat_stream_sink,
+)
+
+MULTI_INTENT_QUERY = "Which forklifts are down and what does that do to today's pick waves?"
+
+
+def _state(message, intents=None, routing_decision=None):
+    return {
+        "messages": [HumanMessage(content=message)],
+        "user_intent": routing_decision,
+        "routing_decision": routing_decision,
+        "agent_responses": {},
+        "final_response": None,
+        "context": {},
+        "session_id": "test",
+        "mcp_results": None,
+        "tool_execution_plan": None,
+        "available_tools": None,
+        "enable_reasoning": False,
+        "reasoning_types": None,
+        "reasoning_chain": None,
+        "intents": intents,
+    }
+
+
+def _agent(intent, delay=0.0, **response):
+    async def node(state):
+        await asyncio.sleep(delay)
+        state["agent_responses"][intent] = {
+            "natural_language": f"{intent} answer",
+            "data": {intent: True},
+            "recommendations": [f"check {intent}"],
+            "confidence": 0.9,
+            "mcp_tools_used": [f"{intent}_tool"],
+            "tool_execution_results": {},
+            **response,
+        }
+        return state
+
+    return node
+
+
+class TestDetectIntents:
+    """Test multi-intent detection."""
+
+    def test_detects_one_intent_per_clause(self):
+        assert MCPIntentClassifier.detect_intents(MULTI_INTENT_QUERY) == ["equipment", "operations"]
+
+    def test_single_intent_and_action_messages_are_not_split(self):
+        assert MCPIntentClassifier.detect_intents("Show me forklift status") == []
+        assert MCPIntentClassifier.detect_intents("forklifts and scanners available in zone A") == []
+        # The operations agent coordinates the dispatch
+        assert MCPIntentClassifier.detect_intents("Create a pick wave and dispatch a forklift") == []
+
+
+class TestFanOut:
+    """Test concurrent agent branches and response merging."""
+
+    @pytest.mark.asyncio
+    async def test_branches_run_concurrently_and_merge(self):
+        planner = MCPPlannerGraph()
+        state = _state(MULTI_INTENT_QUERY, ["operations", "equipment"], "operations")
+        with patch.object(planner, "_mcp_operations_agent", _agent("operations", 0.2)), \
+             patch.object(planner, "_mcp_equipment_agent", _agent("equipment", 0.2, confidence=0.6)):
+            start = asyncio.get_running_loop().time()
+            state = await planner._mcp_fan_out(state)
+            elapsed = asyncio.get_running_loop().time() - start
+
+        assert elapsed < 0.35
+        branches = state["context"]["branches"]
+        assert set(branches) == {"operations", "equipment"}
+        assert all(b["status"] == "ok" and b["latency_ms"] >= 150 for b in branches.values())
+
+        state = planner._mcp_synthesize_response(state)
+        merged = state["context"]["structured_response"]
+        assert state["final_response"] == "operations answer\n\nequipment answer"
+        assert merged["response_type"] == "multi_intent"
+        assert merged["data"] == {"operations": {"operations": True}, "equipment": {"equipment": True}}
+        assert merged["confidence"] == 0.6
+        assert merged["mcp_tools_used"] == ["operations_tool", "equipment_tool"]
+        assert merged["branches"] is branches
+
+    @pytest.mark.asyncio
+    async def test_branch_past_deadline_is_cancelled(self):
+        planner = MCPPlannerGraph()
+        state = _state(MULTI_INTENT_QUERY, ["operations", "equipment"], "operations")
+        with patch.object(planner, "_mcp_operations_agent", _agent("operations")), \
+             patch.object(planner, "_mcp_equipment_agent", _agent("equipment", 5.0)), \
+             patch("src.api.graphs.mcp_integrated_planner_graph._calculate_agent_timeout", return_value=0.1):
+            state = await planner._mcp_fan_out(state)
+            await asyncio.sleep(0.01)
+
+        assert state["context"]["branches"]["operations"]["status"] == "ok"
+        assert state["context"]["branches"]["equipment"]["status"] == "timeout"
+        assert state["context"]["branches"]["equipment"]["latency_ms"] >= 100
+        assert state["agent_responses"]["equipment"]["response_type"] == "timeout"
+        assert state["agent_responses"]["operations"]["natural_language"] == "operations answer"
+
+    @pytest.mark.asyncio
+    async def test_cancelling_fan_out_cancels_branches(self):
+        finished = []
+
+        def slow_agent(intent):
+            async def node(state):
+                await asyncio.sleep(0.2)
+                finished.append(intent)
+                return state
+
+            return node
+
+        planner = MCPPlannerGraph()
+        state = _state(MULTI_INTENT_QUERY, ["operations", "equipment"], "operations")
+        with patch.object(planner, "_mcp_operations_agent", slow_agent("operations")), \
+             patch.object(planner, "_mcp_equipment_agent", slow_agent("equipment")):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(planner._mcp_fan_out(state), timeout=0.05)
+            await asyncio.sleep(0.3)
+
+        assert finished == []
+
+    @pytest.mark.asyncio
+    async def test_streaming_branches_emit_merged_text_once(self):
+        def streaming_agent(intent):
+            async def node(state):
+                # Interleaves with the other branch, like two streamed LLM calls
+                sink = get_chat_stream_sink()
+                if sink is not None:
+                    sink.begin_llm_segment()
+                for chunk in ('{"natural_language": "', f"{intent} ", 'answer"}'):
+                    if sink is not None:
+                        sink.llm_delta(chunk)
+                    await asyncio.sleep(0.01)
+                return await _agent(intent)(state)
+
+            return node
+
+        planner = MCPPlannerGraph()
+        state = _state(MULTI_INTENT_QUERY, ["operations", "equipment"], "operations")
+        sink = ChatStreamSink()
+        token = set_chat_stream_sink(sink)
+        try:
+            with patch.object(planner, "_mcp_operations_agent", streaming_agent("operations")), \
+                 patch.object(planner, "_mcp_equipment_agent", streaming_agent("equipment")):
+                state = await planner._mcp_fan_out(state)
+                assert sink.queue.empty()
+                planner._mcp_synthesize_response(state)
+        finally:
+            reset_chat_stream_sink(token)
+
+        events = [sink.queue.get_nowait() for _ in range(sink.queue.qsize())]
+        assert events == [{
+            "event": EVENT_TOKEN,
+            "data": {"text": "operations answer\n\nequipment answer", "segment": 1},
+        }]
+
+    def test_route_to_fan_out(self):
+        planner = MCPPlannerGraph()
+
+        assert planner._route_to_agent(_state("q", ["operations", "equipment"], "operations")) == "fan_out"
+        assert planner._route_to_agent(_state("q", ["operations"], "operations")) == "operations"
+        assert planner._route_to_agent(_state("q", None, "safety")) == "safety"
@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for chunked, parallel embedding requests in NIMClient.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.api.services.llm import nim_client as nim_module
+from src.api.services.llm.nim_client import NIMClient, NIMConfig
+
+
+def _client(handler, **limits) -> NIMClient:
+    config = NIMConfig(llm_api_key="test", **limits)
+    client = NIMClient(config=config, enable_cache=False)
+    client.embedding_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url="http://nim/v1"
+    )
+    return client
+
+
+class TestEmbeddingSubBatches:
+    """Test splitting, ordering and per-sub-batch retries."""
+
+    def test_split_respects_text_and_token_limits(self):
+        client = _client(lambda request: None, embedding_max_batch_texts=3, embedding_max_batch_tokens=10)
+
+        batches = client._split_embedding_batches(["a", "b", "c", "d", "x" * 40, "e"])
+
+        assert batches == [["a", "b", "c"], ["d"], ["x" * 40], ["e"]]
+
+    @pytest.mark.asyncio
+    async def test_only_failed_sub_batch_is_retried_and_order_is_kept(self, monkeypatch):
+        async def no_sleep(_):
+            return None
+
+        monkeypatch.setattr(nim_module.asyncio, "sleep", no_sleep)
+        requests = []
+
+        def handler(request):
+            texts = json.loads(request.content)["input"]
+            requests.append(texts)
+            if texts == ["t2", "t3"] and requests.count(texts) == 1:
+                return httpx.Response(503, json={"error": "busy"})
+            # Return items out of order; the client sorts by index
+            data = [{"index": i, "embedding": [float(t[1:])]} for i, t in enumerate(texts)]
+            return httpx.Response(200, json={"data": data[::-1], "usage": {"total_tokens": len(texts)}})
+
+        client = _client(handler, embedding_max_batch_texts=2, embedding_max_parallel_batches=2)
+
+        result = await client.generate_embeddings([f"t{i}" for i in range(5)])
+
+        assert result.embeddings == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+        assert result.usage == {"total_tokens": 5}
+        assert sorted(map(tuple, requests)) == [("t0", "t1"), ("t2", "t3"), ("t2", "t3"), ("t4",)]
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(400, json={"error": "bad input"})
+
+        client = _client(handler)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.generate_embeddings(["a"])
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_latency_does_not_shrink_the_limit(self):
+        async def handler(request):
+            texts = json.loads(request.content)["input"]
+            # Latency grows with batch size on a healthy server
+            await asyncio.sleep(0.005 if len(texts) == 1 else 0.05)
+            data = [{"index": i, "embedding": [0.0]} for i in range(len(texts))]
+            return httpx.Response(200, json={"data": data, "usage": {"total_tokens": len(texts)}})
+
+        client = _client(handler)
+
+        await client.generate_embeddings(["query"])
+        for _ in range(5):
+            await client.generate_embeddings([f"t{i}" for i in range(20)])
+
+        assert client.embedding_limiter.get_stats()["decreases"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_sub_batch_cancels_the_others(self):
+        finished = []
+
+        async def handler(request):
+            texts = json.loads(request.content)["input"]
+            if texts == ["bad"]:
+                return httpx.Response(400, json={"error": "bad input"})
+            await asyncio.sleep(0.2)
+            finished.append(texts)
+            data = [{"index": i, "embedding": [0.0]} for i in range(len(texts))]
+            return httpx.Response(200, json={"data": data, "usage": {}})
+
+        client = _client(handler, embedding_max_batch_texts=1, embedding_max_parallel_batches=4)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.generate_embeddings(["a", "bad", "c", "d"])
+        await asyncio.sleep(0.3)
+
+        assert finished == []
+        assert client.embedding_limiter.in_flight == 0
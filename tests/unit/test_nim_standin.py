@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the offline NIM stand-in server, driven through NIMClient.
+"""
+
+import json
+
+import httpx
+import numpy as np
+import pytest
+
+from scripts.testing.nim_standin import StandinConfig, create_app
+from src.api.services.llm.nim_client import NIMClient, NIMConfig
+
+PARSE_PROMPT = [
+    {
+        "role": "system",
+        "content": 'Return JSON format:\n{\n    "intent": "equipment_lookup",\n    "entities": '
+                   '{"equipment_id": "EQ001"},\n    "context": {"priority": "high"}\n}\n\n'
+                   "Intent options: equipment_lookup, equipment_dispatch",
+    },
+    {"role": "user", "content": 'Query: "Show me forklift FL-001"'},
+]
+
+
+def _client_for(app) -> NIMClient:
+    client = NIMClient(config=NIMConfig(llm_api_key="test"), enable_cache=False)
+    transport = httpx.ASGITransport(app=app)
+    client.llm_client = httpx.AsyncClient(transport=transport, base_url="http://standin/v1")
+    client.embedding_client = httpx.AsyncClient(transport=transport, base_url="http://standin/v1")
+    return client
+
+
+class TestNIMStandin:
+    """Test response shapes, streaming, embeddings and fault injection."""
+
+    @pytest.mark.asyncio
+    async def test_completions_follow_prompt_format_and_stream_identically(self):
+        client = _client_for(create_app(StandinConfig(profile="instant")))
+
+        parsed = json.loads((await client.generate_response(PARSE_PROMPT)).content)
+        streamed = await client.generate_response(PARSE_PROMPT, stream=True)
+        answer = await client.generate_response([
+            {"role": "system", "content": 'Respond with "response_type": "equipment_info" and "natural_language".'},
+            {"role": "user", "content": "Which forklifts are free?"},
+        ])
+
+        assert parsed["intent"] == "equipment_lookup"
+        assert parsed["entities"] == {"equipment_id": "EQ001"}
+        assert json.loads(streamed.content) == parsed
+        assert json.loads(answer.content)["response_type"] == "equipment_info"
+        assert "Which forklifts are free?" in json.loads(answer.content)["natural_language"]
+
+    @pytest.mark.asyncio
+    async def test_embeddings_are_deterministic_and_word_similar(self):
+        client = _client_for(create_app(StandinConfig(profile="instant")))
+
+        result = await client.generate_embeddings(
+            ["forklift battery status", "forklift battery status", "forklift battery level", "PPE policy"]
+        )
+        vectors = np.array(result.embeddings)
+
+        assert vectors.shape == (4, 1024)
+        assert np.allclose(vectors[0], vectors[1])
+        assert vectors[0] @ vectors[2] > vectors[0] @ vectors[3]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_returns_429(self):
+        transport = httpx.ASGITransport(app=create_app(StandinConfig(profile="instant", max_concurrency=0)))
+        async with httpx.AsyncClient(transport=transport, base_url="http://standin") as http:
+            response = await http.post("/v1/embeddings", json={"input": ["x"]})
+            stats = (await http.get("/standin/stats")).json()
+
+        assert response.status_code == 429
+        assert stats["rate_limited"] == 1
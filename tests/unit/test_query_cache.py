@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the bounded query result cache.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.api.services.cache.query_cache import QueryCache
+
+
+class TestQueryCache:
+    """Test LRU, TTL and size bounds of QueryCache."""
+
+    @pytest.mark.asyncio
+    async def test_get_returns_cached_result(self):
+        cache = QueryCache()
+        await cache.set("Show forklift status", "s1", {"reply": "ok"})
+
+        assert await cache.get("  show forklift STATUS ", "s1") == {"reply": "ok"}
+        assert await cache.get("show forklift status", "other-session") is None
+
+        stats = await cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["total_entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_context_is_part_of_key(self):
+        cache = QueryCache()
+        await cache.set("q", "s", {"reply": "a"}, context={"zone": "A", "obj": object()})
+
+        assert await cache.get("q", "s", {"zone": "A"}) == {"reply": "a"}
+        assert await cache.get("q", "s", {"zone": "B"}) is None
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_respects_max_entries(self):
+        cache = QueryCache(max_entries=2, num_stripes=1)
+        await cache.set("a", "s", {"v": 1})
+        await cache.set("b", "s", {"v": 2})
+        # Touch "a" so "b" becomes least recently used
+        await cache.get("a", "s")
+        await cache.set("c", "s", {"v": 3})
+
+        assert await cache.get("b", "s") is None
+        assert await cache.get("a", "s") == {"v": 1}
+        assert await cache.get("c", "s") == {"v": 3}
+        assert (await cache.get_stats())["evictions"] == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_entries", [1, 3, 17, 40])
+    async def test_small_budgets_are_never_exceeded(self, max_entries):
+        cache = QueryCache(max_entries=max_entries, num_stripes=16)
+        for i in range(200):
+            await cache.set(f"query {i}", "s", {"v": i})
+
+        stats = await cache.get_stats()
+        assert stats["num_stripes"] <= max_entries
+        assert stats["total_entries"] <= max_entries
+        # Per-stripe budgets add up to the configured bound
+        assert sum(stripe.max_entries for stripe in cache._stripes) == max_entries
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_evicts_and_rejects_oversize(self):
+        cache = QueryCache(max_bytes=100, num_stripes=1)
+        await cache.set("small1", "s", {"v": "x" * 30})
+        await cache.set("small2", "s", {"v": "y" * 30})
+        await cache.set("small3", "s", {"v": "z" * 30})
+        stats = await cache.get_stats()
+        assert stats["total_bytes"] <= 100
+        assert stats["evictions"] >= 1
+
+        await cache.set("huge", "s", {"v": "x" * 500})
+        assert await cache.get("huge", "s") is None
+        assert (await cache.get_stats())["rejected_oversize"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_purged_on_write(self):
+        cache = QueryCache(num_stripes=1)
+        with patch("src.api.services.cache.query_cache.time.monotonic", return_value=1000.0):
+            await cache.set("old", "s", {"v": 1}, ttl_seconds=10)
+        with patch("src.api.services.cache.query_cache.time.monotonic", return_value=1011.0):
+            await cache.set("new", "s", {"v": 2}, ttl_seconds=10)
+            stats = await cache.get_stats()
+
+        assert stats["total_entries"] == 1
+        assert stats["expirations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_stats_does_not_deadlock(self):
+        cache = QueryCache()
+        await cache.set("q", "s", {"v": 1})
+        stats = await cache.get_stats()
+        assert stats["total_entries"] == 1
+        await cache.clear()
+        assert (await cache.get_stats())["total_entries"] == 0
@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for single-flight request deduplication.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.api.services.deduplication.request_deduplicator import RequestDeduplicator
+
+
+class _FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio commands used."""
+
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+
+    def _expire(self, key):
+        if key in self.expires and time.monotonic() >= self.expires[key]:
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+
+    async def set(self, key, value, nx=False, px=None):
+        self._expire(key)
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        self.expires.pop(key, None)
+        if px is not None:
+            self.expires[key] = time.monotonic() + px / 1000
+        return True
+
+    async def get(self, key):
+        self._expire(key)
+        return self.data.get(key)
+
+    async def exists(self, key):
+        self._expire(key)
+        return int(key in self.data)
+
+    async def pexpire(self, key, px):
+        self._expire(key)
+        if key in self.data:
+            self.expires[key] = time.monotonic() + px / 1000
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+        self.expires.pop(key, None)
+
+
+def _counting_factory(calls, result="ok", delay=0.05):
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return result
+
+    return factory
+
+
+class TestSingleFlight:
+    """Test coalescing, cancellation and bounded result retention."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_execution(self):
+        dedup = RequestDeduplicator()
+        calls = []
+        factory = _counting_factory(calls)
+
+        results = await asyncio.gather(*(dedup.single_flight("k", factory) for _ in range(10)))
+
+        assert len(calls) == 1
+        assert all(r.value == "ok" for r in results)
+        assert sum(not r.shared for r in results) == 1
+        assert dedup.active_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_keeps_flight_running(self):
+        dedup = RequestDeduplicator()
+        calls = []
+        factory = _counting_factory(calls)
+
+        leader = asyncio.create_task(dedup.single_flight("k", factory))
+        follower = asyncio.create_task(dedup.single_flight("k", factory))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert (await follower).value == "ok"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelling_all_callers_cancels_work(self):
+        dedup = RequestDeduplicator()
+        finished = []
+
+        async def factory():
+            await asyncio.sleep(1)
+            finished.append(1)
+
+        callers = [asyncio.create_task(dedup.single_flight("k", factory)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert dedup.active_requests == {}
+        assert (await dedup.get_stats())["cancelled_flights"] == 1
+        assert finished == []
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_not_retained(self):
+        dedup = RequestDeduplicator()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            dedup.single_flight("k", failing), dedup.single_flight("k", failing),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert "k" not in dedup.request_results
+
+    @pytest.mark.asyncio
+    async def test_recent_results_are_bounded_and_filtered(self):
+        dedup = RequestDeduplicator(max_results=2)
+        calls = []
+
+        for key in ("a", "b", "c"):
+            await dedup.single_flight(key, _counting_factory(calls, delay=0))
+        await dedup.single_flight("err", _counting_factory(calls, result="error", delay=0),
+                                  retain=lambda r: r != "error")
+
+        assert list(dedup.request_results) == ["b", "c"]
+        recent = await dedup.single_flight("c", _counting_factory(calls, delay=0))
+        assert recent.shared and recent.source == "recent"
+        assert len(calls) == 4
+
+
+class TestDistributedSingleFlight:
+    """Test cross-worker leader election through Redis."""
+
+    @pytest.mark.asyncio
+    async def test_follower_worker_uses_published_result(self):
+        redis_client = _FakeRedis()
+        codec = (json.dumps, json.loads)
+        workers = []
+        for _ in range(2):
+            dedup = RequestDeduplicator(redis_enabled=True, redis_poll_interval_seconds=0.01)
+            dedup.redis_client = redis_client
+            dedup._redis_initialized = True
+            workers.append(dedup)
+
+        calls = []
+        leader, follower = await asyncio.gather(
+            workers[0].single_flight("k", _counting_factory(calls, result={"reply": "ok"}), codec=codec),
+            workers[1].single_flight("k", _counting_factory(calls, result={"reply": "ok"}), codec=codec),
+        )
+
+        assert len(calls) == 1
+        assert leader.value == follower.value == {"reply": "ok"}
+        assert follower.source == "remote"
+        assert "dedup:lock:k" not in redis_client.data
+
+    @pytest.mark.asyncio
+    async def test_leader_lock_outlives_its_ttl_while_work_runs(self):
+        redis_client = _FakeRedis()
+        codec = (json.dumps, json.loads)
+        workers = []
+        for _ in range(2):
+            dedup = RequestDeduplicator(
+                redis_enabled=True,
+                redis_lock_ttl_seconds=0.05,
+                redis_poll_interval_seconds=0.01,
+            )
+            dedup.redis_client = redis_client
+            dedup._redis_initialized = True
+            workers.append(dedup)
+
+        calls = []
+
+        async def late_follower():
+            # Arrives after the lock's original TTL has passed
+            await asyncio.sleep(0.12)
+            return await workers[1].single_flight("k", _counting_factory(calls), codec=codec)
+
+        leader, follower = await asyncio.gather(
+            workers[0].single_flight("k", _counting_factory(calls, delay=0.25), codec=codec),
+            late_follower(),
+        )
+
+        assert len(calls) == 1
+        assert follower.source == "remote"
+        assert "dedup:lock:k" not in redis_client.data
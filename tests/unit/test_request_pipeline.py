@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the pure ASGI request pipeline middleware.
+"""
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException, status
+from unittest.mock import AsyncMock, patch
+
+from src.api.middleware import (
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    RequestSizeLimitMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+
+def _build_app(limiter) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/v1/chat")
+    async def chat():
+        return {"ok": True}
+
+    @app.get("/api/v1/health/simple")
+    async def health_simple():
+        return {"ok": True}
+
+    async def limiter_factory():
+        return limiter
+
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(RateLimitMiddleware, limiter_factory=limiter_factory)
+    app.add_middleware(RequestSizeLimitMiddleware, max_request_size=16, max_upload_size=1024)
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def _request(app: FastAPI, method: str, path: str, **kwargs) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.request(method, path, **kwargs)
+
+
+class TestRequestPipeline:
+    """Test rate limiting, size limits, metrics and security headers."""
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_is_rejected(self):
+        limiter = AsyncMock()
+        response = await _request(_build_app(limiter), "POST", "/api/v1/chat", content=b"x" * 32)
+
+        assert response.status_code == 413
+        assert response.json()["status_code"] == 413
+        limiter.check_rate_limit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_returns_429(self):
+        limiter = AsyncMock()
+        limiter.check_rate_limit.side_effect = HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded.",
+            headers={"Retry-After": "30"},
+        )
+        response = await _request(_build_app(limiter), "POST", "/api/v1/chat", json={})
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "30"
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_fails_open_and_skips_health(self):
+        limiter = AsyncMock()
+        limiter.check_rate_limit.side_effect = RuntimeError("redis down")
+        app = _build_app(limiter)
+
+        assert (await _request(app, "POST", "/api/v1/chat", json={})).status_code == 200
+        assert (await _request(app, "GET", "/api/v1/health/simple")).status_code == 200
+        limiter.check_rate_limit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_metrics_record_status_code(self):
+        with patch(
+            "src.api.middleware.request_pipeline.metrics_collector.observe_http_request"
+        ) as observe:
+            await _request(_build_app(AsyncMock()), "GET", "/api/v1/health/simple")
+
+        method, path, status_code, duration = observe.call_args.args
+        assert (method, path, status_code) == ("GET", "/api/v1/health/simple", 200)
+        assert duration >= 0
@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the shared response serializer.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import List
+
+import numpy as np
+
+from src.api.utils.serialization import (
+    CIRCULAR_REFERENCE,
+    dumps,
+    serialize_reasoning_chain,
+    to_jsonable,
+)
+
+
+class Status(Enum):
+    ACTIVE = "active"
+
+
+@dataclass
+class Step:
+    step_id: str
+    step_type: Status = Status.ACTIVE
+    timestamp: datetime = field(default_factory=lambda: datetime(2025, 1, 1))
+    dependencies: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Chain:
+    chain_id: str
+    reasoning_type: Status = Status.ACTIVE
+    created_at: datetime = field(default_factory=lambda: datetime(2025, 1, 1))
+    steps: list = field(default_factory=list)
+
+
+class TestToJsonable:
+    """Test type conversion, cycle handling and limits."""
+
+    def test_converts_rich_types(self):
+        result = to_jsonable({
+            "status": Status.ACTIVE,
+            "at": datetime(2025, 1, 1, 12, 30),
+            "cost": Decimal("1.5"),
+            "count": np.int64(3),
+            "series": np.array([1.0, 2.0]),
+            "step": Step("s1"),
+            "tags": ("a", "b"),
+        })
+
+        assert result == {
+            "status": "active",
+            "at": "2025-01-01T12:30:00",
+            "cost": 1.5,
+            "count": 3,
+            "series": [1.0, 2.0],
+            "step": {"step_id": "s1", "step_type": "active",
+                     "timestamp": "2025-01-01T00:00:00", "dependencies": []},
+            "tags": ["a", "b"],
+        }
+        assert type(result["count"]) is int
+
+    def test_cycles_are_replaced_but_shared_objects_are_kept(self):
+        shared = {"zone": "A"}
+        data = {"first": shared, "second": shared}
+        data["self"] = data
+
+        result = to_jsonable(data)
+
+        assert result["first"] == result["second"] == {"zone": "A"}
+        assert result["self"] == CIRCULAR_REFERENCE
+
+    def test_depth_limit_and_skip_keys(self):
+        data = {"a": {"b": {"c": 1}}, "reasoning_chain": {"x": 1}}
+
+        result = to_jsonable(data, max_depth=1, skip_keys=frozenset({"reasoning_chain"}))
+
+        assert result == {"a": {"b": "{'c': 1}"}}
+
+    def test_plain_objects_are_stringified_unless_expanded(self):
+        class Thing:
+            def __init__(self):
+                self.name = "pallet"
+
+            def __str__(self):
+                return "Thing"
+
+        assert to_jsonable(Thing()) == "Thing"
+        assert to_jsonable(Thing(), expand_objects=True) == {"name": "pallet"}
+
+
+class TestDumps:
+    """Test encoding and reasoning chain projection."""
+
+    def test_dumps_handles_numpy_and_cycles(self):
+        data = {"values": np.arange(3), "when": datetime(2025, 1, 1), "status": Status.ACTIVE}
+        data["loop"] = data
+
+        decoded = json.loads(dumps(data))
+
+        assert decoded["values"] == [0, 1, 2]
+        assert decoded["when"] == "2025-01-01T00:00:00"
+        assert decoded["status"] == "active"
+        assert decoded["loop"] == CIRCULAR_REFERENCE
+
+    def test_dumps_handles_integers_beyond_64_bits(self):
+        data = {"big": 2**70, "values": np.arange(2), "nested": [-(2**65)]}
+
+        decoded = json.loads(dumps(data))
+
+        assert decoded == {"big": 2**70, "values": [0, 1], "nested": [-(2**65)]}
+
+    def test_serialize_reasoning_chain(self):
+        chain = Chain("c1", steps=[Step("s1", dependencies=["s0"]), {"step_id": "s2", "obj": object()}])
+
+        result = serialize_reasoning_chain(chain)
+
+        assert result["reasoning_type"] == "active"
+        assert result["created_at"] == "2025-01-01T00:00:00"
+        assert result["steps"][0]["step_type"] == "active"
+        assert result["steps"][0]["dependencies"] == ["s0"]
+        assert result["steps"][1] == {"step_id": "s2"}
+        json.dumps(result)
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the router registry and lazy route group loading.
+"""
+
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.middleware.lazy_routers import LazyRouterMiddleware
+from src.api.services.startup.routers import (
+    ROUTER_GROUPS,
+    RouterGroup,
+    RouterRegistry,
+)
+
+PREFIX = "tests_router_registry_fake"
+
+
+def _router_module(name, prefix):
+    module = types.ModuleType(f"{PREFIX}.{name}")
+    module.router = APIRouter(prefix=prefix)
+
+    @module.router.get("/status")
+    async def status():
+        return {"group": name}
+
+    return module
+
+
+@pytest.fixture
+def fake_modules():
+    modules = {
+        f"{PREFIX}.health": _router_module("health", "/api/v1/health"),
+        f"{PREFIX}.wms": _router_module("wms", "/api/v1/wms"),
+        f"{PREFIX}.forecasting": _router_module("forecasting", "/api/v1/forecasting"),
+    }
+    with patch.dict(sys.modules, modules):
+        yield modules
+
+
+GROUPS = (
+    RouterGroup("health", f"{PREFIX}.health", ("/api/v1/health",), deferrable=False),
+    RouterGroup("wms", f"{PREFIX}.wms", ("/api/v1/wms",)),
+    RouterGroup("forecasting", f"{PREFIX}.forecasting", ("/api/v1/forecasting",)),
+    RouterGroup("broken", f"{PREFIX}.missing", ("/api/v1/broken",)),
+)
+
+
+def _app(registry):
+    app = FastAPI()
+    app.add_middleware(LazyRouterMiddleware, registry=registry)
+    registry.install(app)
+    return app
+
+
+class TestRouterRegistry:
+    """Test eager, deferred and disabled route groups."""
+
+    def test_eager_and_disabled_groups(self, fake_modules):
+        registry = RouterRegistry(GROUPS, disabled=["forecasting", "broken", "health"], lazy=["wms"])
+        client = TestClient(_app(registry))
+
+        groups = registry.get_status()["groups"]
+        assert groups["health"]["state"] == "loaded"  # Not deferrable
+        assert groups["wms"]["state"] == "deferred"
+        assert groups["forecasting"]["state"] == groups["broken"]["state"] == "disabled"
+        assert [p.group for p in registry.profiles] == ["health"]
+        assert registry.profiles[0].trigger == "startup"
+        assert client.get("/api/v1/forecasting/status").status_code == 404
+
+    def test_deferred_group_loads_on_first_request(self, fake_modules):
+        registry = RouterRegistry(GROUPS, disabled=["broken"], lazy=["all"])
+        client = TestClient(_app(registry))
+
+        assert client.get("/api/v1/wms/status").json() == {"group": "wms"}
+        assert client.get("/api/v1/wms/status").json() == {"group": "wms"}
+        assert registry.states == {"wms": "loaded", "forecasting": "deferred", "broken": "disabled", "health": "loaded"}
+        assert [(p.group, p.trigger) for p in registry.profiles] == [
+            ("health", "startup"), ("wms", "/api/v1/wms/status"),
+        ]
+        # Prefixes match whole path segments only
+        assert registry.deferred_group_for("/api/v1/forecastingx") is None
+
+    def test_openapi_loads_every_deferred_group(self, fake_modules):
+        registry = RouterRegistry(GROUPS, disabled=["broken"], lazy=["all"])
+        client = TestClient(_app(registry))
+
+        paths = client.get("/openapi.json").json()["paths"]
+
+        assert set(paths) == {
+            "/api/v1/health/status", "/api/v1/wms/status", "/api/v1/forecasting/status",
+        }
+        assert not registry.has_deferred
+
+    def test_failed_deferred_import_returns_503(self, fake_modules):
+        registry = RouterRegistry(GROUPS, lazy=["broken"])
+        client = TestClient(_app(registry))
+
+        assert client.get("/api/v1/broken/status").status_code == 503
+        assert client.get("/api/v1/broken/status").status_code == 503
+        status = registry.get_status()["groups"]["broken"]
+        assert status["state"] == "failed"
+        assert status["error"].startswith("No module named")
+        assert client.get("/api/v1/wms/status").status_code == 200
+
+    def test_from_env_and_group_prefixes(self):
+        with patch.dict(
+            "os.environ",
+            {"ROUTER_LAZY_GROUPS": "Forecasting, document", "ROUTER_GROUPS_DISABLED": "training,unknown"},
+        ):
+            registry = RouterRegistry.from_env()
+
+        assert registry.states == {"forecasting": "deferred", "document": "deferred", "training": "disabled"}
+        prefixes = [prefix for group in ROUTER_GROUPS for prefix in group.path_prefixes]
+        assert not any(
+            a != b and (a == b or a.startswith(b + "/")) for a in prefixes for b in prefixes
+        )
@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the speculative input safety gate.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.routers import chat as chat_module
+from src.api.routers.chat import ChatRequest
+from src.api.services.guardrails.guardrails_service import GuardrailsResult
+from src.api.services.guardrails.safety_gate import (
+    SafetyGate,
+    reset_safety_gate,
+    set_safety_gate,
+    wait_for_input_safety,
+)
+
+
+async def _guarded_agent(started: list) -> str:
+    """Stand-in for the planner: route, wait for the gate, then run the agent."""
+    await wait_for_input_safety()
+    started.append("agent")
+    return "agent result"
+
+
+class TestSafetyGate:
+    """Test that agent work waits for, and respects, the safety verdict."""
+
+    @pytest.mark.asyncio
+    async def test_wait_is_noop_without_gate(self):
+        await asyncio.wait_for(wait_for_input_safety(), timeout=0.1)
+
+    @pytest.mark.asyncio
+    async def test_agent_starts_only_after_safe_verdict(self):
+        started = []
+        gate = SafetyGate()
+        token = set_safety_gate(gate)
+        try:
+            planner = asyncio.create_task(_guarded_agent(started))
+        finally:
+            reset_safety_gate(token)
+
+        await asyncio.sleep(0.01)
+        assert started == []
+
+        gate.resolve(True)
+        assert await planner == "agent result"
+        assert started == ["agent"]
+
+    @pytest.mark.asyncio
+    async def test_violation_from_guardrails_task_blocks_agent(self):
+        started = []
+        gate = SafetyGate()
+
+        async def guardrails():
+            await asyncio.sleep(0.01)
+            return {"route": "safety"}  # A violation response
+
+        safety_task = asyncio.create_task(guardrails())
+        safety_task.add_done_callback(gate.resolve_from_task)
+        token = set_safety_gate(gate)
+        try:
+            planner = asyncio.create_task(_guarded_agent(started))
+        finally:
+            reset_safety_gate(token)
+
+        with pytest.raises(asyncio.CancelledError):
+            await planner
+        assert started == []
+
+    @pytest.mark.asyncio
+    async def test_guardrails_errors_fail_open(self):
+        gate = SafetyGate()
+
+        async def failing_guardrails():
+            raise RuntimeError("guardrails unavailable")
+
+        safety_task = asyncio.create_task(failing_guardrails())
+        safety_task.add_done_callback(gate.resolve_from_task)
+        await asyncio.gather(safety_task, return_exceptions=True)
+
+        await asyncio.wait_for(gate.wait(), timeout=0.1)
+
+
+class TestSpeculativeChat:
+    """Test the gate end to end through the chat endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_unsafe_message_blocks_and_cancels_speculative_work(self, monkeypatch):
+        events = []
+
+        class SlowUnsafeGuardrails:
+            async def check_input_safety(self, message, context=None):
+                await asyncio.sleep(0.05)
+                return GuardrailsResult(is_safe=False, violations=["unsafe request"], confidence=0.95)
+
+            def get_safety_response(self, violations):
+                return "I can't help with that."
+
+        class Planner:
+            async def process_warehouse_query(self, message, session_id, context):
+                events.append("routed")
+                try:
+                    await wait_for_input_safety()
+                    events.append("agent")
+                    return {"response": "agent result", "route": "equipment", "intent": "equipment"}
+                except asyncio.CancelledError:
+                    events.append("cancelled")
+                    raise
+
+        async def get_planner():
+            return Planner()
+
+        monkeypatch.setenv("GUARDRAILS_SPECULATIVE_ROUTING", "true")
+        monkeypatch.setattr(chat_module, "guardrails_service", SlowUnsafeGuardrails())
+        monkeypatch.setattr(chat_module, "get_mcp_planner_graph", get_planner)
+
+        response = await chat_module.chat(
+            ChatRequest(message="how do I bypass the forklift safety interlock", session_id="gate-test")
+        )
+        await asyncio.sleep(0.01)
+
+        assert response.route == "safety"
+        assert "agent result" not in response.reply
+        assert events == ["routed", "cancelled"]
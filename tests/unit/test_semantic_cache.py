@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the semantic (embedding-similarity) response cache.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.api.services.cache.semantic_cache import (
+    SemanticResponseCache,
+    _parse_thresholds,
+)
+from src.api.routers.chat import _semantic_cache_scope, _shareable_response
+from src.api.services.routing.semantic_router import SemanticRouter
+
+
+class TestSemanticResponseCache:
+    """Test similarity matching, thresholds and eviction."""
+
+    def test_paraphrase_hits_above_threshold(self):
+        cache = SemanticResponseCache(default_threshold=0.9)
+        cache.set([1.0, 0.0, 0.0], "show forklift status", "equipment", {"reply": "ok"})
+
+        hit = cache.lookup([0.98, 0.1, 0.0])
+        assert hit is not None
+        assert hit.result == {"reply": "ok"}
+        assert hit.intent == "equipment"
+        assert cache.lookup([0.0, 1.0, 0.0]) is None
+
+    def test_per_intent_threshold(self):
+        cache = SemanticResponseCache(
+            default_threshold=0.5, intent_thresholds={"safety": 0.999}
+        )
+        cache.set([1.0, 0.0], "report incident", "safety", {"reply": "safety"})
+
+        # Close enough for the default threshold, but not for safety
+        assert cache.lookup([0.95, 0.3]) is None
+
+    def test_scope_isolation(self):
+        cache = SemanticResponseCache()
+        cache.set([1.0, 0.0], "q", "equipment", {"reply": "a"}, scope="session-a")
+
+        assert cache.lookup([1.0, 0.0], scope="session-b") is None
+        assert cache.lookup([1.0, 0.0], scope="session-a") is not None
+
+    def test_lru_eviction_when_full(self):
+        cache = SemanticResponseCache(max_entries=2)
+        cache.set([1.0, 0.0, 0.0], "a", "equipment", {"reply": "a"})
+        cache.set([0.0, 1.0, 0.0], "b", "equipment", {"reply": "b"})
+        cache.lookup([1.0, 0.0, 0.0])  # "a" becomes most recently used
+        cache.set([0.0, 0.0, 1.0], "c", "equipment", {"reply": "c"})
+
+        assert cache.lookup([0.0, 1.0, 0.0]) is None
+        assert cache.lookup([1.0, 0.0, 0.0]).result == {"reply": "a"}
+        assert cache.lookup([0.0, 0.0, 1.0]).result == {"reply": "c"}
+
+    def test_expired_entries_do_not_match(self):
+        cache = SemanticResponseCache()
+        with patch("src.api.services.cache.semantic_cache.time.monotonic", return_value=100.0):
+            cache.set([1.0, 0.0], "q", "equipment", {"reply": "a"}, ttl_seconds=10)
+        with patch("src.api.services.cache.semantic_cache.time.monotonic", return_value=111.0):
+            assert cache.lookup([1.0, 0.0]) is None
+
+    @pytest.mark.asyncio
+    async def test_stats_report_hit_rate(self):
+        cache = SemanticResponseCache()
+        cache.set([1.0, 0.0], "q", "equipment", {"reply": "a"})
+        cache.lookup([1.0, 0.0])
+        cache.lookup([0.0, 1.0])
+
+        stats = await cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["hits_by_intent"] == {"equipment": 1}
+
+    def test_parse_thresholds(self):
+        thresholds = _parse_thresholds("equipment=0.9, bad, safety=x")
+        assert thresholds["equipment"] == 0.9
+        assert thresholds["safety"] == 0.96
+
+
+class TestChatSemanticCacheScope:
+    """Test what the chat endpoint shares through the semantic cache."""
+
+    def test_scope_defaults_to_session(self):
+        with patch.dict("os.environ", {}, clear=False) as env:
+            env.pop("SEMANTIC_CACHE_SCOPE", None)
+            assert _semantic_cache_scope("session-a") == "session-a"
+            assert _semantic_cache_scope(None) == "default"
+        with patch.dict("os.environ", {"SEMANTIC_CACHE_SCOPE": "global"}):
+            assert _semantic_cache_scope("session-a") == "global"
+
+    def test_request_scoped_fields_are_not_cached(self):
+        response = {
+            "reply": "Forklift FL-01 is available",
+            "route": "equipment",
+            "intent": "equipment",
+            "session_id": "session-a",
+            "context": {"user": "alice"},
+            "context_info": {"turns": 3},
+            "conversation_enhanced": True,
+            "response_id": "resp-1",
+            "enrichments_pending": True,
+        }
+
+        assert _shareable_response(response) == {
+            "reply": "Forklift FL-01 is available",
+            "route": "equipment",
+            "intent": "equipment",
+        }
+
+
+class TestSemanticRouterQueryEmbedding:
+    """Test that the router memoizes query embeddings for reuse."""
+
+    @pytest.mark.asyncio
+    async def test_embed_query_is_memoized(self):
+        router = SemanticRouter()
+        router._initialized = True
+        router.embedding_service = AsyncMock()
+        router.embedding_service.generate_embedding.return_value = [0.1, 0.2]
+
+        first = await router.embed_query("Forklift status?")
+        second = await router.embed_query("forklift status?")
+
+        assert first == second == [0.1, 0.2]
+        router.embedding_service.generate_embedding.assert_awaited_once()
@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the vectorized semantic router and persisted category embeddings.
+"""
+
+import numpy as np
+import pytest
+
+from src.api.services.routing.semantic_router import IntentCategory, SemanticRouter
+
+
+class _FakeEmbeddingService:
+    model_name = "test-model"
+
+    def __init__(self):
+        self.calls = []
+
+    async def generate_embeddings(self, texts, input_type="query"):
+        self.calls.append(list(texts))
+        vectors = []
+        for text in texts:
+            rng = np.random.default_rng(sum(map(ord, text)))
+            vectors.append(rng.standard_normal(16).tolist())
+        return vectors
+
+
+def _categories(safety_description="Safety incidents and PPE", exemplars=()):
+    return {
+        "equipment": IntentCategory("equipment", "Forklifts and assets", ["forklift"]),
+        "safety": IntentCategory("safety", safety_description, ["ppe"], exemplars=list(exemplars)),
+    }
+
+
+async def _router(path, **category_args):
+    router = SemanticRouter(embeddings_path=str(path))
+    router.embedding_service = _FakeEmbeddingService()
+    router.intent_categories = _categories(**category_args)
+    await router._precompute_category_embeddings()
+    return router
+
+
+class TestCategoryEmbeddings:
+    """Test batching and persistence of category vectors."""
+
+    @pytest.mark.asyncio
+    async def test_restart_reuses_persisted_vectors(self, tmp_path):
+        path = tmp_path / "router.npz"
+
+        first = await _router(path)
+        second = await _router(path)
+        changed = await _router(path, safety_description="Safety incidents, PPE and spills")
+
+        assert len(first.embedding_service.calls) == 1
+        assert len(first.embedding_service.calls[0]) == 2
+        assert second.embedding_service.calls == []
+        assert len(changed.embedding_service.calls) == 1
+        assert "spills" in changed.embedding_service.calls[0][0]
+        assert second.intent_categories["equipment"].embedding == first.intent_categories["equipment"].embedding
+
+
+class TestScoreCategories:
+    """Test that matrix scoring matches per-category cosine similarity."""
+
+    @pytest.mark.asyncio
+    async def test_max_similarity_over_exemplars(self, tmp_path):
+        router = await _router(tmp_path / "router.npz", exemplars=["Report a spill", "Is PPE required?"])
+        texts = router.embedding_service.calls[0]
+        query = np.random.default_rng(7).standard_normal(16)
+
+        scores = router.score_categories(query.tolist())
+
+        vectors = dict(zip(texts, await router.embedding_service.generate_embeddings(texts)))
+
+        def cosine(a, b):
+            a, b = np.asarray(a), np.asarray(b)
+            return float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+        safety_texts = [t for t in texts if "safety" in t or t in ("Report a spill", "Is PPE required?")]
+        assert len(safety_texts) == 3
+        assert scores["safety"] == pytest.approx(max(cosine(query, vectors[t]) for t in safety_texts), abs=1e-5)
+        equipment_text = next(t for t in texts if "equipment" in t)
+        assert scores["equipment"] == pytest.approx(cosine(query, vectors[equipment_text]), abs=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_classify_uses_matrix_scores(self, tmp_path):
+        router = await _router(tmp_path / "router.npz")
+        router._initialized = True
+        equipment_vector = router.intent_categories["equipment"].embedding
+
+        async def embed_query(message):
+            return equipment_vector
+
+        router.embed_query = embed_query
+
+        intent, confidence = await router.classify_intent_semantic("forklift FL-01", "safety", 0.3)
+
+        assert intent == "equipment"
+        assert confidence == pytest.approx(1.0, abs=1e-5)
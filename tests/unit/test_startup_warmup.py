@@ -0,0 +1,235 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the startup warm-up and the warm-up readiness endpoint.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.routers.health import warmup_readiness_check
+from src.api.services.startup.warmup import (
+    StartupWarmup,
+    WarmupComponent,
+    default_components,
+)
+from src.api.utils.async_singleton import AsyncSingleton
+
+
+def _component(name, events, delay=0.0, fail=False, **kwargs):
+    async def build():
+        events.append(f"start {name}")
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} unavailable")
+        events.append(f"end {name}")
+
+    return WarmupComponent(name, build, **kwargs)
+
+
+class TestStartupWarmup:
+    """Test component scheduling and status."""
+
+    @pytest.mark.asyncio
+    async def test_components_run_concurrently_after_dependencies(self):
+        events = []
+        warmup = StartupWarmup([
+            _component("nim_client", events, 0.05),
+            _component("planner", events, 0.1),
+            _component("equipment_agent", events, 0.1, depends_on=("nim_client",)),
+            _component("operations_agent", events, 0.1, depends_on=("nim_client",)),
+        ])
+
+        start = asyncio.get_running_loop().time()
+        await warmup.run()
+        elapsed = asyncio.get_running_loop().time() - start
+
+        # planner overlaps the chain nim_client -> agents
+        assert elapsed < 0.25
+        assert events.index("end nim_client") < events.index("start equipment_agent")
+        assert events.index("end nim_client") < events.index("start operations_agent")
+        assert warmup.state == "ready"
+        assert all(c["status"] == "ready" for c in warmup.get_status()["components"].values())
+
+    @pytest.mark.asyncio
+    async def test_failures_and_timeouts(self):
+        events = []
+        warmup = StartupWarmup(
+            [
+                _component("hybrid_retriever", events, fail=True),
+                _component("safety_agent", events, depends_on=("hybrid_retriever",)),
+                _component("semantic_router", events, 1.0),
+                _component("redis_connections", events, fail=True, required=False),
+            ],
+            timeout=0.05,
+        )
+
+        await warmup.run()
+        components = warmup.get_status()["components"]
+
+        assert warmup.state == "degraded"
+        assert components["hybrid_retriever"]["status"] == "failed"
+        assert components["hybrid_retriever"]["error"] == "hybrid_retriever unavailable"
+        assert components["safety_agent"]["status"] == "skipped"
+        assert components["semantic_router"]["status"] == "failed"
+        assert "start safety_agent" not in events
+
+    @pytest.mark.asyncio
+    async def test_optional_failures_do_not_degrade(self):
+        warmup = StartupWarmup([
+            _component("planner", []),
+            _component("milvus_connection", [], fail=True, required=False),
+        ])
+
+        await warmup.run()
+
+        assert warmup.state == "ready"
+        assert warmup.get_status()["components"]["milvus_connection"]["status"] == "failed"
+
+    def test_default_components(self):
+        names = [c.name for c in default_components()]
+        with_connections = {c.name: c for c in default_components(prewarm_connections=True)}
+
+        assert {"planner", "tool_catalog", "semantic_router", "equipment_agent",
+                "operations_agent", "safety_agent", "document_agent",
+                "forecasting_agent"} <= set(names)
+        assert "redis_connections" not in names
+        assert not with_connections["redis_connections"].required
+        # Every dependency is a component
+        assert all(d in with_connections for c in with_connections.values() for d in c.depends_on)
+
+
+class TestWarmupReadiness:
+    """Test /api/v1/health/ready."""
+
+    @pytest.mark.asyncio
+    async def test_not_ready_until_warmup_finishes(self):
+        gate = asyncio.Event()
+
+        async def build():
+            await gate.wait()
+
+        warmup = StartupWarmup([WarmupComponent("planner", build)])
+        with patch("src.api.services.startup.warmup.get_startup_warmup", return_value=warmup):
+            task = warmup.start()
+            await asyncio.sleep(0)
+            with pytest.raises(HTTPException) as exc_info:
+                await warmup_readiness_check()
+            assert exc_info.value.status_code == 503
+            assert exc_info.value.detail["status"] == "warming"
+
+            gate.set()
+            await task
+            result = await warmup_readiness_check()
+
+        assert result["status"] == "ready"
+        assert result["warmup"]["state"] == "ready"
+
+        with patch("src.api.services.startup.warmup.get_startup_warmup", return_value=None):
+            assert (await warmup_readiness_check())["warmup"]["state"] == "disabled"
+
+
+class TestSharedPlannerInitialization:
+    """Test that early requests and the warm-up share one planner initialization."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_initialization(self):
+        import src.api.graphs.mcp_integrated_planner_graph as planner_module
+
+        created = []
+
+        class SlowPlanner:
+            def __init__(self):
+                created.append(self)
+
+            async def initialize(self):
+                await asyncio.sleep(0.1)
+
+        with patch.object(planner_module, "MCPPlannerGraph", SlowPlanner), \
+             patch.object(planner_module, "_mcp_planner_graph", AsyncSingleton(planner_module._create_mcp_planner_graph)):
+            # A request that gives up early does not cancel the initialization
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(planner_module.get_mcp_planner_graph(), timeout=0.01)
+            first, second = await asyncio.gather(
+                planner_module.get_mcp_planner_graph(), planner_module.get_mcp_planner_graph()
+            )
+
+            assert first is second is created[0]
+            assert len(created) == 1
+
+    @pytest.mark.asyncio
+    async def test_agent_is_published_only_once_initialized(self):
+        import src.api.agents.safety.mcp_safety_agent as agent_module
+
+        created = []
+
+        class SlowAgent:
+            def __init__(self):
+                self.ready = False
+                created.append(self)
+
+            async def initialize(self):
+                await asyncio.sleep(0.05)
+                self.ready = True
+
+        with patch.object(agent_module, "MCPSafetyComplianceAgent", SlowAgent), \
+             patch.object(agent_module, "_mcp_safety_agent", AsyncSingleton(agent_module._create_mcp_safety_agent)):
+            first = asyncio.ensure_future(agent_module.get_mcp_safety_agent())
+            await asyncio.sleep(0)
+            # A request arriving mid-initialization waits instead of getting a half-built agent
+            assert agent_module._mcp_safety_agent.instance is None
+            second = await agent_module.get_mcp_safety_agent()
+
+            assert second is await first is created[0]
+            assert second.ready
+            assert len(created) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_initialization_is_retried(self):
+        attempts = []
+
+        async def create():
+            attempts.append(None)
+            if len(attempts) == 1:
+                raise RuntimeError("milvus unavailable")
+            return "agent"
+
+        singleton = AsyncSingleton(create)
+
+        with pytest.raises(RuntimeError):
+            await singleton.get()
+        assert singleton.instance is None
+        assert await singleton.get() == await singleton.get() == "agent"
+        assert len(attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_planner_warmup_fails_when_initialization_failed(self):
+        from src.api.services.startup.warmup import _warm_planner
+
+        class FailedPlanner:
+            initialized = False
+
+        with patch(
+            "src.api.graphs.mcp_integrated_planner_graph.get_mcp_planner_graph",
+            return_value=FailedPlanner(),
+        ):
+            warmup = StartupWarmup([WarmupComponent("planner", _warm_planner)])
+            await warmup.run()
+
+        assert warmup.get_status()["components"]["planner"]["status"] == "failed"
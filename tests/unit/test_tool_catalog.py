@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for versioned tool catalog snapshots.
+"""
+
+import numpy as np
+import pytest
+
+from src.api.services.mcp.tool_catalog import ToolCatalogSnapshot
+from src.api.services.mcp.tool_discovery import (
+    DiscoveredTool,
+    ToolCategory,
+    ToolDiscoveryService,
+)
+from src.api.services.mcp.tool_routing import RoutingContext, ToolRoutingService
+
+
+def _tool(name, description, category, capabilities=("executable",), source="adapter"):
+    return DiscoveredTool(
+        name=name,
+        description=description,
+        category=category,
+        source=source,
+        source_type="mcp_adapter",
+        parameters={},
+        capabilities=list(capabilities),
+    )
+
+
+async def _service(*tools):
+    service = ToolDiscoveryService()
+    for tool in tools:
+        await service._register_discovered_tool(tool)
+    return service
+
+
+class TestToolCatalogSnapshot:
+    """Test snapshot views."""
+
+    def test_precomputed_views(self):
+        status = _tool("get_equipment_status", "Equipment status", ToolCategory.EQUIPMENT,
+                       capabilities=("executable", "parameterized"))
+        incident = _tool("log_incident", "Log an incident", ToolCategory.SAFETY)
+        snapshot = ToolCatalogSnapshot.build(3, {status.tool_id: status, incident.tool_id: incident})
+
+        assert snapshot.version == 3
+        assert [s["name"] for s in snapshot.summaries] == ["get_equipment_status", "log_incident"]
+        assert snapshot.tools_in_category(ToolCategory.SAFETY) == [incident]
+        assert snapshot.tools_with_tag("Executable") == [status, incident]
+        assert snapshot.tools_with_capabilities(["parameterized", "executable"]) == [status]
+        assert snapshot.tools_with_capabilities(["unknown"]) == []
+        with pytest.raises(TypeError):
+            snapshot.tools["new"] = status
+
+    def test_description_embeddings_are_normalized(self):
+        tool = _tool("scan_document", "Scan a document", ToolCategory.UTILITY)
+        snapshot = ToolCatalogSnapshot.build(1, {tool.tool_id: tool})
+
+        embedded = snapshot.with_description_embeddings([[3.0, 4.0]])
+
+        assert embedded.version == 1
+        assert snapshot.description_embeddings is None
+        np.testing.assert_allclose(embedded.description_embeddings, [[0.6, 0.8]])
+        with pytest.raises(ValueError):
+            snapshot.with_description_embeddings([[1.0], [2.0]])
+
+
+class TestCatalogPublishing:
+    """Test catalog versioning in ToolDiscoveryService."""
+
+    @pytest.mark.asyncio
+    async def test_version_changes_only_with_the_catalog(self):
+        status = _tool("get_equipment_status", "Equipment status", ToolCategory.EQUIPMENT)
+        service = await _service(status)
+        first = service.get_catalog()
+
+        assert service.get_catalog() is first
+        # Rediscovering an unchanged tool keeps the version
+        await service._register_discovered_tool(
+            _tool("get_equipment_status", "Equipment status", ToolCategory.EQUIPMENT)
+        )
+        assert service.get_catalog() is first
+
+        await service._register_discovered_tool(
+            _tool("get_equipment_status", "Live equipment status", ToolCategory.EQUIPMENT)
+        )
+        second = service.get_catalog()
+        assert second.version == first.version + 1
+        assert second.summaries[0]["description"] == "Live equipment status"
+        assert first.summaries[0]["description"] == "Equipment status"
+
+    @pytest.mark.asyncio
+    async def test_catalog_embeddings(self):
+        calls = []
+
+        async def embed(texts):
+            calls.append(texts)
+            return [[1.0, float(i)] for i in range(len(texts))]
+
+        service = await _service(
+            _tool("get_equipment_status", "Equipment status", ToolCategory.EQUIPMENT),
+            _tool("log_incident", "Log an incident", ToolCategory.SAFETY),
+        )
+        service.description_embedder = embed
+
+        snapshot = await service.ensure_catalog_embeddings()
+
+        assert snapshot.description_embeddings.shape == (2, 2)
+        assert await service.ensure_catalog_embeddings() is snapshot
+        assert len(calls) == 1
+        assert calls[0][1] == "log incident (safety): Log an incident"
+
+    @pytest.mark.asyncio
+    async def test_routing_candidates_cached_per_version(self):
+        status = _tool("get_equipment_status", "Equipment status", ToolCategory.EQUIPMENT)
+        service = await _service(status)
+        routing = ToolRoutingService(service, tool_binding=None)
+        context = RoutingContext(
+            query="equipment status", intent="equipment", entities={},
+            user_context={}, session_id="s1", agent_id="equipment",
+        )
+
+        assert await routing._discover_candidate_tools(context) == [status]
+        assert len(routing._candidate_cache) == 1
+
+        dispatch = _tool("dispatch_equipment", "Dispatch equipment", ToolCategory.EQUIPMENT)
+        await service._register_discovered_tool(dispatch)
+        candidates = await routing._discover_candidate_tools(context)
+
+        assert set(t.name for t in candidates) == {"get_equipment_status", "dispatch_equipment"}
+        assert routing._candidate_cache_version == service.get_catalog().version
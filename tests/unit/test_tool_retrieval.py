@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for embedding-based tool retrieval.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.api.services.mcp.tool_catalog import ToolCatalogSnapshot
+from src.api.services.mcp.tool_discovery import (
+    DiscoveredTool,
+    ToolCategory,
+    ToolDiscoveryService,
+)
+from src.api.services.mcp.tool_routing import (
+    RoutingContext,
+    RoutingStrategy,
+    ToolRoutingService,
+)
+
+# Description vectors: one axis per topic
+_VECTORS = {
+    "get_equipment_status": [1.0, 0.0, 0.0],
+    "dispatch_equipment": [0.8, 0.6, 0.0],
+    "assign_task": [0.0, 1.0, 0.0],
+    "log_incident": [0.0, 0.0, 1.0],
+}
+_CATEGORIES = {
+    "get_equipment_status": ToolCategory.EQUIPMENT,
+    "dispatch_equipment": ToolCategory.EQUIPMENT,
+    "assign_task": ToolCategory.OPERATIONS,
+    "log_incident": ToolCategory.SAFETY,
+}
+
+
+def _tool(name):
+    return DiscoveredTool(
+        name=name,
+        description=name.replace("_", " "),
+        category=_CATEGORIES[name],
+        source="adapter",
+        source_type="mcp_adapter",
+        parameters={},
+        capabilities=["executable"],
+    )
+
+
+async def _embed(texts):
+    return [_VECTORS[text.split(" (")[0].replace(" ", "_")] for text in texts]
+
+
+async def _service():
+    service = ToolDiscoveryService()
+    for name in _VECTORS:
+        await service._register_discovered_tool(_tool(name))
+    service.description_embedder = _embed
+    return service
+
+
+class TestCatalogTopK:
+    """Test similarity ranking on a catalog snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_ranks_by_cosine_similarity(self):
+        service = await _service()
+        snapshot = await service.ensure_catalog_embeddings()
+
+        ranked = snapshot.top_k([2.0, 0.1, 0.0], k=2)
+
+        assert [tool.name for tool, _ in ranked] == ["get_equipment_status", "dispatch_equipment"]
+        assert ranked[0][1] == pytest.approx(0.9988, abs=1e-3)
+        assert [t.name for t, _ in snapshot.top_k([0.0, 1.0, 0.0], k=5, min_score=0.5)] == [
+            "assign_task", "dispatch_equipment",
+        ]
+        assert [t.name for t, _ in snapshot.top_k([0.0, 1.0, 0.0], category=ToolCategory.EQUIPMENT)] == [
+            "dispatch_equipment", "get_equipment_status",
+        ]
+        assert snapshot.top_k([1.0, 0.0, 0.0], category=ToolCategory.ANALYSIS) == []
+        with pytest.raises(ValueError):
+            snapshot.top_k([1.0, 0.0])
+
+    def test_no_results_without_embeddings(self):
+        tool = _tool("log_incident")
+        snapshot = ToolCatalogSnapshot.build(1, {tool.tool_id: tool})
+
+        assert snapshot.top_k([0.0, 0.0, 1.0]) == []
+        assert snapshot.summaries_for([tool.tool_id, "missing"]) == [snapshot.summaries[0]]
+
+
+class TestToolRetrieval:
+    """Test retrieval through the discovery and routing services."""
+
+    @pytest.mark.asyncio
+    async def test_retrieve_tools_for_query_reuses_router_embedding(self):
+        service = await _service()
+        router = AsyncMock()
+        router.embed_query.return_value = [0.0, 0.0, 1.0]
+
+        with patch(
+            "src.api.services.routing.semantic_router.get_semantic_router",
+            AsyncMock(return_value=router),
+        ):
+            tools = await service.retrieve_tools_for_query("Report a spill in aisle 3", k=1)
+
+        router.embed_query.assert_awaited_once_with("Report a spill in aisle 3")
+        assert [t.name for t in tools] == ["log_incident"]
+
+        service.description_embedder = None
+        assert await service.retrieve_tools_for_query("Report a spill in aisle 3") is None
+
+    @pytest.mark.asyncio
+    async def test_semantic_routing_strategy(self):
+        service = await _service()
+        routing = ToolRoutingService(service, tool_binding=None)
+        context = RoutingContext(
+            query="who should pick wave 12", intent="operations", entities={},
+            user_context={}, session_id="s1", agent_id="operations",
+            query_embedding=[0.1, 1.0, 0.0],
+        )
+
+        decision = await routing.route_tools(context, RoutingStrategy.SEMANTIC, max_tools=1)
+
+        assert decision.routing_strategy == RoutingStrategy.SEMANTIC
+        assert [t.name for t in decision.selected_tools] == ["assign_task"]
+        assert [t.name for t in decision.fallback_tools] == [
+            "dispatch_equipment", "get_equipment_status", "log_incident",
+        ]
+        assert decision.tool_scores[0].context_relevance_score == pytest.approx(0.995, abs=1e-3)
+
+    @pytest.mark.asyncio
+    async def test_semantic_routing_falls_back_without_query_embedding(self):
+        service = await _service()
+        routing = ToolRoutingService(service, tool_binding=None)
+        context = RoutingContext(
+            query="equipment status", intent="equipment", entities={},
+            user_context={}, session_id="s1", agent_id="equipment",
+        )
+
+        decision = await routing.route_tools(context, RoutingStrategy.SEMANTIC)
+
+        assert decision.routing_strategy == RoutingStrategy.BALANCED
+        assert "get_equipment_status" in [t.name for t in decision.selected_tools]
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the inverted tool search index and ToolDiscoveryService search.
+"""
+
+import pytest
+
+from src.api.services.mcp.tool_discovery import (
+    DiscoveredTool,
+    ToolCategory,
+    ToolDiscoveryService,
+)
+from src.api.services.mcp.tool_index import ToolSearchIndex, tokenize
+
+
+def _tool(name, description, category, capabilities=(), tags=()):
+    return DiscoveredTool(
+        name=name,
+        description=description,
+        category=category,
+        source="test_adapter",
+        source_type="mcp_adapter",
+        parameters={},
+        capabilities=list(capabilities),
+        metadata={"tags": list(tags)},
+    )
+
+
+class TestToolSearchIndex:
+    """Test BM25 ranking and incremental maintenance."""
+
+    @pytest.fixture
+    def index(self):
+        index = ToolSearchIndex()
+        index.add("status", "get_equipment_status", "Get status of forklifts and scanners",
+                  tags=["executable"], category="equipment")
+        index.add("assign", "assign_equipment", "Assign equipment to a worker",
+                  tags=["executable", "parameterized"], category="equipment")
+        index.add("incident", "log_incident", "Log a safety incident for equipment",
+                  category="safety")
+        return index
+
+    def test_tokenize(self):
+        assert tokenize("Get_Equipment_Status for the Forklifts") == ["equipment", "status", "forklift"]
+
+    def test_name_matches_rank_first(self, index):
+        keys = [key for key, _ in index.search("equipment")]
+
+        assert set(keys) == {"status", "assign", "incident"}
+        assert keys[-1] == "incident"  # Only mentioned in the description
+        assert [key for key, _ in index.search("forklift status")][0] == "status"
+
+    def test_filters(self, index):
+        assert [k for k, _ in index.search("equipment", category="safety")] == ["incident"]
+        assert [k for k, _ in index.search("equipment", tags=["parameterized"])] == ["assign"]
+        assert [k for k, _ in index.search("", category="equipment")] == ["status", "assign"]
+        assert index.search("equipment", tags=["missing"]) == []
+
+    def test_match_all(self, index):
+        message = "Assign a forklift to the night shift"
+
+        # Any single shared term matches by default
+        assert [k for k, _ in index.search(message)] != []
+        assert index.search(message, match_all=True) == []
+        assert [k for k, _ in index.search("assign equipment worker", match_all=True)] == ["assign"]
+        assert [k for k, _ in index.search("equipment", match_all=True, category="safety")] == ["incident"]
+
+    def test_replace_and_remove(self, index):
+        index.add("assign", "dispatch_equipment", "Dispatch a forklift", category="equipment")
+
+        assert [k for k, _ in index.search("assign")] == []
+        assert "assign" in [k for k, _ in index.search("dispatch")]
+        assert index.remove("status") is True
+        assert index.remove("status") is False
+        assert [k for k, _ in index.search("", limit=1)] == ["assign"]
+        assert index.get_stats()["tools"] == 2
+
+
+class TestToolDiscoverySearch:
+    """Test ToolDiscoveryService.search_tools on the index."""
+
+    @pytest.mark.asyncio
+    async def test_search_tools_is_kept_in_sync(self):
+        service = ToolDiscoveryService()
+        status = _tool("get_equipment_status", "Equipment status lookup", ToolCategory.EQUIPMENT,
+                       capabilities=["executable"])
+        incident = _tool("log_incident", "Log a safety incident", ToolCategory.SAFETY,
+                         tags=["erp"])
+        await service._register_discovered_tool(status)
+        await service._register_discovered_tool(incident)
+
+        assert await service.search_tools("What is the equipment status?") == [status]
+        assert await service.search_tools("What is the equipment status?", match_all=True) == [status]
+        assert await service.search_tools("Log the forklift status", match_all=True) == []
+        assert await service.search_tools("incident", category=ToolCategory.EQUIPMENT) == []
+        assert await service.search_tools("", tags=["erp"]) == [incident]
+
+        # Rediscovery refreshes the entry instead of duplicating it
+        await service._register_discovered_tool(
+            _tool("log_incident", "Report an injury", ToolCategory.SAFETY)
+        )
+        assert len(service.search_index) == 2
+        assert await service.search_tools("injury") == [incident]
+        assert await service.search_tools("log") == [incident]
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for request span tracing and per-stage latency stats.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.services.monitoring.performance_monitor import PerformanceMonitor
+from src.api.services.monitoring.tracing import current_span, span, start_trace, traced
+
+
+@traced("llm.generate")
+async def _fake_llm_call(delay: float = 0.01):
+    await asyncio.sleep(delay)
+    return "ok"
+
+
+class TestSpans:
+    """Test span nesting, task propagation and no-op behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_nested_spans_across_tasks(self):
+        async def run():
+            root = start_trace("chat")
+            with span("agent.equipment"):
+                await asyncio.gather(_fake_llm_call(), _fake_llm_call())
+            with span("enrichment", deferred=False):
+                pass
+            root.finish()
+            return root
+
+        root = await asyncio.create_task(run())
+        tree = root.to_dict()
+
+        agent, enrichment = tree["children"]
+        assert agent["name"] == "agent.equipment"
+        assert [c["name"] for c in agent["children"]] == ["llm.generate", "llm.generate"]
+        assert agent["duration_ms"] >= agent["children"][0]["duration_ms"]
+        assert enrichment["attributes"] == {"deferred": False}
+
+    @pytest.mark.asyncio
+    async def test_span_is_noop_without_trace(self):
+        async def run():
+            with span("sql.query") as s:
+                assert s is None
+            return await _fake_llm_call(0)
+
+        assert await asyncio.create_task(run()) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_errors_are_recorded_and_spans_stop_after_finish(self):
+        async def run():
+            root = start_trace("chat")
+            with pytest.raises(ValueError):
+                with span("milvus.search"):
+                    raise ValueError("down")
+            root.finish()
+            with span("late") as late:
+                assert late is None
+            assert current_span() is root
+            return root
+
+        root = await asyncio.create_task(run())
+        assert [(c.name, c.error) for c in root.children] == [("milvus.search", "ValueError")]
+
+
+class TestStageStats:
+    """Test aggregation of traces into per-stage percentiles."""
+
+    @pytest.mark.asyncio
+    async def test_stage_percentiles_in_stats(self):
+        monitor = PerformanceMonitor()
+
+        async def request(request_id):
+            root = start_trace("chat", request_id=request_id)
+            await monitor.start_request(request_id, trace=root)
+            with span("agent.parse"):
+                await _fake_llm_call(0)
+            await _fake_llm_call(0)
+            await monitor.end_request(request_id, route="equipment")
+
+        for i in range(3):
+            await asyncio.create_task(request(f"r{i}"))
+        stats = await monitor.get_stats()
+
+        assert stats["stages"]["llm.generate"]["requests"] == 3
+        assert stats["stages"]["llm.generate"]["calls"] == 6
+        assert stats["stages"]["agent.parse"]["p95"] >= 0.0
+        assert monitor.request_metrics["r0"].trace.end_time is not None